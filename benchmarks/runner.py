@@ -13,6 +13,7 @@ from benchmarks.config import (
     MOCK_API_PORT,
     REDIS_URL,
 )
+from benchmarks.scenarios.rpc_batching import RpcBatchingScenario
 from benchmarks.scenarios.saturation import SaturationScenario
 from benchmarks.scenarios.shared_state import SharedStateScenario
 from benchmarks.utils.mock_server import MockVeniceServer
@@ -100,6 +101,22 @@ async def run_benchmarks(scenarios: list[str], duration: int, rate_limit: int):
                 f"Shared State Result: {result.throughput_rpm:.2f} RPM, Avg Latency: {result.avg_latency * 1000:.2f}ms"
             )
 
+        if "rpc_batching" in scenarios or "all" in scenarios:
+            logger.info(
+                f"Running RPC Batching Scenario (Duration: {duration}s per phase, Limit: {rate_limit} RPM)"
+            )
+            scenario = RpcBatchingScenario(duration=duration, rate_limit=rate_limit)
+            result = await scenario.execute()
+            if scenario.unbatched_result is not None:
+                results.append(scenario.unbatched_result)
+            results.append(result)
+            for name, wire in scenario.wire_requests.items():
+                logger.info(f"{name}: {wire} HTTP requests")
+            logger.info(
+                f"RPC Batching Result: {result.successful_requests}/{result.total_requests} calls served "
+                f"(unbatched: {scenario.unbatched_result.successful_requests if scenario.unbatched_result else 0})"
+            )
+
     finally:
         await server.stop()
 
@@ -134,7 +151,7 @@ def main():
         "--scenarios",
         nargs="+",
         default=["all"],
-        choices=["all", "saturation", "shared_state"],
+        choices=["all", "saturation", "shared_state", "rpc_batching"],
         help="Scenarios to run",
     )
     parser.add_argument(
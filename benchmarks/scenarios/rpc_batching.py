@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+from benchmarks.config import MOCK_API_URL
+from benchmarks.scenarios.base import BaseScenario
+from benchmarks.utils.metrics import BenchmarkResult, MetricsCollector, RequestMetric
+from venice_ai import VeniceClient
+
+
+class RpcBatchingScenario(BaseScenario):
+    """Send the same stream of ``crypto.rpc`` calls unbatched, then through ``RpcBatcher``.
+
+    Calls arrive in once-a-second bursts (like fan-out lookups) totalling 10x
+    the proxy's RPM limit. Unbatched, every call is one HTTP request and most
+    are rejected with 429; batched, each burst shares a request and fits
+    under the limit.
+    """
+
+    def __init__(self, duration: int = 30, rate_limit: int = 100):
+        super().__init__("RpcBatching", duration, rate_limit)
+        self.unbatched_result: BenchmarkResult | None = None
+        self.wire_requests: dict[str, int] = {}
+
+    def create_client(self) -> VeniceClient:
+        # No scheduler or Redis: the comparison is about wire requests only
+        return VeniceClient(
+            api_key="benchmark-key", base_url=f"{MOCK_API_URL}/api/v1", max_retries=0
+        )
+
+    async def run_call(self, client: VeniceClient, batch: bool) -> None:
+        start_time = time.time()
+        status_code = 200
+        try:
+            await client.crypto.rpc(
+                network="ethereum-mainnet", method="eth_blockNumber", params=[], batch=batch
+            )
+        except Exception as e:
+            status_code = getattr(e, "status_code", None) or 500
+        finally:
+            self.collector.record(
+                RequestMetric(
+                    timestamp=start_time,
+                    duration=time.time() - start_time,
+                    status_code=status_code,
+                    endpoint="crypto/rpc",
+                )
+            )
+
+    async def run_phase(self, batch: bool) -> BenchmarkResult:
+        self.collector = MetricsCollector()
+        burst = max(1, self.rate_limit * 10 // 60)
+        tasks = []
+
+        async with self.create_client() as client:
+            start_time = time.time()
+            while time.time() - start_time < self.duration:
+                tasks.extend(
+                    asyncio.create_task(self.run_call(client, batch)) for _ in range(burst)
+                )
+                await asyncio.sleep(1.0)
+            await asyncio.gather(*tasks, return_exceptions=True)
+            wire = client.rpc_batcher.stats.batches if batch else len(tasks)
+
+        name = "RpcBatching (batched)" if batch else "RpcBatching (unbatched)"
+        self.wire_requests[name] = wire
+        return self.collector.calculate_results(name, self.duration)
+
+    async def execute(self) -> BenchmarkResult:
+        self.unbatched_result = await self.run_phase(batch=False)
+        # Let the mock server's one-minute window roll over between phases
+        await asyncio.sleep(60)
+        return await self.run_phase(batch=True)
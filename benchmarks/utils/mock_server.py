@@ -33,6 +33,7 @@ class MockVeniceServer:
             "tier_heavy": {"rpm": 20, "tpm": 500000},
             "tier_image": {"rpm": 20, "tpm": 0},  # Shared
             "tier_tts": {"rpm": 60, "tpm": 0},  # Shared
+            "tier_rpc": {"rpm": rate_limit_rpm, "tpm": 0},  # Crypto RPC proxy
         }
 
         self.model_map = {
@@ -53,8 +54,12 @@ class MockVeniceServer:
             # Image / Special
             "venice-sd35": "tier_image",
             "tts-kokoro": "tier_tts",
+            "crypto-rpc": "tier_rpc",
         }
 
+        # Wire-level request counter for the crypto RPC proxy
+        self.rpc_requests = 0
+
         # Load templates
         try:
             with open("benchmarks/data/response_templates.json") as f:
@@ -68,6 +73,7 @@ class MockVeniceServer:
         self.app.router.add_post("/api/v1/image/generate", self.handle_image)
         self.app.router.add_get("/api/v1/models", self.handle_models)
         self.app.router.add_get("/api/v1/api_keys/rate_limits", self.handle_rate_limits)
+        self.app.router.add_post("/api/v1/crypto/rpc/{network}", self.handle_rpc)
 
     def _get_bucket_key(self, model_id: str) -> str:
         tier_name = self.model_map.get(model_id, "tier_standard")
@@ -225,6 +231,34 @@ class MockVeniceServer:
             content_type="application/json",
         )
 
+    async def handle_rpc(self, request: web.Request) -> web.Response:
+        # One rate-limit slot per HTTP request, however many calls it carries
+        self.rpc_requests += 1
+        headers = self._check_rate_limit("crypto-rpc", tokens_used=0)
+
+        if int(headers["x-ratelimit-remaining-requests"]) <= 0:
+            return web.Response(
+                status=429,
+                headers=headers,
+                text=json.dumps({"error": "Rate limit exceeded"}),
+                content_type="application/json",
+            )
+
+        await asyncio.sleep(0.05)
+
+        data = await request.json()
+        items = data if isinstance(data, list) else [data]
+        results = [
+            {"jsonrpc": "2.0", "id": item.get("id"), "result": hex(int(time.time()))}
+            for item in items
+        ]
+        # Batch answers are not guaranteed to keep request order
+        body: Any = results[::-1] if isinstance(data, list) else results[0]
+        headers["x-venice-rpc-credits"] = str(len(items))
+        return web.Response(
+            status=200, headers=headers, text=json.dumps(body), content_type="application/json"
+        )
+
     async def handle_models(self, request: web.Request) -> web.Response:
         # Models endpoint uses a default bucket
         headers = self._check_rate_limit("venice-uncensored")
@@ -85,13 +85,23 @@ if TYPE_CHECKING:
 
 from ._client import VeniceClient
 from ._sync_client import SyncVeniceClient
+from .cache import (
+    CacheRule,
+    FileCacheStore,
+    MemoryCacheStore,
+    RedisCacheStore,
+    ResponseCache,
+)
 from .core import (
     RateLimitBucket,
     RateLimitDiscovery,
     RedisBackendConfig,
 )
+from .core.job_poller import JobPoller
+from .core.model_fallback import ModelFallback
 from .core.models.common import Tool, ToolChoice, ToolFunction
 from .core.models.headers import BalanceInfo, DeprecationInfo, RateLimitInfo
+from .core.retry_budget import RetryBudget
 from .costs import (
     BudgetManager,
     BudgetRemaining,
@@ -112,6 +122,7 @@ from .exceptions import (
     APITimeoutError,
     AuthenticationError,
     BillingTimeoutError,
+    ChecksumMismatchError,
     ConflictError,
     InternalServerError,
     InvalidRequestError,
@@ -133,13 +144,17 @@ from .exceptions import (
 from .helpers import (
     Conversation,
     cosine_similarity,
+    cosine_similarity_matrix,
+    decode_embedding,
     detect_image_format,
     extract_thinking_blocks,
     fit_image_bytes,
     tool_from_function,
     tool_from_model,
+    top_k,
 )
 from .middleware.retry import RetryOptions
+from .models.catalog import ModelCatalog
 from .models.selection import (
     CheapestVideoResult,
     DynamicModelSelector,
@@ -150,10 +165,12 @@ from .rate_limiting import (
     RateLimiterMode,
     SimpleRateLimiter,
 )
+from .resources.crypto import RpcBatcher
+from .resources.embeddings import EmbeddingBatcher
 from .resources.image import ImageJob
 from .resources.music import Music, MusicJob
 from .resources.video import VideoJob
-from .streaming import BytesResponse, ChatStream, Stream
+from .streaming import BytesResponse, ChatStream, Stream, StreamAccumulator
 from .types.api.audio import AudioResponse
 from .types.api.capabilities import (
     Capabilities,
@@ -198,8 +215,9 @@ from .types.api.requests.responses import ResponsesRequest
 from .types.api.responses import (
     ResponsesResponse,
 )
-from .types.api.streaming import ChatCompletionChunk
+from .types.api.streaming import ChatCompletionChunk, ChatCompletionChunkView
 from .utils import build_model_id, get_filtered_models
+from .vector import SearchHit, SemanticSearch, VectorIndex
 
 # ── Lazy-loaded enterprise / optional imports ────────────────────────────────
 # These modules import redis, pydantic-settings, etc.  We defer loading them
@@ -258,6 +276,7 @@ __all__ = [
     # Streaming & response wrappers
     "Stream",
     "ChatStream",
+    "StreamAccumulator",
     "BytesResponse",
     # Common request types
     "TextContent",
@@ -282,6 +301,7 @@ __all__ = [
     # Response types
     "ChatCompletionResponse",
     "ChatCompletionChunk",
+    "ChatCompletionChunkView",
     "ChatUsage",
     "ParsedChatCompletion",
     "ToolCall",
@@ -310,6 +330,9 @@ __all__ = [
     "Conversation",
     # Vector similarity
     "cosine_similarity",
+    "cosine_similarity_matrix",
+    "decode_embedding",
+    "top_k",
     # Image utilities
     "detect_image_format",
     "fit_image_bytes",
@@ -321,6 +344,11 @@ __all__ = [
     "BalanceInfo",
     # Retry options
     "RetryOptions",
+    "RetryBudget",
+    # Job polling
+    "JobPoller",
+    # Model fallback
+    "ModelFallback",
     # Rate limiting (core)
     "RateLimitDiscovery",
     "RateLimitBucket",
@@ -344,6 +372,7 @@ __all__ = [
     "CheapestVideoResult",
     "DynamicModelSelector",
     "create_model_selector",
+    "ModelCatalog",
     # Model selection helpers (lazy)
     "get_chat_model",
     "get_embedding_model",
@@ -353,6 +382,14 @@ __all__ = [
     "create_production_config",
     "create_development_config",
     "create_testing_config",
+    # Embedding micro-batching
+    "EmbeddingBatcher",
+    # JSON-RPC micro-batching
+    "RpcBatcher",
+    # Local vector search
+    "VectorIndex",
+    "SemanticSearch",
+    "SearchHit",
     # Image job abstraction
     "ImageJob",
     # Video job abstraction
@@ -363,6 +400,7 @@ __all__ = [
     # Exceptions
     "VideoGenerationError",
     "MusicGenerationError",
+    "ChecksumMismatchError",
     "VeniceAPIErrorCode",
     "VeniceError",
     "APIError",
@@ -399,6 +437,12 @@ __all__ = [
     "CostRecord",
     "CostSummary",
     "BudgetRemaining",
+    # Response caching
+    "ResponseCache",
+    "CacheRule",
+    "MemoryCacheStore",
+    "RedisCacheStore",
+    "FileCacheStore",
 ]
 
 try:
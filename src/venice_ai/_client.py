@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import logging
 import os
-from collections.abc import AsyncIterator, Awaitable, Iterable
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    BinaryIO,
     cast,
 )
 
@@ -17,24 +19,33 @@ import aiohttp
 from pydantic import BaseModel, ValidationError
 from yarl import URL
 
-from . import _constants
+from . import _constants, _download
+from ._download import DEFAULT_CHUNK_SIZE, DEFAULT_PART_SIZE
+from ._sse import JSON_DECODE_ERRORS, SSEDecoder, json_loads
 from .core.http_client import _extract_rate_limit_headers
+from .core.job_poller import JobPoller
+from .core.model_fallback import ModelFallback, ModelFallbackStats
+from .core.retry_budget import RetryBudget, retry_scope
+from .core.single_flight import SingleFlight, SingleFlightStats
 from .exceptions import (
     APIError,
     APIResponseProcessingError,
     APIResponseValidationError,
+    APITimeoutError,
     _make_status_error,
 )
 from .middleware import RetryOptions
+from .models.catalog import ModelCatalog
 from .rate_limiting import RateLimiterProtocol
+from .rate_limiting.token_estimation import CharTokenEstimator, completion_budget
 from .resources.api_keys import ApiKeys
 from .resources.audio import Audio
 from .resources.augment import Augment
 from .resources.billing import Billing
 from .resources.characters import Characters
 from .resources.chat import ChatResource
-from .resources.crypto import Crypto
-from .resources.embeddings import Embeddings
+from .resources.crypto import Crypto, RpcBatcher
+from .resources.embeddings import EmbeddingBatcher, Embeddings
 from .resources.image import Image
 from .resources.models import Models
 from .resources.music import Music
@@ -50,11 +61,19 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from .auth.x402 import X402Auth
     from .auth.x402_solana import SolanaX402Auth
+    from .cache import ResponseCache
+    from .core.backends.base import AccountBackend
     from .core.config import VeniceAIConfig
     from .core.http_client import VeniceHTTPClient
     from .costs import CostTracker
 
 
+def _usage_total_tokens(item: Any, current: int | None) -> int | None:
+    """Return ``item.usage.total_tokens`` when the chunk reports usage, else ``current``."""
+    total = getattr(getattr(item, "usage", None), "total_tokens", None)
+    return total if isinstance(total, int) else current
+
+
 class VeniceClient:
     """
     Asynchronous client for the Venice AI API.
@@ -72,6 +91,18 @@ class VeniceClient:
     _session_lock: asyncio.Lock
     _is_closed: bool = False
     _should_close_session: bool
+    _single_flight: SingleFlight | None = None
+    _response_cache: ResponseCache | None = None
+    _cache_scope: str | None = None
+    _account_backend: AccountBackend | None = None
+    _retry_budget: RetryBudget | None = None
+    _job_poller: JobPoller | None = None
+    _owns_job_poller: bool = True
+    _model_catalog: ModelCatalog | None = None
+    _model_fallback: ModelFallback | None = None
+    _request_batching: bool = False
+    _embedding_batcher: EmbeddingBatcher | None = None
+    _rpc_batcher: RpcBatcher | None = None
 
     chat: ChatResource
     responses: Responses
@@ -156,6 +187,14 @@ class VeniceClient:
         skip_auto_headers: list[str] | NotGiven = NOT_GIVEN,
         retry_options: RetryOptions | NotGiven = NOT_GIVEN,
         cost_tracker: CostTracker | None = None,
+        coalesce_requests: bool = False,
+        response_cache: ResponseCache | None = None,
+        account_backend: AccountBackend | None = None,
+        retry_budget: RetryBudget | None | NotGiven = NOT_GIVEN,
+        job_poller: JobPoller | None = None,
+        model_catalog: ModelCatalog | None = None,
+        model_fallbacks: Mapping[str, str] | ModelFallback | None = None,
+        batch_requests: bool | None = None,
     ) -> None:
         """
         Initializes the asynchronous VeniceClient.
@@ -216,6 +255,58 @@ class VeniceClient:
             cost_tracker: Optional :class:`CostTracker` that the SDK will
                 feed every chat-completion and embeddings response into,
                 automatically. When ``None`` (default) no tracking is wired.
+            coalesce_requests: When ``True``, concurrent identical idempotent
+                requests (``GET``/``HEAD``, plus ``POST /embeddings``) share a
+                single HTTP round-trip and the same parsed result. Keys cover
+                method, path, canonicalised body/params, headers and the
+                response model. Counters are exposed via
+                :attr:`coalescing_stats`. Defaults to ``False``.
+            response_cache: Optional :class:`~venice_ai.cache.ResponseCache`
+                serving repeated deterministic requests (per-endpoint opt-in,
+                TTL, stale-while-revalidate). Hits are reported to
+                ``cost_tracker`` as savings. When ``None`` (default) nothing
+                is cached.
+            account_backend: Optional
+                :class:`~venice_ai.core.backends.AccountBackend` shared with
+                other workers. Streaming requests reserve their estimated
+                token budget in it before sending and refund the unused part
+                from the final ``usage`` when the stream ends or is closed.
+                When ``None`` (default) streams are not reserved.
+            retry_budget: :class:`~venice_ai.core.retry_budget.RetryBudget`
+                shared by the retry middleware and the rate limiter, so a
+                request's retries across both layers draw from one per-model
+                and global allowance (20% of recent requests by default) and
+                no retry starts that cannot finish before the request's total
+                timeout. A default budget is created when omitted; pass
+                ``None`` to keep only the deadline check.
+            job_poller: :class:`~venice_ai.core.job_poller.JobPoller` that
+                ``VideoJob.wait()`` / ``MusicJob.wait()`` register with, so
+                all queued jobs are polled from one task at adaptive,
+                rate-capped intervals. A poller is created on first use when
+                omitted and closed with the client; a supplied one is left
+                open, so it can be shared between clients.
+            model_catalog: :class:`~venice_ai.models.catalog.ModelCatalog`
+                that ``models.get()``, ``models.get_capabilities()`` and the
+                model selector read the ``/models`` catalog from. Pass one
+                backed by a ``FileCacheStore`` or ``RedisCacheStore`` to share
+                the catalog across processes. Defaults to
+                :meth:`ModelCatalog.from_env`, namespaced by ``base_url``.
+            model_fallbacks: ``model -> fallback model`` map, or a configured
+                :class:`~venice_ai.core.model_fallback.ModelFallback`. A
+                request for a model the rate limiter (or ``account_backend``)
+                is holding back is sent to its first fallback that can
+                proceed, and a 429 or 503 is retried on the next one.
+                Defaults to ``config.scheduler.model_fallbacks``; counters
+                are exposed via :attr:`model_fallback_stats`.
+            batch_requests: When ``True``, concurrent small
+                ``embeddings.create`` calls with the same model and options
+                are merged into one request and the response is split back
+                (see :attr:`embedding_batcher`), and concurrent
+                ``crypto.rpc`` calls for the same network are sent as one
+                JSON-RPC batch (see :attr:`rpc_batcher`). Batches hold up to
+                ``config.state.batch_size`` inputs and wait at most
+                ``config.state.batch_timeout`` seconds for company. Defaults
+                to ``config.scheduler.enable_request_batching``.
         """
         # --- API key / auth resolution ---
         # Either an api_key (Bearer) or a wallet auth (X402Auth / SolanaX402Auth,
@@ -277,6 +368,15 @@ class VeniceClient:
         self._skip_auto_headers = skip_auto_headers
         self._retry_options = retry_options
         self._cost_tracker = cost_tracker
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._response_cache = response_cache
+        self._account_backend = account_backend
+        self._retry_budget = (
+            RetryBudget() if retry_budget is NOT_GIVEN else cast(RetryBudget | None, retry_budget)
+        )
+        self._job_poller = job_poller
+        self._owns_job_poller = job_poller is None
+        self._model_catalog = model_catalog
 
         # --- Rate limiter configuration ---
         if http_client is None:
@@ -297,6 +397,33 @@ class VeniceClient:
                 self._rate_limiter_config_path = None
 
         self._config = config
+        if isinstance(model_fallbacks, ModelFallback):
+            self._model_fallback = model_fallbacks
+        else:
+            if model_fallbacks is None and config is not None:
+                model_fallbacks = config.scheduler.model_fallbacks
+            self._model_fallback = ModelFallback(model_fallbacks) if model_fallbacks else None
+        if (
+            self._model_fallback is not None
+            and self._model_fallback.equivalents
+            and self._model_fallback.selector is None
+        ):
+            from .models.selection import DynamicModelSelector
+
+            self._model_fallback.selector = DynamicModelSelector(self)
+
+        if batch_requests is None:
+            batch_requests = config is not None and config.scheduler.enable_request_batching
+        self._request_batching = batch_requests
+        if config is not None:
+            self._batch_size = config.state.batch_size
+            self._batch_window = config.state.batch_timeout
+        else:
+            from .core.config import StateConfig
+
+            state_defaults = StateConfig()
+            self._batch_size = state_defaults.batch_size
+            self._batch_window = state_defaults.batch_timeout
         self._venice_http_client: VeniceHTTPClient | None = None
 
         if http_client:
@@ -363,6 +490,73 @@ class VeniceClient:
         self.crypto = Crypto(self)
         self.tee = Tee(self)
 
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """The :class:`~venice_ai.cache.ResponseCache` wired on this client, if any."""
+        return self._response_cache
+
+    @property
+    def cache_scope(self) -> str:
+        """Fingerprint of the base URL and credential that scopes response-cache keys."""
+        if self._cache_scope is None:
+            from .cache import credential_scope
+
+            credential = self._api_key or (self._auth.wallet_address if self._auth else "")
+            self._cache_scope = credential_scope(self.base_url, credential)
+        return self._cache_scope
+
+    @property
+    def retry_budget(self) -> RetryBudget | None:
+        """The :class:`~venice_ai.core.retry_budget.RetryBudget` shared by both retry layers."""
+        return self._retry_budget
+
+    @property
+    def job_poller(self) -> JobPoller:
+        """The :class:`~venice_ai.core.job_poller.JobPoller` that waits on queued jobs."""
+        if self._job_poller is None:
+            self._job_poller = JobPoller()
+        return self._job_poller
+
+    @property
+    def model_catalog(self) -> ModelCatalog:
+        """The :class:`~venice_ai.models.catalog.ModelCatalog` caching the ``/models`` listing."""
+        if self._model_catalog is None:
+            self._model_catalog = ModelCatalog.from_env(namespace=self.base_url)
+        return self._model_catalog
+
+    @property
+    def coalescing_stats(self) -> SingleFlightStats | None:
+        """Single-flight counters, or ``None`` unless ``coalesce_requests=True``."""
+        return self._single_flight.stats if self._single_flight is not None else None
+
+    @property
+    def request_batching(self) -> bool:
+        """Whether ``embeddings.create`` and ``crypto.rpc`` calls are merged (``batch_requests``)."""
+        return self._request_batching
+
+    @property
+    def embedding_batcher(self) -> EmbeddingBatcher:
+        """The :class:`EmbeddingBatcher` merging ``embeddings.create`` calls (``batch_requests``)."""
+        if self._embedding_batcher is None:
+            self._embedding_batcher = self.embeddings.batcher(
+                max_batch_size=self._batch_size, max_wait_ms=self._batch_window * 1000
+            )
+        return self._embedding_batcher
+
+    @property
+    def rpc_batcher(self) -> RpcBatcher:
+        """The :class:`~venice_ai.resources.crypto.RpcBatcher` behind ``crypto.rpc(batch=True)``."""
+        if self._rpc_batcher is None:
+            self._rpc_batcher = self.crypto.batcher(
+                max_batch_size=self._batch_size, max_wait_ms=self._batch_window * 1000
+            )
+        return self._rpc_batcher
+
+    @property
+    def model_fallback_stats(self) -> ModelFallbackStats | None:
+        """Model fallback counters, or ``None`` unless fallbacks are configured."""
+        return self._model_fallback.stats if self._model_fallback is not None else None
+
     # -------------------------------------------------------------------
     # Cost tracker wiring
     # -------------------------------------------------------------------
@@ -520,6 +714,9 @@ class VeniceClient:
         responses). The session's auth headers ride along; CDN endpoints typically
         ignore unrecognized auth.
 
+        The whole body is buffered in memory; use :meth:`download_to` to
+        stream large assets to disk.
+
         :param url: Absolute URL to fetch.
         :return: Response body as ``bytes``.
         :raises aiohttp.ClientResponseError: If the response status is >= 400.
@@ -529,6 +726,51 @@ class VeniceClient:
             resp.raise_for_status()
             return await resp.read()
 
+    async def download_to(
+        self,
+        url: str,
+        destination: str | os.PathLike[str] | BinaryIO,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        checksum: str | None = None,
+        parallel: int = 1,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_resumes: int = 3,
+    ) -> int:
+        """Stream an absolute URL into a file path or binary file-like object.
+
+        The streaming counterpart of :meth:`fetch_external` for large assets
+        (video renders, music clips): chunks are written off the event loop as
+        they arrive, so memory stays at about ``chunk_size`` per download.
+        A dropped connection is resumed with an HTTP ``Range`` request, and
+        path destinations are written to ``<name>.part`` and renamed on
+        success. Uses the client's managed session; the session's total
+        timeout is replaced by connect / read-stall limits so long downloads
+        are not cut off.
+
+        :param url: Absolute URL to fetch.
+        :param destination: File path (parents are created) or writable binary file.
+        :param chunk_size: Bytes per read/write.
+        :param checksum: Optional ``"algorithm:hexdigest"`` (bare hex means sha256).
+        :param parallel: Concurrent ranged requests for large files (paths only).
+        :param part_size: Bytes per ranged request when ``parallel > 1``.
+        :param max_resumes: ``Range`` resumes allowed after disconnects.
+        :return: Number of bytes written.
+        :raises aiohttp.ClientResponseError: If the response status is >= 400.
+        :raises ChecksumMismatchError: If the content does not match ``checksum``.
+        """
+        session = await self._get_session()
+        return await _download.download(
+            session,
+            url,
+            destination,
+            chunk_size=chunk_size,
+            checksum=checksum,
+            max_resumes=max_resumes,
+            parallel=parallel,
+            part_size=part_size,
+        )
+
     async def get[T: BaseModel](
         self,
         path: str,
@@ -857,6 +1099,13 @@ class VeniceClient:
         self._siwe_cache = (header, expires_at)
         return header
 
+    def _total_timeout(self, timeout: float | aiohttp.ClientTimeout | None) -> float | None:
+        """Total seconds allowed for a request (``timeout`` or the client default)."""
+        timeout_value = timeout if timeout is not None else self._timeout
+        if isinstance(timeout_value, aiohttp.ClientTimeout):
+            return timeout_value.total
+        return float(timeout_value)
+
     async def _prepare_and_send_request(
         self,
         method: str,
@@ -868,9 +1117,62 @@ class VeniceClient:
         params: dict[str, Any] | None = None,
         timeout: float | aiohttp.ClientTimeout | None = None,
         force_direct: bool = False,
+        sender: Callable[..., Awaitable[aiohttp.ClientResponse]] | None = None,
     ) -> aiohttp.ClientResponse:
         """Shared request lifecycle for ``_request()`` and ``_stream_request()``.
 
+        Sends the request via :meth:`_send_request`, or ``sender`` when given
+        (it takes the same arguments). When model fallbacks are configured and
+        the JSON body names a model, the body's ``model`` is swapped for a
+        fallback as :class:`ModelFallback` decides; ``sender`` then sees the
+        body actually sent.
+        """
+        send_request = sender or self._send_request
+        fallback = self._model_fallback
+        # JSON-RPC batch bodies are lists and never name a model
+        model = json_data.get("model") if isinstance(json_data, dict) else None
+        if fallback is None or force_direct or not isinstance(model, str):
+            return await send_request(
+                method,
+                path,
+                json_data=json_data,
+                data=data,
+                headers=headers,
+                params=params,
+                timeout=timeout,
+                force_direct=force_direct,
+            )
+
+        async def send(target: str) -> aiohttp.ClientResponse:
+            body = json_data if target == model else {**(json_data or {}), "model": target}
+            return await send_request(
+                method,
+                path,
+                json_data=body,
+                data=data,
+                headers=headers,
+                params=params,
+                timeout=timeout,
+            )
+
+        return await fallback.send(
+            model, send, rate_limiter=self.rate_limiter, backend=self._account_backend
+        )
+
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_data: dict[str, Any] | None = None,
+        data: dict[str, Any] | aiohttp.FormData | None = None,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | aiohttp.ClientTimeout | None = None,
+        force_direct: bool = False,
+    ) -> aiohttp.ClientResponse:
+        """Send one request, returning the validated raw response.
+
         Handles rate-limiter routing, session acquisition, header merging, URL
         construction, timeout configuration, request transmission, and initial
         status validation.  Returns the raw response; the caller is responsible
@@ -914,17 +1216,17 @@ class VeniceClient:
                 model_id = params["model"]
 
             # Extract numeric timeout for classification
-            timeout_value = timeout if timeout is not None else self._timeout
-            if isinstance(timeout_value, aiohttp.ClientTimeout):
-                numeric_timeout = timeout_value.total if timeout_value.total else 60.0
-            else:
-                numeric_timeout = float(timeout_value)
+            total_timeout = self._total_timeout(timeout)
+            numeric_timeout = total_timeout if total_timeout else 60.0
 
-            # Create request dict for classification
+            # Create request dict for classification. The body is passed by
+            # reference (not merged) so token estimation sees messages and
+            # max_completion_tokens without copying the payload.
             request_dict = {
                 "model": model_id,
                 "endpoint": path,
                 "timeout": numeric_timeout,
+                "body": json_data,
             }
 
             # Classify request to create metadata
@@ -966,11 +1268,14 @@ class VeniceClient:
 
             # Submit through scheduler for queueing and rate limit management
             logger.debug(f"Routing request through scheduler. Path: {path}, Model: {model_id}")
-            result = await self.rate_limiter.submit_request(
-                metadata,
-                execute_http_request,
-                error_factory=_make_status_error,
-            )
+            with retry_scope(
+                self._retry_budget, str(model_id), timeout=total_timeout, rate_limited=True
+            ):
+                result = await self.rate_limiter.submit_request(
+                    metadata,
+                    execute_http_request,
+                    error_factory=_make_status_error,
+                )
 
             # For INTELLIGENT mode, await the future to get actual response
             if hasattr(result, "request") and result.request and hasattr(result.request, "future"):
@@ -1022,8 +1327,14 @@ class VeniceClient:
 
             from .utils.errors import wrap_aiohttp_errors
 
+            # JSON-RPC batch bodies are lists and never name a model
+            body_model = json_data.get("model") if isinstance(json_data, dict) else None
+            retry_key = body_model or (params or {}).get("model") or path
             async with wrap_aiohttp_errors():
-                response = await session.request(**kwargs)
+                with retry_scope(
+                    self._retry_budget, str(retry_key), timeout=self._total_timeout(timeout)
+                ):
+                    response = await session.request(**kwargs)
 
         # Validate response status (common for both paths)
         if not response.ok:
@@ -1063,6 +1374,26 @@ class VeniceClient:
     # Response handling helpers
     # -------------------------------------------------------------------
 
+    def _record_token_usage(self, json_data: dict[str, Any], response_data: Any) -> None:
+        """Feed a response's ``usage`` back to the classifier's token calibration.
+
+        No-op unless the rate limiter has a classifier exposing
+        ``record_usage`` and the response carries a ``usage`` object.
+        Calibration errors are logged and never fail the request.
+        """
+        if not isinstance(response_data, dict):
+            return
+        usage = response_data.get("usage")
+        if not isinstance(usage, dict):
+            return
+        record_usage = getattr(getattr(self.rate_limiter, "classifier", None), "record_usage", None)
+        if not callable(record_usage):
+            return
+        try:
+            record_usage(json_data, usage)
+        except Exception as e:  # noqa: BLE001 — calibration must never fail a request
+            logger.debug(f"Token calibration update failed: {e}")
+
     def _handle_empty_response(
         self,
         response: Any,
@@ -1135,6 +1466,105 @@ class VeniceClient:
             The parsed response, which can be a Pydantic model, a dictionary,
             or a raw `aiohttp.ClientResponse`.
         """
+        if raw_response or files or data:
+            return await self._send_and_parse(
+                method,
+                path,
+                json_data=json_data,
+                data=data,
+                files=files,
+                headers=headers,
+                params=params,
+                cast_to=cast_to,
+                raw_response=raw_response,
+                timeout=timeout,
+                force_direct=force_direct,
+            )
+
+        async def fetch() -> Any:
+            return await self._send_shared(
+                method,
+                path,
+                json_data=json_data,
+                headers=headers,
+                params=params,
+                cast_to=cast_to,
+                timeout=timeout,
+                force_direct=force_direct,
+            )
+
+        # Response cache sits in front of single-flight: hits never reach the
+        # network, and concurrent misses for the same key still coalesce.
+        if self._response_cache is not None:
+            return await self._response_cache.get_or_fetch(
+                method,
+                path,
+                json_data=json_data,
+                params=params,
+                cast_to=cast_to,
+                fetch=fetch,
+                cost_tracker=self._cost_tracker,
+                scope=self.cache_scope,
+            )
+        return await fetch()
+
+    async def _send_shared[T: BaseModel](
+        self,
+        method: str,
+        path: str,
+        *,
+        json_data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        params: dict[str, Any] | None,
+        cast_to: type[T] | None,
+        timeout: float | aiohttp.ClientTimeout | None,
+        force_direct: bool,
+    ) -> T | Any:
+        """Send a JSON request, sharing it with identical in-flight callers if enabled."""
+
+        def send() -> Awaitable[T | Any]:
+            return self._send_and_parse(
+                method,
+                path,
+                json_data=json_data,
+                headers=headers,
+                params=params,
+                cast_to=cast_to,
+                timeout=timeout,
+                force_direct=force_direct,
+            )
+
+        # Single-flight: concurrent identical idempotent requests share one
+        # round-trip and one parsed result (opt-in, see ``coalesce_requests``).
+        if self._single_flight is not None:
+            key = self._single_flight.key_for(
+                method,
+                path,
+                json_data=json_data,
+                params=params,
+                headers=headers,
+                discriminator=cast_to.__qualname__ if cast_to else "",
+            )
+            if key is not None:
+                return await self._single_flight.do(key, send)
+        return await send()
+
+    async def _send_and_parse[T: BaseModel](
+        self,
+        method: str,
+        path: str,
+        *,
+        json_data: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        files: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        cast_to: type[T] | None = None,
+        raw_response: bool = False,
+        timeout: float | aiohttp.ClientTimeout | None = None,
+        force_direct: bool = False,
+    ) -> T | Any | aiohttp.ClientResponse | bytes:
+        """Send one request and parse the response (the body of :meth:`_request`)."""
         # Handle file uploads with aiohttp.FormData
         form_data_to_send = None
         if files:
@@ -1190,6 +1620,9 @@ class VeniceClient:
                 "Failed to parse JSON response", original_error=e, response=response
             ) from e
 
+        if json_data is not None and self.rate_limiter is not None:
+            self._record_token_usage(json_data, response_data)
+
         # Handle model validation
         if cast_to:
             try:
@@ -1271,6 +1704,7 @@ class VeniceClient:
         params: dict[str, Any] | None = None,
         cast_to: type[T],
         timeout: float | aiohttp.ClientTimeout | None = None,
+        chunk_factory: Callable[[dict[str, Any]], Any] | None = None,
     ) -> AsyncIterator[T]:
         """
         Makes a streaming HTTP request to the Venice AI API.
@@ -1286,10 +1720,34 @@ class VeniceClient:
             params: Query parameters for the request.
             cast_to: The Pydantic model to cast each event to.
             timeout: The timeout for the request.
+            chunk_factory: Optional callable applied to each decoded JSON
+                object *instead of* ``cast_to.model_validate`` — used by
+                validation-free streaming modes to wrap the dict in a
+                lightweight view. In-band error frames are still raised.
 
         Yields:
             An asynchronous iterator of Pydantic models.
         """
+        # With an account backend, hold the estimated token budget for the
+        # whole stream; it is settled against the final ``usage`` below. It is
+        # taken per attempt, after model fallback has picked the model, so it
+        # is always charged to the model that serves the stream.
+        reservation: tuple[str, str, int] | None = None
+
+        async def send_reserved(
+            method: str, path: str, *, json_data: dict[str, Any] | None = None, **kwargs: Any
+        ) -> aiohttp.ClientResponse:
+            nonlocal reservation
+            reservation = await self._reserve_stream_tokens(json_data, timeout)
+            try:
+                return await self._send_request(method, path, json_data=json_data, **kwargs)
+            except BaseException:
+                if reservation is not None:
+                    await self._release_stream_tokens(reservation, 0)
+                    reservation = None
+                raise
+
+        used_tokens: int | None = None
         # Use the consolidated helper to prepare and send the request
         response = await self._prepare_and_send_request(
             method,
@@ -1298,10 +1756,13 @@ class VeniceClient:
             headers=headers,
             params=params,
             timeout=timeout,
+            sender=send_reserved,
         )
 
-        # Process the response as a streaming iterator
-        # For SSE (Server-Sent Events), we need to read line by line
+        # Process the response as a streaming iterator. Bytes go straight into
+        # the incremental SSE decoder; frames come out with their ``data``
+        # payload still as bytes, ready for the JSON backend.
+        decoder = SSEDecoder()
         try:
             # Check if we're in VCR mode (response has _body attribute and it is populated)
             # This handles VCR cassettes which might not stream properly in all cases
@@ -1311,7 +1772,7 @@ class VeniceClient:
 
             if is_vcr:
                 # VCR compatibility path
-                content = await response.content.read()
+                content: bytes | str = await response.content.read()
 
                 # If read() returned empty but we have vcr_body, use that
                 if not content and vcr_body:
@@ -1320,89 +1781,210 @@ class VeniceClient:
                         content = vcr_body
                     elif hasattr(vcr_body, "string"):
                         content = vcr_body.string
+                    elif isinstance(vcr_body, str):
+                        content = vcr_body
 
                 if content:
                     # Process VCR content as a single block
                     if asyncio.iscoroutine(content):
                         content = await content
 
-                    if isinstance(content, bytes):
-                        full_content = content.decode("utf-8")
-                    else:
-                        full_content = str(content)  # type: ignore[unreachable]
+                    if isinstance(content, str):
+                        content = content.encode("utf-8")
 
-                    lines = full_content.split("\n")
-                    for line in lines:
-                        async for item in self._process_stream_line(line, cast_to, response):
+                    for event in decoder.feed(content):
+                        for item in self._decode_stream_event(
+                            event.data, cast_to, response, chunk_factory
+                        ):
+                            if reservation is not None:
+                                used_tokens = _usage_total_tokens(item, used_tokens)
+                            yield item
+                    for event in decoder.flush():
+                        for item in self._decode_stream_event(
+                            event.data, cast_to, response, chunk_factory
+                        ):
+                            if reservation is not None:
+                                used_tokens = _usage_total_tokens(item, used_tokens)
                             yield item
                 return
 
-            # Real streaming path - iterate line by line
-            async for raw_line in response.content:
-                line_str = raw_line.decode("utf-8").strip()
-                async for item in self._process_stream_line(line_str, cast_to, response):
+            # Real streaming path - feed whatever the transport has buffered
+            async for raw_chunk in response.content.iter_any():
+                for event in decoder.feed(raw_chunk):
+                    for item in self._decode_stream_event(
+                        event.data, cast_to, response, chunk_factory
+                    ):
+                        if reservation is not None:
+                            used_tokens = _usage_total_tokens(item, used_tokens)
+                        yield item
+            for event in decoder.flush():
+                for item in self._decode_stream_event(event.data, cast_to, response, chunk_factory):
+                    if reservation is not None:
+                        used_tokens = _usage_total_tokens(item, used_tokens)
                     yield item
 
         finally:
             # Ensure the response is properly closed
             response.close()
+            if reservation is not None:
+                # Without a final usage report the whole budget counts as used.
+                await self._release_stream_tokens(
+                    reservation, reservation[2] if used_tokens is None else used_tokens
+                )
 
-    async def _process_stream_line[T: BaseModel](
-        self, line_str: str, cast_to: type[T], response: Any | None = None
-    ) -> AsyncIterator[T]:
-        """Helper to process a single line from the stream.
+    async def _reserve_stream_tokens(
+        self,
+        json_data: dict[str, Any] | None,
+        timeout: float | aiohttp.ClientTimeout | None = None,
+    ) -> tuple[str, str, int] | None:
+        """Reserve a streaming request's estimated tokens in the account backend.
 
-        Args:
-            line_str: A single decoded line from the SSE body.
-            cast_to: The Pydantic model each ``data:`` chunk is validated against.
-            response: The originating HTTP response, used to attach context to a
-                raised :class:`~venice_ai.exceptions.APIError` if the server emits
-                an in-band error frame.
+        Waits until the backend grants the reservation, for at most the
+        request's total timeout. Returns ``(model, reservation_id, tokens)``,
+        or ``None`` when no backend is configured or the body names no model.
 
         Raises:
-            APIError: If the line is a well-formed ``data:`` JSON object carrying a
-                top-level ``error`` payload (an in-band error frame). Such frames
-                must surface to the caller rather than be silently dropped, so a
-                truncated stream is distinguishable from a complete one.
+            APITimeoutError: The backend had no capacity before the timeout.
         """
-        line_str = line_str.strip()
+        backend = self._account_backend
+        if backend is None or not json_data:
+            return None
+        model = json_data.get("model")
+        if not isinstance(model, str):
+            return None
 
-        # Skip empty lines and non-data lines
-        if not line_str or not line_str.startswith("data: "):
+        estimate = getattr(getattr(self.rate_limiter, "classifier", None), "estimate_tokens", None)
+        if callable(estimate):
+            tokens = int(estimate(json_data))
+        else:
+            tokens = max(1, CharTokenEstimator().count_prompt_tokens(json_data))
+            tokens += completion_budget(json_data)
+
+        total = self._total_timeout(timeout)
+        deadline = None if total is None else time.monotonic() + total
+        reservation_id = uuid.uuid4().hex
+        while True:
+            allowed, wait = await backend.reserve_streaming(model, reservation_id, tokens)
+            if allowed:
+                return model, reservation_id, tokens
+            wait = max(wait, 0.01)
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise APITimeoutError(
+                    f"No streaming capacity for {model} ({tokens} tokens) within {total:g}s"
+                )
+            logger.debug(f"Stream reservation for {model} waiting {wait:.2f}s ({tokens} tokens)")
+            await asyncio.sleep(wait)
+
+    async def _release_stream_tokens(self, reservation: tuple[str, str, int], used: int) -> None:
+        """Settle a stream reservation, refunding ``reserved - used`` tokens."""
+        backend = self._account_backend
+        if backend is None:
             return
+        model, reservation_id, reserved = reservation
+        try:
+            await backend.release_streaming_reservation(model, reservation_id, reserved, used)
+        except Exception as e:  # noqa: BLE001 — accounting must never fail a stream
+            logger.warning(f"Failed to release stream reservation {reservation_id}: {e}")
+
+    def _decode_stream_event[T: BaseModel](
+        self,
+        data: bytes,
+        cast_to: type[T],
+        response: Any | None = None,
+        chunk_factory: Callable[[dict[str, Any]], Any] | None = None,
+    ) -> Iterator[T]:
+        """Parse one SSE ``data`` payload and yield the validated model, if any.
+
+        Args:
+            data: The frame payload as produced by :class:`~venice_ai._sse.SSEDecoder`.
+            cast_to: The Pydantic model each payload is validated against.
+            response: The originating HTTP response, attached to an in-band
+                :class:`~venice_ai.exceptions.APIError`.
+            chunk_factory: When set, wraps each decoded object instead of
+                validating it against ``cast_to``.
 
+        Raises:
+            APIError: If the payload is a JSON object carrying a top-level
+                ``error`` (an in-band error frame). Such frames must surface to
+                the caller rather than be silently dropped, so a truncated
+                stream is distinguishable from a complete one.
+        """
         # Handle the termination signal
-        if line_str == "data: [DONE]":
-            logger.debug("Found [DONE] signal")
+        if not data or data == b"[DONE]":
             return
 
         try:
-            # Extract JSON from the data: prefix
-            json_str = line_str[6:]  # Remove "data: " prefix
-            data = json.loads(json_str)
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            payload = json_loads(data)
+        except JSON_DECODE_ERRORS as e:
+            if b"\n" in data:
+                # Some producers (and older recorded cassettes) emit one JSON
+                # object per ``data:`` line with no blank line in between, which
+                # the SSE grammar folds into one multi-line payload. Fall back
+                # to treating each line as its own frame.
+                for line in data.split(b"\n"):
+                    yield from self._decode_stream_event(
+                        line.strip(), cast_to, response, chunk_factory
+                    )
+                return
             # Genuinely-malformed / non-JSON keepalive noise: log and skip.
-            logger.debug(f"Failed to parse streaming line: {line_str}, error: {e}")
+            logger.debug(f"Failed to parse streaming frame: {data!r}, error: {e}")
             return
 
         # In-band error frame (e.g. ``data: {"error": "..."}`` or a nested
         # ``{"error": {"message": ..., "code": ...}}``). The HTTP response itself
         # succeeded, so this never reaches the status-code error path; surface it
         # here as an APIError instead of dropping it and ending the stream early.
-        if isinstance(data, dict) and data.get("error"):
-            raise self._make_stream_error(data, response)
+        if isinstance(payload, dict) and payload.get("error"):
+            raise self._make_stream_error(payload, response)
+
+        if chunk_factory is not None:
+            if isinstance(payload, dict):
+                yield chunk_factory(payload)
+            return
 
         try:
             # Use model_validate for proper Pydantic instantiation
             if hasattr(cast_to, "model_validate"):
-                yield cast_to.model_validate(data)
+                yield cast_to.model_validate(payload)
             else:
-                yield cast_to(**data)
+                yield cast_to(**payload)
         except ValidationError as e:
             # A data: frame that isn't an error and doesn't match the chunk
             # schema: log and skip, preserving prior lenient behaviour for
             # forward-compatible / unknown chunk shapes.
-            logger.debug(f"Failed to parse streaming line: {line_str}, error: {e}")
+            logger.debug(f"Failed to parse streaming frame: {data!r}, error: {e}")
+
+    async def _process_stream_line[T: BaseModel](
+        self, line_str: str, cast_to: type[T], response: Any | None = None
+    ) -> AsyncIterator[T]:
+        """Helper to process a single, already-split ``data:`` line.
+
+        Line-oriented entry point kept for callers that split the body
+        themselves; :meth:`_stream_request` feeds raw bytes through
+        :class:`~venice_ai._sse.SSEDecoder` and :meth:`_decode_stream_event`
+        instead.
+
+        Args:
+            line_str: A single decoded line from the SSE body.
+            cast_to: The Pydantic model each ``data:`` chunk is validated against.
+            response: The originating HTTP response, used to attach context to a
+                raised :class:`~venice_ai.exceptions.APIError` if the server emits
+                an in-band error frame.
+
+        Raises:
+            APIError: If the line is a well-formed ``data:`` JSON object carrying a
+                top-level ``error`` payload (an in-band error frame).
+        """
+        line_str = line_str.strip()
+
+        # Skip empty lines and non-data lines
+        if not line_str.startswith("data:"):
+            return
+
+        for item in self._decode_stream_event(
+            line_str[5:].lstrip().encode("utf-8"), cast_to, response
+        ):
+            yield item
 
     @staticmethod
     def _make_stream_error(data: dict[str, Any], response: Any | None) -> APIError:
@@ -1435,6 +2017,22 @@ class VeniceClient:
         if self._is_closed:
             return
 
+        # Send merged requests still waiting for their batch window
+        if self._embedding_batcher is not None:
+            await self._embedding_batcher.aclose()
+        if self._rpc_batcher is not None:
+            await self._rpc_batcher.aclose()
+
+        # Let stale-while-revalidate refreshes finish while the session is open.
+        if self._response_cache is not None:
+            await self._response_cache.aclose()
+        if self._model_catalog is not None:
+            await self._model_catalog.aclose()
+
+        # A caller-supplied poller may be shared with other clients
+        if self._job_poller is not None and self._owns_job_poller:
+            await self._job_poller.close()
+
         if self._venice_http_client is not None:
             try:
                 await self._venice_http_client.close()
@@ -26,3 +26,7 @@ DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=120.0, connect=5.0)
 #: Environment variable to enable rate limiter features
 #: Set to "true" to enable rate limiting functionality
 ENV_RATE_LIMITER_ENABLED = "VENICE_RATE_LIMITER_FEATURES_ENABLED"
+
+#: Directory for the on-disk model catalog cache shared by every process
+#: (see :meth:`venice_ai.models.catalog.ModelCatalog.from_env`)
+ENV_MODEL_CACHE_DIR = "VENICE_MODEL_CACHE_DIR"
@@ -0,0 +1,391 @@
+"""
+Streaming asset downloads for Venice AI
+
+Video renders and music clips are fetched from CDN URLs that can be hundreds
+of megabytes. :func:`download` streams the body to disk (or any binary
+file-like object) chunk by chunk instead of buffering it, so memory stays
+flat at roughly ``chunk_size`` per download:
+
+- Writes are offloaded to a worker thread, one call per chunk.
+- A connection dropped mid-body is resumed with an HTTP ``Range`` request
+  from the last byte written (up to ``max_resumes`` times).
+- ``checksum`` (``"sha256:<hex>"`` or any :mod:`hashlib` algorithm) is
+  verified before the file is moved into place.
+- With ``parallel > 1`` a large file whose server honours ``Range`` is split
+  into ``part_size`` ranges fetched concurrently into a preallocated file.
+
+Path destinations are written to ``<name>.part`` and renamed on success, so
+a failed download never leaves a truncated file under the final name.
+
+Used by :meth:`VeniceClient.download_to` and the ``download`` /
+``download_to`` helpers on :class:`~venice_ai.resources.video.VideoJob`,
+:class:`~venice_ai.resources.music.MusicJob` and
+:class:`~venice_ai.resources.image.ImageJob`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import os
+import re
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import aiohttp
+
+from .exceptions import ChecksumMismatchError
+
+logger = logging.getLogger(__name__)
+
+#: Bytes read from the socket and written per chunk.
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+#: Range size per task for parallel downloads.
+DEFAULT_PART_SIZE = 32 << 20  # 32 MiB
+
+#: Base delay before a resume request; doubles on each resume.
+RESUME_BACKOFF = 0.5
+
+#: Downloads have no total deadline; a stalled socket still fails.
+DEFAULT_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=30.0, sock_read=60.0)
+
+# Disconnects worth resuming from the last byte written.
+_RESUMABLE_ERRORS = (aiohttp.ClientPayloadError, aiohttp.ClientConnectionError, TimeoutError)
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+type Destination = str | os.PathLike[str] | BinaryIO
+
+
+class _Sink:
+    """Sequential writer for one byte range, hashing what it writes when asked."""
+
+    def __init__(
+        self,
+        write: Callable[[bytes], Any],
+        rewind: Callable[[], None] | None,
+        checksum: str | None,
+    ) -> None:
+        self._write = write
+        self._rewind = rewind
+        self._algorithm, self._expected = _parse_checksum(checksum)
+        self._hasher = hashlib.new(self._algorithm) if self._algorithm else None
+        self.written = 0
+
+    async def write(self, chunk: bytes) -> None:
+        await asyncio.to_thread(self._write, chunk)
+        if self._hasher is not None:
+            self._hasher.update(chunk)
+        self.written += len(chunk)
+
+    @property
+    def can_restart(self) -> bool:
+        return self._rewind is not None
+
+    async def restart(self) -> None:
+        """Discard what was written; the server ignored ``Range`` and resent everything."""
+        assert self._rewind is not None
+        await asyncio.to_thread(self._rewind)
+        if self._algorithm:
+            self._hasher = hashlib.new(self._algorithm)
+        self.written = 0
+
+    def verify(self) -> None:
+        if self._hasher is not None:
+            _check_digest(self._algorithm, self._expected, self._hasher.hexdigest())
+
+
+def _parse_checksum(checksum: str | None) -> tuple[str, str]:
+    """Split ``"algo:hex"`` (bare hex means sha256); validate the algorithm."""
+    if not checksum:
+        return "", ""
+    algorithm, sep, digest = checksum.partition(":")
+    if not sep:
+        algorithm, digest = "sha256", checksum
+    algorithm = algorithm.lower()
+    if algorithm not in hashlib.algorithms_available:
+        raise ValueError(f"Unsupported checksum algorithm {algorithm!r}")
+    return algorithm, digest.lower()
+
+
+def _check_digest(algorithm: str, expected: str, actual: str) -> None:
+    if actual != expected:
+        raise ChecksumMismatchError(
+            f"{algorithm} checksum mismatch: expected {expected}, got {actual}",
+            expected=expected,
+            actual=actual,
+        )
+
+
+def _expected_length(resp: aiohttp.ClientResponse, offset: int) -> int | None:
+    """Absolute end offset (exclusive) the response promises, if known."""
+    if resp.status == 206:
+        match = _CONTENT_RANGE.match(resp.headers.get("Content-Range", ""))
+        if match:
+            return int(match.group(2)) + 1
+    if resp.content_length is not None:
+        return offset + resp.content_length
+    return None
+
+
+async def _fetch_range(
+    session: aiohttp.ClientSession,
+    url: str,
+    sink: _Sink,
+    *,
+    start: int = 0,
+    end: int | None = None,
+    chunk_size: int,
+    max_resumes: int,
+    timeout: aiohttp.ClientTimeout,
+) -> None:
+    """Stream bytes ``start..end`` (inclusive; open-ended if ``None``) into ``sink``.
+
+    Disconnects and short bodies are resumed from ``start + sink.written``.
+    """
+    resumes = 0
+    while True:
+        offset = start + sink.written
+        headers: dict[str, str] = {}
+        if offset > 0 or end is not None:
+            headers["Range"] = f"bytes={offset}-{'' if end is None else end}"
+        try:
+            async with session.get(url, headers=headers, timeout=timeout) as resp:
+                resp.raise_for_status()
+                if headers and resp.status != 206:
+                    if start > 0 or end is not None or not sink.can_restart:
+                        raise aiohttp.ClientResponseError(
+                            resp.request_info,
+                            resp.history,
+                            status=resp.status,
+                            message="Server ignored the Range header",
+                        )
+                    # Full body resent from byte 0: start over
+                    await sink.restart()
+                    offset = 0
+                target = _expected_length(resp, offset)
+                async for chunk in resp.content.iter_chunked(chunk_size):
+                    await sink.write(chunk)
+            if target is None or start + sink.written >= target:
+                return
+            raise aiohttp.ClientPayloadError(
+                f"Connection closed after {start + sink.written} of {target} bytes"
+            )
+        except _RESUMABLE_ERRORS as e:
+            if resumes >= max_resumes:
+                raise
+            resumes += 1
+            delay = RESUME_BACKOFF * 2 ** (resumes - 1)
+            logger.info(
+                f"Download of {url} interrupted at byte {start + sink.written} ({e}); "
+                f"resuming in {delay:.1f}s ({resumes}/{max_resumes})"
+            )
+            await asyncio.sleep(delay)
+
+
+async def _probe_size(
+    session: aiohttp.ClientSession, url: str, timeout: aiohttp.ClientTimeout
+) -> int | None:
+    """Total size when the server honours ``Range``, else ``None``."""
+    async with session.get(url, headers={"Range": "bytes=0-0"}, timeout=timeout) as resp:
+        resp.raise_for_status()
+        if resp.status != 206:
+            return None
+        match = _CONTENT_RANGE.match(resp.headers.get("Content-Range", ""))
+        if match is None or match.group(3) == "*":
+            return None
+        return int(match.group(3))
+
+
+async def _download_parallel(
+    session: aiohttp.ClientSession,
+    url: str,
+    part_path: Path,
+    size: int,
+    *,
+    parallel: int,
+    part_size: int,
+    chunk_size: int,
+    max_resumes: int,
+    timeout: aiohttp.ClientTimeout,
+) -> None:
+    """Fetch ``size`` bytes as ``part_size`` ranges, ``parallel`` at a time."""
+
+    def preallocate() -> None:
+        with open(part_path, "wb") as f:
+            f.truncate(size)
+
+    await asyncio.to_thread(preallocate)
+    semaphore = asyncio.Semaphore(parallel)
+
+    async def fetch_part(start: int) -> None:
+        end = min(start + part_size, size) - 1
+        async with semaphore:
+            f = await asyncio.to_thread(open, part_path, "r+b")
+            try:
+                await asyncio.to_thread(f.seek, start)
+                sink = _Sink(f.write, None, None)
+                await _fetch_range(
+                    session,
+                    url,
+                    sink,
+                    start=start,
+                    end=end,
+                    chunk_size=chunk_size,
+                    max_resumes=max_resumes,
+                    timeout=timeout,
+                )
+            finally:
+                await asyncio.to_thread(f.close)
+
+    async with asyncio.TaskGroup() as tg:
+        for start in range(0, size, part_size):
+            tg.create_task(fetch_part(start))
+
+
+def _file_digest(path: Path, algorithm: str, chunk_size: int) -> str:
+    hasher = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+async def download(
+    session: aiohttp.ClientSession,
+    url: str,
+    destination: Destination,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checksum: str | None = None,
+    max_resumes: int = 3,
+    parallel: int = 1,
+    part_size: int = DEFAULT_PART_SIZE,
+    timeout: aiohttp.ClientTimeout | None = None,
+) -> int:
+    """Stream ``url`` into ``destination`` and return the number of bytes written.
+
+    Args:
+        session: Session to issue the requests on.
+        url: Absolute URL to fetch.
+        destination: File path (parents are created) or a binary file-like
+            object with ``write``. File-like objects are written from their
+            current position and left open.
+        chunk_size: Bytes per read/write.
+        checksum: ``"algorithm:hexdigest"`` (bare hex means sha256) to verify.
+        max_resumes: ``Range`` resumes allowed per byte range after a
+            disconnect.
+        parallel: Concurrent ranged requests for large files (path
+            destinations only); ``1`` downloads sequentially.
+        part_size: Bytes per ranged request when ``parallel > 1``; files
+            smaller than two parts are downloaded sequentially.
+        timeout: Per-request timeout; defaults to no total limit with
+            connect and read-stall limits.
+
+    Raises:
+        aiohttp.ClientResponseError: If the server answers with status >= 400.
+        aiohttp.ClientPayloadError: If the body is still incomplete after
+            ``max_resumes`` resumes.
+        ChecksumMismatchError: If the content does not match ``checksum``.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be > 0, got {chunk_size}")
+    timeout = timeout if timeout is not None else DEFAULT_DOWNLOAD_TIMEOUT
+
+    if not isinstance(destination, (str, os.PathLike)):
+        return await _download_to_file(
+            session, url, destination, chunk_size, checksum, max_resumes, timeout
+        )
+
+    path = Path(destination)
+    part_path = path.with_name(path.name + ".part")
+    await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+    try:
+        size = await _probe_size(session, url, timeout) if parallel > 1 else None
+        if size is not None and size >= 2 * part_size:
+            await _download_parallel(
+                session,
+                url,
+                part_path,
+                size,
+                parallel=parallel,
+                part_size=part_size,
+                chunk_size=chunk_size,
+                max_resumes=max_resumes,
+                timeout=timeout,
+            )
+            algorithm, expected = _parse_checksum(checksum)
+            if algorithm:
+                actual = await asyncio.to_thread(_file_digest, part_path, algorithm, chunk_size)
+                _check_digest(algorithm, expected, actual)
+            written = size
+        else:
+            f = await asyncio.to_thread(open, part_path, "wb")
+            try:
+                written = await _stream_into(
+                    session, url, f, chunk_size, checksum, max_resumes, timeout, rewind=True
+                )
+            finally:
+                await asyncio.to_thread(f.close)
+        await asyncio.to_thread(os.replace, part_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            part_path.unlink(missing_ok=True)
+        raise
+    return written
+
+
+async def _download_to_file(
+    session: aiohttp.ClientSession,
+    url: str,
+    f: BinaryIO,
+    chunk_size: int,
+    checksum: str | None,
+    max_resumes: int,
+    timeout: aiohttp.ClientTimeout,
+) -> int:
+    seekable = False
+    with contextlib.suppress(AttributeError, OSError, ValueError):
+        seekable = f.seekable()
+    return await _stream_into(
+        session, url, f, chunk_size, checksum, max_resumes, timeout, rewind=seekable
+    )
+
+
+async def _stream_into(
+    session: aiohttp.ClientSession,
+    url: str,
+    f: BinaryIO,
+    chunk_size: int,
+    checksum: str | None,
+    max_resumes: int,
+    timeout: aiohttp.ClientTimeout,
+    *,
+    rewind: bool,
+) -> int:
+    origin = f.tell() if rewind else 0
+
+    def restart() -> None:
+        f.seek(origin)
+        f.truncate()
+
+    sink = _Sink(f.write, restart if rewind else None, checksum)
+    await _fetch_range(
+        session, url, sink, chunk_size=chunk_size, max_resumes=max_resumes, timeout=timeout
+    )
+    sink.verify()
+    return sink.written
+
+
+async def write_bytes(destination: Destination, data: bytes) -> None:
+    """Write in-memory ``data`` to a path or binary file-like object off the event loop."""
+    if isinstance(destination, (str, os.PathLike)):
+        path = Path(destination)
+        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+        await asyncio.to_thread(path.write_bytes, data)
+    else:
+        await asyncio.to_thread(destination.write, data)
@@ -1,16 +1,26 @@
 """Request classification for Venice AI SDK rate limiting.
 
 Classifies requests by endpoint pattern and model name into ResourceType
-categories (LLM, IMAGE, AUDIO, EMBEDDING, etc.) for queue routing.
+categories (LLM, IMAGE, AUDIO, EMBEDDING, etc.) for queue routing, and
+estimates the tokens an LLM request will consume for TPM budgeting.
 """
 
 import logging
+import math
 import re
 import uuid
+from collections.abc import Mapping
 from typing import Any
 
 from ._queue_types import RequestMetadata, ResourceType
 from .core.rate_limit_discovery import RateLimitDiscovery
+from .rate_limiting.token_estimation import (
+    DEFAULT_COMPLETION_TOKENS,
+    CharTokenEstimator,
+    TokenCalibration,
+    TokenEstimator,
+    completion_budget,
+)
 from .validation.validators import validate_priority, validate_timeout
 
 logger = logging.getLogger(__name__)
@@ -198,11 +208,37 @@ class RequestClassifier:
     Uses a two-tier strategy: (1) endpoint regex matching, then (2) model name
     pattern matching as fallback. Defaults to LLM for unknown patterns.
     Also estimates token usage for LLM requests.
+
+    The request dict may carry the outgoing JSON payload under ``"body"``
+    (as :class:`~venice_ai.VeniceClient` does); otherwise the request dict
+    itself is read as the body. Prompt tokens come from ``token_estimator``
+    scaled by the per-model ``calibration`` factor, which
+    :meth:`record_usage` updates from response ``usage``.
     """
 
-    def __init__(self, rate_limit_discovery: RateLimitDiscovery):
-        """Initialize with endpoint and model pattern registries."""
+    def __init__(
+        self,
+        rate_limit_discovery: RateLimitDiscovery,
+        *,
+        token_estimator: TokenEstimator | None = None,
+        calibration: TokenCalibration | None = None,
+        default_completion_tokens: int = DEFAULT_COMPLETION_TOKENS,
+    ):
+        """Initialize with endpoint and model pattern registries.
+
+        Args:
+            rate_limit_discovery: Shared tier/limit discovery.
+            token_estimator: Prompt-token counter; defaults to
+                :class:`CharTokenEstimator` (~4 chars/token).
+            calibration: Per-model correction learned from responses; a fresh
+                :class:`TokenCalibration` by default.
+            default_completion_tokens: Output budget assumed when a request
+                sets no ``max_completion_tokens`` / ``max_tokens``.
+        """
         self.rate_limit_discovery = rate_limit_discovery
+        self.token_estimator: TokenEstimator = token_estimator or CharTokenEstimator()
+        self.calibration = calibration if calibration is not None else TokenCalibration()
+        self.default_completion_tokens = default_completion_tokens
 
         # Reference module-level pre-compiled pattern registries
         self.model_less_endpoints = _MODEL_LESS_ENDPOINTS
@@ -339,45 +375,48 @@ class RequestClassifier:
     def _estimate_tokens(self, request: dict[str, Any]) -> int:
         """Estimate total token count for an LLM request.
 
-        Uses ~4 chars/token heuristic on message content + prompt text,
-        then adds max_completion_tokens (default 150) for expected output.
-        Returns at least 1.
+        Prompt tokens come from :attr:`token_estimator` (at least 1), scaled
+        by the model's calibration factor; the completion budget
+        (``max_completion_tokens`` / ``max_tokens`` / ``max_output_tokens``,
+        default 150, times ``n``) is added for expected output.
         """
-        total_chars = 0
-
-        # Sum character lengths from chat messages
-        messages = request.get("messages", [])
-        for message in messages:
-            if isinstance(message, dict):
-                content = message.get("content", "")
-                if isinstance(content, str):
-                    total_chars += len(content)
-                elif isinstance(content, list):
-                    # Multimodal: extract text portions only
-                    for item in content:
-                        if isinstance(item, dict) and item.get("type") == "text":
-                            total_chars += len(item.get("text", ""))
-
-        # Also count direct prompt text (completion endpoint format)
-        prompt = request.get("prompt", "")
-        if isinstance(prompt, str):
-            total_chars += len(prompt)
-        elif isinstance(prompt, list):
-            for p in prompt:
-                if isinstance(p, str):
-                    total_chars += len(p)
-
-        # ~4 chars per token, minimum 1
-        estimated_tokens = max(1, total_chars // 4)
-
-        # Add expected output tokens
-        max_tokens = request.get("max_completion_tokens", 150)
-        if isinstance(max_tokens, (int, float)):
-            estimated_tokens += int(max_tokens)
-        else:
-            estimated_tokens += 150
+        body = self._body_of(request)
+        prompt_tokens = max(1, self.token_estimator.count_prompt_tokens(body))
+
+        model_id = request.get("model")
+        if isinstance(model_id, str):
+            factor = self.calibration.factor(model_id)
+            if factor != 1.0:
+                prompt_tokens = max(1, math.ceil(prompt_tokens * factor))
+
+        return int(prompt_tokens + completion_budget(body, self.default_completion_tokens))
 
-        return int(estimated_tokens)
+    def estimate_tokens(self, request: dict[str, Any]) -> int:
+        """Estimated total tokens (prompt plus completion budget) for an LLM request body.
+
+        Uses the same calibrated estimate as :meth:`classify`, for callers
+        that need a token count without classifying the request.
+        """
+        return self._estimate_tokens(request)
+
+    def record_usage(self, request: Mapping[str, Any], usage: Mapping[str, Any]) -> None:
+        """Calibrate the estimator against a completed request's ``usage``.
+
+        Args:
+            request: The request body that was sent (must include ``model``).
+            usage: The response's ``usage`` object (``prompt_tokens`` is read).
+        """
+        model_id = request.get("model")
+        actual = usage.get("prompt_tokens")
+        if not isinstance(model_id, str) or not isinstance(actual, int):
+            return
+        estimated = max(1, self.token_estimator.count_prompt_tokens(request))
+        self.calibration.observe(model_id, estimated, actual)
+
+    @staticmethod
+    def _body_of(request: Mapping[str, Any]) -> Mapping[str, Any]:
+        body = request.get("body")
+        return body if isinstance(body, Mapping) else request
 
     def get_resource_type_for_model(self, model_id: str) -> ResourceType:
         """Classify a model by name only (no endpoint context). Defaults to LLM."""
@@ -0,0 +1,263 @@
+"""
+Incremental Server-Sent Events decoder.
+
+Streaming endpoints (``chat/completions``, ``responses``) answer with
+``text/event-stream`` bodies. :class:`SSEDecoder` turns the raw bytes coming
+off the socket into :class:`ServerSentEvent` frames without decoding every
+line to ``str`` first: lines are split with :meth:`bytes.splitlines` (which
+handles ``\\n``, ``\\r`` and ``\\r\\n`` in C), field names are compared as
+bytes, and the ``data`` payload stays ``bytes`` so it can be handed straight
+to the JSON parser.
+
+The decoder follows the WHATWG event-stream grammar:
+
+* consecutive ``data:`` lines are joined with ``\\n``;
+* ``event:``, ``id:`` and ``retry:`` fields are tracked (``id`` persists across
+  events, ``retry`` only accepts ASCII digits);
+* lines starting with ``:`` are comments (keepalives) and ignored;
+* a blank line dispatches the pending event;
+* a line terminator split across two network reads (``\\r`` | ``\\n``) is
+  treated as a single terminator.
+
+One deliberate leniency: :meth:`SSEDecoder.flush` dispatches a pending event
+at end-of-stream even if the server never sent the closing blank line. Some
+proxies and recorded cassettes drop the trailing separator, and the final
+frame is usually the one carrying ``usage``.
+
+:func:`json_loads` picks the fastest JSON backend available at import time —
+``orjson``, then ``msgspec``, then the standard library. Neither accelerator
+is a dependency; install one alongside the SDK to opt in. Catch
+:data:`JSON_DECODE_ERRORS` rather than :class:`json.JSONDecodeError` so the
+error handling holds whichever backend is active.
+
+Example::
+
+    decoder = SSEDecoder()
+    async for chunk in response.content.iter_any():
+        for event in decoder.feed(chunk):
+            handle(event.json())
+    for event in decoder.flush():
+        handle(event.json())
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+_BOM = b"\xef\xbb\xbf"
+
+
+def _select_json_backend() -> tuple[str, Callable[[bytes | str], Any], tuple[type[Exception], ...]]:
+    """Return ``(name, loads, decode_errors)`` for the fastest installed backend."""
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError (a ValueError).
+        return "orjson", orjson.loads, (ValueError,)
+
+    try:
+        import msgspec
+    except ImportError:
+        pass
+    else:
+        decoder = msgspec.json.Decoder()
+        return "msgspec", decoder.decode, (ValueError, msgspec.DecodeError)
+
+    return "json", json.loads, (ValueError,)
+
+
+#: Name of the active JSON backend (``"orjson"``, ``"msgspec"`` or ``"json"``).
+JSON_BACKEND: str
+#: Parse a JSON document from ``bytes`` or ``str`` using the active backend.
+json_loads: Callable[[bytes | str], Any]
+#: Exception types raised by :func:`json_loads` for malformed input.
+JSON_DECODE_ERRORS: tuple[type[Exception], ...]
+
+JSON_BACKEND, json_loads, JSON_DECODE_ERRORS = _select_json_backend()
+
+
+@dataclass(slots=True)
+class ServerSentEvent:
+    """A single dispatched SSE frame.
+
+    Attributes:
+        data: The event payload. Multi-line ``data:`` fields are joined with
+            ``b"\\n"``; the trailing separator is not included.
+        event: The ``event:`` field, or ``"message"`` when the frame had none.
+        id: The last event id seen on the stream (persists across frames).
+        retry: The last ``retry:`` value in milliseconds, if any.
+    """
+
+    data: bytes
+    event: str = "message"
+    id: str | None = None
+    retry: int | None = None
+
+    @property
+    def text(self) -> str:
+        """The payload decoded as UTF-8."""
+        return self.data.decode("utf-8")
+
+    def json(self) -> Any:
+        """Parse the payload with the active JSON backend."""
+        return json_loads(self.data)
+
+
+class SSEDecoder:
+    """Bytes-in, events-out incremental parser for ``text/event-stream`` bodies.
+
+    Feed it network chunks of any size with :meth:`feed`; each call returns the
+    events completed by that chunk. Call :meth:`flush` once the body is
+    exhausted to recover a trailing frame that was not followed by a blank
+    line. A decoder instance holds per-stream state and must not be shared
+    between responses.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_skip_lf",
+        "_started",
+        "_data",
+        "_event",
+        "_last_id",
+        "_retry",
+    )
+
+    def __init__(self) -> None:
+        self._buffer = b""
+        self._skip_lf = False
+        self._started = False
+        self._data: list[bytes] = []
+        self._event: bytes | None = None
+        self._last_id: str | None = None
+        self._retry: int | None = None
+
+    @property
+    def last_event_id(self) -> str | None:
+        """The most recent ``id:`` value, for ``Last-Event-ID`` on reconnect."""
+        return self._last_id
+
+    @property
+    def retry(self) -> int | None:
+        """The most recent ``retry:`` value in milliseconds."""
+        return self._retry
+
+    def feed(self, chunk: bytes | bytearray | memoryview) -> list[ServerSentEvent]:
+        """Consume a chunk of the body and return the events it completed.
+
+        Args:
+            chunk: Raw bytes from the response body. Boundaries are arbitrary —
+                a chunk may end mid-line or mid-terminator.
+
+        Returns:
+            Events dispatched by blank lines inside this chunk, in order.
+        """
+        if not chunk:
+            return []
+        data = bytes(chunk)
+
+        if not self._started:
+            self._started = True
+            if data.startswith(_BOM):
+                data = data[3:]
+
+        if self._skip_lf:
+            # The previous chunk ended with "\r"; a leading "\n" here completes
+            # the same CRLF terminator rather than starting a blank line.
+            self._skip_lf = False
+            if data[:1] == b"\n":
+                data = data[1:]
+
+        if self._buffer:
+            data = self._buffer + data
+            self._buffer = b""
+        if not data:
+            return []
+
+        lines = data.splitlines()
+        last = data[-1:]
+        if last == b"\r":
+            self._skip_lf = True
+        elif last != b"\n":
+            # Unterminated tail: keep it for the next chunk.
+            self._buffer = lines.pop()
+
+        events: list[ServerSentEvent] = []
+        for line in lines:
+            event = self._process_line(line)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def flush(self) -> list[ServerSentEvent]:
+        """Finish the stream and return any frame still pending.
+
+        Processes an unterminated final line and dispatches the pending event
+        even without a closing blank line. The decoder is reset for reuse
+        afterwards (the last event id is kept).
+        """
+        events: list[ServerSentEvent] = []
+        if self._buffer:
+            line, self._buffer = self._buffer, b""
+            event = self._process_line(line)
+            if event is not None:
+                events.append(event)
+        event = self._process_line(b"")
+        if event is not None:
+            events.append(event)
+        self._skip_lf = False
+        self._started = False
+        return events
+
+    def _process_line(self, line: bytes) -> ServerSentEvent | None:
+        if not line:
+            return self._dispatch()
+
+        # Fast path: the overwhelming majority of lines are "data: {...}".
+        if line.startswith(b"data:"):
+            value = line[5:]
+            if value[:1] == b" ":
+                value = value[1:]
+            self._data.append(value)
+            return None
+
+        if line[:1] == b":":
+            return None  # comment / keepalive
+
+        name, _, value = line.partition(b":")
+        if value[:1] == b" ":
+            value = value[1:]
+
+        if name == b"data":
+            self._data.append(value)
+        elif name == b"event":
+            self._event = value
+        elif name == b"id" and b"\x00" not in value:
+            self._last_id = value.decode("utf-8", errors="replace")
+        elif name == b"retry" and value.isdigit():
+            self._retry = int(value)
+        # Unknown field names are ignored, per spec.
+        return None
+
+    def _dispatch(self) -> ServerSentEvent | None:
+        parts = self._data
+        event_name = self._event
+        self._event = None
+        if not parts:
+            return None
+        self._data = []
+        payload = parts[0] if len(parts) == 1 else b"\n".join(parts)
+        if not payload and len(parts) == 1:
+            # A lone empty "data:" line leaves an empty buffer: no dispatch.
+            return None
+        return ServerSentEvent(
+            data=payload,
+            event=event_name.decode("utf-8", errors="replace") if event_name else "message",
+            id=self._last_id,
+            retry=self._retry,
+        )
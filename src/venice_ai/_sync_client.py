@@ -14,17 +14,28 @@ Example::
             messages=[{"role": "user", "content": "Hello!"}],
         )
         print(response.choices[0].message.content)
+
+One client can be shared by many threads. Calls from different threads run
+concurrently on the background loop, and :meth:`SyncVeniceClient.map` /
+:meth:`SyncVeniceClient.submit` fan out many requests from a single thread::
+
+    replies = client.map(
+        lambda p: client.async_client.chat.completions.create(model=model, messages=p),
+        conversations,
+        max_concurrency=16,
+    )
 """
 
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import contextlib
 import functools
 import inspect
 import logging
 import threading
-from collections.abc import Iterator
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, Iterator
 from typing import Any
 
 from ._client import VeniceClient
@@ -92,6 +103,21 @@ def _wrap_result(result: Any, run: Any) -> Any:
     return result
 
 
+def _sync_method(attr: Callable[..., Awaitable[Any]], run: Any) -> Callable[..., Any]:
+    """Wrap async method *attr* in a blocking caller.
+
+    The async method is kept on ``_venice_async`` so :meth:`SyncVeniceClient.map`
+    and :meth:`SyncVeniceClient.submit` can schedule it without blocking.
+    """
+
+    @functools.wraps(attr)
+    def sync_method(*args: Any, **kwargs: Any) -> Any:
+        return _wrap_result(run(attr(*args, **kwargs)), run)
+
+    sync_method._venice_async = attr  # type: ignore[attr-defined]
+    return sync_method
+
+
 class _SyncProxy:
     """Generic proxy that converts async method calls into synchronous ones.
 
@@ -120,13 +146,7 @@ class _SyncProxy:
 
         # Async method → wrap in synchronous caller, then wrap result
         if inspect.iscoroutinefunction(attr):
-            run = self._run
-
-            @functools.wraps(attr)
-            def sync_method(*args: Any, **kwargs: Any) -> Any:
-                return _wrap_result(run(attr(*args, **kwargs)), run)
-
-            return sync_method
+            return _sync_method(attr, self._run)
 
         # Sub-resource or namespace containing resources → wrap and cache
         if _should_proxy(attr):
@@ -212,22 +232,158 @@ class SyncVeniceClient:
         self._thread.start()
         self._async_client = VeniceClient(**init_kwargs)
         self._is_closed = False
-        # Active per-block RetryOptions override set by with_retries(). When
-        # not None, _run wraps each submitted coroutine in the async
-        # client's with_retries(options) context manager so the ContextVar
-        # mechanism that powers the async path also applies here.
-        self._retry_override: RetryOptions | None = None
+        # Per-thread RetryOptions override set by with_retries(). When not
+        # None, _submit wraps each coroutine in the async client's
+        # with_retries(options) context manager so the ContextVar mechanism
+        # that powers the async path also applies here. Thread-local so one
+        # client can be shared by threads with different policies.
+        self._retry_local = threading.local()
+
+    def _retry_state(self) -> threading.local:
+        local = self.__dict__.get("_retry_local")
+        if local is None:
+            local = self.__dict__["_retry_local"] = threading.local()
+        return local
+
+    @property
+    def _retry_override(self) -> RetryOptions | None:
+        """The calling thread's active :meth:`with_retries` options, if any."""
+        return getattr(self._retry_state(), "options", None)
+
+    @_retry_override.setter
+    def _retry_override(self, options: RetryOptions | None) -> None:
+        self._retry_state().options = options
+
+    @property
+    def async_client(self) -> VeniceClient:
+        """The wrapped :class:`~venice_ai.VeniceClient`.
+
+        Its methods return coroutines, which is what :meth:`map` and
+        :meth:`submit` expect from a lambda::
+
+            client.map(lambda p: client.async_client.embeddings.create(model=m, input=p), batches)
+        """
+        return self._async_client
+
+    def _submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future[Any]:
+        """Schedule *coro* on the background loop under the caller's retry override."""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "Synchronous SyncVeniceClient methods cannot be called from inside map() or "
+                "submit(); use client.async_client in the callable instead"
+            )
+        options = self._retry_override
+        if options is not None:
+            coro = self._wrap_with_retries(coro, options)
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
 
     def _run(self, coro: Any) -> Any:
         """Submit a coroutine to the background loop and block until done.
 
-        If a :meth:`with_retries` block is active, the coroutine is wrapped
-        in :meth:`VeniceClient.with_retries` first so the override applies.
+        If a :meth:`with_retries` block is active in the calling thread, the
+        coroutine is wrapped in :meth:`VeniceClient.with_retries` first so the
+        override applies.
+        """
+        return self._submit(coro).result()
+
+    def _call(self, fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        """Call *fn* for its awaitable, unwrapping this client's sync methods."""
+        result = getattr(fn, "_venice_async", fn)(*args, **kwargs)
+        if not inspect.isawaitable(result):
+            raise TypeError(
+                f"{getattr(fn, '__qualname__', fn)!r} did not return an awaitable; pass a "
+                "client method or a callable using client.async_client"
+            )
+        return result
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future[Any]:
+        """Start ``fn(*args, **kwargs)`` on the background loop without waiting.
+
+        *fn* is a method of this client (``client.chat.completions.create``)
+        or a callable returning a coroutine (typically via
+        :attr:`async_client`). The caller's :meth:`with_retries` override
+        applies.
+
+        Example::
+
+            futures = [client.submit(client.image.generate, model=m, prompt=p) for p in prompts]
+            images = [f.result() for f in futures]
+
+        :return: A :class:`concurrent.futures.Future` resolving to the call's
+            result. Cancelling it cancels the request.
         """
-        if self._retry_override is not None:
-            coro = self._wrap_with_retries(coro, self._retry_override)
-        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
-        return future.result()
+
+        async def call() -> Any:
+            return _wrap_result(await self._call(fn, args, kwargs), self._run)
+
+        return self._submit(call())
+
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        *,
+        max_concurrency: int = 8,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Call ``fn(item)`` for every item concurrently and return results in order.
+
+        At most *max_concurrency* calls are in flight at once; they run on the
+        background loop, so the calling thread only blocks once for the batch.
+        *fn* follows the same rules as :meth:`submit`.
+
+        Example::
+
+            replies = client.map(
+                lambda p: client.async_client.chat.completions.create(model=m, messages=p),
+                conversations,
+                max_concurrency=16,
+            )
+
+        :param fn: Client method or callable returning a coroutine.
+        :param items: Arguments, consumed lazily as capacity frees up.
+        :param max_concurrency: Upper bound on concurrent calls.
+        :param return_exceptions: Put exceptions in the result list instead of
+            raising the first one (which cancels the calls still running).
+        :return: One result per item, in input order.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        results: list[Any] = self._run(self._map(fn, items, max_concurrency, return_exceptions))
+        return results
+
+    async def _map(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_concurrency: int,
+        return_exceptions: bool,
+    ) -> list[Any]:
+        results: dict[int, Any] = {}
+        pending = enumerate(items)
+
+        async def worker() -> None:
+            # Workers share one iterator, so items are pulled as slots free up
+            for index, item in pending:
+                try:
+                    results[index] = _wrap_result(await self._call(fn, (item,), {}), self._run)
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results[index] = e
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(max_concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        return [results[i] for i in range(len(results))]
 
     async def _wrap_with_retries(self, coro: Any, options: RetryOptions) -> Any:
         async with self._async_client.with_retries(options):
@@ -237,10 +393,11 @@ class SyncVeniceClient:
     def with_retries(self, options: RetryOptions) -> Iterator[None]:
         """Synchronous parallel of :meth:`VeniceClient.with_retries`.
 
-        Within the ``with`` block, every method call on this client runs
-        with *options* as its retry policy; on exit the previous override
-        (or the construction-time default) is restored. Blocks may be
-        nested.
+        Within the ``with`` block, every method call made by the current
+        thread on this client (including :meth:`map` and :meth:`submit`)
+        runs with *options* as its retry policy; on exit the previous
+        override (or the construction-time default) is restored. Blocks may
+        be nested. Other threads sharing the client are unaffected.
 
         Example::
 
@@ -260,13 +417,7 @@ class SyncVeniceClient:
         attr = getattr(self._async_client, name)
 
         if inspect.iscoroutinefunction(attr):
-            run = self._run
-
-            @functools.wraps(attr)
-            def sync_method(*args: Any, **kwargs: Any) -> Any:
-                return _wrap_result(run(attr(*args, **kwargs)), run)
-
-            return sync_method
+            return _sync_method(attr, self._run)
 
         if _should_proxy(attr):
             proxy = _SyncProxy(attr, self._run)
@@ -0,0 +1,75 @@
+"""
+Streaming upload helpers for Venice AI
+
+Audio transcription and voice cloning accept file paths and binary file
+objects that can run to hundreds of megabytes (hour-long WAVs). Instead of
+reading them into memory on the event loop, the multipart body is streamed
+from an open file: aiohttp reads it chunk by chunk in the default executor
+while the request is written, and rewinds it if the retry middleware resends
+the request.
+
+- :func:`open_upload` opens a path in a worker thread. aiohttp closes the
+  handle once the request finishes.
+- :func:`borrow_file` wraps a caller-owned file so it is streamed from its
+  current position and left open afterwards.
+- :func:`b64encode` base64-encodes content for JSON bodies in a worker
+  thread, so multi-megabyte images do not stall the event loop.
+
+Used by :class:`~venice_ai.resources.audio.Audio` and
+:class:`~venice_ai.resources.image.Image`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import io
+import os
+from typing import Any, BinaryIO
+
+from aiohttp import payload
+
+#: Content below this size is encoded inline; a thread hop would cost more.
+INLINE_B64_LIMIT = 64 << 10  # 64 KiB
+
+
+class _BorrowedFilePayload(payload.IOBasePayload):
+    """Streams a caller-owned file and leaves it open when the request ends."""
+
+    def _close(self) -> None:
+        self._consumed = True
+
+
+def is_streamable(file: Any) -> bool:
+    """Whether ``file`` is a binary file worth streaming rather than reading.
+
+    In-memory buffers are excluded: reading them does no I/O and aiohttp
+    would copy them anyway.
+    """
+    return isinstance(file, io.IOBase) and not isinstance(file, (io.BytesIO, io.TextIOBase))
+
+
+async def open_upload(path: str | os.PathLike[str]) -> BinaryIO:
+    """Open ``path`` for a streamed upload without blocking the event loop.
+
+    Raises:
+        FileNotFoundError: If ``path`` does not exist.
+        OSError: If it cannot be opened.
+    """
+    return await asyncio.to_thread(open, path, "rb")
+
+
+def borrow_file(file: BinaryIO, *, filename: str, content_type: str) -> payload.Payload:
+    """Wrap a caller-owned binary file for streaming as a multipart field."""
+    return _BorrowedFilePayload(file, filename=filename, content_type=content_type)
+
+
+def _b64encode_str(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+async def b64encode(data: bytes) -> str:
+    """Base64-encode ``data`` to ``str``, off the event loop for large inputs."""
+    if len(data) < INLINE_B64_LIMIT:
+        return _b64encode_str(data)
+    return await asyncio.to_thread(_b64encode_str, data)
@@ -0,0 +1,617 @@
+"""
+Response Cache
+==============
+
+Opt-in caching of deterministic API responses, wired into
+:meth:`VeniceClient._request <venice_ai.VeniceClient>` via
+``VeniceClient(response_cache=...)``.
+
+Repeated evaluation runs re-send identical ``chat.completions.create`` calls
+with ``temperature=0`` or a fixed ``seed``, identical ``embeddings.create``
+inputs and identical ``image.generate`` prompts. :class:`ResponseCache` keys
+each eligible request on a SHA-256 of its canonicalised method, path, JSON
+body, query params and response model, and serves repeats from a
+:class:`CacheStore`. Each client also mixes in a fingerprint of its base URL
+and credential (:func:`credential_scope`), so clients using different API
+keys never see each other's entries in a shared store:
+
+* :class:`MemoryCacheStore` — in-process LRU bounded by total payload bytes.
+* :class:`RedisCacheStore` — shared across workers; reuses the connection
+  pooling of :class:`~venice_ai.core.backends.RedisBackend` (requires the
+  ``redis`` extra).
+* :class:`FileCacheStore` — one file per entry in a directory, shared by every
+  process on the host.
+
+Caching is configured per endpoint with a :class:`CacheRule` (TTL plus an
+optional stale-while-revalidate window). When a :class:`~venice_ai.costs.CostTracker`
+is wired on the client, cache hits are recorded as savings
+(:meth:`CostTracker.record_cache_hit`) instead of spend.
+
+Example:
+    >>> from venice_ai import VeniceClient
+    >>> from venice_ai.cache import CacheRule, MemoryCacheStore, ResponseCache
+    >>>
+    >>> cache = ResponseCache(
+    ...     MemoryCacheStore(max_bytes=256 * 1024 * 1024),
+    ...     endpoints={
+    ...         "embeddings": 7 * 24 * 3600,
+    ...         "chat/completions": CacheRule(ttl=3600, stale_while_revalidate=600),
+    ...     },
+    ... )
+    >>> client = VeniceClient(response_cache=cache)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+from pydantic import BaseModel
+
+from ._sse import json_loads
+
+if TYPE_CHECKING:
+    from .core.backends.redis import RedisBackend
+    from .costs import CostTracker
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "CacheRule",
+    "CacheStats",
+    "CacheStore",
+    "FileCacheStore",
+    "MemoryCacheStore",
+    "RedisCacheStore",
+    "ResponseCache",
+    "credential_scope",
+]
+
+#: Endpoints whose shorthand (``float``) rules only cache deterministic bodies.
+_SAMPLED_ENDPOINTS = frozenset({"chat/completions"})
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+
+@runtime_checkable
+class CacheStore(Protocol):
+    """Byte-oriented key/value storage used by :class:`ResponseCache`."""
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the stored value, or ``None`` when missing or expired."""
+        ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store ``value`` for ``ttl`` seconds."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+        ...
+
+    async def clear(self) -> None:
+        """Remove every entry owned by this store."""
+        ...
+
+
+class MemoryCacheStore:
+    """In-process LRU store bounded by the total size of stored values.
+
+    Args:
+        max_bytes: Upper bound on the summed length of stored values. Least
+            recently used entries are evicted to make room; a single value
+            larger than the bound is not stored.
+        max_entries: Optional cap on the number of entries.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entries: int | None = None) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._size = 0
+        self.evictions = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """Summed length of all stored values."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if key in self._entries:
+            self._remove(key)
+        if len(value) > self.max_bytes:
+            return
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._size += len(value)
+        while self._size > self.max_bytes or (
+            self.max_entries is not None and len(self._entries) > self.max_entries
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._size -= len(value)
+
+
+class RedisCacheStore:
+    """Redis-backed store shared across processes.
+
+    Connections come from a :class:`~venice_ai.core.backends.RedisBackend`,
+    so the cache shares its per-event-loop pools (pass the backend your
+    rate limiter already uses, or let the store create one from
+    ``redis_url``). Values are written with a millisecond expiry.
+
+    Args:
+        backend: Existing backend to borrow connections from.
+        redis_url: Used to build a backend when ``backend`` is not given.
+        prefix: Key prefix; :meth:`clear` only removes keys under it.
+    """
+
+    def __init__(
+        self,
+        backend: RedisBackend | None = None,
+        *,
+        redis_url: str = "redis://localhost:6379",
+        prefix: str = "venice:response_cache",
+    ) -> None:
+        if backend is None:
+            from .core.backends.redis import RedisBackend
+
+            backend = RedisBackend(redis_url=redis_url)
+        self._backend = backend
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    async def get(self, key: str) -> bytes | None:
+        redis_client = await self._backend.connection()
+        value = await redis_client.get(self._key(key))
+        if value is None:
+            return None
+        # The backend's pools use decode_responses=True.
+        return value.encode("utf-8") if isinstance(value, str) else value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        redis_client = await self._backend.connection()
+        await redis_client.set(self._key(key), value.decode("utf-8"), px=max(1, int(ttl * 1000)))
+
+    async def delete(self, key: str) -> None:
+        redis_client = await self._backend.connection()
+        await redis_client.delete(self._key(key))
+
+    async def clear(self) -> None:
+        redis_client = await self._backend.connection()
+        batch: list[str] = []
+        async for key in redis_client.scan_iter(match=f"{self.prefix}:*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                await redis_client.delete(*batch)
+                batch.clear()
+        if batch:
+            await redis_client.delete(*batch)
+
+
+class FileCacheStore:
+    """Directory-backed store shared by every process on the host.
+
+    Each entry is one file named after the SHA-256 of its key, holding the
+    absolute expiry time followed by the value. Writes go to a temporary file
+    that is renamed into place, so concurrent readers never see a partial
+    entry. File I/O runs in a worker thread. The directory is created on the
+    first write.
+
+    Args:
+        directory: Where entries are stored; :meth:`clear` removes every
+            entry file in it.
+    """
+
+    _SUFFIX = ".cache"
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (hashlib.sha256(key.encode("utf-8")).hexdigest() + self._SUFFIX)
+
+    async def get(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self._read, self._path(key))
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await asyncio.to_thread(self._write, self._path(key), value, time.time() + ttl)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+
+    async def clear(self) -> None:
+        def remove_all() -> None:
+            for path in self.directory.glob(f"*{self._SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+        await asyncio.to_thread(remove_all)
+
+    @staticmethod
+    def _read(path: Path) -> bytes | None:
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        header, _, value = raw.partition(b"\n")
+        try:
+            expires_at = float(header)
+        except ValueError:
+            path.unlink(missing_ok=True)
+            return None
+        if expires_at <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return value
+
+    def _write(self, path: Path, value: bytes, expires_at: float) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"%.3f\n" % expires_at)
+                f.write(value)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+# ---------------------------------------------------------------------------
+# Policy
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class CacheRule:
+    """Caching policy for one endpoint.
+
+    Attributes:
+        ttl: Seconds a stored response is served as fresh.
+        stale_while_revalidate: Extra seconds during which an expired entry
+            is still returned immediately while a background request
+            refreshes it. ``0`` disables the stale window.
+        require_deterministic: Only cache bodies that pin sampling —
+            ``temperature == 0`` or an explicit ``seed``.
+    """
+
+    ttl: float
+    stale_while_revalidate: float = 0.0
+    require_deterministic: bool = False
+
+    def __post_init__(self) -> None:
+        if self.ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if self.stale_while_revalidate < 0:
+            raise ValueError("stale_while_revalidate must be >= 0")
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters for a :class:`ResponseCache`."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    revalidations: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (fresh or stale)."""
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+
+def credential_scope(base_url: str, credential: str) -> str:
+    """Return a one-way fingerprint of a base URL and API key (or wallet address).
+
+    :class:`~venice_ai.VeniceClient` passes this as the ``scope`` of every
+    cache lookup (see :attr:`VeniceClient.cache_scope
+    <venice_ai.VeniceClient.cache_scope>`).
+    """
+    digest = hashlib.sha256(f"{base_url}\n{credential}".encode()).hexdigest()
+    return digest[:32]
+
+
+def _is_deterministic(body: Mapping[str, Any] | None) -> bool:
+    if not body:
+        return False
+    return body.get("temperature") == 0 or body.get("seed") is not None
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class ResponseCache:
+    """Serve repeated deterministic requests from a :class:`CacheStore`.
+
+    Args:
+        store: Where entries live. Defaults to a 64 MiB :class:`MemoryCacheStore`.
+        endpoints: Per-endpoint opt-in, keyed by the relative API path
+            (``"embeddings"``, ``"chat/completions"``, ``"image/generate"``).
+            Values are a :class:`CacheRule` or a plain TTL in seconds; the
+            TTL shorthand for ``chat/completions`` only caches deterministic
+            bodies (``temperature=0`` or ``seed`` set).
+        namespace: Mixed into every key so unrelated caches can share a
+            store.
+
+    Lookups made by a client also carry its ``scope``
+    (:func:`credential_scope`), so entries are never shared across API keys.
+
+    Streaming bodies, raw/binary responses, form uploads and non-2xx
+    responses are never cached. Cache-store failures are logged and counted
+    in :attr:`stats` but never fail the request.
+    """
+
+    def __init__(
+        self,
+        store: CacheStore | None = None,
+        *,
+        endpoints: Mapping[str, CacheRule | float],
+        namespace: str = "v1",
+    ) -> None:
+        self.store: CacheStore = store if store is not None else MemoryCacheStore()
+        self.namespace = namespace
+        self._rules: dict[str, CacheRule] = {}
+        for path, rule in endpoints.items():
+            path = path.strip("/")
+            if not isinstance(rule, CacheRule):
+                rule = CacheRule(ttl=float(rule), require_deterministic=path in _SAMPLED_ENDPOINTS)
+            self._rules[path] = rule
+        self.stats = CacheStats()
+        self._revalidating: set[str] = set()
+        self._background: set[asyncio.Task[Any]] = set()
+
+    def rule_for(
+        self, method: str, path: str, json_data: Mapping[str, Any] | None
+    ) -> CacheRule | None:
+        """Return the rule that applies to a request, or ``None`` if uncacheable."""
+        rule = self._rules.get(path.strip("/"))
+        if rule is None or method.upper() not in ("GET", "POST"):
+            return None
+        if json_data is not None and json_data.get("stream"):
+            return None
+        if rule.require_deterministic and not _is_deterministic(json_data):
+            return None
+        return rule
+
+    def key_for(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_data: Mapping[str, Any] | None = None,
+        params: Mapping[str, Any] | None = None,
+        cast_to: type[BaseModel] | None = None,
+        scope: str | None = None,
+    ) -> str | None:
+        """Return the hex cache key for a request, or ``None`` if unserialisable."""
+        try:
+            canonical = json.dumps(
+                [
+                    self.namespace,
+                    scope,
+                    method.upper(),
+                    path.strip("/"),
+                    json_data,
+                    params,
+                    cast_to.__qualname__ if cast_to else None,
+                ],
+                sort_keys=True,
+                separators=(",", ":"),
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    async def get_or_fetch(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_data: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        cast_to: type[BaseModel] | None,
+        fetch: Callable[[], Awaitable[Any]],
+        cost_tracker: CostTracker | None = None,
+        scope: str | None = None,
+    ) -> Any:
+        """Answer a request from the cache, or run ``fetch`` and store its result.
+
+        Called by :class:`~venice_ai.VeniceClient` with its
+        :func:`credential_scope`; requests without a matching rule go
+        straight to ``fetch``.
+        """
+        rule = self.rule_for(method, path, json_data)
+        key = (
+            self.key_for(
+                method, path, json_data=json_data, params=params, cast_to=cast_to, scope=scope
+            )
+            if rule is not None
+            else None
+        )
+        if rule is None or key is None:
+            return await fetch()
+
+        raw = await self._safe_get(key)
+        if raw is not None:
+            try:
+                stored_at, payload = _unpack(raw)
+                result = _decode(payload, cast_to)
+            except Exception:  # noqa: BLE001 — a corrupt entry is just a miss
+                logger.warning("Discarding undecodable cache entry %s", key, exc_info=True)
+                self.stats.errors += 1
+            else:
+                age = time.time() - stored_at
+                if age < rule.ttl:
+                    self.stats.hits += 1
+                    await _record_savings(cost_tracker, result)
+                    return result
+                if age < rule.ttl + rule.stale_while_revalidate:
+                    self.stats.stale_hits += 1
+                    self._schedule_revalidation(key, rule, cast_to, fetch)
+                    await _record_savings(cost_tracker, result)
+                    return result
+
+        self.stats.misses += 1
+        result = await fetch()
+        await self._store(key, rule, result)
+        return result
+
+    async def invalidate(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_data: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        cast_to: type[BaseModel] | None = None,
+        scope: str | None = None,
+    ) -> None:
+        """Drop the entry for one request, if cached.
+
+        Pass the client's :attr:`~venice_ai.VeniceClient.cache_scope` as
+        ``scope`` to drop an entry cached through that client.
+        """
+        key = self.key_for(
+            method, path, json_data=json_data, params=params, cast_to=cast_to, scope=scope
+        )
+        if key is not None:
+            await self.store.delete(key)
+
+    async def clear(self) -> None:
+        """Remove every entry from the underlying store."""
+        await self.store.clear()
+
+    async def aclose(self) -> None:
+        """Wait for in-flight background revalidations to finish."""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+    # -- internals -----------------------------------------------------------
+
+    def _schedule_revalidation(
+        self,
+        key: str,
+        rule: CacheRule,
+        cast_to: type[BaseModel] | None,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> None:
+        if key in self._revalidating:
+            return
+        self._revalidating.add(key)
+
+        async def revalidate() -> None:
+            try:
+                result = await fetch()
+                self.stats.revalidations += 1
+                await self._store(key, rule, result)
+            except Exception:  # noqa: BLE001 — the caller already has a stale answer
+                logger.warning("Background cache revalidation failed", exc_info=True)
+                self.stats.errors += 1
+            finally:
+                self._revalidating.discard(key)
+
+        task = asyncio.create_task(revalidate())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _safe_get(self, key: str) -> bytes | None:
+        try:
+            return await self.store.get(key)
+        except Exception:  # noqa: BLE001 — a cache outage must not fail requests
+            logger.warning("Response cache read failed; treating as miss", exc_info=True)
+            self.stats.errors += 1
+            return None
+
+    async def _store(self, key: str, rule: CacheRule, result: Any) -> None:
+        payload = _encode(result)
+        if payload is None:
+            return
+        try:
+            await self.store.set(key, _pack(payload), rule.ttl + rule.stale_while_revalidate)
+            self.stats.stores += 1
+        except Exception:  # noqa: BLE001 — a cache outage must not fail requests
+            logger.warning("Response cache write failed", exc_info=True)
+            self.stats.errors += 1
+
+
+def _encode(result: Any) -> bytes | None:
+    if isinstance(result, BaseModel):
+        return result.model_dump_json().encode("utf-8")
+    if isinstance(result, dict | list):
+        try:
+            return json.dumps(result, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def _decode(payload: bytes, cast_to: type[BaseModel] | None) -> Any:
+    if cast_to is not None:
+        return cast_to.model_validate_json(payload)
+    return json_loads(payload)
+
+
+def _pack(payload: bytes) -> bytes:
+    return b"%.3f\n" % time.time() + payload
+
+
+def _unpack(raw: bytes) -> tuple[float, bytes]:
+    header, _, payload = raw.partition(b"\n")
+    return float(header), payload
+
+
+async def _record_savings(tracker: CostTracker | None, result: Any) -> None:
+    if tracker is None:
+        return
+    try:
+        await tracker.record_cache_hit(result)
+    except Exception:  # noqa: BLE001 — observability must never break the request
+        logger.warning("cost_tracker.record_cache_hit() raised; ignoring", exc_info=True)
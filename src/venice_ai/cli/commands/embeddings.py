@@ -1,4 +1,8 @@
-"""Embeddings command for Venice AI CLI — Generate text embeddings."""
+"""Embeddings command for Venice AI CLI — Generate text embeddings.
+
+``venice-py embeddings TEXT`` embeds one text; ``venice-py embeddings batch``
+(see :mod:`.embeddings_batch`) embeds a whole file.
+"""
 
 import asyncio
 import json
@@ -8,8 +12,50 @@ import click
 
 from venice_ai.cli.utils.console import console
 
+from .embeddings_batch import batch
+
+
+class _EmbeddingsGroup(click.Group):
+    """Runs the single-text command unless a subcommand is named.
+
+    Keeps ``venice-py embeddings "some text"`` working next to
+    ``venice-py embeddings batch``.
+    """
+
+    default_command = "text"
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if not args or args[0] not in self.commands and args[0] not in ctx.help_option_names:
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
 
-@click.command("embeddings")
+@click.group("embeddings", cls=_EmbeddingsGroup)
+def embeddings():
+    """Generate text embeddings.
+
+    Converts text into vector representations for semantic analysis,
+    similarity search, clustering, and more.
+
+    Examples:
+
+      # Generate embeddings for text
+      venice-py embeddings "The quick brown fox"
+
+      # Pipe text via stdin
+      echo "Some text" | venice-py embeddings
+
+      # Embed a whole corpus (see: venice-py embeddings batch --help)
+      venice-py embeddings batch corpus.jsonl -o vectors.npy
+
+    Run 'venice-py embeddings text --help' for the single-text options.
+    """
+
+
+embeddings.add_command(batch)
+
+
+@embeddings.command("text")
 @click.argument("text", required=False)
 @click.option(
     "--model",
@@ -42,11 +88,8 @@ from venice_ai.cli.utils.console import console
     help="Save embeddings to file",
 )
 @click.pass_context
-def embeddings(ctx, text, model, encoding_format, dimensions, output_json, output):
-    """Generate text embeddings.
-
-    Converts text into vector representations for semantic analysis,
-    similarity search, clustering, and more.
+def embed_text(ctx, text, model, encoding_format, dimensions, output_json, output):
+    """Embed one text (the default when no subcommand is given).
 
     Examples:
 
@@ -0,0 +1,653 @@
+"""Bulk embeddings for Venice AI CLI — ``venice-py embeddings batch``.
+
+Streams a corpus from a text-lines, JSONL or CSV file, packs it into
+token-bounded requests, embeds them concurrently through one client (and so
+its rate limiter), and streams the vectors to JSONL, ``.npy`` or Parquet in
+input order. Nothing holds more than a few batches in memory.
+
+Progress is checkpointed to ``<output>.checkpoint.json`` whenever the output
+is consistent on disk, so an interrupted run continues where it stopped:
+partial writes past the checkpoint are discarded and the input is skipped
+up to the last saved row.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import csv
+import itertools
+import json
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, BinaryIO, Protocol
+
+import click
+
+from venice_ai.cli.utils.console import console, print_error, print_info
+from venice_ai.resources.embeddings import MAX_EMBEDDING_INPUTS, _estimate_input_tokens
+
+_CHECKPOINT_VERSION = 1
+#: Fixed ``.npy`` header size, so the header can be rewritten in place as
+#: rows are appended.
+_NPY_HEADER_SIZE = 128
+
+Record = tuple[str, str]  # (id, text)
+
+
+# ---------------------------------------------------------------------------
+# Input
+# ---------------------------------------------------------------------------
+
+
+def iter_records(path: Path, *, text_field: str = "text", id_field: str = "id") -> Iterator[Record]:
+    """Yield ``(id, text)`` pairs from ``path`` without reading it all.
+
+    ``.jsonl``/``.ndjson`` files hold one object per line and ``.csv`` files
+    have a header row; both take the text from ``text_field`` and the id from
+    ``id_field`` when present. Any other file holds one text per line. Rows
+    without an id are numbered from 0. Blank text lines are skipped.
+
+    Raises:
+        ValueError: If a row is malformed or has no text.
+    """
+    suffix = path.suffix.lower()
+    with open(path, encoding="utf-8", newline="" if suffix == ".csv" else None) as f:
+        if suffix in (".jsonl", ".ndjson"):
+            rows = (_json_row(line, n) for n, line in enumerate(f, 1) if line.strip())
+            yield from _fields(rows, text_field, id_field)
+        elif suffix == ".csv":
+            reader = csv.DictReader(f)
+            if reader.fieldnames is None or text_field not in reader.fieldnames:
+                raise ValueError(f"CSV header has no {text_field!r} column")
+            yield from _fields(((n, row) for n, row in enumerate(reader, 2)), text_field, id_field)
+        else:
+            texts = (line.strip() for line in f)
+            yield from ((str(i), text) for i, text in enumerate(t for t in texts if t))
+
+
+def _json_row(line: str, lineno: int) -> tuple[int, dict[str, Any]]:
+    try:
+        row = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Line {lineno}: invalid JSON ({e.msg})") from e
+    if not isinstance(row, dict):
+        raise ValueError(f"Line {lineno}: expected a JSON object")
+    return lineno, row
+
+
+def _fields(
+    rows: Iterator[tuple[int, dict[str, Any]]], text_field: str, id_field: str
+) -> Iterator[Record]:
+    for index, (lineno, row) in enumerate(rows):
+        text = row.get(text_field)
+        if not isinstance(text, str) or not text.strip():
+            raise ValueError(f"Line {lineno}: {text_field!r} must be a non-empty string")
+        row_id = row.get(id_field)
+        yield (str(index) if row_id in (None, "") else str(row_id)), text
+
+
+def pack_batches(
+    records: Iterator[Record], *, max_inputs: int, max_tokens: int
+) -> Iterator[list[Record]]:
+    """Group records into requests of at most ``max_inputs`` inputs and
+    ``max_tokens`` estimated tokens; an oversized input is sent on its own."""
+    batch: list[Record] = []
+    tokens = 0
+    for record in records:
+        cost = _estimate_input_tokens(record[1])
+        if batch and (len(batch) >= max_inputs or tokens + cost > max_tokens):
+            yield batch
+            batch, tokens = [], 0
+        batch.append(record)
+        tokens += cost
+    if batch:
+        yield batch
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+
+class _Writer(Protocol):
+    """Appends rows of little-endian float32 vectors in input order."""
+
+    def write(self, ids: list[str], vectors: list[bytes]) -> None: ...
+
+    def sync(self) -> dict[str, Any] | None:
+        """Make written rows durable; return resume state, or ``None`` if
+        rows are still buffered."""
+        ...
+
+    def close(self) -> dict[str, Any]: ...
+
+
+def _truncate(path: Path, size: int) -> BinaryIO:
+    f = open(path, "r+b" if path.exists() else "w+b")  # noqa: SIM115 — owned by the writer
+    f.truncate(size)
+    f.seek(size)
+    return f
+
+
+class _JsonlWriter:
+    """One ``{"id": ..., "embedding": [...]}`` object per line."""
+
+    def __init__(self, path: Path, state: dict[str, Any] | None) -> None:
+        self._file = _truncate(path, state["size"] if state else 0)
+
+    def write(self, ids: list[str], vectors: list[bytes]) -> None:
+        lines = []
+        for row_id, raw in zip(ids, vectors, strict=True):
+            values = struct.unpack(f"<{len(raw) // 4}f", raw)
+            lines.append(json.dumps({"id": row_id, "embedding": values}) + "\n")
+        self._file.write("".join(lines).encode("utf-8"))
+
+    def sync(self) -> dict[str, Any]:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return {"size": self._file.tell()}
+
+    def close(self) -> dict[str, Any]:
+        state = self.sync()
+        self._file.close()
+        return state
+
+
+class _NpyWriter:
+    """A ``(rows, dimensions)`` float32 ``.npy`` matrix plus ``<stem>.ids.jsonl``.
+
+    The header is rewritten with the current row count on every sync, so the
+    file is a valid array at each checkpoint.
+    """
+
+    def __init__(self, path: Path, state: dict[str, Any] | None) -> None:
+        self.rows = state["rows"] if state else 0
+        self.dimensions: int | None = state["dimensions"] if state else None
+        size = _NPY_HEADER_SIZE + self.rows * (self.dimensions or 0) * 4
+        self._file = _truncate(path, size)
+        self._ids = _truncate(path.with_suffix(".ids.jsonl"), state["ids_size"] if state else 0)
+
+    def write(self, ids: list[str], vectors: list[bytes]) -> None:
+        for raw in vectors:
+            if self.dimensions is None:
+                self.dimensions = len(raw) // 4
+            elif len(raw) != self.dimensions * 4:
+                raise ValueError(
+                    f"Embedding has {len(raw) // 4} dimensions, expected {self.dimensions}"
+                )
+        self._file.write(b"".join(vectors))
+        self._ids.write("".join(json.dumps(i) + "\n" for i in ids).encode("utf-8"))
+        self.rows += len(vectors)
+
+    def _header(self) -> bytes:
+        header = (
+            f"{{'descr': '<f4', 'fortran_order': False, 'shape': ({self.rows}, "
+            f"{self.dimensions or 0}), }}"
+        ).encode("latin-1")
+        prefix = b"\x93NUMPY\x01\x00" + struct.pack("<H", _NPY_HEADER_SIZE - 10)
+        return prefix + header.ljust(_NPY_HEADER_SIZE - len(prefix) - 1) + b"\n"
+
+    def sync(self) -> dict[str, Any]:
+        end = self._file.tell()
+        self._file.seek(0)
+        self._file.write(self._header())
+        self._file.seek(end)
+        for f in (self._file, self._ids):
+            f.flush()
+            os.fsync(f.fileno())
+        return {"rows": self.rows, "dimensions": self.dimensions, "ids_size": self._ids.tell()}
+
+    def close(self) -> dict[str, Any]:
+        state = self.sync()
+        self._file.close()
+        self._ids.close()
+        return state
+
+
+class _ParquetWriter:
+    """A directory of ``part-NNNNN.parquet`` files with ``id`` and ``embedding`` columns.
+
+    Rows are buffered and written ``part_rows`` at a time; each part is
+    renamed into place once complete, so readers (and resumes) only ever see
+    whole files.
+    """
+
+    def __init__(self, path: Path, state: dict[str, Any] | None, *, part_rows: int) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise click.ClickException(
+                "Parquet output requires pyarrow. Install it with: pip install pyarrow"
+            ) from e
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.path = path
+        self.part_rows = part_rows
+        self.parts = state["parts"] if state else 0
+        self._ids: list[str] = []
+        self._vectors: list[bytes] = []
+        path.mkdir(parents=True, exist_ok=True)
+        # Parts written after the last checkpoint are regenerated
+        for stale in path.glob("part-*.parquet"):
+            if int(stale.stem.removeprefix("part-")) >= self.parts:
+                stale.unlink()
+
+    def write(self, ids: list[str], vectors: list[bytes]) -> None:
+        self._ids.extend(ids)
+        self._vectors.extend(vectors)
+        if len(self._ids) >= self.part_rows:
+            self._write_part()
+
+    def _write_part(self) -> None:
+        pa = self._pa
+        dimensions = len(self._vectors[0]) // 4
+        data = b"".join(self._vectors)
+        if sys.byteorder == "big":
+            swapped = array("f", data)
+            swapped.byteswap()
+            data = swapped.tobytes()
+        values = pa.Array.from_buffers(pa.float32(), len(data) // 4, [None, pa.py_buffer(data)])
+        table = pa.table(
+            {
+                "id": pa.array(self._ids, pa.string()),
+                "embedding": pa.FixedSizeListArray.from_arrays(values, dimensions),
+            }
+        )
+        target = self.path / f"part-{self.parts:05d}.parquet"
+        tmp = target.with_suffix(".parquet.part")
+        self._pq.write_table(table, str(tmp))
+        os.replace(tmp, target)
+        self.parts += 1
+        self._ids, self._vectors = [], []
+
+    def sync(self) -> dict[str, Any] | None:
+        return None if self._ids else {"parts": self.parts}
+
+    def close(self) -> dict[str, Any]:
+        if self._ids:
+            self._write_part()
+        return {"parts": self.parts}
+
+
+def open_writer(path: Path, state: dict[str, Any] | None, *, part_rows: int) -> _Writer:
+    """Open the writer for ``path``'s suffix, resuming from ``state`` if given.
+
+    Raises:
+        click.BadParameter: For an unsupported suffix.
+    """
+    suffix = path.suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return _JsonlWriter(path, state)
+    if suffix == ".npy":
+        return _NpyWriter(path, state)
+    if suffix == ".parquet":
+        return _ParquetWriter(path, state, part_rows=part_rows)
+    raise click.BadParameter(
+        f"Unsupported output {path.name!r}; use .jsonl, .npy or .parquet", param_hint="--output"
+    )
+
+
+def output_matches(path: Path, state: dict[str, Any]) -> bool:
+    """Whether ``path`` still holds every row a checkpoint's writer ``state`` recorded.
+
+    Bytes past the checkpoint are fine (a resumed writer truncates them); an
+    output that is shorter, or missing parts, was replaced or truncated since.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        return all((path / f"part-{n:05d}.parquet").exists() for n in range(state["parts"]))
+    if suffix == ".npy":
+        size = _NPY_HEADER_SIZE + state["rows"] * (state["dimensions"] or 0) * 4
+        ids = path.with_suffix(".ids.jsonl")
+        return _size(path) >= size and _size(ids) >= int(state["ids_size"])
+    return _size(path) >= int(state["size"])
+
+
+def _size(path: Path) -> int:
+    return path.stat().st_size if path.exists() else 0
+
+
+# ---------------------------------------------------------------------------
+# Checkpoint
+# ---------------------------------------------------------------------------
+
+
+class Checkpoint:
+    """Resume state stored beside the output as ``<output>.checkpoint.json``.
+
+    Args:
+        path: The checkpoint file.
+        run: Settings that must match for a run to resume (input, model, ...).
+    """
+
+    def __init__(self, path: Path, run: dict[str, Any]) -> None:
+        self.path = path
+        self.run = run
+        self.rows = 0
+        self.complete = False
+        self.writer: dict[str, Any] | None = None
+
+    @classmethod
+    def for_output(cls, output: Path, run: dict[str, Any]) -> Checkpoint:
+        return cls(output.with_name(output.name + ".checkpoint.json"), run)
+
+    def load(self) -> bool:
+        """Adopt the stored state; ``False`` if there is none.
+
+        Raises:
+            click.ClickException: If it belongs to a different run.
+        """
+        if not self.path.exists():
+            return False
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        if data.get("version") != _CHECKPOINT_VERSION or data.get("run") != self.run:
+            raise click.ClickException(
+                f"{self.path} belongs to a different run; pass --no-resume to start over."
+            )
+        self.rows = data["rows"]
+        self.complete = data["complete"]
+        self.writer = data["writer"]
+        return True
+
+    def clear(self) -> None:
+        """Delete the stored state, so a later run cannot adopt it."""
+        self.path.unlink(missing_ok=True)
+        self.rows, self.writer, self.complete = 0, None, False
+
+    def save(self, rows: int, writer: dict[str, Any], *, complete: bool = False) -> None:
+        self.rows, self.writer, self.complete = rows, writer, complete
+        data = {
+            "version": _CHECKPOINT_VERSION,
+            "run": self.run,
+            "rows": rows,
+            "complete": complete,
+            "writer": writer,
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+
+def _raw_vector(embedding: list[float] | str) -> bytes:
+    if isinstance(embedding, str):
+        return base64.b64decode(embedding)
+    return struct.pack(f"<{len(embedding)}f", *embedding)
+
+
+async def embed_to_writer(
+    client: Any,
+    batches: Iterator[list[Record]],
+    writer: _Writer,
+    checkpoint: Checkpoint,
+    *,
+    model: str,
+    dimensions: int | None,
+    concurrency: int,
+    on_rows: Callable[[int], None] | None = None,
+) -> tuple[int, int]:
+    """Embed ``batches`` and write them in order; return ``(rows, tokens)``.
+
+    At most ``2 * concurrency`` batches are in flight or waiting to be
+    written, so a slow request never lets finished batches pile up. The
+    first failed request stops the run; the checkpoint keeps what was saved.
+    """
+    window = asyncio.Semaphore(2 * concurrency)
+    numbered = enumerate(batches)
+    finished: dict[int, tuple[list[str], list[bytes]]] = {}
+    write_lock = asyncio.Lock()
+    next_seq = 0
+    rows = checkpoint.rows
+    tokens = 0
+
+    def commit(ids: list[str], vectors: list[bytes], rows_after: int) -> None:
+        writer.write(ids, vectors)
+        state = writer.sync()
+        if state is not None:
+            checkpoint.save(rows_after, state)
+
+    async def drain() -> None:
+        nonlocal next_seq, rows
+        async with write_lock:
+            while next_seq in finished:
+                ids, vectors = finished.pop(next_seq)
+                await asyncio.to_thread(commit, ids, vectors, rows + len(ids))
+                rows += len(ids)
+                next_seq += 1
+                window.release()
+                if on_rows is not None:
+                    on_rows(len(ids))
+
+    async def worker() -> None:
+        nonlocal tokens
+        while True:
+            await window.acquire()
+            try:
+                seq, batch = next(numbered)
+            except StopIteration:
+                window.release()
+                return
+            response = await client.embeddings.create(
+                model=model,
+                input=[text for _, text in batch],
+                dimensions=dimensions,
+                encoding_format="base64",
+            )
+            items = sorted(response.data, key=lambda item: item.index)
+            if len(items) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, got {len(items)}")
+            tokens += response.usage.total_tokens
+            finished[seq] = (
+                [row_id for row_id, _ in batch],
+                [_raw_vector(i.embedding) for i in items],
+            )
+            await drain()
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
+    state = await asyncio.to_thread(writer.close)
+    checkpoint.save(rows, state, complete=True)
+    return rows, tokens
+
+
+@click.command("batch")
+@click.argument("input_file", metavar="INPUT", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--output",
+    "-o",
+    required=True,
+    type=click.Path(),
+    help="Output file: .jsonl, .npy (plus .ids.jsonl) or .parquet (a directory of parts)",
+)
+@click.option("--model", "-m", default=None, help="Embedding model to use")
+@click.option("--dimensions", type=int, default=None, help="Number of output dimensions")
+@click.option("--text-field", default="text", show_default=True, help="JSONL/CSV text column")
+@click.option("--id-field", default="id", show_default=True, help="JSONL/CSV id column")
+@click.option(
+    "--batch-size",
+    type=click.IntRange(1, MAX_EMBEDDING_INPUTS),
+    default=256,
+    show_default=True,
+    help="Maximum inputs per request",
+)
+@click.option(
+    "--max-batch-tokens",
+    type=click.IntRange(min=1),
+    default=100_000,
+    show_default=True,
+    help="Estimated-token budget per request (~4 characters per token)",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Requests in flight (still paced by the client's rate limiter)",
+)
+@click.option(
+    "--part-rows",
+    type=click.IntRange(min=1),
+    default=50_000,
+    show_default=True,
+    help="Rows per Parquet part file",
+)
+@click.option(
+    "--resume/--no-resume",
+    default=True,
+    help="Continue from the output's checkpoint if there is one",
+)
+@click.pass_context
+def batch(
+    ctx: click.Context,
+    input_file: str,
+    output: str,
+    model: str | None,
+    dimensions: int | None,
+    text_field: str,
+    id_field: str,
+    batch_size: int,
+    max_batch_tokens: int,
+    concurrency: int,
+    part_rows: int,
+    resume: bool,
+) -> None:
+    """Embed a whole file of texts.
+
+    INPUT is a .jsonl or .csv file with a text column (and optionally an id
+    column), or any other file with one text per line. Vectors are written
+    in input order as they arrive, and an interrupted run resumes from its
+    last checkpoint when started again.
+
+    Examples:
+
+      venice-py embeddings batch corpus.jsonl -o vectors.npy
+
+      venice-py embeddings batch docs.csv --text-field body -o vectors.parquet -c 8
+    """
+    asyncio.run(
+        _batch_async(
+            ctx,
+            Path(input_file),
+            Path(output),
+            model=model,
+            dimensions=dimensions,
+            text_field=text_field,
+            id_field=id_field,
+            batch_size=batch_size,
+            max_batch_tokens=max_batch_tokens,
+            concurrency=concurrency,
+            part_rows=part_rows,
+            resume=resume,
+        )
+    )
+
+
+async def _batch_async(
+    ctx: click.Context,
+    input_path: Path,
+    output: Path,
+    *,
+    model: str | None,
+    dimensions: int | None = None,
+    text_field: str = "text",
+    id_field: str = "id",
+    batch_size: int = 256,
+    max_batch_tokens: int = 100_000,
+    concurrency: int = 4,
+    part_rows: int = 50_000,
+    resume: bool = True,
+) -> None:
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+    from venice_ai import VeniceClient
+    from venice_ai.cli._model_defaults import resolve_default_model
+    from venice_ai.cli.config import get_client_kwargs, load_config
+
+    plain = ctx.obj.get("plain", False) if ctx.obj else False
+    config = ctx.obj.get("config", load_config()) if ctx.obj else load_config()
+
+    async with VeniceClient(**get_client_kwargs()) as client:
+        model = await resolve_default_model(client, config, "embedding", explicit=model)
+        checkpoint = Checkpoint.for_output(
+            output,
+            {
+                "input": str(input_path.resolve()),
+                "model": model,
+                "dimensions": dimensions,
+                "text_field": text_field,
+                "id_field": id_field,
+            },
+        )
+        if not resume:
+            # Before the output is truncated: a run that fails before its first
+            # checkpoint must not leave the old one to be resumed
+            checkpoint.clear()
+        elif checkpoint.load():
+            if checkpoint.writer is None or not output_matches(output, checkpoint.writer):
+                raise click.ClickException(
+                    f"{output} no longer matches {checkpoint.path}; pass --no-resume to start over."
+                )
+            if checkpoint.complete:
+                print_info(f"{output} is already complete ({checkpoint.rows} rows)")
+                return
+            print_info(f"Resuming after {checkpoint.rows} rows")
+
+        output.parent.mkdir(parents=True, exist_ok=True)
+        writer = open_writer(output, checkpoint.writer, part_rows=part_rows)
+        records = itertools.islice(
+            iter_records(input_path, text_field=text_field, id_field=id_field),
+            checkpoint.rows,
+            None,
+        )
+        batches = pack_batches(records, max_inputs=batch_size, max_tokens=max_batch_tokens)
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("Embedding {task.completed} rows"),
+            TimeElapsedColumn(),
+            console=console,
+            disable=plain,
+        ) as progress:
+            task = progress.add_task("", total=None, completed=checkpoint.rows)
+            try:
+                rows, tokens = await embed_to_writer(
+                    client,
+                    batches,
+                    writer,
+                    checkpoint,
+                    model=model,
+                    dimensions=dimensions,
+                    concurrency=concurrency,
+                    on_rows=lambda n: progress.advance(task, n),
+                )
+            except Exception as e:
+                print_error(f"Embedding failed: {e}")
+                print_info(f"Progress saved after {checkpoint.rows} rows; re-run to resume")
+                raise SystemExit(1) from e
+
+    if plain:
+        click.echo(f"Saved: {output}")
+        click.echo(f"Rows: {rows}")
+        click.echo(f"Tokens: {tokens}")
+    else:
+        console.print(f"\n[bold green]✅ Embeddings saved to:[/bold green] {output}")
+        console.print(f"  Model: {model}")
+        console.print(f"  Rows: {rows}")
+        console.print(f"  Tokens used this run: {tokens}")
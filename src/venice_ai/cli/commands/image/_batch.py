@@ -0,0 +1,251 @@
+"""
+Work queue and journal for ``venice-py image batch``.
+
+Prompts come from a text file (one prompt per line) or a JSONL file whose
+rows carry per-prompt parameters::
+
+    {"prompt": "A lighthouse at dusk", "seed": 42, "size": "1280x720"}
+    {"prompt": "A lighthouse at dawn", "model": "flux-dev", "name": "dawn"}
+
+Each row becomes a :class:`BatchJob` keyed by a hash of the request it makes
+(the row over the batch-wide CLI options, see :func:`with_settings`), so the
+key survives rows being added or reordered but not a change of ``--model``
+or ``--size``. Finished jobs are appended to a :class:`BatchJournal` next to
+the images; starting the same batch again skips every job whose images are
+already on disk.
+"""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import dataclasses
+import hashlib
+import json
+import os
+import re
+import tempfile
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+#: Base64 characters read per write, so a large image is never held twice
+#: in memory.
+B64_CHUNK = 1 << 20
+
+#: ``image.create`` parameters a JSONL row may set.
+ROW_PARAMS = frozenset(
+    {
+        "model",
+        "aspect_ratio",
+        "cfg_scale",
+        "embed_exif_metadata",
+        "enable_web_search",
+        "format",
+        "height",
+        "hide_watermark",
+        "lora_strength",
+        "num_images",
+        "quality",
+        "resolution",
+        "safe_mode",
+        "seed",
+        "steps",
+        "style_preset",
+        "width",
+    }
+)
+
+_JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+_SIZE_RE = re.compile(r"^(\d+)x(\d+)$")
+
+
+@dataclass(slots=True, frozen=True)
+class BatchJob:
+    """One prompt of a batch.
+
+    Attributes:
+        index: 1-based position in the prompts file.
+        key: Stable identifier derived from the request the job makes.
+        prompt: The prompt text.
+        params: Per-row ``image.create`` overrides.
+        name: Output file stem chosen by the row, if any.
+    """
+
+    index: int
+    key: str
+    prompt: str
+    params: dict[str, Any] = field(default_factory=dict)
+    name: str | None = None
+
+    def filenames(self, extension: str, count: int) -> list[str]:
+        """File names for ``count`` images of this job."""
+        stem = self.name or f"batch_{self.index}_{self.key[:8]}"
+        if count == 1:
+            return [f"{stem}.{extension}"]
+        return [f"{stem}_{n}.{extension}" for n in range(1, count + 1)]
+
+
+def load_jobs(path: Path) -> list[BatchJob]:
+    """Read the jobs in a prompts file.
+
+    Files ending in ``.jsonl`` or ``.ndjson`` hold one JSON object per line;
+    anything else holds one prompt per line. Blank lines are skipped.
+
+    Raises:
+        ValueError: If a JSONL row is malformed.
+    """
+    jsonl = path.suffix.lower() in _JSONL_SUFFIXES
+    rows: list[dict[str, Any]] = []
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if line:
+                rows.append(_parse_row(line, lineno) if jsonl else {"prompt": line})
+
+    jobs = []
+    for index, row in enumerate(rows, 1):
+        params = dict(row)
+        prompt = params.pop("prompt")
+        name = params.pop("name", None)
+        jobs.append(BatchJob(index=index, key="", prompt=prompt, params=params, name=name))
+    return with_settings(jobs, {})
+
+
+def with_settings(jobs: list[BatchJob], settings: Mapping[str, Any]) -> list[BatchJob]:
+    """Key ``jobs`` by their effective request: ``settings`` overridden by each row.
+
+    ``settings`` are the batch-wide ``image.create`` arguments (model, size,
+    steps, ...). Rerunning with different ones gives every job a new key, so
+    the journal does not skip prompts that were made with other settings.
+    """
+    # Identical requests get distinct keys by counting repeats
+    seen: Counter[str] = Counter()
+    keyed = []
+    for job in jobs:
+        request = {**settings, **job.params, "prompt": job.prompt, "name": job.name}
+        digest = hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+        seen[digest] += 1
+        keyed.append(dataclasses.replace(job, key=f"{digest[:16]}-{seen[digest]}"))
+    return keyed
+
+
+def _parse_row(line: str, lineno: int) -> dict[str, Any]:
+    try:
+        row = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Line {lineno}: invalid JSON ({e.msg})") from e
+    if not isinstance(row, dict):
+        raise ValueError(f"Line {lineno}: expected a JSON object")
+    prompt = row.get("prompt")
+    if not isinstance(prompt, str) or not prompt.strip():
+        raise ValueError(f"Line {lineno}: 'prompt' must be a non-empty string")
+
+    size = row.pop("size", None)
+    if size is not None:
+        match = _SIZE_RE.match(str(size))
+        if not match:
+            raise ValueError(f"Line {lineno}: size must be in WxH format, got: {size}")
+        row["width"], row["height"] = int(match.group(1)), int(match.group(2))
+
+    name = row.get("name")
+    if name is not None and (not isinstance(name, str) or not name or Path(name).name != name):
+        raise ValueError(f"Line {lineno}: 'name' must be a plain file name")
+
+    unknown = set(row) - ROW_PARAMS - {"prompt", "name"}
+    if unknown:
+        raise ValueError(f"Line {lineno}: unknown field(s): {', '.join(sorted(unknown))}")
+    return row
+
+
+class BatchJournal:
+    """Append-only record of finished jobs, one JSON object per line.
+
+    Args:
+        path: Journal file; created on the first record.
+        resume: Read earlier records so finished jobs can be skipped. When
+            ``False`` the journal is truncated on the first record.
+    """
+
+    def __init__(self, path: Path, *, resume: bool = True) -> None:
+        self.path = path
+        self._done: dict[str, list[str]] = {}
+        self._truncate = not resume
+        self._file: TextIO | None = None
+        if resume:
+            self._replay()
+
+    def _replay(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # a line torn by an interrupted run
+                if entry.get("status") == "ok":
+                    self._done[entry["key"]] = entry["files"]
+
+    def is_done(self, job: BatchJob, save_dir: Path) -> bool:
+        """Whether ``job`` finished in an earlier run and its images still exist."""
+        files = self._done.get(job.key)
+        if not files:
+            return False
+        return all((save_dir / name).exists() for name in files)
+
+    def record(
+        self, job: BatchJob, *, files: list[str] | None = None, error: str | None = None
+    ) -> None:
+        """Append the outcome of ``job`` and flush it to disk."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(  # noqa: SIM115 — kept open for the whole run
+                self.path, "w" if self._truncate else "a", encoding="utf-8"
+            )
+        entry: dict[str, Any] = {"key": job.key, "index": job.index, "prompt": job.prompt}
+        if error is None:
+            entry.update(status="ok", files=files or [])
+        else:
+            entry.update(status="error", error=error)
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def write_b64_image(path: Path, data: str) -> int:
+    """Decode base64 ``data`` into ``path`` chunk by chunk; return bytes written.
+
+    Line breaks and other whitespace (wrapped base64) are ignored. The
+    image is written to a temporary file beside ``path`` and renamed into
+    place, so an interrupted run never leaves a truncated image behind.
+    Blocking; call it through :func:`asyncio.to_thread`.
+
+    Raises:
+        binascii.Error: If ``data`` is not valid base64.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".part")
+    written = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            carry = ""
+            for start in range(0, len(data), B64_CHUNK):
+                # Decode whole 4-character groups; the rest joins the next chunk
+                chunk = carry + "".join(data[start : start + B64_CHUNK].split())
+                cut = len(chunk) - len(chunk) % 4
+                written += f.write(base64.b64decode(chunk[:cut], validate=True))
+                carry = chunk[cut:]
+            if carry:
+                base64.b64decode(carry, validate=True)  # always raises: truncated input
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+    return written
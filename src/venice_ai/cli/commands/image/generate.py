@@ -1,5 +1,7 @@
 """
 Image generation and batch generation commands.
+
+See also: ``._batch`` for the batch work queue and resume journal.
 """
 
 import asyncio
@@ -8,7 +10,14 @@ from pathlib import Path
 from typing import Any, cast
 
 import click
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeRemainingColumn,
+)
 
 from venice_ai import VeniceClient
 from venice_ai.exceptions import VeniceError
@@ -25,6 +34,7 @@ from ...utils import (
     print_info,
     print_success,
 )
+from ._batch import BatchJob, BatchJournal, load_jobs, with_settings, write_b64_image
 from ._helpers import _load_preset_config, validate_size
 
 
@@ -423,7 +433,7 @@ async def _generate_image_async(
     "-f",
     required=True,
     type=click.Path(exists=True),
-    help="File containing prompts (one per line)",
+    help="Prompts, one per line, or a .jsonl file with per-prompt parameters",
 )
 @click.option("--model", "-m", help="Image model to use", default=None)
 @click.option(
@@ -434,6 +444,25 @@ async def _generate_image_async(
     help="Image size in WxH format (e.g., 1024x1024, 1920x1080)",
 )
 @click.option("--save-dir", help="Directory to save images", default=None)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Prompts generated at once (requests still pass the client's rate limiter)",
+)
+@click.option(
+    "--journal",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Journal of finished prompts (default: .<prompts-file>.batch.jsonl in the save dir)",
+)
+@click.option(
+    "--resume/--no-resume",
+    default=True,
+    help="Skip prompts the journal records as saved",
+)
 # GENERATION CONTROL PARAMETERS
 @click.option("--steps", type=int, help="Inference steps (1-50, higher=better quality)")
 @click.option("--cfg-scale", type=float, help="CFG scale (0-20, higher=stricter prompt adherence)")
@@ -452,6 +481,9 @@ def batch_generate(
     model: str | None,
     size: str,
     save_dir: str | None,
+    concurrency: int,
+    journal: str | None,
+    resume: bool,
     steps: int | None,
     cfg_scale: float | None,
     seed: int | None,
@@ -461,7 +493,16 @@ def batch_generate(
     hide_watermark: bool,
     embed_exif: bool,
 ) -> None:
-    """Generate multiple images from a file of prompts"""
+    """Generate multiple images from a file of prompts
+
+    Prompts run concurrently, and each finished prompt is recorded in a
+    journal in the save directory. Re-running an interrupted batch skips
+    the prompts that were already saved.
+
+    In a .jsonl prompts file every line is an object with a "prompt" and
+    optional per-prompt parameters (model, seed, steps, size, format, ...)
+    plus "name" for the output file name.
+    """
     asyncio.run(
         _batch_generate_async(
             ctx,
@@ -477,10 +518,21 @@ def batch_generate(
             safe_mode,
             hide_watermark,
             embed_exif,
+            concurrency=concurrency,
+            journal_file=journal,
+            resume=resume,
         )
     )
 
 
+def _open_journal(
+    path: Path, jobs: list[BatchJob], save_path: Path, *, resume: bool
+) -> tuple[BatchJournal, list[BatchJob]]:
+    """Open the batch journal and return it with the jobs still to run."""
+    journal = BatchJournal(path, resume=resume)
+    return journal, [job for job in jobs if not journal.is_done(job, save_path)]
+
+
 async def _batch_generate_async(
     ctx: click.Context,
     prompts_file: str,
@@ -495,19 +547,26 @@ async def _batch_generate_async(
     safe_mode: bool | None = None,
     hide_watermark: bool = False,
     embed_exif: bool = False,
+    *,
+    concurrency: int = 4,
+    journal_file: str | None = None,
+    resume: bool = True,
 ) -> None:
     """Async implementation of batch image generation"""
 
     # Read prompts from file
     prompts_path = Path(prompts_file)
-    with open(prompts_path) as f:
-        prompts = [line.strip() for line in f if line.strip()]
+    try:
+        jobs = load_jobs(prompts_path)
+    except ValueError as e:
+        print_error(f"Invalid prompts file: {e}")
+        raise SystemExit(1) from e
 
-    if not prompts:
+    if not jobs:
         print_error("No prompts found in file")
         raise SystemExit(1)
 
-    print_info(f"Found {len(prompts)} prompt(s) to process")
+    print_info(f"Found {len(jobs)} prompt(s) to process")
 
     # Get config
     config = ctx.obj.get("config", load_config())
@@ -521,8 +580,9 @@ async def _batch_generate_async(
 
     save_path.mkdir(parents=True, exist_ok=True)
 
-    # Determine output format for filenames
-    output_format = format or "png"
+    journal_path = (
+        Path(journal_file) if journal_file else save_path / f".{prompts_path.stem}.batch.jsonl"
+    )
 
     # Initialize Venice client and process prompts
     try:
@@ -530,7 +590,7 @@ async def _batch_generate_async(
             # Resolve model at runtime (no hardcoded fallback)
             model = await resolve_default_model(client, config, "image", explicit=model)
 
-            # Build base kwargs for SDK calls (prompt added per iteration)
+            # Build base kwargs for SDK calls (prompt and row parameters added per job)
             base_kwargs: dict[str, Any] = {
                 "model": model,
                 "width": width,
@@ -555,106 +615,92 @@ async def _batch_generate_async(
             if embed_exif:
                 base_kwargs["embed_exif_metadata"] = embed_exif
 
+            # Keys cover the resolved options, so a rerun with other ones starts over
+            jobs = with_settings(jobs, base_kwargs)
+            batch_journal, pending = await asyncio.to_thread(
+                _open_journal, journal_path, jobs, save_path, resume=resume
+            )
+            if len(pending) < len(jobs):
+                print_info(
+                    f"Resuming: {len(jobs) - len(pending)} already saved, {len(pending)} remaining"
+                )
+
             successful = 0
             failed = 0
+            done = 0
+            total = len(pending)
 
-            if plain:
-                # Plain mode: simple text output without Rich progress
-                for idx, prompt in enumerate(prompts, 1):
-                    click.echo(f"[{idx}/{len(prompts)}] Generating: {prompt[:50]}...")
-
-                    try:
-                        generate_kwargs = {**base_kwargs, "prompt": prompt}
-                        response = cast(
-                            ImageGenerationResponse,
-                            await client.image.create(**generate_kwargs),
-                        )
-
-                        if response and response.images:
-                            image_bytes = base64.b64decode(response.images[0])
-                            from datetime import datetime
-
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                            filename = f"batch_{idx}_{timestamp}.{output_format}"
-                            file_path = save_path / filename
-
-                            with open(file_path, "wb") as f:
-                                f.write(image_bytes)
-
-                            click.echo(f"  Saved: {file_path}")
-                            successful += 1
-                        else:
-                            click.echo("  Warning: No image generated")
-                            failed += 1
-
-                    except Exception as e:
-                        click.echo(f"  Failed: {str(e)[:50]}")
-                        failed += 1
-
-                    await asyncio.sleep(0.5)
-            else:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=console,
-                ) as progress:
-                    for idx, prompt in enumerate(prompts, 1):
-                        task_desc = f"[{idx}/{len(prompts)}] Generating: {prompt[:50]}..."
-                        task = progress.add_task(task_desc, total=None)
-
-                        try:
-                            generate_kwargs = {**base_kwargs, "prompt": prompt}
-                            response = cast(
-                                ImageGenerationResponse,
-                                await client.image.create(**generate_kwargs),
-                            )
-
-                            if response and response.images:
-                                # Save the image
-                                image_bytes = base64.b64decode(response.images[0])
-                                from datetime import datetime
-
-                                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                                filename = f"batch_{idx}_{timestamp}.{output_format}"
-                                file_path = save_path / filename
-
-                                with open(file_path, "wb") as f:
-                                    f.write(image_bytes)
-
-                                progress.update(
-                                    task,
-                                    description=f"[green]✓[/green] {prompt[:50]}... → {filename}",
-                                )
-                                successful += 1
-                            else:
-                                progress.update(
-                                    task,
-                                    description=f"[yellow]⚠[/yellow] {prompt[:50]}... - No image",
-                                )
-                                failed += 1
-
-                        except Exception as e:
-                            progress.update(
-                                task,
-                                description=f"[red]✗[/red] {prompt[:50]}... - {str(e)[:30]}",
-                            )
-                            failed += 1
-
-                        # Small delay between requests to be respectful
-                        await asyncio.sleep(0.5)
+            async def run_job(job: BatchJob) -> None:
+                nonlocal successful, failed, done
+                generate_kwargs = {**base_kwargs, **job.params, "prompt": job.prompt}
+                try:
+                    response = cast(
+                        ImageGenerationResponse,
+                        await client.image.create(**generate_kwargs),
+                    )
+                    if not response or not response.images:
+                        raise ValueError("No image generated")
+                    names = job.filenames(
+                        generate_kwargs.get("format") or "png", len(response.images)
+                    )
+                    for name, data in zip(names, response.images, strict=True):
+                        await asyncio.to_thread(write_b64_image, save_path / name, data)
+                except Exception as e:
+                    batch_journal.record(job, error=str(e))
+                    failed += 1
+                    done += 1
+                    message = f"[{done}/{total}] Failed: {job.prompt[:50]} - {str(e)[:50]}"
+                    if plain:
+                        click.echo(message)
+                    else:
+                        progress.console.print(f"[red]✗[/red] {message}")
+                else:
+                    batch_journal.record(job, files=names)
+                    successful += 1
+                    done += 1
+                    if plain:
+                        click.echo(f"[{done}/{total}] Saved: {save_path / names[0]}")
+                if not plain:
+                    progress.advance(task)
+
+            queue = iter(pending)
+
+            async def worker() -> None:
+                for job in queue:
+                    await run_job(job)
+
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                TimeRemainingColumn(),
+                console=console,
+                disable=plain,
+            ) as progress:
+                task = progress.add_task("Generating", total=total)
+                try:
+                    await asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
+                finally:
+                    batch_journal.close()
 
             # Summary
+            skipped = len(jobs) - len(pending)
             if plain:
                 click.echo("\nBatch Generation Complete")
                 click.echo(f"Successful: {successful}")
+                if skipped:
+                    click.echo(f"Skipped (already saved): {skipped}")
                 if failed > 0:
-                    click.echo(f"Failed: {failed}")
+                    click.echo(f"Failed: {failed} (re-run the same command to retry)")
                 click.echo(f"Images saved to: {save_path}")
             else:
                 console.print("\n[bold]Batch Generation Complete[/bold]")
                 console.print(f"✅ Successful: {successful}")
+                if skipped:
+                    console.print(f"⏭  Skipped (already saved): {skipped}")
                 if failed > 0:
-                    console.print(f"❌ Failed: {failed}")
+                    console.print(f"❌ Failed: {failed} (re-run the same command to retry)")
                 console.print(f"📁 Images saved to: {save_path}")
 
     except VeniceError as e:
@@ -4,13 +4,16 @@ Configuration management for Venice AI CLI
 
 import os
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 from dotenv import load_dotenv
 
 from . import _paths
 
+if TYPE_CHECKING:
+    from venice_ai.models.catalog import ModelCatalog
+
 # ``yaml`` is gated behind the ``[cli]`` extra. Lazy-import it inside the
 # read/write helpers so subcommands that don't touch the config file (e.g.
 # ``venice-py lint``) work on a bare ``pip install venice-py`` install.
@@ -194,13 +197,36 @@ def get_base_url(config_path: Path | None = None) -> str:
 
 
 def get_client_kwargs(config_path: Path | None = None) -> dict[str, Any]:
-    """Return ``VeniceClient`` constructor kwargs (api_key + base_url).
+    """Return ``VeniceClient`` constructor kwargs (api_key, base_url, model_catalog).
 
     Resolves the API key (raising if absent) and the base URL from the
     resolved config. This is the canonical helper for CLI command modules
     constructing a client.
     """
+    base_url = get_base_url(config_path)
     return {
         "api_key": ensure_api_key(config_path),
-        "base_url": get_base_url(config_path),
+        "base_url": base_url,
+        "model_catalog": _model_catalog(base_url),
     }
+
+
+def _model_catalog(base_url: str) -> "ModelCatalog":
+    """Model catalog cached on disk, so each invocation does not re-download it.
+
+    Stored under ``~/.venice-py/cache/models`` unless ``VENICE_MODEL_CACHE_DIR``
+    points elsewhere, and keyed by ``base_url``.
+    """
+    from venice_ai import _constants
+    from venice_ai.cache import FileCacheStore
+    from venice_ai.models.catalog import ModelCatalog
+
+    directory = os.environ.get(_constants.ENV_MODEL_CACHE_DIR) or (
+        _paths.app_dir() / "cache" / "models"
+    )
+    return ModelCatalog(
+        FileCacheStore(directory),
+        ttl=300.0,
+        stale_while_revalidate=3600.0,
+        namespace=base_url,
+    )
@@ -14,6 +14,18 @@ from .auth import (
 from .config import (
     RedisBackendConfig as RedisBackendConfig,
 )
+from .job_poller import (
+    JobPoller as JobPoller,
+)
+from .job_poller import (
+    JobPollerStats as JobPollerStats,
+)
+from .model_fallback import (
+    ModelFallback as ModelFallback,
+)
+from .model_fallback import (
+    ModelFallbackStats as ModelFallbackStats,
+)
 from .models import (
     VeniceBaseModel as VeniceBaseModel,
 )
@@ -23,6 +35,18 @@ from .rate_limit_discovery import (
 from .rate_limit_discovery import (
     RateLimitDiscovery as RateLimitDiscovery,
 )
+from .retry_budget import (
+    RetryBudget as RetryBudget,
+)
+from .retry_budget import (
+    RetryBudgetStats as RetryBudgetStats,
+)
+from .single_flight import (
+    SingleFlight as SingleFlight,
+)
+from .single_flight import (
+    SingleFlightStats as SingleFlightStats,
+)
 
 __all__ = [
     # Auth utilities
@@ -35,4 +59,16 @@ __all__ = [
     # Rate limiting
     "RateLimitBucket",
     "RateLimitDiscovery",
+    # Retry coordination
+    "RetryBudget",
+    "RetryBudgetStats",
+    # Request coalescing
+    "SingleFlight",
+    "SingleFlightStats",
+    # Job polling
+    "JobPoller",
+    "JobPollerStats",
+    # Model fallback
+    "ModelFallback",
+    "ModelFallbackStats",
 ]
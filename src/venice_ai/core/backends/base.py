@@ -18,6 +18,10 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+#: Seconds a streaming reservation survives without being released. Bounds how
+#: long a crashed worker's reservation lingers; long enough for slow streams.
+STREAMING_RESERVATION_TTL = 600.0
+
 
 @dataclass
 class HealthCheckResult:
@@ -89,6 +93,9 @@ class AccountBackend(abc.ABC):
 
         This method is called when a streaming response completes. It uses
         refund-based accounting: refund = reserved_tokens - actual_tokens.
+        Backends that took the reservation with :meth:`reserve_streaming`
+        refund the amount they recorded, so a reservation is refunded at
+        most once.
 
         For non-streaming workloads or simplified backends, a no-op
         implementation that returns True is acceptable.
@@ -100,7 +107,8 @@ class AccountBackend(abc.ABC):
             actual_tokens: Actual tokens consumed by the stream
 
         Returns:
-            True if release succeeded (or was no-op), False on error
+            True if release succeeded (or was no-op), False on error or
+            when the reservation is unknown (expired or already released)
 
         Note:
             This method was added for compatibility with the streaming
@@ -109,6 +117,42 @@ class AccountBackend(abc.ABC):
         """
         pass
 
+    async def reserve(self, model: str, tokens: int = 0) -> tuple[bool, float]:
+        """Check capacity and, if available, record the request.
+
+        Returns ``(can_proceed, wait_seconds)``. Backends with shared state
+        should override this to check and deduct atomically; the default is a
+        :meth:`check_capacity` followed by a separate :meth:`record_request`.
+        """
+        can_proceed, wait_time = await self.check_capacity(model)
+        if can_proceed:
+            await self.record_request(model, tokens or None)
+        return can_proceed, wait_time
+
+    async def reserve_streaming(
+        self,
+        bucket_id: str,
+        reservation_id: str,
+        tokens: int,
+        ttl: float = STREAMING_RESERVATION_TTL,
+    ) -> tuple[bool, float]:
+        """Reserve ``tokens`` for a streaming request under ``reservation_id``.
+
+        The reservation is settled by :meth:`release_streaming_reservation`
+        once the stream's real usage is known; backends that record it expire
+        the record after ``ttl`` seconds. The default just calls
+        :meth:`reserve` and keeps no record.
+
+        Returns:
+            ``(can_proceed, wait_seconds)`` as for :meth:`reserve`.
+        """
+        del reservation_id, ttl  # not recorded by the default implementation
+        return await self.reserve(bucket_id, tokens)
+
+    async def refund(self, model: str, requests: int = 0, tokens: int = 0) -> None:
+        """Return unused capacity taken by :meth:`reserve`. No-op by default."""
+        del model, requests, tokens  # default backends do not track remaining capacity
+
     # === Failure Tracking and Circuit Breaking ===
 
     @abc.abstractmethod
@@ -8,13 +8,18 @@ for single-process applications. For distributed deployments, use Redis backend.
 import asyncio
 import logging
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import Any
 
-from .base import AccountBackend, HealthCheckResult
+from .base import STREAMING_RESERVATION_TTL, AccountBackend, HealthCheckResult
 
 logger = logging.getLogger(__name__)
 
+#: Failures older than this (seconds) are pruned when a new one is recorded.
+FAILURE_RETENTION = 3600
+#: Capacity of the failure ring; the oldest entry is dropped when full.
+FAILURE_MAX_ENTRIES = 1000
+
 
 class MemoryBackend(AccountBackend):
     """
@@ -40,8 +45,8 @@ class MemoryBackend(AccountBackend):
         """
         super().__init__(namespace)
 
-        # Failure tracking
-        self._failures: list[tuple[float, str, str]] = []  # (timestamp, type, message)
+        # Failure tracking: ring of (timestamp, type, message), oldest first
+        self._failures: deque[tuple[float, str, str]] = deque(maxlen=FAILURE_MAX_ENTRIES)
         self._circuit_broken_until: float | None = None
 
         # Rate limit state (from response headers)
@@ -51,6 +56,9 @@ class MemoryBackend(AccountBackend):
         self._request_counts: dict[str, int] = defaultdict(int)
         self._token_counts: dict[str, int] = defaultdict(int)
 
+        # Open streaming reservations: (bucket_id, reservation_id) -> (tokens, expires_at)
+        self._reservations: dict[tuple[str, str], tuple[int, float]] = {}
+
         # Async lock for thread safety
         self._lock = asyncio.Lock()
 
@@ -76,8 +84,7 @@ class MemoryBackend(AccountBackend):
     async def get_all_stats(self) -> dict[str, Any]:
         """Get all statistics from the backend."""
         async with self._lock:
-            cutoff = time.time() - 30
-            recent_failures = sum(1 for ts, _, _ in self._failures if ts > cutoff)
+            recent_failures = self._count_recent_failures(30)
 
             return {
                 "rate_limits_count": len(self._rate_limits),
@@ -96,6 +103,7 @@ class MemoryBackend(AccountBackend):
             self._rate_limits.clear()
             self._request_counts.clear()
             self._token_counts.clear()
+            self._reservations.clear()
             self._circuit_broken_until = None
             logger.debug("MemoryBackend cleanup completed")
 
@@ -152,6 +160,42 @@ class MemoryBackend(AccountBackend):
             if tokens_used is not None:
                 self._token_counts[model] += tokens_used
 
+    async def reserve_streaming(
+        self,
+        bucket_id: str,
+        reservation_id: str,
+        tokens: int,
+        ttl: float = STREAMING_RESERVATION_TTL,
+    ) -> tuple[bool, float]:
+        """
+        Reserve tokens for a streaming request.
+
+        Counts the request, charges ``tokens`` against the model's token count
+        and cached ``tpm_remaining``, and remembers the reservation for
+        ``ttl`` seconds so :meth:`release_streaming_reservation` can refund it.
+
+        Args:
+            bucket_id: Model identifier
+            reservation_id: Unique id for this stream
+            tokens: Estimated tokens for the whole stream
+            ttl: Seconds before an unreleased reservation is discarded
+
+        Returns:
+            Tuple of (can_proceed, wait_seconds); nothing is reserved when blocked
+        """
+        can_proceed, wait_time = await self.check_capacity(bucket_id)
+        if not can_proceed:
+            return False, wait_time
+        tokens = max(0, tokens)
+        async with self._lock:
+            now = time.time()
+            self._purge_expired_reservations(now)
+            self._request_counts[bucket_id] += 1
+            self._token_counts[bucket_id] += tokens
+            self._adjust_tpm_remaining(bucket_id, -tokens)
+            self._reservations[(bucket_id, reservation_id)] = (tokens, now + ttl)
+        return True, 0.0
+
     async def release_streaming_reservation(
         self,
         bucket_id: str,
@@ -161,17 +205,43 @@ class MemoryBackend(AccountBackend):
     ) -> bool:
         """Release streaming reservation with refund-based accounting.
 
-        For MemoryBackend, this is largely a no-op since the simplified
-        backend doesn't track individual reservations. Returns True to
-        indicate success for protocol compatibility.
+        Refunds ``reserved - actual`` (negative when the stream overran its
+        estimate) using the amount recorded by :meth:`reserve_streaming`.
+        Unknown reservations (expired, released, or never taken here) are
+        left alone and reported as ``False``.
         """
-        # MemoryBackend doesn't track individual reservations
-        # This is a no-op implementation for protocol compatibility
-        logger.debug(
-            f"release_streaming_reservation: bucket={bucket_id}, "
-            f"reservation={reservation_id}, refund={reserved_tokens - actual_tokens}"
-        )
-        return True
+        async with self._lock:
+            entry = self._reservations.pop((bucket_id, reservation_id), None)
+            if entry is None or entry[1] <= time.time():
+                logger.debug(
+                    f"release_streaming_reservation: unknown or expired reservation "
+                    f"{reservation_id} for {bucket_id} (reserved={reserved_tokens})"
+                )
+                return False
+            refund = entry[0] - max(0, actual_tokens)
+            self._token_counts[bucket_id] -= refund
+            self._adjust_tpm_remaining(bucket_id, refund)
+            logger.debug(
+                f"release_streaming_reservation: bucket={bucket_id}, "
+                f"reservation={reservation_id}, refund={refund}"
+            )
+            return True
+
+    def _purge_expired_reservations(self, now: float) -> None:
+        """Drop reservations whose TTL has passed (tokens stay charged)."""
+        expired = [key for key, (_, expires_at) in self._reservations.items() if expires_at <= now]
+        for key in expired:
+            del self._reservations[key]
+
+    def _adjust_tpm_remaining(self, model: str, delta: int) -> None:
+        """Add ``delta`` to the cached ``tpm_remaining``, clamped to ``[0, tpm_limit]``."""
+        limits = self._rate_limits.get(model)
+        if not limits or "tpm_remaining" not in limits:
+            return
+        remaining = max(0, limits["tpm_remaining"] + delta)
+        if "tpm_limit" in limits:
+            remaining = min(remaining, limits["tpm_limit"])
+        limits["tpm_remaining"] = remaining
 
     # === Failure Tracking and Circuit Breaking ===
 
@@ -184,7 +254,11 @@ class MemoryBackend(AccountBackend):
             error_message: Optional error message
         """
         async with self._lock:
-            self._failures.append((time.time(), error_type, error_message))
+            now = time.time()
+            expired = now - FAILURE_RETENTION
+            while self._failures and self._failures[0][0] <= expired:
+                self._failures.popleft()
+            self._failures.append((now, error_type, error_message))
             logger.debug(f"Recorded failure: {error_type} - {error_message}")
 
     async def get_failure_count(self, window_seconds: int = 30) -> int:
@@ -198,8 +272,21 @@ class MemoryBackend(AccountBackend):
             Number of failures in the window
         """
         async with self._lock:
-            cutoff = time.time() - window_seconds
-            return sum(1 for ts, _, _ in self._failures if ts > cutoff)
+            return self._count_recent_failures(window_seconds)
+
+    def _count_recent_failures(self, window_seconds: float) -> int:
+        """Count failures newer than ``window_seconds``, scanning from the newest end.
+
+        Only entries inside the window are visited, so the cost is bounded by
+        the count rather than by the size of the ring.
+        """
+        cutoff = time.time() - window_seconds
+        count = 0
+        for ts, _, _ in reversed(self._failures):
+            if ts <= cutoff:
+                break
+            count += 1
+        return count
 
     async def is_circuit_broken(self) -> bool:
         """
@@ -3,14 +3,21 @@ Simplified RedisBackend for VeniceAccount operations.
 
 This Redis backend provides distributed rate limit tracking and failure management.
 For single-process applications, consider using MemoryBackend instead.
+
+Per-model rate-limit state is a Redis hash updated only by server-side Lua
+scripts, so concurrent workers sharing an account never lose decrements and
+each capacity check / reservation / refund is a single round-trip.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import threading
 import time
+import uuid
 import weakref
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
@@ -19,6 +26,7 @@ if TYPE_CHECKING:
     from redis.asyncio.cluster import RedisCluster
     from redis.exceptions import (
         ConnectionError,
+        NoScriptError,
         RedisError,
         ResponseError,
         TimeoutError,
@@ -30,6 +38,7 @@ try:
     from redis.asyncio.cluster import RedisCluster
     from redis.exceptions import (
         ConnectionError,
+        NoScriptError,
         RedisError,
         ResponseError,
         TimeoutError,
@@ -43,10 +52,173 @@ except ImportError as _redis_import_error:  # pragma: no cover
 import builtins
 import contextlib
 
-from .base import AccountBackend, HealthCheckResult
+from .base import STREAMING_RESERVATION_TTL, AccountBackend, HealthCheckResult
 
 logger = logging.getLogger(__name__)
 
+#: Failures within :data:`CIRCUIT_FAILURE_WINDOW` seconds that trip the breaker.
+CIRCUIT_FAILURE_THRESHOLD = 20
+CIRCUIT_FAILURE_WINDOW = 30
+#: Minimum wait reported while the circuit breaker is open.
+CIRCUIT_BREAK_WAIT = 30.0
+#: Failures older than this (seconds) are pruned; also the failure window's TTL.
+FAILURE_RETENTION = 3600
+#: Upper bound on failures kept in the window (oldest are dropped first).
+FAILURE_MAX_ENTRIES = 1000
+
+# Capacity check / reservation / usage recording, atomically.
+#   KEYS: rate-limit hash, forced circuit-break key, failure window (ZSET),
+#         [streaming reservation key]
+#   ARGV: now, tokens, key TTL, mode ("check" | "reserve" | "record"),
+#         failure threshold, failure window, circuit-break wait,
+#         [reservation TTL]
+# Returns {allowed (0/1), wait seconds as a string}. "record" never blocks.
+# With a fourth key, a successful reservation also stores its token count
+# there (expiring after the reservation TTL) for the release script.
+_ACQUIRE_LUA = """
+local now = tonumber(ARGV[1])
+local tokens = tonumber(ARGV[2])
+local mode = ARGV[4]
+local exists = redis.call('EXISTS', KEYS[1]) == 1
+local s = redis.call('HMGET', KEYS[1], 'rpm_limit', 'rpm_remaining', 'rpm_reset',
+    'tpm_limit', 'tpm_remaining', 'tpm_reset', 'retry_until')
+local rpm_limit, rpm_remaining, rpm_reset = tonumber(s[1]), tonumber(s[2]), tonumber(s[3])
+local tpm_limit, tpm_remaining, tpm_reset = tonumber(s[4]), tonumber(s[5]), tonumber(s[6])
+local retry_until = tonumber(s[7])
+
+-- A window whose reset time has passed starts over at its limit
+local rolled = {}
+if rpm_reset and rpm_reset <= now then
+    rpm_remaining = rpm_limit or rpm_remaining
+    rpm_reset = nil
+    table.insert(rolled, 'rpm_reset')
+end
+if tpm_reset and tpm_reset <= now then
+    tpm_remaining = tpm_limit or tpm_remaining
+    tpm_reset = nil
+    table.insert(rolled, 'tpm_reset')
+end
+
+if mode ~= 'record' then
+    local wait = 0
+    if retry_until and retry_until > now then
+        wait = retry_until - now
+    end
+    if rpm_remaining and rpm_remaining <= 0 and rpm_reset then
+        wait = math.max(wait, rpm_reset - now)
+    end
+    if tpm_remaining and tpm_reset and (tpm_remaining <= 0
+            or (tokens > tpm_remaining and tpm_remaining ~= tpm_limit)) then
+        wait = math.max(wait, tpm_reset - now)
+    end
+    local broken = redis.call('EXISTS', KEYS[2]) == 1
+    if not broken then
+        local recent = redis.call('ZCOUNT', KEYS[3], '(' .. (now - tonumber(ARGV[6])), '+inf')
+        broken = recent >= tonumber(ARGV[5])
+    end
+    if broken then
+        wait = math.max(wait, tonumber(ARGV[7]))
+    end
+    if wait > 0 or mode == 'check' then
+        return {wait > 0 and 0 or 1, tostring(wait)}
+    end
+end
+
+if exists then
+    if #rolled > 0 then
+        redis.call('HDEL', KEYS[1], unpack(rolled))
+    end
+    if rpm_remaining then
+        redis.call('HSET', KEYS[1], 'rpm_remaining', math.max(0, rpm_remaining - 1))
+    end
+    if tpm_remaining and tokens > 0 then
+        redis.call('HSET', KEYS[1], 'tpm_remaining', math.max(0, tpm_remaining - tokens))
+    end
+    redis.call('HSET', KEYS[1], 'last_request', ARGV[1])
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+end
+if KEYS[4] then
+    redis.call('SET', KEYS[4], tokens, 'PX', math.ceil(tonumber(ARGV[8]) * 1000))
+end
+return {1, '0'}
+"""
+
+# Give back unused requests/tokens, capped at the window's limit.
+#   KEYS: rate-limit hash
+#   ARGV: requests, tokens
+_REFUND_LUA = """
+local function refund(remaining_field, limit_field, amount)
+    if amount <= 0 then
+        return
+    end
+    local s = redis.call('HMGET', KEYS[1], remaining_field, limit_field)
+    local remaining, limit = tonumber(s[1]), tonumber(s[2])
+    if not remaining then
+        return
+    end
+    remaining = remaining + amount
+    if limit and remaining > limit then
+        remaining = limit
+    end
+    redis.call('HSET', KEYS[1], remaining_field, remaining)
+end
+refund('rpm_remaining', 'rpm_limit', tonumber(ARGV[1]))
+refund('tpm_remaining', 'tpm_limit', tonumber(ARGV[2]))
+return 1
+"""
+
+# Settle a streaming reservation: refund reserved - actual tokens, once.
+#   KEYS: reservation key, rate-limit hash
+#   ARGV: actual tokens
+# Returns the refund applied, or false when the reservation is unknown
+# (expired, already released, or never taken).
+_RELEASE_LUA = """
+local reserved = tonumber(redis.call('GET', KEYS[1]))
+if not reserved then
+    return false
+end
+redis.call('DEL', KEYS[1])
+local refund = reserved - tonumber(ARGV[1])
+local s = redis.call('HMGET', KEYS[2], 'tpm_remaining', 'tpm_limit')
+local remaining, limit = tonumber(s[1]), tonumber(s[2])
+if remaining and refund ~= 0 then
+    remaining = math.max(0, remaining + refund)
+    if limit and remaining > limit then
+        remaining = limit
+    end
+    redis.call('HSET', KEYS[2], 'tpm_remaining', remaining)
+end
+return refund
+"""
+
+# Replace the rate-limit hash with freshly parsed header values.
+#   KEYS: rate-limit hash
+#   ARGV: key TTL, field, value, field, value, ...
+_UPDATE_LUA = """
+redis.call('DEL', KEYS[1])
+if #ARGV > 1 then
+    redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+end
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+class _LuaScript:
+    """Lua script invoked by SHA; falls back to ``EVAL`` (which caches it) on ``NOSCRIPT``."""
+
+    __slots__ = ("sha", "source")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.sha = hashlib.sha1(source.encode(), usedforsecurity=False).hexdigest()
+
+    async def __call__(self, client: Any, keys: list[str], args: list[Any]) -> Any:
+        try:
+            return await client.evalsha(self.sha, len(keys), *keys, *args)
+        except NoScriptError:
+            return await client.eval(self.source, len(keys), *keys, *args)
+
 
 class RedisBackend(AccountBackend):
     """
@@ -55,10 +227,22 @@ class RedisBackend(AccountBackend):
     Features:
     - Per-event-loop connection pooling
     - Thread-safe connection pool management
-    - Distributed failure tracking and circuit breaker
-    - Rate limit state caching from response headers
+    - No per-operation PING: pool health checks plus reconnect-and-retry-once
+      when a command hits ``ConnectionError``
+    - Distributed failure tracking and circuit breaker over a sorted-set
+      sliding window (O(log n) ZCOUNT per check)
+    - Rate limit state from response headers, kept in a Redis hash and
+      updated atomically by Lua scripts (check+reserve, record, refund,
+      streaming reservation release)
+    - Cluster-safe keys: in ``cluster_mode`` the namespace is a ``{hash tag}``
+      so every key a script touches lives in one slot
     """
 
+    _acquire_script: ClassVar[_LuaScript] = _LuaScript(_ACQUIRE_LUA)
+    _refund_script: ClassVar[_LuaScript] = _LuaScript(_REFUND_LUA)
+    _update_script: ClassVar[_LuaScript] = _LuaScript(_UPDATE_LUA)
+    _release_script: ClassVar[_LuaScript] = _LuaScript(_RELEASE_LUA)
+
     # Class-level connection pools indexed by event loop ID
     _connection_pools: ClassVar[dict[int, Any]] = {}
     _pool_lock: ClassVar[threading.Lock] = threading.Lock()
@@ -99,8 +283,10 @@ class RedisBackend(AccountBackend):
         self._owned_redis = redis_client is None
         self._event_loop_id: int | None = None
 
-        # Key prefixes (simplified)
-        self.key_prefix = f"venice:{namespace}"
+        # Key prefixes (simplified). Scripts touch the rate-limit hash, the
+        # circuit-break key and the failure window together, so in cluster mode
+        # the namespace is a hash tag that pins them to one slot.
+        self.key_prefix = f"venice:{{{namespace}}}" if cluster_mode else f"venice:{namespace}"
         self.rate_limit_prefix = f"{self.key_prefix}:rate_limits"
         self.failure_prefix = f"{self.key_prefix}:failures"
         self.circuit_break_key = f"{self.key_prefix}:circuit_break_until"
@@ -146,15 +332,11 @@ class RedisBackend(AccountBackend):
 
             self._event_loop_id = loop_id
 
-            # Return existing connection if valid
+            # Return the cached client without probing it: idle connections are
+            # checked by the pool's health_check_interval and a dropped
+            # connection surfaces as ConnectionError on the command (_execute).
             if self._redis and self._connected:
-                try:
-                    await self._redis.ping()
-                    return self._redis
-                except (ConnectionError, Exception):
-                    logger.warning("Redis connection lost, reconnecting...")
-                    self._redis = None
-                    self._connected = False
+                return self._redis
 
             # Create or reuse connection for this event loop
             async with self._connection_lock:
@@ -238,6 +420,18 @@ class RedisBackend(AccountBackend):
             logger.error(f"Redis error during connection: {e}")
             raise
 
+    async def connection(self) -> Any:
+        """
+        Return the connected Redis client for the running event loop.
+
+        Lets other components (e.g. :class:`~venice_ai.cache.RedisCacheStore`)
+        share this backend's connection pool instead of opening their own.
+
+        Returns:
+            Redis: Connected Redis client (``decode_responses=True``)
+        """
+        return await self._ensure_connected()
+
     async def _cleanup_connection(
         self, loop_id: int, connection: Any, timeout: float = 2.5
     ) -> None:
@@ -302,12 +496,65 @@ class RedisBackend(AccountBackend):
         except Exception as e:
             logger.error(f"Error disconnecting pool: {e}")
 
+    async def _execute[T](self, operation: Callable[[Any], Awaitable[T]]) -> T:
+        """Run ``operation(client)``, reconnecting and retrying once on ``ConnectionError``.
+
+        Owned clients are rebuilt from the pool (and pinged) before the retry;
+        a caller-supplied client is retried as-is, since redis-py has already
+        discarded the broken connection. A second failure propagates.
+        """
+        redis_client = await self._ensure_connected()
+        try:
+            return await operation(redis_client)
+        except ConnectionError as e:
+            logger.warning(f"Redis connection lost ({e}), reconnecting and retrying once")
+            if self._owned_redis:
+                self._connected = False
+                redis_client = await self._ensure_connected()
+            return await operation(redis_client)
+
     # === Key Helpers ===
 
     def _get_rate_limit_key(self, model: str) -> str:
         """Get Redis key for rate limit storage."""
         return f"{self.rate_limit_prefix}:{model}"
 
+    @property
+    def _failure_window_key(self) -> str:
+        """Sorted set of failures scored by timestamp."""
+        return f"{self.failure_prefix}:window"
+
+    def _get_reservation_key(self, bucket_id: str, reservation_id: str) -> str:
+        """Get Redis key holding a streaming reservation's token count."""
+        return f"{self.key_prefix}:reservations:{bucket_id}:{reservation_id}"
+
+    async def _acquire(
+        self,
+        model: str,
+        tokens: int,
+        mode: str,
+        reservation: tuple[str, float] | None = None,
+    ) -> tuple[bool, float]:
+        """Run the acquire script for ``model`` in ``mode`` (one round-trip).
+
+        ``reservation`` is ``(reservation_key, ttl)`` for streaming reservations.
+        """
+        keys = [self._get_rate_limit_key(model), self.circuit_break_key, self._failure_window_key]
+        args: list[Any] = [
+            time.time(),
+            max(0, int(tokens)),
+            self.key_ttl,
+            mode,
+            CIRCUIT_FAILURE_THRESHOLD,
+            CIRCUIT_FAILURE_WINDOW,
+            CIRCUIT_BREAK_WAIT,
+        ]
+        if reservation is not None:
+            keys.append(reservation[0])
+            args.append(reservation[1])
+        allowed, wait = await self._execute(lambda c: self._acquire_script(c, keys, args))
+        return bool(int(allowed)), max(0.0, float(wait))
+
     # === 11 Required Methods from AccountBackend ===
 
     async def health_check(self) -> HealthCheckResult:
@@ -404,30 +651,75 @@ class RedisBackend(AccountBackend):
             return {"rate_limits": 0, "failures": 0, "error": str(e)}
 
     async def check_capacity(self, model: str, request_type: str = "default") -> tuple[bool, float]:
-        """Check capacity for a model."""
+        """Check capacity for a model (rate-limit windows and circuit breaker, one call)."""
         del request_type  # interface-only; Redis backend ignores request_type
-        rate_limits = await self._get_rate_limits(model)
-        wait_time = self._calculate_wait_time(rate_limits)
+        try:
+            return await self._acquire(model, 0, "check")
+        except (ConnectionError, TimeoutError) as e:
+            logger.error(f"Redis connection error checking capacity for {model}: {e}")
+        except (ResponseError, ValueError) as e:
+            logger.error(f"Redis data error checking capacity for {model}: {e}")
+        except RedisError as e:
+            logger.error(f"Redis error checking capacity for {model}: {e}")
+        return True, 0.0
+
+    async def reserve(self, model: str, tokens: int = 0) -> tuple[bool, float]:
+        """Atomically check capacity and, if available, take one request and ``tokens``.
 
-        if await self.is_circuit_broken():
-            return False, max(wait_time, 30.0)
+        Returns:
+            ``(True, 0.0)`` when reserved, otherwise ``(False, wait_seconds)``
+            with nothing deducted. Fails open on Redis errors.
+        """
+        try:
+            return await self._acquire(model, tokens, "reserve")
+        except (ConnectionError, TimeoutError) as e:
+            logger.error(f"Redis connection error reserving capacity for {model}: {e}")
+        except (ResponseError, ValueError) as e:
+            logger.error(f"Redis data error reserving capacity for {model}: {e}")
+        except RedisError as e:
+            logger.error(f"Redis error reserving capacity for {model}: {e}")
+        return True, 0.0
 
-        can_proceed = wait_time <= 0.0
-        return can_proceed, wait_time
+    async def refund(self, model: str, requests: int = 0, tokens: int = 0) -> None:
+        """Atomically return unused requests/tokens to ``model``'s current window."""
+        if requests <= 0 and tokens <= 0:
+            return
+        try:
+            keys = [self._get_rate_limit_key(model)]
+            await self._execute(lambda c: self._refund_script(c, keys, [requests, tokens]))
+        except (ConnectionError, TimeoutError) as e:
+            logger.error(f"Redis connection error refunding capacity for {model}: {e}")
+        except ResponseError as e:
+            logger.error(f"Redis response error refunding capacity for {model}: {e}")
+        except RedisError as e:
+            logger.error(f"Redis error refunding capacity for {model}: {e}")
 
     async def update_rate_limits(self, model: str, headers: dict[str, str]) -> None:
-        """Update rate limits from response headers."""
+        """Update rate limits from response headers.
+
+        Relative reset / ``retry-after`` values are stored as absolute epoch
+        seconds (``*_reset``, ``retry_until``) so every worker reads the same
+        deadline. Empty headers only refresh the key's TTL.
+        """
         try:
-            redis_client = await self._ensure_connected()
             rate_limit_key = self._get_rate_limit_key(model)
 
-            if headers:
-                parsed_limits = self._parse_rate_limit_headers(headers)
-            else:
-                existing_json = await redis_client.get(rate_limit_key)
-                parsed_limits = json.loads(existing_json) if existing_json else {}
+            if not headers:
+                await self._execute(lambda c: c.expire(rate_limit_key, self.key_ttl))
+                return
 
-            await redis_client.setex(rate_limit_key, self.key_ttl, json.dumps(parsed_limits))
+            parsed_limits = self._parse_rate_limit_headers(headers)
+            for field in ("rpm_reset", "tpm_reset"):
+                if field in parsed_limits:
+                    parsed_limits[field] = self._parse_reset_time(str(parsed_limits[field]))
+            retry_after = parsed_limits.pop("retry_after", 0)
+            if retry_after > 0:
+                parsed_limits["retry_until"] = time.time() + retry_after
+
+            args: list[Any] = [self.key_ttl]
+            for field, value in parsed_limits.items():
+                args.extend((field, value))
+            await self._execute(lambda c: self._update_script(c, [rate_limit_key], args))
         except (ConnectionError, TimeoutError) as e:
             logger.error(f"Redis connection error updating rate limits for {model}: {e}")
         except (ResponseError, ValueError) as e:
@@ -436,24 +728,9 @@ class RedisBackend(AccountBackend):
             logger.error(f"Redis error updating rate limits for {model}: {e}")
 
     async def record_request(self, model: str, tokens_used: int | None = None) -> None:
-        """Record a request."""
+        """Record a request (atomic decrement; never blocks, no-op until limits are known)."""
         try:
-            rate_limits = await self._get_rate_limits(model)
-            if rate_limits:
-                current_time = time.time()
-
-                if "rpm_remaining" in rate_limits and rate_limits["rpm_remaining"] > 0:
-                    rate_limits["rpm_remaining"] -= 1
-                if tokens_used and "tpm_remaining" in rate_limits:
-                    rate_limits["tpm_remaining"] = max(
-                        0, rate_limits["tpm_remaining"] - tokens_used
-                    )
-
-                rate_limits["last_request"] = current_time
-
-                redis_client = await self._ensure_connected()
-                rate_limit_key = self._get_rate_limit_key(model)
-                await redis_client.setex(rate_limit_key, self.key_ttl, json.dumps(rate_limits))
+            await self._acquire(model, tokens_used or 0, "record")
         except (ConnectionError, TimeoutError) as e:
             logger.error(f"Redis connection error recording request for {model}: {e}")
         except (ResponseError, ValueError) as e:
@@ -461,6 +738,31 @@ class RedisBackend(AccountBackend):
         except RedisError as e:
             logger.error(f"Redis error recording request for {model}: {e}")
 
+    async def reserve_streaming(
+        self,
+        bucket_id: str,
+        reservation_id: str,
+        tokens: int,
+        ttl: float = STREAMING_RESERVATION_TTL,
+    ) -> tuple[bool, float]:
+        """Atomically reserve ``tokens`` for a stream and record the reservation.
+
+        Same check-and-deduct as :meth:`reserve`; on success the reserved
+        amount is stored under a per-reservation key that expires after
+        ``ttl`` seconds, so a crashed worker's reservation cannot linger.
+        Fails open on Redis errors.
+        """
+        reservation = (self._get_reservation_key(bucket_id, reservation_id), ttl)
+        try:
+            return await self._acquire(bucket_id, tokens, "reserve", reservation)
+        except (ConnectionError, TimeoutError) as e:
+            logger.error(f"Redis connection error reserving stream for {bucket_id}: {e}")
+        except (ResponseError, ValueError) as e:
+            logger.error(f"Redis data error reserving stream for {bucket_id}: {e}")
+        except RedisError as e:
+            logger.error(f"Redis error reserving stream for {bucket_id}: {e}")
+        return True, 0.0
+
     async def release_streaming_reservation(
         self,
         bucket_id: str,
@@ -470,34 +772,69 @@ class RedisBackend(AccountBackend):
     ) -> bool:
         """Release streaming reservation with refund-based accounting.
 
-        For RedisBackend, this is largely a no-op since the simplified
-        backend doesn't track individual reservations. Returns True to
-        indicate success for protocol compatibility.
+        Atomically deletes the reservation and refunds the recorded amount
+        minus ``actual_tokens`` to ``tpm_remaining`` (capped at the limit), so
+        concurrent or repeated releases refund at most once.
         """
-        # RedisBackend doesn't track individual reservations
-        # This is a no-op implementation for protocol compatibility
+        keys = [
+            self._get_reservation_key(bucket_id, reservation_id),
+            self._get_rate_limit_key(bucket_id),
+        ]
+        try:
+            refund = await self._execute(
+                lambda c: self._release_script(c, keys, [max(0, int(actual_tokens))])
+            )
+        except (ConnectionError, TimeoutError) as e:
+            logger.error(f"Redis connection error releasing stream for {bucket_id}: {e}")
+            return False
+        except ResponseError as e:
+            logger.error(f"Redis response error releasing stream for {bucket_id}: {e}")
+            return False
+        except RedisError as e:
+            logger.error(f"Redis error releasing stream for {bucket_id}: {e}")
+            return False
+
+        if refund is None:
+            logger.debug(
+                f"release_streaming_reservation: unknown or expired reservation "
+                f"{reservation_id} for {bucket_id} (reserved={reserved_tokens})"
+            )
+            return False
         logger.debug(
             f"release_streaming_reservation: bucket={bucket_id}, "
-            f"reservation={reservation_id}, refund={reserved_tokens - actual_tokens}"
+            f"reservation={reservation_id}, refund={refund}"
         )
         return True
 
     async def record_failure(self, error_type: str, error_message: str = "") -> None:
-        """Record a failure."""
+        """Record a failure in the sliding window (one pipelined round-trip).
+
+        ZADD scored by timestamp, then prune entries older than
+        :data:`FAILURE_RETENTION` and beyond :data:`FAILURE_MAX_ENTRIES`.
+        """
         try:
-            redis_client = await self._ensure_connected()
             current_time = time.time()
 
             failure_record = {
                 "type": error_type,
                 "message": error_message,
                 "timestamp": current_time,
+                # Distinguishes identical failures recorded in the same instant
+                "id": uuid.uuid4().hex,
             }
 
-            failure_key = f"{self.failure_prefix}:log"
-            await redis_client.lpush(failure_key, json.dumps(failure_record))
-            await redis_client.expire(failure_key, 3600)
-            await redis_client.ltrim(failure_key, 0, 999)
+            failure_key = self._failure_window_key
+            member = json.dumps(failure_record)
+
+            async def push(redis_client: Any) -> None:
+                pipe = redis_client.pipeline(transaction=False)
+                pipe.zadd(failure_key, {member: current_time})
+                pipe.zremrangebyscore(failure_key, "-inf", current_time - FAILURE_RETENTION)
+                pipe.zremrangebyrank(failure_key, 0, -(FAILURE_MAX_ENTRIES + 1))
+                pipe.expire(failure_key, FAILURE_RETENTION)
+                await pipe.execute()
+
+            await self._execute(push)
         except (ConnectionError, TimeoutError) as e:
             logger.error(f"Redis connection error recording failure: {e}")
         except ResponseError as e:
@@ -506,26 +843,13 @@ class RedisBackend(AccountBackend):
             logger.error(f"Redis error recording failure: {e}")
 
     async def get_failure_count(self, window_seconds: int = 30) -> int:
-        """Get failure count in time window."""
+        """Get failure count in time window (a single ZCOUNT)."""
         try:
-            redis_client = await self._ensure_connected()
-            failure_key = f"{self.failure_prefix}:log"
-
-            current_time = time.time()
-            cutoff_time = current_time - window_seconds
-
-            failures = await redis_client.lrange(failure_key, 0, -1)
-            count = 0
-
-            for failure_json in failures:
-                try:
-                    failure = json.loads(failure_json)
-                    if failure.get("timestamp", 0) > cutoff_time:
-                        count += 1
-                except json.JSONDecodeError:
-                    continue
+            failure_key = self._failure_window_key
+            cutoff = f"({time.time() - window_seconds}"
 
-            return count
+            count = await self._execute(lambda c: c.zcount(failure_key, cutoff, "+inf"))
+            return int(count)
         except (ConnectionError, TimeoutError) as e:
             logger.error(f"Redis connection error getting failure count: {e}")
             return 0
@@ -542,26 +866,35 @@ class RedisBackend(AccountBackend):
         Returns True if either:
         - A forced circuit break is active (circuit_break_until key exists), or
         - Failure count exceeds threshold (20 failures in 30s)
+
+        Both are read in one pipelined round-trip.
         """
         try:
-            redis_client = await self._ensure_connected()
-            forced = await redis_client.exists(self.circuit_break_key)
-            if forced:
-                return True
-        except (ConnectionError, TimeoutError) as e:
-            logger.error(f"Redis connection error checking circuit break key: {e}")
-        except (ResponseError, RedisError) as e:
-            logger.error(f"Redis error checking circuit break key: {e}")
+            failure_key = self._failure_window_key
+            cutoff = f"({time.time() - CIRCUIT_FAILURE_WINDOW}"
+
+            async def read(redis_client: Any) -> list[Any]:
+                pipe = redis_client.pipeline(transaction=False)
+                pipe.exists(self.circuit_break_key)
+                pipe.zcount(failure_key, cutoff, "+inf")
+                result: list[Any] = await pipe.execute()
+                return result
 
-        failure_count = await self.get_failure_count(30)
-        return failure_count >= 20
+            forced, failure_count = await self._execute(read)
+            return bool(forced) or int(failure_count) >= CIRCUIT_FAILURE_THRESHOLD
+        except (ConnectionError, TimeoutError) as e:
+            logger.error(f"Redis connection error checking circuit breaker: {e}")
+        except (ResponseError, ValueError) as e:
+            logger.error(f"Redis data error checking circuit breaker: {e}")
+        except RedisError as e:
+            logger.error(f"Redis error checking circuit breaker: {e}")
+        return False
 
     async def clear_failures(self) -> None:
         """Clear all failure records and any forced circuit break."""
         try:
-            redis_client = await self._ensure_connected()
-            failure_key = f"{self.failure_prefix}:log"
-            await redis_client.delete(failure_key, self.circuit_break_key)
+            failure_key = self._failure_window_key
+            await self._execute(lambda c: c.delete(failure_key, self.circuit_break_key))
         except (ConnectionError, TimeoutError) as e:
             logger.error(f"Redis connection error clearing failures: {e}")
         except ResponseError as e:
@@ -580,9 +913,8 @@ class RedisBackend(AccountBackend):
             duration: Duration in seconds to keep circuit broken
         """
         try:
-            redis_client = await self._ensure_connected()
             ttl = max(int(duration), 1)
-            await redis_client.setex(self.circuit_break_key, ttl, "1")
+            await self._execute(lambda c: c.setex(self.circuit_break_key, ttl, "1"))
             logger.debug(f"Forced circuit break for {duration}s (TTL={ttl})")
         except (ConnectionError, TimeoutError) as e:
             logger.error(f"Redis connection error forcing circuit break: {e}")
@@ -594,16 +926,12 @@ class RedisBackend(AccountBackend):
     # === Private Helpers ===
 
     async def _get_rate_limits(self, model: str) -> dict[str, Any]:
-        """Get rate limits for a model (private helper)."""
+        """Get the stored rate-limit hash for a model (private helper)."""
         try:
-            redis_client = await self._ensure_connected()
             redis_key = self._get_rate_limit_key(model)
 
-            limits_json = await redis_client.get(redis_key)
-            if limits_json:
-                result: dict[str, Any] = json.loads(limits_json)
-                return result
-            return {}
+            raw = await self._execute(lambda c: c.hgetall(redis_key))
+            return {field: float(value) for field, value in (raw or {}).items()}
         except (ConnectionError, TimeoutError) as e:
             logger.error(f"Redis connection error getting rate limits for {model}: {e}")
             return {}
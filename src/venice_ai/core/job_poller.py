@@ -0,0 +1,274 @@
+"""
+Shared status poller for queued Venice AI jobs
+
+Video and music generations are queued server-side and polled until they
+finish. Each :meth:`VideoJob.wait` / :meth:`MusicJob.wait` used to run its
+own fixed-interval loop, so hundreds of in-flight renders meant hundreds of
+timers and a steady stream of status requests competing with real traffic
+for rate-limit slots.
+
+:class:`JobPoller` multiplexes them instead. One driver task keeps every
+outstanding job in a heap ordered by when it is next due and:
+
+- derives each job's next poll from the server's ETA (``average_execution_time
+  - execution_duration``), polling sooner as a job nears completion and
+  backing off once a job runs past its estimate;
+- starts at most ``max_polls_per_second`` polls, earliest-due (then
+  nearest-completion) first, with ``max_concurrency`` in flight;
+- on a 429 from the status endpoint, pauses all polling for the advertised
+  ``Retry-After`` instead of failing the job;
+- resolves a per-job future once the job reaches a terminal state.
+
+Status requests still go through the client's rate limiter like any other
+request. :class:`VeniceClient` owns one poller (``client.job_poller``); the
+driver starts on the first :meth:`JobPoller.wait` and exits when idle.
+
+See also: ``venice_ai.resources.video``, ``venice_ai.resources.music``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..exceptions import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+#: Pause applied after a 429 that carries no ``Retry-After``.
+DEFAULT_RATE_LIMIT_PAUSE = 5.0
+
+
+@dataclass(slots=True)
+class JobPollerStats:
+    """Counters for a :class:`JobPoller` instance.
+
+    Attributes:
+        jobs: Jobs registered through :meth:`JobPoller.wait`.
+        polls: Status requests issued.
+        rate_limited: Polls answered with 429 and rescheduled.
+    """
+
+    jobs: int = 0
+    polls: int = 0
+    rate_limited: int = 0
+
+    @property
+    def polls_per_job(self) -> float:
+        return self.polls / self.jobs if self.jobs else 0.0
+
+
+@dataclass(slots=True, eq=False)
+class _Job:
+    poll: Callable[[], Awaitable[Any]]
+    is_terminal: Callable[[Any], bool]
+    remaining: Callable[[Any], float | None] | None
+    on_status: Callable[[Any], None] | None
+    interval: float
+    max_polls: int
+    future: asyncio.Future[Any]
+    polls: int = 0
+    overdue: int = 0
+    last_status: Any = None
+    eta: float = field(default=math.inf)
+
+
+class JobPoller:
+    """Poll many queued jobs from one task with adaptive, rate-capped intervals.
+
+    Args:
+        max_polls_per_second: Cap on status requests started per second,
+            across all jobs.
+        max_concurrency: Status requests allowed in flight at once.
+        min_interval: Shortest delay between two polls of the same job.
+        max_interval: Longest delay between two polls of the same job.
+        eta_fraction: Share of the job's remaining ETA to wait before the
+            next poll (``0.5`` halves the remaining time on each poll).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_polls_per_second: float = 5.0,
+        max_concurrency: int = 8,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        eta_fraction: float = 0.5,
+    ) -> None:
+        if max_polls_per_second <= 0:
+            raise ValueError(f"max_polls_per_second must be > 0, got {max_polls_per_second}")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("intervals must satisfy 0 < min_interval <= max_interval")
+        self.max_polls_per_second = max_polls_per_second
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.eta_fraction = eta_fraction
+        self.stats = JobPollerStats()
+        self._heap: list[tuple[float, float, int, _Job]] = []
+        self._seq = itertools.count()
+        self._next_slot = 0.0
+        self._in_flight: dict[asyncio.Task[None], _Job] = {}
+        self._driver: asyncio.Task[None] | None = None
+        self._wake = asyncio.Event()
+
+    @property
+    def pending(self) -> int:
+        """Jobs currently tracked (scheduled or being polled)."""
+        return len(self._heap) + len(self._in_flight)
+
+    async def wait[S](
+        self,
+        poll: Callable[[], Awaitable[S]],
+        *,
+        is_terminal: Callable[[S], bool],
+        remaining: Callable[[S], float | None] | None = None,
+        on_status: Callable[[S], None] | None = None,
+        interval: float = 5.0,
+        max_polls: int = 120,
+    ) -> S:
+        """Poll a job until ``is_terminal`` accepts its status or ``max_polls`` runs out.
+
+        Args:
+            poll: Coroutine function fetching the job's current status.
+            is_terminal: Whether a status is final (completed or failed).
+            remaining: Seconds the status says are left, or ``None`` when it
+                carries no estimate.
+            on_status: Called with every non-terminal status.
+            interval: Delay between polls when there is no estimate.
+            max_polls: Polls before giving up.
+
+        Returns:
+            The terminal status, or the last status seen if ``max_polls`` was
+            exhausted (the caller decides how to report a timeout).
+
+        Raises:
+            Exception: Whatever ``poll`` or ``on_status`` raised, except
+                :class:`RateLimitError`, which only delays the next poll.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[S] = loop.create_future()
+        job = _Job(
+            poll=poll,
+            is_terminal=is_terminal,
+            remaining=remaining,
+            on_status=on_status,
+            interval=interval,
+            max_polls=max_polls,
+            future=future,
+        )
+        self.stats.jobs += 1
+        self._schedule(job, loop.time())
+        return await future
+
+    async def close(self) -> None:
+        """Stop the driver and cancel the waits of every outstanding job."""
+        driver, self._driver = self._driver, None
+        jobs = [*self._in_flight.values(), *(job for _, _, _, job in self._heap)]
+        tasks = [*self._in_flight, *([driver] if driver is not None else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for job in jobs:
+            job.future.cancel()
+        self._heap.clear()
+        self._in_flight.clear()
+
+    # -- scheduling ------------------------------------------------------
+
+    def _schedule(self, job: _Job, due: float) -> None:
+        heapq.heappush(self._heap, (due, job.eta, next(self._seq), job))
+        self._wake.set()
+        if self._driver is None or self._driver.done():
+            self._driver = asyncio.get_running_loop().create_task(self._run())
+
+    def _next_delay(self, job: _Job, status: Any) -> float:
+        remaining = job.remaining(status) if job.remaining is not None else None
+        if remaining is None:
+            job.eta = math.inf
+            return job.interval
+        job.eta = remaining
+        if remaining <= 0:
+            # Past the server's estimate: back off from min_interval
+            job.overdue += 1
+            return min(self.max_interval, self.min_interval * 2.0 ** (job.overdue - 1))
+        return min(self.max_interval, max(self.min_interval, remaining * self.eta_fraction))
+
+    async def _sleep_or_wake(self, delay: float | None) -> bool:
+        """Sleep up to ``delay`` seconds (forever if ``None``); ``True`` if woken early."""
+        if self._wake.is_set():
+            self._wake.clear()
+            return True
+        waiter = asyncio.ensure_future(self._wake.wait())
+        waiters: set[asyncio.Future[Any]] = {waiter}
+        if delay is not None:
+            waiters.add(asyncio.ensure_future(asyncio.sleep(delay)))
+        try:
+            done, pending = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for w in waiters:
+                w.cancel()
+        self._wake.clear()
+        return waiter in done
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        spacing = 1.0 / self.max_polls_per_second
+        while self._heap or self._in_flight:
+            if not self._heap or len(self._in_flight) >= self.max_concurrency:
+                await self._sleep_or_wake(None)
+                continue
+            due = max(self._heap[0][0], self._next_slot)
+            delay = due - loop.time()
+            if delay > 0 and await self._sleep_or_wake(delay):
+                continue  # a job was added or finished: re-plan
+            _, _, _, job = heapq.heappop(self._heap)
+            if job.future.done():
+                continue  # the waiter was cancelled
+            self._next_slot = max(loop.time(), self._next_slot) + spacing
+            task = loop.create_task(self._poll(job))
+            self._in_flight[task] = job
+            task.add_done_callback(self._poll_done)
+
+    def _poll_done(self, task: asyncio.Task[None]) -> None:
+        self._in_flight.pop(task, None)
+        self._wake.set()
+
+    async def _poll(self, job: _Job) -> None:
+        loop = asyncio.get_running_loop()
+        self.stats.polls += 1
+        try:
+            try:
+                status = await job.poll()
+            except RateLimitError as e:
+                self.stats.rate_limited += 1
+                pause = float(
+                    DEFAULT_RATE_LIMIT_PAUSE
+                    if e.retry_after_seconds is None
+                    else e.retry_after_seconds
+                )
+                logger.info(f"Job status polling rate limited; pausing polls for {pause:.1f}s")
+                self._next_slot = max(self._next_slot, loop.time() + pause)
+                self._schedule(job, loop.time() + pause)
+                return
+            job.polls += 1
+            job.last_status = status
+            if job.future.done():
+                return
+            if job.is_terminal(status) or job.polls >= job.max_polls:
+                job.future.set_result(status)
+                return
+            if job.on_status is not None:
+                job.on_status(status)
+            self._schedule(job, loop.time() + self._next_delay(job, status))
+        except Exception as e:  # noqa: BLE001 - surfaced to the job's waiter
+            if not job.future.done():
+                job.future.set_exception(e)
@@ -0,0 +1,261 @@
+"""
+Client-side model fallback for Venice AI
+
+``SchedulerConfig.model_fallbacks`` maps a model to the model to use when it
+is unavailable. :class:`ModelFallback` applies that map in the request path of
+:class:`VeniceClient`:
+
+* Before sending, a model the rate limiter is holding back (its bucket is
+  exhausted, it is in 429 backoff after repeated failures) is replaced by the
+  first fallback that can proceed now, instead of queueing behind the
+  saturated bucket. Fallbacks must also have capacity in the shared
+  :class:`~venice_ai.core.backends.AccountBackend`, which is only asked once
+  the requested model has been held back.
+* A request that still fails with 429 or 503 is re-sent to the next model in
+  the chain.
+
+Chains follow the map transitively (``a -> b -> c``) and stop at cycles. With
+``equivalents=True`` a :class:`~venice_ai.models.selection.DynamicModelSelector`
+extends the chain with catalog models of the same type that offer at least the
+primary's capabilities.
+
+See also: ``venice_ai.rate_limiting.simple``, ``venice_ai.core.config.enterprise``
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncGenerator, Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..exceptions import RateLimitError, ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+#: Errors after which a request is re-sent to the next fallback model.
+FALLBACK_ERRORS: tuple[type[Exception], ...] = (RateLimitError, ServiceUnavailableError)
+
+
+@dataclass(slots=True)
+class ModelFallbackStats:
+    """Counters for a :class:`ModelFallback` instance.
+
+    Attributes:
+        requests: Requests for a model that has fallbacks.
+        preemptive: Requests rerouted before sending because the requested
+            model was held back.
+        on_error: Re-sends to a fallback after a 429 or 503.
+        exhausted: Requests whose model was held back (or failed) with no
+            fallback able to take them.
+        routes: Requests served by each fallback, keyed by
+            ``(requested_model, fallback_model)``.
+    """
+
+    requests: int = 0
+    preemptive: int = 0
+    on_error: int = 0
+    exhausted: int = 0
+    routes: dict[tuple[str, str], int] = field(default_factory=dict)
+
+    @property
+    def rerouted(self) -> int:
+        """Requests sent to a model other than the one requested."""
+        return self.preemptive + self.on_error
+
+
+class ModelFallback:
+    """Reroute requests from a held-back or failing model to its fallbacks.
+
+    Args:
+        fallbacks: Map of model to fallback model, as in
+            ``SchedulerConfig.model_fallbacks``.
+        equivalents: Extend each chain with capability-equivalent catalog
+            models found by :attr:`selector`.
+        selector: :class:`~venice_ai.models.selection.DynamicModelSelector`
+            used for ``equivalents``. ``VeniceClient`` creates one bound to
+            itself when this is ``None``.
+        max_fallbacks: Most fallback models tried for one request.
+        reroute_after: A model held back for longer than this many seconds
+            is rerouted before sending (default 1.0). Shorter waits are left
+            to the rate limiter.
+    """
+
+    def __init__(
+        self,
+        fallbacks: Mapping[str, str],
+        *,
+        equivalents: bool = False,
+        selector: Any = None,
+        max_fallbacks: int = 3,
+        reroute_after: float = 1.0,
+    ) -> None:
+        if max_fallbacks < 1:
+            raise ValueError("max_fallbacks must be at least 1")
+        self._fallbacks = dict(fallbacks)
+        self.equivalents = equivalents
+        self.selector = selector
+        self.max_fallbacks = max_fallbacks
+        self.reroute_after = reroute_after
+        self._equivalent_cache: dict[str, list[str]] = {}
+        self.stats = ModelFallbackStats()
+
+    @property
+    def fallbacks(self) -> dict[str, str]:
+        """The configured ``model -> fallback`` map (a copy)."""
+        return dict(self._fallbacks)
+
+    def chain(self, model: str) -> list[str]:
+        """Configured fallbacks for ``model`` in order, without cycles."""
+        chain: list[str] = []
+        seen = {model}
+        current = self._fallbacks.get(model)
+        while current is not None and current not in seen and len(chain) < self.max_fallbacks:
+            chain.append(current)
+            seen.add(current)
+            current = self._fallbacks.get(current)
+        return chain
+
+    def has_fallbacks(self, model: str) -> bool:
+        """Whether requests for ``model`` can be rerouted at all."""
+        return model in self._fallbacks or (self.equivalents and self.selector is not None)
+
+    async def send[T](
+        self,
+        model: str,
+        send: Callable[[str], Awaitable[T]],
+        *,
+        rate_limiter: Any = None,
+        backend: Any = None,
+    ) -> T:
+        """Send a request for ``model``, falling back as needed.
+
+        Args:
+            model: The model the request names.
+            send: Sends the request with the given model substituted.
+            rate_limiter: Limiter whose per-model state (``acquire()``) says
+                whether a model is held back.
+            backend: Optional account backend whose ``check_capacity()`` must
+                also admit a fallback before it replaces a held-back model.
+                It is not consulted for ``model`` itself, so requests that
+                are not rerouted cost no backend round-trip.
+
+        Returns:
+            The result of ``send`` for the model that served the request.
+
+        Raises:
+            RateLimitError: The last model tried was rate limited.
+            ServiceUnavailableError: The last model tried was unavailable.
+        """
+        if not self.has_fallbacks(model):
+            return await send(model)
+
+        self.stats.requests += 1
+        candidates = self._candidates(model)
+        try:
+            current = model
+            exhausted = False
+            if await self._held_back(model, rate_limiter):
+                async for candidate in candidates:
+                    if not await self._held_back(candidate, rate_limiter, backend):
+                        logger.info(f"Model {model} is held back, routing request to {candidate}")
+                        self.stats.preemptive += 1
+                        current = candidate
+                        break
+                else:
+                    self.stats.exhausted += 1
+                    exhausted = True
+
+            while True:
+                try:
+                    result = await send(current)
+                except FALLBACK_ERRORS as exc:
+                    next_model = await _next_candidate(candidates)
+                    if next_model is None:
+                        if not exhausted:
+                            self.stats.exhausted += 1
+                        raise
+                    logger.info(
+                        f"{type(exc).__name__} on model {current}, retrying with {next_model}"
+                    )
+                    self.stats.on_error += 1
+                    current = next_model
+                    continue
+                if current != model:
+                    route = (model, current)
+                    self.stats.routes[route] = self.stats.routes.get(route, 0) + 1
+                return result
+        finally:
+            await candidates.aclose()
+
+    async def _candidates(self, model: str) -> AsyncGenerator[str]:
+        """Fallbacks for ``model``: the configured chain, then equivalents."""
+        yielded = 0
+        seen = {model}
+        for candidate in self.chain(model):
+            seen.add(candidate)
+            yielded += 1
+            yield candidate
+        if not (self.equivalents and self.selector is not None):
+            return
+        for candidate in await self._equivalent_models(model):
+            if yielded >= self.max_fallbacks:
+                return
+            if candidate not in seen:
+                seen.add(candidate)
+                yielded += 1
+                yield candidate
+
+    async def _equivalent_models(self, model: str) -> list[str]:
+        """Catalog models of ``model``'s type with at least its capabilities."""
+        if model in self._equivalent_cache:
+            return self._equivalent_cache[model]
+        try:
+            info = await self.selector.get_model_info(model)
+            if not info:
+                return []
+            required = _capabilities(info)
+            matches = []
+            for candidate in await self.selector.get_available_models(info.get("type")):
+                if candidate == model:
+                    continue
+                candidate_info = await self.selector.get_model_info(candidate)
+                if candidate_info and required <= _capabilities(candidate_info):
+                    matches.append(candidate)
+        except Exception:  # noqa: BLE001 — equivalents are best effort
+            logger.debug(f"Could not look up models equivalent to {model}", exc_info=True)
+            return []
+        self._equivalent_cache[model] = matches
+        return matches
+
+    async def _held_back(self, model: str, rate_limiter: Any, backend: Any = None) -> bool:
+        """Whether ``model`` would wait longer than :attr:`reroute_after`."""
+        acquire = getattr(rate_limiter, "acquire", None)
+        if acquire is not None:
+            can_proceed, wait = await acquire(model)
+            if not can_proceed and wait > self.reroute_after:
+                return True
+        if backend is not None:
+            try:
+                can_proceed, wait = await backend.check_capacity(model)
+            except Exception:  # noqa: BLE001 — backend state is advisory here
+                logger.debug(f"Capacity check for {model} failed", exc_info=True)
+                return False
+            if not can_proceed and wait > self.reroute_after:
+                return True
+        return False
+
+
+async def _next_candidate(candidates: AsyncGenerator[str]) -> str | None:
+    async for candidate in candidates:
+        return candidate
+    return None
+
+
+def _capabilities(info: Mapping[str, Any]) -> set[str]:
+    """Names of the capabilities a catalog entry advertises as ``True``."""
+    capabilities = info.get("model_spec", {}).get("capabilities", {}) or {}
+    return {name for name, value in capabilities.items() if value is True}
+
+
+__all__ = ["FALLBACK_ERRORS", "ModelFallback", "ModelFallbackStats"]
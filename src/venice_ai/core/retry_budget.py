@@ -0,0 +1,228 @@
+"""
+Shared retry budget for Venice AI
+
+Two layers can retry a failed request: the aiohttp retry middleware
+(transient 5xx / network errors, see ``venice_ai.middleware.retry``) and the
+rate limiter's 429 handling (``SimpleRateLimiter.submit_request``). Left
+uncoordinated they multiply attempts, and under a partial outage every
+caller retrying at once amplifies the load that caused the failures.
+
+:class:`RetryBudget` is a token bucket both layers draw from. Every request
+deposits ``ratio`` retry tokens into its model's bucket and into a global one;
+every retry withdraws one token from each. A small time-based refill
+(``min_retries_per_second``) keeps low-traffic clients able to retry. Once
+either bucket is empty, retries are refused and the failure surfaces
+immediately.
+
+:class:`VeniceClient` opens a :class:`RetryScope` for each request (see
+:func:`retry_scope`), carrying the budget, the model key and the caller's
+deadline. Both layers look the scope up with :func:`current_retry_scope` and
+ask :meth:`RetryScope.allow_retry` before sleeping, which also refuses a
+retry whose backoff plus expected attempt time would overrun the deadline.
+
+See also: ``venice_ai.middleware.retry``, ``venice_ai.rate_limiting.simple``
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import logging
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+#: Key of the bucket shared by every request.
+GLOBAL_KEY = "*"
+
+
+@dataclass(slots=True)
+class RetryBudgetStats:
+    """Counters for a :class:`RetryBudget` instance.
+
+    Attributes:
+        requests: Requests that deposited into the budget.
+        retries: Retries the budget allowed.
+        denied_budget: Retries refused because a bucket was empty.
+        denied_deadline: Retries refused because they could not finish
+            before the caller's deadline.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    denied_budget: int = 0
+    denied_deadline: int = 0
+
+    @property
+    def retry_ratio(self) -> float:
+        """Allowed retries per request."""
+        return self.retries / self.requests if self.requests else 0.0
+
+
+class _Bucket:
+    __slots__ = ("balance", "updated")
+
+    def __init__(self, balance: float, now: float) -> None:
+        self.balance = balance
+        self.updated = now
+
+
+class RetryBudget:
+    """Token-bucket retry budget shared per model and globally.
+
+    Args:
+        ratio: Retry tokens each request deposits, i.e. the sustained share of
+            request volume that may be retried (default 0.2 = 20%).
+        min_retries_per_second: Time-based refill so idle or low-volume
+            clients can still retry (default 1.0).
+        burst: Bucket capacity and initial balance: retries available
+            back-to-back before deposits are needed (default 10).
+        max_keys: Per-model buckets kept before the oldest is dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        burst: float = 10.0,
+        max_keys: int = 1000,
+    ) -> None:
+        if ratio < 0:
+            raise ValueError(f"ratio must be >= 0, got {ratio}")
+        if burst < 1:
+            raise ValueError(f"burst must be >= 1, got {burst}")
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: dict[str, _Bucket] = {}
+        self.stats = RetryBudgetStats()
+
+    def _bucket(self, key: str, now: float) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                # dicts keep insertion order; drop the oldest model bucket
+                oldest = next((k for k in self._buckets if k != GLOBAL_KEY), None)
+                if oldest is not None:
+                    del self._buckets[oldest]
+            bucket = self._buckets[key] = _Bucket(self.burst, now)
+        elif now > bucket.updated:
+            bucket.balance = min(
+                self.burst,
+                bucket.balance + (now - bucket.updated) * self.min_retries_per_second,
+            )
+            bucket.updated = now
+        return bucket
+
+    def record_request(self, key: str) -> None:
+        """Deposit one request's share of retry tokens for ``key`` and globally."""
+        now = time.monotonic()
+        self.stats.requests += 1
+        for bucket in (self._bucket(key, now), self._bucket(GLOBAL_KEY, now)):
+            bucket.balance = min(self.burst, bucket.balance + self.ratio)
+
+    def try_acquire(self, key: str) -> bool:
+        """Withdraw one retry token for ``key``; ``False`` if either bucket is empty."""
+        now = time.monotonic()
+        model = self._bucket(key, now)
+        shared = self._bucket(GLOBAL_KEY, now)
+        if model.balance < 1 or shared.balance < 1:
+            self.stats.denied_budget += 1
+            return False
+        model.balance -= 1
+        shared.balance -= 1
+        self.stats.retries += 1
+        return True
+
+    def available(self, key: str = GLOBAL_KEY) -> float:
+        """Retry tokens currently available for ``key`` (limited by the global bucket)."""
+        now = time.monotonic()
+        balance = self._bucket(GLOBAL_KEY, now).balance
+        if key != GLOBAL_KEY:
+            balance = min(balance, self._bucket(key, now).balance)
+        return balance
+
+
+@dataclass(slots=True)
+class RetryScope:
+    """Retry context for one logical request.
+
+    Attributes:
+        budget: Budget retries are drawn from, or ``None`` for no budget.
+        key: Budget key, normally the model id.
+        deadline: ``time.monotonic()`` value the request must finish by, or
+            ``None`` when the caller set no total timeout.
+        rate_limited: ``True`` when a rate limiter handles 429 responses for
+            this request, so the retry middleware leaves them to it.
+        retries: Retries taken so far by either layer.
+    """
+
+    budget: RetryBudget | None
+    key: str
+    deadline: float | None = None
+    rate_limited: bool = False
+    retries: int = 0
+
+    def allow_retry(self, delay: float, attempt_time: float = 0.0) -> bool:
+        """Decide whether a retry may start after sleeping ``delay`` seconds.
+
+        Refuses a retry that cannot finish before the deadline, assuming the
+        next attempt takes as long as the last one (``attempt_time``), and
+        otherwise withdraws from the budget.
+        """
+        if self.deadline is not None and time.monotonic() + delay + attempt_time > self.deadline:
+            if self.budget is not None:
+                self.budget.stats.denied_deadline += 1
+            logger.debug(
+                f"Skipping retry for {self.key}: {delay:.2f}s backoff + "
+                f"{attempt_time:.2f}s attempt would pass the deadline"
+            )
+            return False
+        if self.budget is not None and not self.budget.try_acquire(self.key):
+            logger.info(f"Retry budget exhausted for {self.key}; not retrying")
+            return False
+        self.retries += 1
+        return True
+
+
+# Per-request retry scope, set by VeniceClient around each send. Read by the
+# retry middleware and the rate limiter in the same task.
+_active_retry_scope: contextvars.ContextVar[RetryScope | None] = contextvars.ContextVar(
+    "venice_active_retry_scope", default=None
+)
+
+
+def current_retry_scope() -> RetryScope | None:
+    """Return the retry scope of the request being sent, if any."""
+    return _active_retry_scope.get()
+
+
+@contextlib.contextmanager
+def retry_scope(
+    budget: RetryBudget | None,
+    key: str,
+    *,
+    timeout: float | None = None,
+    rate_limited: bool = False,
+) -> Iterator[RetryScope]:
+    """Open a :class:`RetryScope` for one request and deposit into ``budget``.
+
+    Args:
+        budget: Shared budget, or ``None`` to apply only the deadline.
+        key: Budget key (model id).
+        timeout: The caller's total timeout in seconds; sets the deadline.
+        rate_limited: Whether a rate limiter handles 429s for this request.
+    """
+    if budget is not None:
+        budget.record_request(key)
+    deadline = time.monotonic() + timeout if timeout else None
+    scope = RetryScope(budget, key, deadline, rate_limited)
+    token = _active_retry_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _active_retry_scope.reset(token)
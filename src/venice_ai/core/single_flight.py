@@ -0,0 +1,192 @@
+"""
+Single-flight request coalescing for Venice AI
+
+When many coroutines issue the same idempotent request at the same time
+(``models.list()`` on startup, ``billing.get_balance()`` from several
+dashboards, identical ``embeddings.create()`` inputs), :class:`SingleFlight`
+lets the first caller perform the HTTP round-trip while the others await its
+result. Every caller receives the *same* parsed object (or the same
+exception); nothing is cached once the leader finishes.
+
+This generalises the stampede prevention :class:`RateLimitDiscovery` uses for
+its own tier fetch to the whole client. It is opt-in via
+``VeniceClient(coalesce_requests=True)``.
+
+See also: ``venice_ai.core.rate_limit_discovery``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import logging
+from collections.abc import Awaitable, Callable, Collection, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+#: Methods that are coalesced on any path.
+SAFE_METHODS: frozenset[str] = frozenset({"GET", "HEAD"})
+
+#: POST endpoints that are read-only for identical bodies and safe to share.
+DEFAULT_COALESCIBLE_POST_PATHS: frozenset[str] = frozenset({"embeddings"})
+
+
+@dataclass(slots=True)
+class SingleFlightStats:
+    """Counters for a :class:`SingleFlight` instance.
+
+    Attributes:
+        requests: Calls to :meth:`SingleFlight.do` (leaders + followers).
+        executed: Calls that actually ran the request (one per flight).
+        coalesced: Calls that joined an in-flight request instead.
+    """
+
+    requests: int = 0
+    executed: int = 0
+    coalesced: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of requests served by an in-flight leader."""
+        return self.coalesced / self.requests if self.requests else 0.0
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task[Any]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share one in-flight awaitable among concurrent callers with the same key.
+
+    The leader's work runs in its own task so that cancelling one caller does
+    not cancel the request for the others; the task is cancelled only when
+    every waiter has gone away.
+
+    Args:
+        post_paths: POST paths (relative, as passed to ``VeniceClient.post``)
+            whose identical bodies may be coalesced. ``GET``/``HEAD`` are
+            always eligible.
+    """
+
+    def __init__(self, *, post_paths: Collection[str] = DEFAULT_COALESCIBLE_POST_PATHS) -> None:
+        self._post_paths = frozenset(p.strip("/") for p in post_paths)
+        self._flights: dict[Hashable, _Flight] = {}
+        self.stats = SingleFlightStats()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently in flight."""
+        return len(self._flights)
+
+    def key_for(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_data: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        discriminator: str = "",
+    ) -> Hashable | None:
+        """Return the coalescing key for a request, or ``None`` if ineligible.
+
+        Bodies and params are canonicalised with sorted keys, so dict
+        ordering does not matter. Requests whose body asks for a stream or
+        that cannot be serialised to JSON are never coalesced.
+        """
+        method = method.upper()
+        path = path.strip("/")
+        if method not in SAFE_METHODS and not (method == "POST" and path in self._post_paths):
+            return None
+        if json_data is not None and json_data.get("stream"):
+            return None
+        try:
+            body = _canonical(json_data)
+            query = _canonical(params)
+            extra = _canonical(headers)
+        except (TypeError, ValueError):
+            return None
+        return (method, path, body, query, extra, discriminator)
+
+    async def do[R](self, key: Hashable, fn: Callable[[], Awaitable[R]]) -> R:
+        """Run ``fn`` once per key among concurrent callers and share its result.
+
+        Args:
+            key: Value from :meth:`key_for`.
+            fn: Zero-argument callable returning the awaitable to run. Only the
+                leader calls it.
+
+        Returns:
+            The leader's result (the same object for every caller).
+
+        Raises:
+            Exception: Whatever ``fn`` raised, re-raised in every caller.
+        """
+        self.stats.requests += 1
+        _record_request()
+
+        flight = self._flights.get(key)
+        # A finished flight waits for its done-callback to be forgotten, and a
+        # cancelled one is dying: neither may be joined.
+        if flight is None or flight.task.done() or flight.task.cancelling():
+            self.stats.executed += 1
+            task = asyncio.ensure_future(fn())
+            flight = self._flights[key] = _Flight(task)
+            task.add_done_callback(functools.partial(self._forget, key, flight))
+        else:
+            self.stats.coalesced += 1
+            _record_coalesced()
+            logger.debug("Coalesced duplicate request (%d already waiting)", flight.waiters)
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                flight.task.cancel()
+                self._forget(key, flight, flight.task)
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: Hashable, flight: _Flight, _task: asyncio.Task[Any]) -> None:
+        # A later flight may already own the key if this one was cancelled.
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+
+def _canonical(value: Any) -> str:
+    if value is None:
+        return ""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def _record_request() -> None:
+    """Record a request routed through single-flight (including coalesced)."""
+    try:
+        from ..observability.metrics import get_enhanced_metrics
+
+        metrics = get_enhanced_metrics()
+        if metrics._enabled:
+            metrics.requests_single_flight_total.inc()
+    except (ImportError, AttributeError, TypeError, ValueError):
+        pass
+
+
+def _record_coalesced() -> None:
+    """Record a request that joined an in-flight duplicate."""
+    try:
+        from ..observability.metrics import get_enhanced_metrics
+
+        metrics = get_enhanced_metrics()
+        if metrics._enabled:
+            metrics.requests_coalesced_total.inc()
+    except (ImportError, AttributeError, TypeError, ValueError):
+        pass
@@ -367,6 +367,10 @@ class CostSummary(BaseModel):
     average_tokens: float = Field(
         ..., description="Mean tokens per tracked request (0.0 when none)"
     )
+    cache_hits: int = Field(0, description="Responses served from a ResponseCache")
+    saved_cost_usd: Decimal = Field(
+        Decimal("0.00"), description="USD cost avoided by cache hits (not part of the total)"
+    )
 
 
 class BudgetRemaining(BaseModel):
@@ -399,6 +403,9 @@ class CostTracker:
     * **From-client factory** — :meth:`from_client` builds a tracker
       pre-populated with the live pricing map.
 
+    Responses served by a :class:`~venice_ai.cache.ResponseCache` are recorded
+    with :meth:`record_cache_hit` as savings, not spend.
+
     All mutating operations take a single :class:`asyncio.Lock` so concurrent
     in-flight requests can update state safely.
     """
@@ -411,6 +418,9 @@ class CostTracker:
         self.requests: list[CostRecord] = []
         self.total_cost_usd: Decimal = Decimal("0.00")
         self.total_tokens: int = 0
+        self.cache_hits: int = 0
+        self.saved_cost_usd: Decimal = Decimal("0.00")
+        self.saved_tokens: int = 0
         self._lock = asyncio.Lock()
 
     @classmethod
@@ -441,6 +451,57 @@ class CostTracker:
             :class:`CostRecord`.
         :raises TypeError: For unsupported response types.
         """
+        model_id, cost, prompt_tokens, completion_tokens, total_tokens = self._price(
+            response, model, caller="track"
+        )
+
+        record = CostRecord(
+            timestamp=datetime.now(UTC),
+            model=model_id,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=total_tokens,
+            cost_usd=cost,
+            metadata=dict(metadata or {}),
+        )
+        async with self._lock:
+            self.requests.append(record)
+            self.total_cost_usd += cost
+            self.total_tokens += total_tokens
+        return cost
+
+    async def record_cache_hit(
+        self,
+        response: ChatCompletion | EmbeddingsResponse | Any,
+        *,
+        model: str | None = None,
+    ) -> Decimal:
+        """Record a response served from a :class:`~venice_ai.cache.ResponseCache`.
+
+        The response's cost is added to :attr:`saved_cost_usd` rather than
+        :attr:`total_cost_usd`, so budgets only see real spend. Untracked
+        response types count as a hit with zero savings.
+
+        :returns: The USD cost the cache hit avoided.
+        """
+        if isinstance(response, ChatCompletion | EmbeddingsResponse):
+            _, cost, _, _, total_tokens = self._price(response, model, caller="record_cache_hit")
+        else:
+            cost, total_tokens = Decimal("0.00"), 0
+        async with self._lock:
+            self.cache_hits += 1
+            self.saved_cost_usd += cost
+            self.saved_tokens += total_tokens
+        return cost
+
+    def _price(
+        self,
+        response: ChatCompletion | EmbeddingsResponse,
+        model: str | None,
+        *,
+        caller: str,
+    ) -> tuple[str, Decimal, int, int, int]:
+        """Return ``(model_id, cost_usd, prompt, completion, total)`` for *response*."""
         if isinstance(response, ChatCompletion):
             model_id = model or response.model
             pricing = self.pricing_map.get(model_id)
@@ -458,24 +519,10 @@ class CostTracker:
             total_tokens = response.usage.total_tokens
         else:
             raise TypeError(
-                f"CostTracker.track() does not support {type(response).__name__}; "
+                f"CostTracker.{caller}() does not support {type(response).__name__}; "
                 f"expected ChatCompletionResponse or EmbeddingsResponse."
             )
-
-        record = CostRecord(
-            timestamp=datetime.now(UTC),
-            model=model_id,
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            total_tokens=total_tokens,
-            cost_usd=cost,
-            metadata=dict(metadata or {}),
-        )
-        async with self._lock:
-            self.requests.append(record)
-            self.total_cost_usd += cost
-            self.total_tokens += total_tokens
-        return cost
+        return model_id, cost, prompt_tokens, completion_tokens, total_tokens
 
     async def summary(self) -> CostSummary:
         """Aggregate stats across all tracked requests."""
@@ -488,6 +535,8 @@ class CostTracker:
                     total_tokens=0,
                     average_cost_usd=Decimal("0.00"),
                     average_tokens=0.0,
+                    cache_hits=self.cache_hits,
+                    saved_cost_usd=self.saved_cost_usd,
                 )
             return CostSummary(
                 total_requests=n,
@@ -495,6 +544,8 @@ class CostTracker:
                 total_tokens=self.total_tokens,
                 average_cost_usd=self.total_cost_usd / Decimal(n),
                 average_tokens=self.total_tokens / n,
+                cache_hits=self.cache_hits,
+                saved_cost_usd=self.saved_cost_usd,
             )
 
     async def by_model(self) -> dict[str, Decimal]:
@@ -511,6 +562,9 @@ class CostTracker:
             self.requests.clear()
             self.total_cost_usd = Decimal("0.00")
             self.total_tokens = 0
+            self.cache_hits = 0
+            self.saved_cost_usd = Decimal("0.00")
+            self.saved_tokens = 0
 
 
 class BudgetManager:
@@ -164,6 +164,7 @@ __all__ = [
     "MissingStreamClassError",
     "VideoGenerationError",
     "MusicGenerationError",
+    "ChecksumMismatchError",
     "StreamConsumedError",
     "StreamClosedError",
     "PaymentRequiredError",
@@ -558,6 +559,20 @@ class MusicGenerationError(VeniceError):
         self.error_code = error_code
 
 
+class ChecksumMismatchError(VeniceError):
+    """Raised when a downloaded asset does not match the expected checksum.
+
+    Attributes:
+        expected: The hex digest the caller asked for.
+        actual: The hex digest of the bytes received.
+    """
+
+    def __init__(self, message: str, *, expected: str, actual: str) -> None:
+        super().__init__(message)
+        self.expected = expected
+        self.actual = actual
+
+
 class MissingStreamClassError(VeniceError):
     """Raised when ``stream=True`` is passed but no ``stream_cls`` is provided."""
 
@@ -459,7 +459,10 @@ class VeniceClientFactory:
                 provider = VeniceProvider(client=client, rate_limit_discovery=discovery)
 
                 # 3. Create RequestClassifier with discovery
-                request_classifier = RequestClassifier(rate_limit_discovery=discovery)
+                request_classifier = RequestClassifier(
+                    rate_limit_discovery=discovery,
+                    token_estimator=rate_config.token_estimator,
+                )
 
                 # 4. Create Classifier Adapter
                 classifier = VeniceClassifierAdapter(classifier=request_classifier)
@@ -517,6 +520,9 @@ class VeniceClientFactory:
             max_models=rate_config.max_models,
             stale_threshold=rate_config.stale_threshold,
             max_retries=rate_config.max_retries,
+            proactive=rate_config.proactive,
+            burst_fraction=rate_config.burst_fraction,
+            token_estimator=rate_config.token_estimator,
         )
 
 
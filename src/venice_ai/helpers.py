@@ -8,6 +8,9 @@ Convenience helpers for common patterns when working with the Venice AI SDK.
 - :func:`tool_from_function` -- create a :class:`Tool` from a typed Python function
 - :class:`Conversation` -- thin wrapper for building multi-turn message lists
 - :func:`cosine_similarity` -- score two embedding vectors in [-1, 1]
+- :func:`decode_embedding` -- turn a float list or base64 embedding into a float32 vector
+- :func:`cosine_similarity_matrix` -- score every query against every document
+- :func:`top_k` -- the ``k`` documents most similar to a query
 - :func:`detect_image_format` -- sniff (extension, mime_type) from raw image bytes
 - :func:`fit_image_bytes` -- resize an image to fit within a max-dimension box
 - :func:`extract_thinking_blocks` -- parse ``<thinking>`` / ``<think>`` tags
@@ -16,11 +19,15 @@ Convenience helpers for common patterns when working with the Venice AI SDK.
 
 from __future__ import annotations
 
+import base64
+import heapq
 import inspect
 import io
 import math
 import re
+import sys
 import types
+from array import array
 from collections.abc import Callable, Sequence
 from typing import (
     TYPE_CHECKING,
@@ -55,10 +62,13 @@ __all__ = [
     "tool_from_function",
     "Conversation",
     "cosine_similarity",
+    "cosine_similarity_matrix",
+    "decode_embedding",
     "detect_image_format",
     "extract_thinking_blocks",
     "fit_image_bytes",
     "normalize_duration_seconds",
+    "top_k",
 ]
 
 
@@ -211,6 +221,151 @@ def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
     return dot / (math.sqrt(norm_a) * math.sqrt(norm_b))
 
 
+def _numpy() -> Any:
+    """Return the ``numpy`` module, or ``None`` when it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def decode_embedding(embedding: Sequence[float] | str) -> Any:
+    """Convert one ``embedding`` value into a compact float32 vector.
+
+    Base64 strings (``encoding_format="base64"``) are decoded as
+    little-endian float32. With NumPy installed the result is a 1-D
+    ``numpy.float32`` array; base64 input is wrapped with ``np.frombuffer``
+    without copying, so the array is read-only. Without NumPy an
+    ``array('f')`` is returned instead. Either uses 4 bytes per dimension,
+    against roughly 32 for a list of Python floats.
+
+    :param embedding: An ``EmbeddingObject.embedding`` value: a list of
+        floats or a base64 string.
+    :raises ValueError: If a base64 payload is not a whole number of float32
+        values.
+    """
+    np = _numpy()
+    if isinstance(embedding, str):
+        raw = base64.b64decode(embedding)
+        if len(raw) % 4:
+            raise ValueError(
+                f"Base64 embedding decodes to {len(raw)} bytes, not a whole number of float32 values"
+            )
+        if np is not None:
+            return np.frombuffer(raw, dtype="<f4")
+        vector = array("f")
+        vector.frombytes(raw)
+        if sys.byteorder == "big":
+            vector.byteswap()
+        return vector
+    if np is not None:
+        return np.asarray(embedding, dtype=np.float32)
+    return array("f", embedding)
+
+
+def _numpy_unit_rows(np: Any, vectors: Any) -> Any:
+    """Stack *vectors* into a 2-D float32 matrix with unit-length rows."""
+    if isinstance(vectors, np.ndarray):
+        matrix = np.asarray(vectors, dtype=np.float32)
+    else:
+        matrix = np.stack([decode_embedding(v) for v in vectors]) if len(vectors) else None
+    if matrix is None or matrix.size == 0:
+        raise ValueError("Vectors must be non-empty")
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2-D collection of vectors, got {matrix.ndim} dimension(s)")
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    if not norms.all():
+        raise ValueError("Cosine similarity is undefined for a zero vector")
+    return matrix / norms
+
+
+def _python_unit_rows(vectors: Any) -> list[array[float]]:
+    """Normalise each vector into an ``array('f')`` of unit length."""
+    rows: list[array[float]] = []
+    for vector in vectors:
+        row = decode_embedding(vector)
+        if not len(row):
+            raise ValueError("Vectors must be non-empty")
+        norm = math.sqrt(math.sumprod(row, row))
+        if norm == 0.0:
+            raise ValueError("Cosine similarity is undefined for a zero vector")
+        rows.append(array("f", [x / norm for x in row]))
+    if not rows:
+        raise ValueError("Vectors must be non-empty")
+    return rows
+
+
+def _check_dimensions(a: int, b: int) -> None:
+    if a != b:
+        raise ValueError(f"Vectors must have the same length: got {a} and {b}")
+
+
+def cosine_similarity_matrix(queries: Any, documents: Any) -> Any:
+    """Cosine similarity of every query against every document.
+
+    Vectorised counterpart of :func:`cosine_similarity` for reranking and
+    deduplication. Inputs may be NumPy arrays, lists of float lists or lists
+    of base64 strings (anything :func:`decode_embedding` accepts), e.g.
+    ``[d.embedding for d in response.data]`` or ``response.as_array()``.
+
+    With NumPy installed the result is a ``(len(queries), len(documents))``
+    float32 array computed with a single matrix product. Without NumPy the
+    vectors are normalised into ``array('f')`` rows and the result is a list
+    of lists of floats with the same shape.
+
+    :param queries: Query vectors, one per row.
+    :param documents: Document vectors, one per row.
+    :raises ValueError: If either side is empty, the dimensions differ, or a
+        vector has zero magnitude.
+    """
+    np = _numpy()
+    if np is not None:
+        q = _numpy_unit_rows(np, queries)
+        d = _numpy_unit_rows(np, documents)
+        _check_dimensions(q.shape[1], d.shape[1])
+        return q @ d.T
+
+    q_rows = _python_unit_rows(queries)
+    d_rows = _python_unit_rows(documents)
+    for row in (*q_rows, *d_rows):
+        _check_dimensions(len(q_rows[0]), len(row))
+    return [[math.sumprod(q, d) for d in d_rows] for q in q_rows]
+
+
+def top_k(query: Any, documents: Any, k: int = 10) -> list[tuple[int, float]]:
+    """Return the ``k`` documents most similar to *query*.
+
+    :param query: One vector (float list, base64 string or 1-D array).
+    :param documents: Document vectors, as accepted by
+        :func:`cosine_similarity_matrix`.
+    :param k: Number of results; fewer are returned when there are fewer
+        documents.
+    :return: ``(document_index, score)`` pairs, highest score first.
+    :raises ValueError: If *k* is not positive, or for the same reasons as
+        :func:`cosine_similarity_matrix`.
+    """
+    if k < 1:
+        raise ValueError(f"k must be positive, got {k}")
+    if not len(documents):
+        return []
+
+    np = _numpy()
+    if np is not None:
+        scores = cosine_similarity_matrix(np.asarray(decode_embedding(query))[None, :], documents)[
+            0
+        ]
+        if k < len(scores):
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(len(scores))
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(int(i), float(scores[i])) for i in ranked]
+
+    (scores,) = cosine_similarity_matrix([query], documents)
+    return heapq.nlargest(k, enumerate(scores), key=lambda item: item[1])
+
+
 _DURATION_PATTERN = re.compile(
     r"""
     ^\s*               # optional leading whitespace
@@ -29,6 +29,15 @@ The module implements a sophisticated retry strategy that considers:
 4. **Exponential Backoff**: Increases delay between attempts to reduce server load
 5. **Jitter Application**: Adds randomness to prevent synchronized retry storms
 
+## Retry Budget
+
+When the request is sent by :class:`~venice_ai.VeniceClient`, every retry is
+also checked against the request's
+:class:`~venice_ai.core.retry_budget.RetryScope`: the shared
+:class:`~venice_ai.core.retry_budget.RetryBudget` must have a token left, and
+the backoff plus the last attempt's duration must fit before the caller's
+deadline. 429s are left to the rate limiter when one handles the request.
+
 ## Performance Considerations
 
 The retry mechanism is designed to be efficient and respectful of server resources:
@@ -42,6 +51,7 @@ import asyncio
 import contextvars
 import logging
 import random
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -51,6 +61,8 @@ from typing import Any
 from aiohttp import ClientError, ClientResponse, ServerTimeoutError
 from aiohttp.typedefs import Middleware
 
+from ..core.retry_budget import current_retry_scope
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,7 +82,9 @@ class RetryOptions:
         retry_status_codes: Set of HTTP status codes that should trigger a retry attempt.
             Default includes server errors (5xx). Rate limiting (429) is intentionally excluded
             because SimpleRateLimiter handles 429 retries with per-model state tracking,
-            exponential backoff, and Retry-After header support. Common additions might
+            exponential backoff, and Retry-After header support. If 429 is added anyway,
+            requests a rate limiter handles still leave their 429s to it, so they are
+            never retried (and slept on) by both layers. Common additions might
             include 408 (Request Timeout) or 413 (Payload Too Large) depending on use case.
 
         retry_exceptions: List of exception types that should trigger retry attempts.
@@ -367,14 +381,21 @@ def create_retry_middleware(options: RetryOptions | None = None) -> Middleware:
             return await handler(request)
 
         last_exception = None
+        scope = current_retry_scope()
 
         for attempt in range(options.max_attempts + 1):  # +1 for the initial attempt
+            started = time.monotonic()
             try:
                 # Make the request
                 response = await handler(request)
 
-                # Check if we should retry based on status code
-                if response.status in options.retry_status_codes and attempt < options.max_attempts:
+                # Check if we should retry based on status code. A rate
+                # limiter handling this request owns 429s (and their backoff).
+                if (
+                    response.status in options.retry_status_codes
+                    and attempt < options.max_attempts
+                    and not (response.status == 429 and scope is not None and scope.rate_limited)
+                ):
                     # Calculate delay
                     delay = calculate_backoff_delay(
                         attempt,
@@ -391,6 +412,11 @@ def create_retry_middleware(options: RetryOptions | None = None) -> Middleware:
                             # Use Retry-After delay, but cap it at max_retry_after
                             delay = min(retry_after, options.max_retry_after)
 
+                    if scope is not None and not scope.allow_retry(
+                        delay, time.monotonic() - started
+                    ):
+                        return response
+
                     logger.info(
                         f"Retrying request {method} {request.url} "
                         f"(attempt {attempt + 1}/{options.max_attempts + 1}) "
@@ -432,6 +458,11 @@ def create_retry_middleware(options: RetryOptions | None = None) -> Middleware:
                         options.jitter_factor,
                     )
 
+                    if scope is not None and not scope.allow_retry(
+                        delay, time.monotonic() - started
+                    ):
+                        raise
+
                     logger.info(
                         f"Retrying request {method} {request.url} "
                         f"(attempt {attempt + 1}/{options.max_attempts + 1}) "
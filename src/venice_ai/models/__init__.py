@@ -11,6 +11,7 @@ Key Components:
     - Intelligent model selection with DynamicModelSelector
     - Capability-based filtering and matching
     - Cached model information with TTL support
+    - A catalog cache shared across processes (ModelCatalog)
 
 Quick Start:
     >>> from venice_ai import VeniceClient, create_model_selector
@@ -26,6 +27,7 @@ Quick Start:
 For detailed selection capabilities, see the DynamicModelSelector class.
 """
 
+from .catalog import CatalogStats, ModelCatalog
 from .selection import (
     CheapestVideoResult,
     DynamicModelSelector,
@@ -48,4 +50,6 @@ __all__ = [
     "get_multiple_models",
     "get_video_model",
     "get_cheapest_video_model",
+    "ModelCatalog",
+    "CatalogStats",
 ]
@@ -0,0 +1,308 @@
+"""
+Model Catalog Cache
+===================
+
+Shared cache for the ``/models`` catalog, read by
+:meth:`Models.get <venice_ai.resources.models.Models.get>`,
+:meth:`Models.get_capabilities <venice_ai.resources.models.Models.get_capabilities>`
+and :class:`~venice_ai.models.selection.DynamicModelSelector` through
+``client.models.list(..., cached=True)``.
+
+The full catalog is large and changes rarely, yet every new worker process
+and every CLI invocation used to download it again. :class:`ModelCatalog`
+keeps the raw response body in a :class:`~venice_ai.cache.CacheStore`, so a
+:class:`~venice_ai.cache.FileCacheStore` or
+:class:`~venice_ai.cache.RedisCacheStore` lets processes share one copy:
+
+* Within ``ttl`` the stored catalog is served without a request.
+* Within the following ``stale_while_revalidate`` window it is still served
+  immediately while one background request refreshes it.
+* Past that, callers wait for a refresh. Refreshes are conditional
+  (``If-None-Match`` / ``If-Modified-Since`` from the stored ``ETag`` /
+  ``Last-Modified``), so an unchanged catalog costs a 304 and no body.
+* If a refresh fails and any stored copy exists, the copy is served.
+
+Concurrent refreshes of the same listing within a process share one request.
+
+Example:
+    >>> from venice_ai import VeniceClient
+    >>> from venice_ai.cache import FileCacheStore
+    >>> from venice_ai.models import ModelCatalog
+    >>>
+    >>> catalog = ModelCatalog(
+    ...     FileCacheStore("/var/cache/venice/models"),
+    ...     ttl=300,
+    ...     stale_while_revalidate=3600,
+    ... )
+    >>> client = VeniceClient(model_catalog=catalog)
+
+Setting ``VENICE_MODEL_CACHE_DIR`` gives clients created without a
+``model_catalog`` an on-disk catalog in that directory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+from .. import _constants
+from ..cache import CacheStore, FileCacheStore, MemoryCacheStore
+from ..types.api import ModelsListResponse
+
+if TYPE_CHECKING:
+    from .._client import VeniceClient
+
+logger = logging.getLogger(__name__)
+
+#: How long a stored catalog is kept after it stops being served, so a later
+#: refresh can still revalidate it instead of downloading it again.
+DEFAULT_RETENTION = 7 * 24 * 3600.0
+
+
+@dataclass(slots=True)
+class CatalogStats:
+    """Counters for a :class:`ModelCatalog`.
+
+    Attributes:
+        hits: Lookups answered with a fresh catalog.
+        stale_hits: Lookups answered with a stale catalog while it refreshed.
+        fetches: Refreshes that downloaded the catalog body.
+        not_modified: Refreshes answered with 304 Not Modified.
+        errors: Failed refreshes and cache-store errors.
+    """
+
+    hits: int = 0
+    stale_hits: int = 0
+    fetches: int = 0
+    not_modified: int = 0
+    errors: int = 0
+
+
+@dataclass(slots=True)
+class _Entry:
+    listing: ModelsListResponse
+    body: bytes
+    fetched_at: float
+    etag: str | None
+    last_modified: str | None
+
+    def pack(self) -> bytes:
+        header = {
+            "fetched_at": self.fetched_at,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+        }
+        return json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n" + self.body
+
+
+def _unpack_header(raw: bytes) -> tuple[dict[str, Any], bytes]:
+    header, _, body = raw.partition(b"\n")
+    return json.loads(header), body
+
+
+class ModelCatalog:
+    """Cache the model catalog in a store shared across clients and processes.
+
+    Args:
+        store: Where catalogs live. Defaults to an in-process
+            :class:`~venice_ai.cache.MemoryCacheStore`.
+        ttl: Seconds a catalog is served without a request.
+        stale_while_revalidate: Extra seconds a catalog is still served
+            while a background request refreshes it.
+        retention: Seconds a stored catalog is kept for conditional
+            revalidation; must cover ``ttl + stale_while_revalidate``.
+        namespace: Mixed into store keys so unrelated catalogs (for example
+            different base URLs) can share a store.
+    """
+
+    def __init__(
+        self,
+        store: CacheStore | None = None,
+        *,
+        ttl: float = 30.0,
+        stale_while_revalidate: float = 0.0,
+        retention: float = DEFAULT_RETENTION,
+        namespace: str = "v1",
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if stale_while_revalidate < 0:
+            raise ValueError("stale_while_revalidate must be >= 0")
+        self.store: CacheStore = store if store is not None else MemoryCacheStore()
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.retention = max(retention, ttl + stale_while_revalidate)
+        self.namespace = namespace
+        self.stats = CatalogStats()
+        self._entries: dict[str, _Entry] = {}
+        self._refreshing: dict[str, asyncio.Task[_Entry]] = {}
+
+    @classmethod
+    def from_env(cls, namespace: str = "v1") -> ModelCatalog:
+        """Build the catalog a client uses when none is passed.
+
+        On-disk with a 5-minute TTL and 1-hour stale window when
+        ``VENICE_MODEL_CACHE_DIR`` is set, otherwise in-process with a
+        30-second TTL. ``VeniceClient`` passes its base URL as ``namespace``
+        so clients for different deployments never share a catalog.
+        """
+        directory = os.environ.get(_constants.ENV_MODEL_CACHE_DIR)
+        if directory:
+            return cls(
+                FileCacheStore(directory),
+                ttl=300.0,
+                stale_while_revalidate=3600.0,
+                namespace=namespace,
+            )
+        return cls(namespace=namespace)
+
+    def key_for(self, params: Mapping[str, Any]) -> str:
+        """Return the store key for a ``/models`` query."""
+        query = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        return f"venice:models:{self.namespace}:{query}"
+
+    async def get(self, client: VeniceClient, params: Mapping[str, Any]) -> ModelsListResponse:
+        """Return the catalog for ``params``, refreshing it if it is too old.
+
+        Raises:
+            APIError: If the catalog has never been fetched and the request
+                fails.
+        """
+        key = self.key_for(params)
+        entry = self._entries.get(key)
+        if entry is None or self._age(entry) >= self.ttl:
+            # Another process may have refreshed the shared copy already.
+            entry = await self._load(key, entry)
+        if entry is not None:
+            age = self._age(entry)
+            if age < self.ttl:
+                self.stats.hits += 1
+                return entry.listing
+            if age < self.ttl + self.stale_while_revalidate:
+                self.stats.stale_hits += 1
+                self._refresh_task(client, params, key)
+                return entry.listing
+        return (await asyncio.shield(self._refresh_task(client, params, key))).listing
+
+    async def refresh(self, client: VeniceClient, params: Mapping[str, Any]) -> ModelsListResponse:
+        """Revalidate the catalog for ``params`` now, whatever its age."""
+        key = self.key_for(params)
+        return (await asyncio.shield(self._refresh_task(client, params, key))).listing
+
+    async def invalidate(self, params: Mapping[str, Any]) -> None:
+        """Forget the catalog for ``params`` in this process and in the store."""
+        key = self.key_for(params)
+        self._entries.pop(key, None)
+        await self.store.delete(key)
+
+    async def aclose(self) -> None:
+        """Wait for in-flight refreshes to finish."""
+        if self._refreshing:
+            await asyncio.gather(*self._refreshing.values(), return_exceptions=True)
+
+    # -- internals -----------------------------------------------------------
+
+    @staticmethod
+    def _age(entry: _Entry) -> float:
+        return time.time() - entry.fetched_at
+
+    def _refresh_task(
+        self, client: VeniceClient, params: Mapping[str, Any], key: str
+    ) -> asyncio.Task[_Entry]:
+        task = self._refreshing.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._fetch(client, params, key))
+            self._refreshing[key] = task
+            task.add_done_callback(lambda t: self._refresh_done(key, t))
+        return task
+
+    def _refresh_done(self, key: str, task: asyncio.Task[_Entry]) -> None:
+        if self._refreshing.get(key) is task:
+            del self._refreshing[key]
+        if not task.cancelled():
+            task.exception()  # retrieved here so background failures are not reported twice
+
+    async def _fetch(self, client: VeniceClient, params: Mapping[str, Any], key: str) -> _Entry:
+        entry = self._entries.get(key)
+        headers: dict[str, str] = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        try:
+            response = await client.get(
+                "models",
+                params=dict(params),
+                headers=headers or None,
+                raw_response=True,
+                force_direct=True,
+            )
+            try:
+                if response.status == 304 and entry is not None:
+                    self.stats.not_modified += 1
+                    entry = replace(
+                        entry,
+                        fetched_at=time.time(),
+                        etag=response.headers.get("ETag", entry.etag),
+                        last_modified=response.headers.get("Last-Modified", entry.last_modified),
+                    )
+                else:
+                    body = await response.read()
+                    listing = ModelsListResponse.model_validate_json(body)
+                    self.stats.fetches += 1
+                    entry = _Entry(
+                        listing=listing,
+                        body=body,
+                        fetched_at=time.time(),
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
+            finally:
+                response.release()
+        except Exception:
+            if entry is None:
+                raise
+            self.stats.errors += 1
+            logger.warning("Model catalog refresh failed; serving cached copy", exc_info=True)
+            return entry
+        self._entries[key] = entry
+        await self._save(key, entry)
+        logger.debug(f"Model catalog refreshed for {key} ({len(entry.listing.data)} models)")
+        return entry
+
+    async def _load(self, key: str, current: _Entry | None) -> _Entry | None:
+        """Adopt the stored catalog if it is newer than ``current``."""
+        try:
+            raw = await self.store.get(key)
+            if raw is None:
+                return current
+            header, body = _unpack_header(raw)
+            fetched_at = float(header["fetched_at"])
+            if current is not None and fetched_at <= current.fetched_at:
+                return current
+            entry = _Entry(
+                listing=ModelsListResponse.model_validate_json(body),
+                body=body,
+                fetched_at=fetched_at,
+                etag=header.get("etag"),
+                last_modified=header.get("last_modified"),
+            )
+        except Exception:  # noqa: BLE001 — a cache outage or corrupt entry is just a miss
+            logger.warning("Model catalog cache read failed; ignoring", exc_info=True)
+            self.stats.errors += 1
+            return current
+        self._entries[key] = entry
+        return entry
+
+    async def _save(self, key: str, entry: _Entry) -> None:
+        try:
+            await self.store.set(key, entry.pack(), self.retention)
+        except Exception:  # noqa: BLE001 — a cache outage must not fail requests
+            logger.warning("Model catalog cache write failed", exc_info=True)
+            self.stats.errors += 1
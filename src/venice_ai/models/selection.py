@@ -279,11 +279,19 @@ class DynamicModelSelector:
         """
         self.client = client
         self._cache = ModelCache(ttl_seconds=cache_ttl)
+        # Catalog listing the cache was last built from
+        self._source: Any = None
         self._fetch_lock = asyncio.Lock()
         self.default_selector = default_selector
 
     async def _fetch_models(self, force_refresh: bool = False) -> dict[str, Any]:
-        """Fetch models from API with caching."""
+        """Fetch models from the client's shared catalog, with caching.
+
+        The listing comes from ``client.models.list(type="all", cached=True)``
+        (the client's :class:`~venice_ai.models.catalog.ModelCatalog`), so the
+        selector and ``models.get()`` share one copy. ``force_refresh`` skips
+        the catalog and fetches a live listing.
+        """
         if not force_refresh and not self._cache.is_expired():
             return self._cache.models
 
@@ -295,7 +303,11 @@ class DynamicModelSelector:
             try:
                 logger.info("Fetching available models from API...")
                 # Use the models endpoint to get ALL available models
-                response = await self.client.models.list(type="all")
+                response = await self.client.models.list(type="all", cached=not force_refresh)
+                if response is self._source and self._cache.models:
+                    # Catalog unchanged since the last build: just restart the TTL
+                    self._cache.update(self._cache.models)
+                    return self._cache.models
 
                 # Convert response to dict format
                 models_dict = {}
@@ -453,6 +465,7 @@ class DynamicModelSelector:
                         models_dict[model_id] = model_data
 
                 self._cache.update(models_dict)
+                self._source = response
                 logger.info(f"Successfully fetched {len(models_dict)} models")
                 return models_dict
 
@@ -59,6 +59,7 @@ class EnhancedMetrics:
     - Custom stream usage (created, bytes, duration)
     - Streaming fallback tracking
     - Tier discovery coalescing metrics
+    - Client-wide request coalescing (single-flight) metrics
 
     **Usage:**
     ```python
@@ -179,6 +180,19 @@ class EnhancedMetrics:
                 registry=registry,
             )
 
+            # Client-wide single-flight coalescing metrics
+            self.requests_single_flight_total = Counter(
+                "venice_requests_single_flight_total",
+                "Requests routed through single-flight coalescing (including coalesced)",
+                registry=registry,
+            )
+
+            self.requests_coalesced_total = Counter(
+                "venice_requests_coalesced_total",
+                "Requests that shared an identical in-flight request",
+                registry=registry,
+            )
+
             logger.info("Enhanced Prometheus metrics initialized")
 
         except Exception as e:
@@ -199,6 +213,8 @@ class EnhancedMetrics:
         self.tier_discovery_coalesced_total = dummy  # type: ignore[assignment]
         self.tier_discovery_concurrent_requests = dummy  # type: ignore[assignment]
         self.tier_discovery_time_saved_seconds = dummy  # type: ignore[assignment]
+        self.requests_single_flight_total = dummy  # type: ignore[assignment]
+        self.requests_coalesced_total = dummy  # type: ignore[assignment]
 
         logger.info("Dummy enhanced metrics initialized")
 
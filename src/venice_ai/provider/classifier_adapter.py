@@ -107,3 +107,7 @@ class VeniceClassifierAdapter(ClassifierProtocol):
             endpoint=venice_meta.endpoint,
             requires_model=venice_meta.requires_model,
         )
+
+    def record_usage(self, request: dict[str, Any], usage: dict[str, Any]) -> None:
+        """Forward response usage to the wrapped classifier's token calibration."""
+        self._classifier.record_usage(request, usage)
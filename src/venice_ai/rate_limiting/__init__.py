@@ -7,6 +7,12 @@ from .simple import (
     RateLimiterProtocol,
     SimpleRateLimiter,
 )
+from .token_estimation import (
+    CharTokenEstimator,
+    TokenCalibration,
+    TokenEstimator,
+    TokenizerTokenEstimator,
+)
 
 __all__ = [
     "RateLimiterConfig",
@@ -15,4 +21,8 @@ __all__ = [
     "ModelBucketState",
     "SimpleRateLimiter",
     "NoOpRateLimiter",
+    "TokenEstimator",
+    "CharTokenEstimator",
+    "TokenizerTokenEstimator",
+    "TokenCalibration",
 ]
@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from enum import StrEnum
 
+from .token_estimation import TokenEstimator
+
 
 class RateLimiterMode(StrEnum):
     """Rate limiter mode selection."""
@@ -22,6 +24,9 @@ class RateLimiterConfig:
         - Single-process only
         - No Redis required
 
+    With ``proactive=True`` SimpleRateLimiter also paces requests with
+    local request/token buckets built from the rate-limit headers.
+
     For AdaptiveScheduler (mode=ADAPTIVE):
         - Proactive rate limiting (prevents 429s)
         - Multi-process/worker coordination via Redis
@@ -41,7 +46,12 @@ class RateLimiterConfig:
     max_models: int = 1000
     stale_threshold: float = 3600.0
     max_retries: int = 3
+    proactive: bool = False  # Pace with local token buckets instead of waiting for 429s
+    burst_fraction: float = 0.1  # Share of the per-minute limit sendable back-to-back
 
     # AdaptiveScheduler configuration (requires adaptive package)
     redis_url: str | None = None
     account_id: str | None = None  # Required for key scoping in adaptive mode
+    # Prompt-token counter used for TPM budgeting (ADAPTIVE and proactive SIMPLE);
+    # None = ~4 chars/token heuristic
+    token_estimator: TokenEstimator | None = None
@@ -7,6 +7,8 @@ This module provides:
 - Global abuse protection (blocks all requests after threshold failures)
 - Automatic cleanup of stale model state
 - Memory bounds via max_models limit
+- Optional proactive pacing: local request/token buckets refilled at the
+  header-reported per-minute limits (``proactive=True``)
 
 For production deployments requiring distributed coordination,
 use ADAPTIVE mode with the adaptive-rate-limiter package.
@@ -24,6 +26,7 @@ from typing import (
     Protocol,
 )
 
+from ..core.retry_budget import current_retry_scope
 from ..utils.parsing import ms_epoch_to_seconds
 
 if TYPE_CHECKING:
@@ -113,6 +116,12 @@ class ModelBucketState:
     consecutive_failures: int = 0
     backoff_until: float = 0.0
 
+    # Local token buckets (proactive mode). None until a limit header is seen;
+    # may go negative while reservations are queued behind the refill.
+    request_allowance: float | None = None
+    token_allowance: float | None = None
+    allowance_updated: float = 0.0
+
     # Timestamps
     last_updated: float = field(default_factory=time.time)
     last_accessed: float = field(default_factory=time.time)
@@ -149,11 +158,22 @@ class SimpleRateLimiter:
     - Automatic cleanup of stale model state
     - Memory bounds via max_models limit
 
+    Proactive mode (``proactive=True``):
+    - Turns the ``x-ratelimit-limit-*`` headers into local request and token
+      buckets refilled at ``limit / 60`` per second, holding at most
+      ``burst_fraction`` of a minute's allowance
+    - Each request reserves one request and its estimated tokens up front and
+      sleeps until the reservation is covered, so traffic is spread across
+      the window instead of bursting until a 429
+    - Buckets are clamped to ``x-ratelimit-remaining-*`` on every response
+    - Token estimates come from the attached ``classifier`` (a
+      :class:`~venice_ai._request_classifier.RequestClassifier` is created if
+      none is set)
+
     Limitations (by design):
     - Single-process only (no cross-worker coordination)
-    - Reactive only (responds to 429s, does not prevent them)
-    - No token prediction (cannot estimate before request)
-    - No cold-start protection (concurrent cold starts may stampede)
+    - Reactive by default (responds to 429s; enable ``proactive`` to pace)
+    - No cold-start protection (pacing starts once limit headers are seen)
 
     For production deployments, use ADAPTIVE mode with adaptive-rate-limiter.
     """
@@ -173,6 +193,9 @@ class SimpleRateLimiter:
         max_models: int = 1000,
         stale_threshold: float = 3600.0,
         max_retries: int = 3,
+        proactive: bool = False,
+        burst_fraction: float = 0.1,
+        token_estimator: Any | None = None,
     ):
         """
         Initialize SimpleRateLimiter.
@@ -186,7 +209,16 @@ class SimpleRateLimiter:
             max_models: Maximum number of models to track (default: 1000)
             stale_threshold: Time after which unused models are cleaned up (default: 3600.0)
             max_retries: Maximum number of retry attempts for 429 responses (default: 3)
+            proactive: Pace requests with local token buckets derived from
+                rate-limit headers (default: False)
+            burst_fraction: Fraction of the per-minute limit that may be sent
+                back-to-back in proactive mode (default: 0.1)
+            token_estimator: Prompt-token counter for the classifier created in
+                proactive mode (default: ~4 chars/token heuristic)
         """
+        if not 0 < burst_fraction <= 1:
+            raise ValueError(f"burst_fraction must be in (0, 1], got {burst_fraction}")
+
         self._model_states: dict[str, ModelBucketState] = {}
         self._locks: dict[str, asyncio.Lock] = {}
         self._global_lock = asyncio.Lock()
@@ -204,13 +236,28 @@ class SimpleRateLimiter:
         self.max_models = max_models
         self.stale_threshold = stale_threshold
         self.max_retries = max_retries
+        self.proactive = proactive
+        self.burst_fraction = burst_fraction
 
         # Cleanup tracking
         self._last_cleanup: float = 0.0
 
+        # Pacing statistics (proactive mode)
+        self._paced_requests: int = 0
+        self._pacing_delay_total: float = 0.0
+
         # Lifecycle state (for VeniceClient compatibility)
         self._running: bool = False
         self._classifier: Any | None = None
+        if proactive:
+            # Proactive pacing needs token estimates, which VeniceClient only
+            # produces when the limiter exposes a classifier.
+            from .._request_classifier import RequestClassifier
+            from ..core.rate_limit_discovery import RateLimitDiscovery
+
+            self._classifier = RequestClassifier(
+                RateLimitDiscovery(), token_estimator=token_estimator
+            )
 
     # ==========================================================================
     # Lifecycle Methods (VeniceClient compatibility)
@@ -371,10 +418,89 @@ class SimpleRateLimiter:
             state.last_updated = time.time()
             state.last_accessed = time.time()
 
+            if self.proactive:
+                self._reconcile_allowances(state, normalized)
+
             # Handle 429 response
             if status_code == 429:
                 await self._apply_backoff(state, normalized)
 
+    # ==========================================================================
+    # Proactive pacing (token buckets)
+    # ==========================================================================
+
+    def _capacity(self, limit: int) -> float:
+        """Bucket size for a per-minute ``limit``: ``burst_fraction`` of it, at least 1."""
+        return max(1.0, limit * self.burst_fraction)
+
+    def _refill(self, state: ModelBucketState, now: float) -> None:
+        """Top up both buckets for the time elapsed since the last update.
+
+        A bucket whose limit is no longer positive (e.g. the server started
+        reporting ``0``) is dropped, so that dimension is not paced.
+        """
+        elapsed = max(0.0, now - state.allowance_updated)
+        if state.rpm_limit > 0:
+            cap = self._capacity(state.rpm_limit)
+            level = cap if state.request_allowance is None else state.request_allowance
+            state.request_allowance = min(cap, level + elapsed * state.rpm_limit / 60.0)
+        else:
+            state.request_allowance = None
+        if state.tpm_limit > 0:
+            cap = self._capacity(state.tpm_limit)
+            level = cap if state.token_allowance is None else state.token_allowance
+            state.token_allowance = min(cap, level + elapsed * state.tpm_limit / 60.0)
+        else:
+            state.token_allowance = None
+        state.allowance_updated = now
+
+    def _reconcile_allowances(self, state: ModelBucketState, headers: dict[str, str]) -> None:
+        """Clamp the local buckets to what the server reports as remaining.
+
+        The server sees traffic this process does not (other workers, other
+        clients on the same key), so its ``remaining`` counts are an upper
+        bound on what may be sent now.
+        """
+        self._refill(state, time.time())
+        if "x-ratelimit-remaining-requests" in headers and state.request_allowance is not None:
+            state.request_allowance = min(state.request_allowance, float(state.rpm_remaining))
+        if "x-ratelimit-remaining-tokens" in headers and state.token_allowance is not None:
+            state.token_allowance = min(state.token_allowance, float(state.tpm_remaining))
+
+    async def reserve(self, model: str, tokens: int = 0) -> float:
+        """Reserve one request and ``tokens`` tokens from the model's buckets.
+
+        The reservation is taken immediately (buckets may go negative); the
+        return value is how long the caller must wait for the refill to cover
+        it. Queued callers therefore leave at evenly spaced intervals. Returns
+        ``0.0`` when no limits are known yet or proactive mode is off.
+
+        Args:
+            model: Model identifier
+            tokens: Estimated tokens for the request
+
+        Returns:
+            Seconds to wait before sending
+        """
+        if not self.proactive:
+            return 0.0
+        async with self._get_lock(model):
+            state = self._get_state(model)
+            self._refill(state, time.time())
+            wait = 0.0
+            if state.request_allowance is not None:
+                state.request_allowance -= 1.0
+                if state.request_allowance < 0:
+                    wait = -state.request_allowance * 60.0 / state.rpm_limit
+            if state.token_allowance is not None and tokens > 0:
+                state.token_allowance -= tokens
+                if state.token_allowance < 0:
+                    wait = max(wait, -state.token_allowance * 60.0 / state.tpm_limit)
+            if wait > 0:
+                self._paced_requests += 1
+                self._pacing_delay_total += wait
+            return wait
+
     async def _apply_backoff(self, state: ModelBucketState, headers: dict[str, str]) -> None:
         """Apply exponential backoff after a 429 response."""
         state.consecutive_failures += 1
@@ -483,6 +609,8 @@ class SimpleRateLimiter:
                 "tpm_reset": state.tpm_reset,
                 "consecutive_failures": state.consecutive_failures,
                 "backoff_until": state.backoff_until,
+                "request_allowance": state.request_allowance,
+                "token_allowance": state.token_allowance,
                 "last_updated": state.last_updated,
                 "last_accessed": state.last_accessed,
             }
@@ -513,6 +641,9 @@ class SimpleRateLimiter:
             "global_failures": len(self._global_failures),
             "global_blocked": time.time() < self._global_block_until,
             "last_cleanup": self._last_cleanup,
+            "proactive": self.proactive,
+            "paced_requests": self._paced_requests,
+            "pacing_delay_total": self._pacing_delay_total,
         }
 
     # ==========================================================================
@@ -532,11 +663,17 @@ class SimpleRateLimiter:
         It orchestrates the complete request lifecycle:
 
         1. Check if rate limited (wait if needed)
-        2. Execute the request via request_func
-        3. Inspect response - if 429, create RateLimitError using error_factory
-        4. Update state from response headers
-        5. Handle 429 errors with backoff and retry
-        6. Return the response
+        2. In proactive mode, reserve from the local buckets (pace if needed)
+        3. Execute the request via request_func
+        4. Inspect response - if 429, create RateLimitError using error_factory
+        5. Update state from response headers
+        6. Handle 429 errors with backoff and retry
+        7. Return the response
+
+        When ``VeniceClient`` sends the request, 429 retries also draw from the
+        request's retry scope (see :mod:`venice_ai.core.retry_budget`): a retry
+        is skipped, and the 429 raised, once the shared budget is empty or the
+        backoff plus the last attempt's duration would pass the deadline.
 
         IMPORTANT: request_func() returns raw responses including 429s.
         This method is responsible for detecting 429s and creating errors.
@@ -560,6 +697,7 @@ class SimpleRateLimiter:
 
         model = metadata.model_id
         last_rate_limit_error: Exception | None = None
+        scope = current_retry_scope()
 
         for attempt in range(self.max_retries + 1):
             # Check rate limit before proceeding (based on local state)
@@ -587,8 +725,18 @@ class SimpleRateLimiter:
                     await asyncio.sleep(wait_time)
                     continue
 
+            # Proactive pacing: wait for the local buckets to cover this request
+            if self.proactive:
+                tokens = getattr(metadata, "estimated_tokens", None)
+                pacing_delay = await self.reserve(model, tokens if isinstance(tokens, int) else 0)
+                if pacing_delay > 0:
+                    logger.debug(f"Pacing request on {model} for {pacing_delay:.2f}s")
+                    await asyncio.sleep(pacing_delay)
+
             # Execute the request
+            started = time.monotonic()
             response = await request_func()
+            attempt_time = time.monotonic() - started
 
             # Get status code (aiohttp uses .status, httpx uses .status_code)
             status: int = (
@@ -638,6 +786,9 @@ class SimpleRateLimiter:
                         getattr(rate_limit_error, "retry_after_seconds", None) or self.min_backoff
                     )
 
+                if scope is not None and not scope.allow_retry(wait_time, attempt_time):
+                    raise rate_limit_error
+
                 logger.info(
                     f"Received 429 on {model}, retrying after {wait_time:.1f}s "
                     f"(attempt {attempt + 1}/{self.max_retries + 1})"
@@ -0,0 +1,271 @@
+"""Token estimation for rate-limit budgeting.
+
+:class:`~venice_ai._request_classifier.RequestClassifier` asks a
+:class:`TokenEstimator` how many prompt tokens a request body will consume,
+adds the requested completion budget, and hands the total to the scheduler
+so tokens-per-minute limits can be enforced before a request is sent.
+
+Two estimators ship with the SDK:
+
+* :class:`CharTokenEstimator` — the default ~4 characters/token heuristic.
+  No dependencies, no allocation beyond walking the body.
+* :class:`TokenizerTokenEstimator` — counts with any tokenizer exposing
+  ``encode(str) -> Sequence[int]``, e.g. a ``tiktoken`` encoding
+  (:meth:`TokenizerTokenEstimator.from_tiktoken`).
+
+Either estimate is scaled per model by :class:`TokenCalibration`, which
+learns the ratio of actual ``usage.prompt_tokens`` to the estimate from
+completed responses.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any, Protocol, runtime_checkable
+
+logger = logging.getLogger(__name__)
+
+#: Completion budget assumed when a request does not set one.
+DEFAULT_COMPLETION_TOKENS = 150
+
+#: Body keys holding the output-token cap, in precedence order
+#: (chat completions, legacy chat, responses API).
+_COMPLETION_KEYS = ("max_completion_tokens", "max_tokens", "max_output_tokens")
+
+
+@runtime_checkable
+class TokenEstimator(Protocol):
+    """Counts the prompt tokens of a request body."""
+
+    def count_prompt_tokens(self, body: Mapping[str, Any]) -> int:
+        """Return the estimated number of input tokens in ``body``."""
+        ...
+
+
+def iter_prompt_text(body: Mapping[str, Any]) -> Iterator[str]:
+    """Yield every piece of text in ``body`` that the model reads as input.
+
+    Covers chat ``messages`` (string content, ``text`` parts, tool-call
+    names and arguments), completion-style ``prompt``, responses-API
+    ``input`` / ``instructions`` and serialised ``tools`` definitions.
+    Strings are yielded by reference; nothing is copied.
+    """
+    messages = body.get("messages")
+    if isinstance(messages, list):
+        for message in messages:
+            if isinstance(message, Mapping):
+                yield from _iter_message_text(message)
+
+    prompt = body.get("prompt")
+    if isinstance(prompt, str):
+        yield prompt
+    elif isinstance(prompt, list):
+        for p in prompt:
+            if isinstance(p, str):
+                yield p
+
+    instructions = body.get("instructions")
+    if isinstance(instructions, str):
+        yield instructions
+
+    items = body.get("input")
+    if isinstance(items, str):
+        yield items
+    elif isinstance(items, list):
+        for item in items:
+            if isinstance(item, str):
+                yield item
+            elif isinstance(item, Mapping):
+                yield from _iter_message_text(item)
+
+    tools = body.get("tools")
+    if tools:
+        try:
+            schema = json.dumps(tools, separators=(",", ":"))
+        except (TypeError, ValueError):
+            schema = ""
+        yield schema
+
+
+def _iter_message_text(message: Mapping[str, Any]) -> Iterator[str]:
+    content = message.get("content")
+    if isinstance(content, str):
+        yield content
+    elif isinstance(content, list):
+        # Multimodal: text portions only
+        for part in content:
+            if isinstance(part, Mapping) and part.get("type") in ("text", "input_text"):
+                text = part.get("text")
+                if isinstance(text, str):
+                    yield text
+    tool_calls = message.get("tool_calls")
+    if isinstance(tool_calls, list):
+        for call in tool_calls:
+            function = call.get("function") if isinstance(call, Mapping) else None
+            if isinstance(function, Mapping):
+                for key in ("name", "arguments"):
+                    value = function.get(key)
+                    if isinstance(value, str):
+                        yield value
+
+
+def completion_budget(body: Mapping[str, Any], default: int = DEFAULT_COMPLETION_TOKENS) -> int:
+    """Return the output tokens a request may consume.
+
+    Uses the first numeric ``max_completion_tokens`` / ``max_tokens`` /
+    ``max_output_tokens`` value (``default`` when none is set), multiplied by
+    ``n`` for multi-choice chat requests.
+    """
+    budget = default
+    for key in _COMPLETION_KEYS:
+        value = body.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            budget = int(value)
+            break
+    n = body.get("n")
+    if isinstance(n, int) and not isinstance(n, bool) and n > 1:
+        budget *= n
+    return budget
+
+
+class CharTokenEstimator:
+    """Character-count heuristic: ``len(text) / chars_per_token``.
+
+    Args:
+        chars_per_token: Average characters per token. ``4`` suits English
+            prose with most BPE vocabularies; code and CJK text run lower.
+
+    Raises:
+        ValueError: If ``chars_per_token`` is not positive.
+    """
+
+    def __init__(self, chars_per_token: float = 4.0) -> None:
+        if chars_per_token <= 0:
+            raise ValueError(f"chars_per_token must be positive, got {chars_per_token}")
+        self.chars_per_token = chars_per_token
+
+    def count_prompt_tokens(self, body: Mapping[str, Any]) -> int:
+        total_chars = sum(len(text) for text in iter_prompt_text(body))
+        return int(total_chars // self.chars_per_token)
+
+
+class TokenizerTokenEstimator:
+    """Count prompt tokens with a real tokenizer.
+
+    Accepts any object with ``encode(str) -> Sequence[int]`` (a ``tiktoken``
+    ``Encoding``, a Hugging Face tokenizer, ...). Venice serves many model
+    families, so a single vocabulary is still an approximation; pair it with
+    :class:`TokenCalibration` to correct the per-model bias.
+
+    Args:
+        tokenizer: Object providing ``encode``.
+        per_message_tokens: Framing overhead added per chat message (role
+            markers and separators).
+    """
+
+    def __init__(self, tokenizer: Any, *, per_message_tokens: int = 4) -> None:
+        if not callable(getattr(tokenizer, "encode", None)):
+            raise TypeError("tokenizer must provide an encode(str) method")
+        self._encode = tokenizer.encode
+        self.per_message_tokens = per_message_tokens
+
+    @classmethod
+    def from_tiktoken(cls, encoding: str = "o200k_base", **kwargs: Any) -> TokenizerTokenEstimator:
+        """Build an estimator from a named ``tiktoken`` encoding.
+
+        Raises:
+            ImportError: If ``tiktoken`` is not installed.
+        """
+        try:
+            import tiktoken
+        except ImportError as e:
+            raise ImportError(
+                "tiktoken is required for TokenizerTokenEstimator.from_tiktoken(). "
+                "Install it with: pip install tiktoken"
+            ) from e
+        return cls(tiktoken.get_encoding(encoding), **kwargs)
+
+    def count_prompt_tokens(self, body: Mapping[str, Any]) -> int:
+        tokens = sum(len(self._encode(text)) for text in iter_prompt_text(body))
+        messages = body.get("messages")
+        if isinstance(messages, Sequence) and not isinstance(messages, str):
+            tokens += self.per_message_tokens * len(messages)
+        return tokens
+
+
+class TokenCalibration:
+    """Per-model correction factor learned from response ``usage``.
+
+    After each response, :meth:`observe` folds ``actual / estimated`` prompt
+    tokens into an exponential moving average for that model; :meth:`factor`
+    returns it (``1.0`` until the model has been observed).
+
+    Args:
+        smoothing: EMA weight given to each new observation (0-1].
+        min_factor: Lower clamp for the factor.
+        max_factor: Upper clamp for the factor.
+        max_models: Models tracked before the oldest is forgotten.
+    """
+
+    def __init__(
+        self,
+        *,
+        smoothing: float = 0.2,
+        min_factor: float = 0.25,
+        max_factor: float = 4.0,
+        max_models: int = 1000,
+    ) -> None:
+        if not 0 < smoothing <= 1:
+            raise ValueError(f"smoothing must be in (0, 1], got {smoothing}")
+        if not 0 < min_factor <= 1 <= max_factor:
+            raise ValueError("Calibration bounds must satisfy 0 < min_factor <= 1 <= max_factor")
+        self.smoothing = smoothing
+        self.min_factor = min_factor
+        self.max_factor = max_factor
+        self.max_models = max_models
+        self._factors: dict[str, float] = {}
+
+    def factor(self, model: str) -> float:
+        """Return the current correction factor for ``model``."""
+        return self._factors.get(model, 1.0)
+
+    def observe(self, model: str, estimated: int, actual: int) -> None:
+        """Record one response's estimated vs. actual prompt tokens.
+
+        Observations with a non-positive estimate or actual count are ignored.
+        """
+        if estimated <= 0 or actual <= 0:
+            return
+        ratio = min(self.max_factor, max(self.min_factor, actual / estimated))
+        previous = self._factors.pop(model, None)
+        if previous is None:
+            updated = ratio
+            if len(self._factors) >= self.max_models:
+                self._factors.pop(next(iter(self._factors)))
+        else:
+            updated = previous + self.smoothing * (ratio - previous)
+        self._factors[model] = updated
+        logger.debug(
+            "Token calibration for %s: estimated=%d actual=%d factor=%.3f",
+            model,
+            estimated,
+            actual,
+            updated,
+        )
+
+    def snapshot(self) -> dict[str, float]:
+        """Return a copy of the learned factors, keyed by model."""
+        return dict(self._factors)
+
+
+__all__ = [
+    "DEFAULT_COMPLETION_TOKENS",
+    "CharTokenEstimator",
+    "TokenCalibration",
+    "TokenEstimator",
+    "TokenizerTokenEstimator",
+    "completion_budget",
+    "iter_prompt_text",
+]
@@ -35,7 +35,9 @@ from typing import (
 )
 
 import aiohttp
+from aiohttp.payload import Payload
 
+from .. import _upload
 from .._resource import APIResource
 from ..types.api import (
     AudioResponse,
@@ -732,21 +734,28 @@ class Audio(APIResource["VeniceClient"]):
 
     async def _prepare_audio_file(
         self, file: str | bytes | BinaryIO | Path
-    ) -> tuple[bytes, str, str]:
+    ) -> tuple[bytes | BinaryIO | Payload, str, str]:
         """Resolve an audio ``file`` input to ``(content, filename, content_type)``.
 
         Accepts a path (str/Path), raw bytes, ``io.BytesIO``, or any binary
         file-like object. Content type is inferred from the filename extension,
         defaulting to ``application/octet-stream``.
+
+        Paths and binary files are not read here: a path is opened in a worker
+        thread and the open file is returned, and a caller's file is wrapped so
+        it is streamed without being closed. The multipart writer then reads
+        them in chunks off the event loop, so long recordings are never held
+        in memory whole.
         """
-        file_content: bytes
+        file_content: bytes | BinaryIO | Payload
         filename: str = "audio"
 
         if isinstance(file, (str, Path)):
             file_path = Path(file)
-            if not file_path.exists():
-                raise ValueError(f"Audio file not found: {file}")
-            file_content = file_path.read_bytes()
+            try:
+                file_content = await _upload.open_upload(file_path)
+            except FileNotFoundError:
+                raise ValueError(f"Audio file not found: {file}") from None
             filename = file_path.name
         elif isinstance(file, bytes):
             file_content = file
@@ -755,6 +764,12 @@ class Audio(APIResource["VeniceClient"]):
             filename = self._detect_audio_filename(file_content)
         elif isinstance(file, io.BytesIO):
             file_content = file.read()
+        elif _upload.is_streamable(file):
+            # Caller-owned binary file: wrapped below, once the content type
+            # is known, so it is streamed and left open
+            if isinstance(getattr(file, "name", None), str):
+                filename = Path(file.name).name
+            file_content = file
         elif hasattr(file, "read") and callable(file.read):
             result = cast(Any, file).read()
             if asyncio.iscoroutine(result):
@@ -786,6 +801,10 @@ class Audio(APIResource["VeniceClient"]):
         if ext in content_type_map:
             content_type = content_type_map[ext]
 
+        if _upload.is_streamable(file):
+            file_content = _upload.borrow_file(
+                cast(BinaryIO, file_content), filename=filename, content_type=content_type
+            )
         return file_content, filename, content_type
 
     @overload
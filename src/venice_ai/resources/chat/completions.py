@@ -117,7 +117,11 @@ from ...types.api.chat import ParsedChatCompletion, ToolLoopResult
 from ...types.api.models import LLMModelPricing
 
 # Import streaming models from generated.streaming module
-from ...types.api.streaming import ChatCompletionChunk, ChunkModelFactory
+from ...types.api.streaming import (
+    ChatCompletionChunk,
+    ChatCompletionChunkView,
+    ChunkModelFactory,
+)
 from ...validation.validators import validate_model_id
 
 if TYPE_CHECKING:
@@ -570,6 +574,7 @@ class ChatCompletions(APIResource["VeniceClient"]):
         top_k: int | None = None,
         stream_options: StreamOptions | None = None,
         e2ee: bool | TeeOptions = False,
+        fast_chunks: bool = False,
         **kwargs: Any,
     ) -> AsyncIterable[ChatCompletionChunk]:  # Return type for streaming (async iterator of dicts)
         ...
@@ -716,6 +721,13 @@ class ChatCompletions(APIResource["VeniceClient"]):
                 Venice's server-side ``verified`` claim and does not perform
                 full client-side TDX / NVIDIA quote verification; a one-time
                 :class:`UserWarning` is emitted on engagement.
+            fast_chunks: Streaming only. When ``True``, chunks are yielded as
+                :class:`~venice_ai.types.api.streaming.ChatCompletionChunkView`
+                objects that read straight from the decoded JSON instead of
+                being validated into :class:`ChatCompletionChunk` models. The
+                views expose the same ``choices[i].delta`` attributes; call
+                ``chunk.to_model()`` when a validated model is needed.
+                Passing it with ``stream=False`` raises :class:`ValueError`.
             kwargs: Additional keyword arguments forwarded to the request
                 body for forward-compatibility.
 
@@ -733,6 +745,7 @@ class ChatCompletions(APIResource["VeniceClient"]):
             RateLimitError: If rate limits are exceeded for the account.
             TypeError: If the legacy ``max_tokens`` kwarg is supplied (use
                 ``max_completion_tokens`` in v2).
+            ValueError: If ``fast_chunks`` is set without ``stream=True``.
             APIError: For other API-related errors not covered by specific
                 exceptions.
 
@@ -785,6 +798,10 @@ class ChatCompletions(APIResource["VeniceClient"]):
         # become part of the request body. Engagement (and the FAIL-LOUD guards)
         # are resolved below, before any network call.
         e2ee = kwargs.pop("e2ee", False)
+        # Client-side streaming option; never part of the request body.
+        fast_chunks = bool(kwargs.pop("fast_chunks", False))
+        if fast_chunks and not stream:
+            raise ValueError("fast_chunks only applies to streaming requests; pass stream=True.")
 
         # Extract all optional parameters from kwargs
         frequency_penalty = kwargs.pop("frequency_penalty", None)
@@ -932,6 +949,7 @@ class ChatCompletions(APIResource["VeniceClient"]):
                 e2ee=e2ee,
                 venice_parameters=venice_parameters,
                 tools=tools,
+                fast_chunks=fast_chunks,
             )
 
         if stream:
@@ -1012,6 +1030,7 @@ class ChatCompletions(APIResource["VeniceClient"]):
                 path="chat/completions",
                 json_data=body,
                 cast_to=ChatCompletionChunk,
+                chunk_factory=ChatCompletionChunkView if fast_chunks else None,
             )
             logger.debug(
                 f"Attempting to return stream_cls: {effective_stream_cls_async}, with iterator: {raw_iterator}"
@@ -1037,6 +1056,7 @@ class ChatCompletions(APIResource["VeniceClient"]):
         e2ee: bool | TeeOptions,
         venice_parameters: Any,
         tools: Any,
+        fast_chunks: bool = False,
     ) -> ChatCompletionResponse | AsyncIterable[ChatCompletionChunk]:
         """Run the real Venice E2EE chat flow.
 
@@ -1096,6 +1116,7 @@ class ChatCompletions(APIResource["VeniceClient"]):
             json_data=body,
             headers=session.request_headers(),
             cast_to=ChatCompletionChunk,
+            chunk_factory=ChatCompletionChunkView if fast_chunks else None,
         )
         decrypting = _decrypting_chunks(raw_iterator, session)
 
@@ -1111,6 +1132,7 @@ class ChatCompletions(APIResource["VeniceClient"]):
         model: str,
         messages: Sequence[ChatMessageParam],
         e2ee: bool | TeeOptions = False,
+        fast_chunks: bool = False,
         **kwargs: Any,
     ) -> ChatStream:
         """Shorthand for ``create(stream=True)`` returning a :class:`~venice_ai.streaming.ChatStream`.
@@ -1134,6 +1156,11 @@ class ChatCompletions(APIResource["VeniceClient"]):
                 ``e2ee-*`` model and the ``[e2ee]`` extra; the deltas yielded by
                 the returned stream are already decrypted plaintext. See
                 :meth:`create` for the engagement rules and limitations.
+            fast_chunks: Skip per-chunk Pydantic validation and yield
+                :class:`~venice_ai.types.api.streaming.ChatCompletionChunkView`
+                objects instead. :meth:`~ChatStream.text_deltas` and
+                :meth:`~ChatStream.collect` work unchanged; use it for
+                high-volume token streaming where only the deltas matter.
             kwargs: All other parameters accepted by :meth:`create`.
 
         Returns:
@@ -1149,7 +1176,14 @@ class ChatCompletions(APIResource["VeniceClient"]):
             APIError: For other HTTP-level failures.
         """
         kwargs.pop("stream", None)
-        result = await self.create(model=model, messages=messages, stream=True, e2ee=e2ee, **kwargs)
+        result = await self.create(
+            model=model,
+            messages=messages,
+            stream=True,
+            e2ee=e2ee,
+            fast_chunks=fast_chunks,
+            **kwargs,
+        )
         # result is a Stream[ChatCompletionChunk] — wrap in ChatStream
         if isinstance(result, ChatStream):
             return result
@@ -16,17 +16,28 @@ Idempotency:
     Replaying within 24h with the same key + same body returns the cached response
     with the ``Idempotent-Replayed: true`` header. Same key + different body
     returns 400.
+
+Batching:
+    :class:`RpcBatcher` collects concurrent ``rpc()`` calls per network for a
+    few milliseconds and sends them as one ``batch_rpc()`` request, so many
+    small calls cost one HTTP request and one rate-limit slot.
+    ``rpc(..., batch=True)`` (or a client created with request batching
+    enabled) routes through the client's shared batcher.
 """
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import re
 from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
 from .._resource import APIResource
+from ..exceptions import APIError, APIResponseProcessingError, InvalidRequestError
 from ..types.api.crypto import (
     BatchJsonRpcResponse,
     CryptoNetworksResponse,
@@ -37,10 +48,15 @@ from ..types.api.crypto import (
 if TYPE_CHECKING:
     from .._client import VeniceClient  # noqa: F401
 
-__all__ = ["Crypto"]
+__all__ = ["Crypto", "RpcBatcher", "RpcBatcherStats"]
+
+logger = logging.getLogger(__name__)
 
 _IDEMPOTENCY_KEY_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,255}$")
 _MAX_BATCH_SIZE = 100
+# 4xx statuses that reject the caller rather than the batch's contents:
+# resending each call on its own would only repeat the rejection.
+_CALLER_REJECTED_STATUSES = frozenset({401, 402, 403, 429})
 
 
 def _idempotency_headers(idempotency_key: str | None) -> dict[str, str] | None:
@@ -107,6 +123,7 @@ class Crypto(APIResource["VeniceClient"]):
         params: list[Any] | dict[str, Any] | None = None,
         id: int | str | None = 1,
         idempotency_key: str | None = None,
+        batch: bool | None = None,
     ) -> JsonRpcResponse:
         """Forward a single JSON-RPC 2.0 call to a supported chain.
 
@@ -125,6 +142,13 @@ class Crypto(APIResource["VeniceClient"]):
             (``[A-Za-z0-9_-]{1,255}``). Same key + same body within 24h replays
             the cached response.
         :type idempotency_key: str | None
+        :param batch: Send the call through the client's shared
+            :class:`RpcBatcher` (``client.rpc_batcher``), merged with other
+            concurrent calls for the same network. Defaults to the client's
+            request-batching setting. Calls with an ``idempotency_key`` are
+            always sent on their own. Batched responses carry no response or
+            billing headers.
+        :type batch: bool | None
 
         :return: :class:`JsonRpcResponse`. On per-request failure, ``error`` is
             populated and HTTP status is still 200 — check ``response.error``.
@@ -134,6 +158,13 @@ class Crypto(APIResource["VeniceClient"]):
         :raises venice_ai.exceptions.APIError: For HTTP-level failures (e.g.
             400 unsupported network, 429 rate-limited).
         """
+        if batch is None:
+            batch = self._client.request_batching
+        if batch and idempotency_key is None:
+            return await self._client.rpc_batcher.rpc(
+                network=network, method=method, params=params, id=id
+            )
+
         body = JsonRpcRequest(method=method, params=params, id=id).model_dump(exclude_none=True)
         headers = _idempotency_headers(idempotency_key)
         return await self._client.post(
@@ -222,3 +253,273 @@ class Crypto(APIResource["VeniceClient"]):
         )
         wrapper._response = response  # billing-header surfacing
         return wrapper
+
+    def batcher(
+        self,
+        *,
+        max_batch_size: int = _MAX_BATCH_SIZE,
+        max_wait_ms: float = 5.0,
+        max_concurrent_batches: int = 4,
+    ) -> RpcBatcher:
+        """Return an :class:`RpcBatcher` bound to this resource.
+
+        See :class:`RpcBatcher` for the meaning of each argument.
+
+        Example::
+
+            async with client.crypto.batcher() as batcher:
+                blocks = await asyncio.gather(
+                    *(
+                        batcher.rpc(
+                            network="ethereum-mainnet",
+                            method="eth_getBlockByNumber",
+                            params=[hex(n), False],
+                        )
+                        for n in range(start, start + 50)
+                    )
+                )
+        """
+        return RpcBatcher(
+            self,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_concurrent_batches=max_concurrent_batches,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Micro-batching
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class RpcBatcherStats:
+    """Counters for an :class:`RpcBatcher`."""
+
+    calls: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+    failed_batches: int = 0
+    resent_calls: int = 0
+
+    @property
+    def average_batch_size(self) -> float:
+        """Mean number of calls per batch request sent."""
+        return self.calls / self.batches if self.batches else 0.0
+
+
+@dataclass
+class _PendingRpcBatch:
+    requests: list[JsonRpcRequest] = field(default_factory=list)
+    futures: list[asyncio.Future[JsonRpcResponse]] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+
+
+class RpcBatcher:
+    """Merge concurrent single JSON-RPC calls into ``batch_rpc`` requests.
+
+    Each :meth:`rpc` call joins the pending batch for its network. The batch
+    is sent with :meth:`Crypto.batch_rpc` once it holds ``max_batch_size``
+    calls or ``max_wait_ms`` after its first call. Every call gets a wire
+    ``id`` unique within its batch, so callers may all use the same ``id``.
+    Responses are matched back by that ``id`` (the proxy does not guarantee
+    their order) and returned with the caller's own ``id`` restored.
+
+    The proxy rejects a whole batch with a 4xx when any one call in it is
+    invalid (e.g. an unsupported method), so such a batch is resent call by
+    call with :meth:`Crypto.rpc`: the offending call gets its own error and
+    the others their results. Connection failures, timeouts, 5xx, 429 and
+    authentication or billing rejections fail every call in the batch with
+    the same exception. Per-call JSON-RPC errors are returned in ``error``
+    as with :meth:`Crypto.rpc`.
+
+    Response headers describe a whole batch request, so responses from a
+    batcher carry none: ``rpc_credits``, ``rpc_cost_usd``,
+    ``venice_request_id`` and ``idempotent_replayed`` are ``None``. Use
+    :meth:`Crypto.batch_rpc` directly when you need them. Use the batcher as
+    an async context manager (or call :meth:`aclose`) so pending calls are
+    sent before shutdown.
+
+    :param crypto: The :class:`Crypto` resource to send through.
+    :param max_batch_size: Maximum calls per batch (capped at 100, the
+        proxy's limit).
+    :param max_wait_ms: How long the first call in a batch waits for company
+        before the batch is sent.
+    :param max_concurrent_batches: Maximum batch requests in flight.
+    :raises ValueError: If a size, wait or concurrency bound is not positive.
+    """
+
+    def __init__(
+        self,
+        crypto: Crypto,
+        *,
+        max_batch_size: int = _MAX_BATCH_SIZE,
+        max_wait_ms: float = 5.0,
+        max_concurrent_batches: int = 4,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be >= 0")
+        if max_concurrent_batches < 1:
+            raise ValueError("max_concurrent_batches must be >= 1")
+        self._crypto = crypto
+        self.max_batch_size = min(max_batch_size, _MAX_BATCH_SIZE)
+        self.max_wait = max_wait_ms / 1000.0
+        self._semaphore = asyncio.Semaphore(max_concurrent_batches)
+        self._pending: dict[str, _PendingRpcBatch] = {}
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._closed = False
+        self.stats = RpcBatcherStats()
+
+    async def __aenter__(self) -> RpcBatcher:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def rpc(
+        self,
+        *,
+        network: str,
+        method: str,
+        params: list[Any] | dict[str, Any] | None = None,
+        id: int | str | None = 1,
+    ) -> JsonRpcResponse:
+        """Send one JSON-RPC call as part of the next batch for ``network``.
+
+        :param network: Venice-side network slug.
+        :param method: JSON-RPC method name.
+        :param params: Method parameters, forwarded unchanged.
+        :param id: Caller's request ID, echoed back in the response.
+        :return: The call's :class:`JsonRpcResponse`.
+        :raises venice_ai.exceptions.InvalidRequestError: After :meth:`aclose`.
+        :raises venice_ai.exceptions.APIResponseProcessingError: If the batch
+            response has no item for this call.
+        """
+        if self._closed:
+            raise InvalidRequestError(
+                "RpcBatcher is closed.", request=None, response=None, body=None
+            )
+        request = JsonRpcRequest(method=method, params=params, id=id)
+
+        batch = self._pending.get(network)
+        if batch is None:
+            batch = self._pending[network] = _PendingRpcBatch()
+            batch.timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush, network)
+
+        future: asyncio.Future[JsonRpcResponse] = asyncio.get_running_loop().create_future()
+        batch.requests.append(request)
+        batch.futures.append(future)
+        self.stats.calls += 1
+
+        if len(batch.requests) >= self.max_batch_size:
+            self._flush(network)
+        return await future
+
+    async def flush(self) -> None:
+        """Send every pending batch now and wait for all in-flight requests."""
+        for network in list(self._pending):
+            self._flush(network)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Flush pending calls and reject further :meth:`rpc` calls."""
+        self._closed = True
+        await self.flush()
+
+    def _flush(self, network: str) -> None:
+        batch = self._pending.pop(network, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.ensure_future(self._send(network, batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, network: str, batch: _PendingRpcBatch) -> None:
+        # Callers that were cancelled while queued are not sent.
+        live = [
+            (request, future)
+            for request, future in zip(batch.requests, batch.futures, strict=True)
+            if not future.done()
+        ]
+        if not live:
+            return
+        wire = [request.model_copy(update={"id": i}) for i, (request, _) in enumerate(live)]
+
+        self.stats.batches += 1
+        self.stats.largest_batch = max(self.stats.largest_batch, len(wire))
+        try:
+            async with self._semaphore:
+                try:
+                    responses = await self._crypto.batch_rpc(network=network, requests=wire)
+                except APIError as exc:
+                    if not _rejected_for_contents(exc) or len(live) == 1:
+                        raise
+                    logger.debug(
+                        f"RPC batch of {len(wire)} on {network} rejected ({exc.status_code}); "
+                        "resending each call on its own"
+                    )
+                    await self._send_each(network, live)
+                    return
+        except Exception as exc:  # noqa: BLE001 — delivered to every waiting caller
+            self.stats.failed_batches += 1
+            logger.debug(f"RPC batch of {len(wire)} on {network} failed: {exc}")
+            for _, future in live:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        except BaseException:
+            # Cancelled mid-send (e.g. on client close): release every waiter.
+            self.stats.failed_batches += 1
+            for _, future in live:
+                future.cancel()
+            raise
+
+        # Match by id: the proxy may answer a batch in any order
+        by_id = {str(item.id): item for item in responses.responses}
+        for wire_id, (request, future) in enumerate(live):
+            if future.done():
+                continue
+            item = by_id.get(str(wire_id))
+            if item is not None:
+                future.set_result(item.model_copy(update={"id": request.id}))
+            else:
+                future.set_exception(
+                    APIResponseProcessingError(
+                        f"JSON-RPC batch response has no item for id {wire_id} "
+                        f"({len(responses.responses)} of {len(live)} returned)."
+                    )
+                )
+
+    async def _send_each(
+        self, network: str, live: list[tuple[JsonRpcRequest, asyncio.Future[JsonRpcResponse]]]
+    ) -> None:
+        async def resend(request: JsonRpcRequest, future: asyncio.Future[JsonRpcResponse]) -> None:
+            try:
+                response = await self._crypto.rpc(
+                    network=network,
+                    method=request.method,
+                    params=request.params,
+                    id=request.id,
+                    batch=False,
+                )
+            except Exception as exc:  # noqa: BLE001 — delivered to this caller only
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                if not future.done():
+                    future.set_result(response)
+
+        pending = [(request, future) for request, future in live if not future.done()]
+        self.stats.resent_calls += len(pending)
+        await asyncio.gather(*(resend(request, future) for request, future in pending))
+
+
+def _rejected_for_contents(exc: APIError) -> bool:
+    """Whether a 4xx batch rejection may be down to one of its calls."""
+    status = exc.status_code
+    return status is not None and 400 <= status < 500 and status not in _CALLER_REJECTED_STATUSES
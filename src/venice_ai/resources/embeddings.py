@@ -64,18 +64,29 @@ Note:
     property and provides optimized batch processing for multiple text inputs.
 """
 
+import asyncio
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from typing import (
     TYPE_CHECKING,
+    Any,
     Literal,
 )
 
 from .._resource import APIResource
-from ..exceptions import InvalidRequestError
+from ..exceptions import APIResponseProcessingError, InvalidRequestError
 from ..types.api import EmbeddingsRequest, EmbeddingsResponse
+from ..types.api.embeddings import EmbeddingObject, EmbeddingUsage
 
 if TYPE_CHECKING:
     from .._client import VeniceClient  # noqa: F401
 
+logger = logging.getLogger(__name__)
+
+#: Maximum number of inputs the API accepts in one ``/embeddings`` request.
+MAX_EMBEDDING_INPUTS = 2048
+
 
 class Embeddings(APIResource["VeniceClient"]):
     """
@@ -144,6 +155,14 @@ class Embeddings(APIResource["VeniceClient"]):
         :raises venice_ai.exceptions.RateLimitError: If rate limits are exceeded.
         :raises venice_ai.exceptions.APIError: For other API-related errors.
 
+        When the client was created with request batching enabled
+        (``batch_requests=True`` or ``SchedulerConfig.enable_request_batching``),
+        a call with fewer inputs than the client's batch size is merged with
+        concurrent calls for the same model and options into one request
+        (see :attr:`VeniceClient.embedding_batcher`). The response holds this
+        call's embeddings indexed from 0; ``usage`` is this call's share of
+        the merged request, split by estimated input tokens.
+
         **Examples:**
 
         Generate an embedding for a single string:
@@ -220,14 +239,46 @@ class Embeddings(APIResource["VeniceClient"]):
             )
 
         # Validate array length constraint
-        if isinstance(input, list) and len(input) > 2048:
+        if isinstance(input, list) and len(input) > MAX_EMBEDDING_INPUTS:
             raise InvalidRequestError(
-                f"input array must have 2048 or fewer items, but got {len(input)} items.",
+                f"input array must have {MAX_EMBEDDING_INPUTS} or fewer items, "
+                f"but got {len(input)} items.",
                 request=None,
                 response=None,
                 body=None,
             )
 
+        # Merge small calls into shared requests when the client batches
+        if self._client.request_batching:
+            items = _split_inputs(input)
+            batcher = self._client.embedding_batcher
+            if len(items) < batcher.max_batch_size:
+                return await batcher._create(
+                    items,
+                    model=model,
+                    dimensions=dimensions,
+                    encoding_format=encoding_format,
+                    user=user,
+                )
+
+        return await self._create(
+            model=model,
+            input=input,
+            dimensions=dimensions,
+            encoding_format=encoding_format,
+            user=user,
+        )
+
+    async def _create(
+        self,
+        *,
+        model: str,
+        input: str | list[str] | list[int] | list[list[int]],
+        dimensions: int | None,
+        encoding_format: Literal["float", "base64"] | None,
+        user: str | None,
+    ) -> EmbeddingsResponse:
+        """Send one ``/embeddings`` request for already-validated arguments."""
         # Create Pydantic request model
         embeddings_request = EmbeddingsRequest(
             model=model,
@@ -243,3 +294,351 @@ class Embeddings(APIResource["VeniceClient"]):
         # Make the API request and return the response
         result = await self._client.post("embeddings", json_data=body, cast_to=EmbeddingsResponse)
         return result
+
+    def batcher(
+        self,
+        *,
+        max_batch_size: int = 256,
+        max_wait_ms: float = 10.0,
+        max_batch_tokens: int | None = 100_000,
+        max_concurrent_batches: int = 4,
+        model_input_limits: Mapping[str, int] | None = None,
+    ) -> "EmbeddingBatcher":
+        """Return an :class:`EmbeddingBatcher` bound to this resource.
+
+        See :class:`EmbeddingBatcher` for the meaning of each argument.
+
+        Example::
+
+            async with client.embeddings.batcher(max_wait_ms=5) as batcher:
+                vectors = await asyncio.gather(
+                    *(batcher.embed(doc, model=model) for doc in documents)
+                )
+        """
+        return EmbeddingBatcher(
+            self,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_batch_tokens=max_batch_tokens,
+            max_concurrent_batches=max_concurrent_batches,
+            model_input_limits=model_input_limits,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Micro-batching
+# ---------------------------------------------------------------------------
+
+_BatchKey = tuple[str, int | None, Literal["float", "base64"] | None, str | None, bool]
+
+
+@dataclass
+class EmbeddingBatcherStats:
+    """Counters for an :class:`EmbeddingBatcher`."""
+
+    requests: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+    failed_batches: int = 0
+
+    @property
+    def average_batch_size(self) -> float:
+        """Mean number of inputs per request sent."""
+        return self.requests / self.batches if self.batches else 0.0
+
+
+@dataclass
+class _PendingBatch:
+    inputs: list[str | list[int]] = field(default_factory=list)
+    futures: list[asyncio.Future[Any]] = field(default_factory=list)
+    estimates: list[int] = field(default_factory=list)
+    tokens: int = 0
+    timer: asyncio.TimerHandle | None = None
+
+
+def _estimate_input_tokens(item: str | list[int]) -> int:
+    """Token estimate for one input: ~4 chars/token for text, exact for token arrays."""
+    if isinstance(item, str):
+        return max(1, len(item) // 4)
+    return max(1, len(item))
+
+
+def _split_inputs(
+    input: str | list[str] | list[int] | list[list[int]],
+) -> list[str | list[int]]:
+    """The individual inputs of an ``embeddings.create`` call."""
+    if isinstance(input, str) or isinstance(input[0], int):
+        return [input]  # one string or one token array
+    return list(input)  # list of strings or of token arrays
+
+
+class EmbeddingBatcher:
+    """Pack concurrent single-input embedding calls into batched requests.
+
+    Each :meth:`embed` call enqueues one input and awaits its vector. Inputs
+    sharing ``model``, ``dimensions``, ``encoding_format`` and ``user`` (and
+    input kind — text vs. token array) are collected until the batch reaches
+    ``max_batch_size`` inputs or ``max_batch_tokens`` estimated tokens, or
+    ``max_wait_ms`` elapses after the first input; then one
+    :meth:`Embeddings.create` call is sent and its ``data`` is scattered
+    back to the waiting callers by index. A failed request fails every
+    caller in that batch with the same exception.
+
+    Use it as an async context manager (or call :meth:`aclose`) so pending
+    inputs are flushed before shutdown.
+
+    :param embeddings: The :class:`Embeddings` resource to send through.
+    :param max_batch_size: Maximum inputs per request (capped at
+        :data:`MAX_EMBEDDING_INPUTS`).
+    :param max_wait_ms: How long the first input in a batch waits for
+        company before the batch is sent.
+    :param max_batch_tokens: Estimated-token budget per request (~4
+        chars/token). An input larger than the budget is sent on its own.
+        ``None`` disables the token bound.
+    :param max_concurrent_batches: Maximum batched requests in flight.
+    :param model_input_limits: Per-model overrides of ``max_batch_size`` for
+        models that accept fewer inputs per request.
+    :raises ValueError: If a size, wait or concurrency bound is not positive.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        *,
+        max_batch_size: int = 256,
+        max_wait_ms: float = 10.0,
+        max_batch_tokens: int | None = 100_000,
+        max_concurrent_batches: int = 4,
+        model_input_limits: Mapping[str, int] | None = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be >= 0")
+        if max_batch_tokens is not None and max_batch_tokens < 1:
+            raise ValueError("max_batch_tokens must be >= 1 or None")
+        if max_concurrent_batches < 1:
+            raise ValueError("max_concurrent_batches must be >= 1")
+        self._embeddings = embeddings
+        self.max_batch_size = min(max_batch_size, MAX_EMBEDDING_INPUTS)
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_batch_tokens = max_batch_tokens
+        self.model_input_limits = dict(model_input_limits or {})
+        self._semaphore = asyncio.Semaphore(max_concurrent_batches)
+        self._pending: dict[_BatchKey, _PendingBatch] = {}
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._closed = False
+        self.stats = EmbeddingBatcherStats()
+
+    async def __aenter__(self) -> "EmbeddingBatcher":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def embed(
+        self,
+        input: str | list[int],
+        *,
+        model: str,
+        dimensions: int | None = None,
+        encoding_format: Literal["float", "base64"] | None = None,
+        user: str | None = None,
+    ) -> list[float] | str:
+        """Embed one input as part of the next batch and return its vector.
+
+        :param input: A single string or a single token array.
+        :param model: Embedding model ID.
+        :param dimensions: Optional output dimensionality.
+        :param encoding_format: ``"float"`` (list of floats) or ``"base64"``.
+        :param user: Passed through to :meth:`Embeddings.create`.
+        :return: The embedding — ``list[float]``, or a base64 ``str`` when
+            ``encoding_format="base64"``.
+        :raises venice_ai.exceptions.InvalidRequestError: For an empty
+            ``model`` or ``input``, or after :meth:`aclose`.
+        """
+        if self._closed:
+            raise InvalidRequestError(
+                "EmbeddingBatcher is closed.", request=None, response=None, body=None
+            )
+        if not model:
+            raise InvalidRequestError(
+                "model parameter is required and cannot be empty.",
+                request=None,
+                response=None,
+                body=None,
+            )
+        if not input:
+            raise InvalidRequestError(
+                "input cannot be empty.", request=None, response=None, body=None
+            )
+
+        vector, _, _ = await self._enqueue(
+            input,
+            model=model,
+            dimensions=dimensions,
+            encoding_format=encoding_format,
+            user=user,
+        )
+        return vector
+
+    async def _create(
+        self,
+        items: list[str | list[int]],
+        *,
+        model: str,
+        dimensions: int | None,
+        encoding_format: Literal["float", "base64"] | None,
+        user: str | None,
+    ) -> EmbeddingsResponse:
+        """Batch ``items`` like :meth:`embed` and assemble one response for them.
+
+        Backs :meth:`Embeddings.create` when the client batches requests.
+        Token arrays and strings are enqueued separately, as :meth:`embed`
+        keys batches by input kind.
+        """
+        results = await asyncio.gather(
+            *(
+                self._enqueue(
+                    item,
+                    model=model,
+                    dimensions=dimensions,
+                    encoding_format=encoding_format,
+                    user=user,
+                )
+                for item in items
+            )
+        )
+        prompt_tokens = sum(share * r.usage.prompt_tokens for _, share, r in results)
+        total_tokens = sum(share * r.usage.total_tokens for _, share, r in results)
+        return EmbeddingsResponse(
+            object="list",
+            model=results[0][2].model,
+            data=[
+                EmbeddingObject(
+                    object="embedding", index=i, embedding=vector, encoding_format=encoding_format
+                )
+                for i, (vector, _, _) in enumerate(results)
+            ],
+            usage=EmbeddingUsage(
+                prompt_tokens=round(prompt_tokens), total_tokens=round(total_tokens)
+            ),
+        )
+
+    async def _enqueue(
+        self,
+        input: str | list[int],
+        *,
+        model: str,
+        dimensions: int | None,
+        encoding_format: Literal["float", "base64"] | None,
+        user: str | None,
+    ) -> tuple[list[float] | str, float, EmbeddingsResponse]:
+        """Add ``input`` to its pending batch.
+
+        Returns the vector, this input's share of the batch's estimated
+        tokens, and the batch response.
+        """
+        key: _BatchKey = (model, dimensions, encoding_format, user, isinstance(input, str))
+        tokens = _estimate_input_tokens(input)
+        limit = min(self.model_input_limits.get(model, self.max_batch_size), self.max_batch_size)
+
+        batch = self._pending.get(key)
+        if batch is not None and (
+            len(batch.inputs) >= limit
+            or (self.max_batch_tokens is not None and batch.tokens + tokens > self.max_batch_tokens)
+        ):
+            self._flush(key)
+            batch = None
+        if batch is None:
+            batch = self._pending[key] = _PendingBatch()
+            batch.timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush, key)
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        batch.inputs.append(input)
+        batch.futures.append(future)
+        batch.estimates.append(tokens)
+        batch.tokens += tokens
+        self.stats.requests += 1
+
+        if len(batch.inputs) >= limit or (
+            self.max_batch_tokens is not None and batch.tokens >= self.max_batch_tokens
+        ):
+            self._flush(key)
+        result: tuple[list[float] | str, float, EmbeddingsResponse] = await future
+        return result
+
+    async def flush(self) -> None:
+        """Send every pending batch now and wait for all in-flight requests."""
+        for key in list(self._pending):
+            self._flush(key)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Flush pending inputs and reject further :meth:`embed` calls."""
+        self._closed = True
+        await self.flush()
+
+    def _flush(self, key: _BatchKey) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.ensure_future(self._send(key, batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, key: _BatchKey, batch: _PendingBatch) -> None:
+        model, dimensions, encoding_format, user, _ = key
+        # Callers that were cancelled while queued don't need a slot.
+        live = [
+            (i, f, t)
+            for i, f, t in zip(batch.inputs, batch.futures, batch.estimates, strict=True)
+            if not f.done()
+        ]
+        if not live:
+            return
+        inputs = [item for item, _, _ in live]
+        futures = [future for _, future, _ in live]
+        estimated = sum(tokens for _, _, tokens in live)
+
+        self.stats.batches += 1
+        self.stats.largest_batch = max(self.stats.largest_batch, len(inputs))
+        try:
+            async with self._semaphore:
+                response = await self._embeddings._create(
+                    model=model,
+                    input=inputs,  # type: ignore[arg-type]  # homogeneous by batch key
+                    dimensions=dimensions,
+                    encoding_format=encoding_format,
+                    user=user,
+                )
+        except Exception as exc:  # noqa: BLE001 — delivered to every waiting caller
+            self.stats.failed_batches += 1
+            logger.debug(f"Embedding batch of {len(inputs)} failed: {exc}")
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        except BaseException:
+            # Cancelled mid-send (e.g. on client close): release every waiter.
+            self.stats.failed_batches += 1
+            for future in futures:
+                future.cancel()
+            raise
+
+        by_index = {item.index: item.embedding for item in response.data}
+        for position, (_, future, tokens) in enumerate(live):
+            if future.done():
+                continue
+            if position in by_index:
+                future.set_result((by_index[position], tokens / estimated, response))
+            else:
+                future.set_exception(
+                    APIResponseProcessingError(
+                        f"Embeddings response has no entry for batch index {position} "
+                        f"({len(response.data)} of {len(futures)} returned)."
+                    )
+                )
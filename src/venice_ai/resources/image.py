@@ -84,6 +84,8 @@ from typing import (
 
 import aiohttp
 
+from .. import _upload
+from .._download import write_bytes
 from .._resource import APIResource
 from ..helpers import detect_image_format
 from ..types.api import (
@@ -246,18 +248,28 @@ class ImageJob:
         format is inferred from ``self._kwargs.get("format")`` and the API
         response shape.
         """
+        out = Path(path)
+        await self.download_to(out)
+        return out
+
+    async def download_to(self, destination: str | Path | BinaryIO) -> int:
+        """Write the rendered image to a file path or binary file-like object.
+
+        Base64 decoding and file I/O run in a worker thread. Returns the
+        number of bytes written.
+        """
         from ..exceptions import VeniceError
 
         result = await self.wait()
-        out = Path(path)
         if isinstance(result, (bytes, bytearray)):
-            out.write_bytes(bytes(result))
-            return out
-        # ImageGenerationResponse — first image, base64-decoded
-        if not result.images:
-            raise VeniceError("ImageJob.download() called but the response has no images")
-        out.write_bytes(base64.b64decode(result.images[0]))
-        return out
+            data = bytes(result)
+        else:
+            # ImageGenerationResponse — first image, base64-decoded
+            if not result.images:
+                raise VeniceError("ImageJob.download() called but the response has no images")
+            data = await asyncio.to_thread(base64.b64decode, result.images[0])
+        await write_bytes(destination, data)
+        return len(data)
 
 
 class Image(APIResource["VeniceClient"]):
@@ -303,7 +315,7 @@ class Image(APIResource["VeniceClient"]):
             # Otherwise treat as file path
             image_path = Path(image)
             try:
-                return image_path.read_bytes()
+                return await asyncio.to_thread(image_path.read_bytes)
             except FileNotFoundError:
                 raise VeniceError(f"Image file not found at path: {image}") from None
             except OSError as e:
@@ -325,8 +337,11 @@ class Image(APIResource["VeniceClient"]):
         ):
             # Handle file-like objects with proper type narrowing
             try:
-                # Handle file-like objects
-                result = image.read()
+                # Handle file-like objects; reads from real files go to a worker thread
+                if _upload.is_streamable(image):
+                    result = await asyncio.to_thread(image.read)
+                else:
+                    result = image.read()
                 if asyncio.iscoroutine(result):
                     file_content = await result
                 else:
@@ -694,12 +709,10 @@ class Image(APIResource["VeniceClient"]):
                 "Pass a file path, bytes, or file-like object."
             )
 
-        # Base64 encode the image content for Pydantic validation
-        image_b64 = base64.b64encode(image_content).decode("utf-8")
-
-        # Create and validate the Pydantic request model
+        # Create and validate the Pydantic request model. The image itself is
+        # sent as a multipart file below, so it is passed through unencoded.
         # Build kwargs, omitting enhance when None so the model default (True) applies
-        upscale_kwargs: dict[str, Any] = {"image": image_b64}
+        upscale_kwargs: dict[str, Any] = {"image": image_content}
         if scale is not None:
             upscale_kwargs["scale"] = scale
         if enhance is not None:
@@ -866,7 +879,7 @@ class Image(APIResource["VeniceClient"]):
                     "Internal invariant: _prepare_image_for_request returned mode='multipart' "
                     "without bytes. Please report this as a bug."
                 )
-            image_value = base64.b64encode(image_bytes).decode("utf-8")
+            image_value = await _upload.b64encode(image_bytes)
         else:
             image_value = str(image)
 
@@ -1149,7 +1162,7 @@ class Image(APIResource["VeniceClient"]):
                         "Internal invariant: _prepare_image_for_request returned mode='multipart' "
                         "without bytes. Please report this as a bug."
                     )
-                return base64.b64encode(b).decode("utf-8")
+                return await _upload.b64encode(b)
             return str(val)
 
         images_list: list[str] = []
@@ -26,7 +26,6 @@ Classes:
 from __future__ import annotations
 
 import builtins
-import time
 from typing import TYPE_CHECKING, Literal
 
 from .._resource import APIResource
@@ -57,12 +56,6 @@ from ..types.api.models import (
     VideoModelConstraints,
 )
 
-# Cache TTL for the listing reused by get() / get_capabilities() — short
-# enough that catalog changes propagate quickly, long enough to absorb
-# back-to-back lookups that would otherwise hammer /models.
-_MODEL_LIST_CACHE_TTL_SECONDS = 30.0
-
-
 # Public type alias for the ``Models.list(type=...)`` kwarg. Callers that
 # fan out across multiple types (e.g. the CLI) should annotate their
 # local variables with this alias so the call-site type-check stays tight.
@@ -132,6 +125,7 @@ class Models(APIResource["VeniceClient"]):
         self,
         *,
         type: ModelListType | None = None,
+        cached: bool = False,
     ) -> ModelsListResponse:
         """
         Lists available models asynchronously.
@@ -149,6 +143,10 @@ class Models(APIResource["VeniceClient"]):
             type — the server's own default is ``text``-only, which surprises callers
             who expect "no filter" to mean "everything". Pass ``type="text"`` (or the
             ``"chat"`` alias) explicitly to recover the text-only listing.
+        :param cached: Serve the listing from ``client.model_catalog``, which
+            may be shared with other processes and is revalidated with a
+            conditional request once it expires. The cached response carries
+            no ``_response`` headers.
 
 
         :return: A list of available models with their metadata, capabilities, and pricing information.
@@ -182,6 +180,9 @@ class Models(APIResource["VeniceClient"]):
         # Convert to dictionary, excluding None values
         params = query_params.model_dump(exclude_none=True)
 
+        if cached:
+            return await self._client.model_catalog.get(self._client, params)
+
         result = await self._client.get(
             "models", params=params, cast_to=ModelsListResponse, force_direct=True
         )
@@ -299,10 +300,6 @@ class Models(APIResource["VeniceClient"]):
     def __init__(self, client: VeniceClient) -> None:
         super().__init__(client)
         self._selector: DynamicModelSelector | None = None
-        # 30-second TTL cache for the full model listing, shared by get()
-        # and get_capabilities() so multiple lookups in a tight loop don't
-        # each fetch /models from scratch.
-        self._listing_cache: tuple[float, ModelsListResponse] | None = None
 
     def _get_selector(self) -> DynamicModelSelector:
         """Lazily initialize the underlying DynamicModelSelector."""
@@ -313,27 +310,21 @@ class Models(APIResource["VeniceClient"]):
         return self._selector
 
     async def _cached_listing(self) -> ModelsListResponse:
-        """Return a cached full-catalog :meth:`list` response, refreshing past TTL.
+        """Return the full-catalog :meth:`list` response from ``client.model_catalog``.
 
         Uses ``type="all"`` so :meth:`get` and :meth:`get_capabilities` can
         find any model id regardless of resource type. Per Venice API spec,
         ``type="all"`` returns the union of every model type.
         """
-        now = time.monotonic()
-        if self._listing_cache is not None:
-            cached_at, listing = self._listing_cache
-            if now - cached_at < _MODEL_LIST_CACHE_TTL_SECONDS:
-                return listing
-        listing = await self.list(type="all")
-        self._listing_cache = (now, listing)
-        return listing
+        return await self.list(type="all", cached=True)
 
     async def get(self, model_id: str) -> ModelResponse:
         """Fetch a single model entry by its id.
 
-        Resolves against a 30-second TTL cache of :meth:`list` so back-to-back
-        ``get()`` / :meth:`get_capabilities` calls don't each round-trip the
-        full catalog. The Venice API has no per-model GET endpoint today;
+        Resolves against the client's cached catalog
+        (:class:`~venice_ai.models.catalog.ModelCatalog`, 30-second TTL by
+        default) so back-to-back ``get()`` / :meth:`get_capabilities` calls
+        don't each round-trip the full catalog. The Venice API has no per-model GET endpoint today;
         this method abstracts the list-and-filter pattern users would
         otherwise hand-roll.
 
@@ -14,12 +14,12 @@ SDK (one resource = one content domain).
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from collections.abc import Callable
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
+from .._download import DEFAULT_CHUNK_SIZE, write_bytes
 from .._resource import APIResource
 from ..exceptions import MusicGenerationError
 from ..helpers import normalize_duration_seconds
@@ -124,6 +124,13 @@ async def _preflight_validate_force_instrumental(
         )
 
 
+def _remaining_seconds(status: MusicRetrieveResponse) -> float | None:
+    """Server-estimated seconds left for a processing job, for the job poller."""
+    if isinstance(status, MusicProcessingStatus) and status.average_execution_time > 0:
+        return status.estimated_remaining_ms / 1000.0
+    return None
+
+
 class MusicJob:
     """Manages the lifecycle of an async music generation request.
 
@@ -241,14 +248,17 @@ class MusicJob:
     ) -> MusicCompletedStatus:
         """Poll until complete or failed.
 
-        Drives :meth:`poll` on a fixed interval, returning the final
+        Registers :meth:`poll` with the client's shared
+        :class:`~venice_ai.core.job_poller.JobPoller`, returning the final
         :class:`MusicCompletedStatus` once the server reports completion.
+        The poller spaces polls by the server's ETA and caps status
+        requests across every waiting job.
 
         Args:
-            poll_interval: Seconds to sleep between successive polls.
-                Defaults to ``5.0``.
+            poll_interval: Seconds between polls while the status carries no
+                ETA. Defaults to ``5.0``.
             max_polls: Maximum number of polls before giving up. Defaults
-                to ``120`` (i.e. ten minutes at the default interval).
+                to ``120``.
             on_progress: Optional callback invoked after every poll that
                 returns a :class:`MusicProcessingStatus` - useful for
                 forwarding progress to logs or a UI.
@@ -261,27 +271,40 @@ class MusicJob:
             TimeoutError: If ``max_polls`` is exhausted before completion.
             APIError: For HTTP-level failures while polling.
         """
-        for _ in range(max_polls):
-            status = await self.poll()
-            if isinstance(status, MusicCompletedStatus):
-                return status
-            if isinstance(status, MusicFailedStatus):
-                raise MusicGenerationError(
-                    f"Music generation failed: {status.error}",
-                    error_code=status.error_code,
-                )
+
+        def on_status(status: MusicRetrieveResponse) -> None:
             if on_progress and isinstance(status, MusicProcessingStatus):
                 on_progress(status)
-            await asyncio.sleep(poll_interval)
+
+        status = await self._client.job_poller.wait(
+            self.poll,
+            is_terminal=lambda s: isinstance(s, (MusicCompletedStatus, MusicFailedStatus)),
+            remaining=_remaining_seconds,
+            on_status=on_status,
+            interval=poll_interval,
+            max_polls=max_polls,
+        )
+        if isinstance(status, MusicCompletedStatus):
+            return status
+        if isinstance(status, MusicFailedStatus):
+            raise MusicGenerationError(
+                f"Music generation failed: {status.error}",
+                error_code=status.error_code,
+            )
         raise TimeoutError(f"Music generation did not complete within {max_polls} polls")
 
-    async def download(self, path: str | Path, status: MusicCompletedStatus) -> Path:
+    async def download(
+        self,
+        path: str | Path,
+        status: MusicCompletedStatus,
+        *,
+        checksum: str | None = None,
+    ) -> Path:
         """Download a completed music clip to *path*.
 
         Does NOT call :meth:`cancel` - use the context manager for that.
-        File I/O is offloaded to a worker thread so the event loop never
-        blocks. URL downloads reuse the SDK client's managed HTTP session
-        so proxy, SSL, timeout, and retry configuration are honored.
+        The audio is streamed to disk chunk by chunk via :meth:`download_to`
+        so the event loop never blocks and the clip is never buffered whole.
 
         Args:
             path: Target file path. Parent directories are created
@@ -289,6 +312,7 @@ class MusicJob:
             status: A terminal :class:`MusicCompletedStatus` returned from
                 :meth:`wait` or :meth:`poll`. The bytes are sourced from
                 ``status.data`` when present, or fetched from ``status.url``.
+            checksum: Optional ``"sha256:<hex>"`` digest to verify.
 
         Returns:
             The resolved :class:`pathlib.Path` the audio was written to.
@@ -296,18 +320,46 @@ class MusicJob:
         Raises:
             APIError: If the URL fetch fails (mapped subclasses include
                 ``APIConnectionError``, ``APITimeoutError``).
+            ChecksumMismatchError: If the audio does not match ``checksum``.
             OSError: If the file cannot be written (permission denied,
                 disk full, etc.).
         """
         path = Path(path)
-        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
-        if status.data:
-            await asyncio.to_thread(path.write_bytes, status.data)
-        elif status.url:
-            data = await self._client.fetch_external(status.url)
-            await asyncio.to_thread(path.write_bytes, data)
+        await self.download_to(path, status, checksum=checksum)
         return path
 
+    async def download_to(
+        self,
+        destination: str | Path | BinaryIO,
+        status: MusicCompletedStatus,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        checksum: str | None = None,
+    ) -> int:
+        """Stream a completed music clip into a file path or binary file-like object.
+
+        URL downloads go through :meth:`VeniceClient.download_to` (chunked
+        writes, ``Range`` resume after disconnects); inline ``status.data``
+        is written as-is.
+
+        Args:
+            destination: File path (parents are created) or writable binary file.
+            status: A terminal :class:`MusicCompletedStatus`.
+            chunk_size: Bytes per read/write.
+            checksum: Optional ``"algorithm:hexdigest"`` to verify.
+
+        Returns:
+            Number of bytes written.
+        """
+        if status.data:
+            await write_bytes(destination, status.data)
+            return len(status.data)
+        if not status.url:
+            return 0
+        return await self._client.download_to(
+            status.url, destination, chunk_size=chunk_size, checksum=checksum
+        )
+
     async def cancel(self) -> MusicCompleteResponse:
         """Release server-side storage / cancel an in-progress job.
 
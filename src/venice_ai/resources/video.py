@@ -14,12 +14,12 @@ The video API allows for:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from collections.abc import Callable
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, overload
+from typing import TYPE_CHECKING, BinaryIO, Literal, overload
 
+from .._download import DEFAULT_CHUNK_SIZE, write_bytes
 from .._resource import APIResource
 from ..exceptions import InvalidRequestError, VideoGenerationError
 from ..helpers import normalize_duration_seconds
@@ -105,6 +105,13 @@ async def _preflight_validate_video_duration(
         )
 
 
+def _remaining_seconds(status: VideoRetrieveResponse) -> float | None:
+    """Server-estimated seconds left for a processing job, for the job poller."""
+    if isinstance(status, VideoProcessingStatus) and status.average_execution_time > 0:
+        return status.estimated_remaining_ms / 1000.0
+    return None
+
+
 class VideoJob:
     """Manages the lifecycle of an async video generation request.
 
@@ -197,51 +204,100 @@ class VideoJob:
     ) -> VideoCompletedStatus:
         """Poll until complete or failed. Returns completed status or raises.
 
-        :param poll_interval: Seconds between polls.
+        Polling is handed to the client's shared
+        :class:`~venice_ai.core.job_poller.JobPoller`, which polls every
+        waiting job from one task: the next poll is derived from the server's
+        ETA (sooner as the render nears completion), and status requests are
+        capped across all jobs.
+
+        :param poll_interval: Seconds between polls when the status carries no ETA.
         :param max_polls: Maximum number of polls before raising ``TimeoutError``.
         :param on_progress: Optional callback invoked on each processing status update.
         :raises VideoGenerationError: If the server reports generation failure.
         :raises TimeoutError: If ``max_polls`` is exhausted.
         """
-        for _ in range(max_polls):
-            status = await self.poll()
-            if isinstance(status, VideoCompletedStatus):
-                return status
-            if isinstance(status, VideoFailedStatus):
-                raise VideoGenerationError(
-                    f"Video generation failed: {status.error}",
-                    error_code=status.error_code,
-                )
+
+        def on_status(status: VideoRetrieveResponse) -> None:
             if on_progress and isinstance(status, VideoProcessingStatus):
                 on_progress(status)
-            await asyncio.sleep(poll_interval)
+
+        status = await self._client.job_poller.wait(
+            self.poll,
+            is_terminal=lambda s: isinstance(s, (VideoCompletedStatus, VideoFailedStatus)),
+            remaining=_remaining_seconds,
+            on_status=on_status,
+            interval=poll_interval,
+            max_polls=max_polls,
+        )
+        if isinstance(status, VideoCompletedStatus):
+            return status
+        if isinstance(status, VideoFailedStatus):
+            raise VideoGenerationError(
+                f"Video generation failed: {status.error}",
+                error_code=status.error_code,
+            )
         raise TimeoutError(f"Video generation did not complete within {max_polls} polls")
 
-    async def download(self, path: str | Path, status: VideoCompletedStatus) -> Path:
+    async def download(
+        self,
+        path: str | Path,
+        status: VideoCompletedStatus,
+        *,
+        checksum: str | None = None,
+        parallel: int = 1,
+    ) -> Path:
         """Download a completed video to *path*. Does NOT call ``cancel()`` — use the context manager.
 
-        File I/O is offloaded to a worker thread so the event loop never blocks.
-        URL downloads reuse the SDK client's managed HTTP session, so proxy,
-        SSL, timeout, and retry configuration are honored.
+        The body is streamed to disk chunk by chunk (see :meth:`download_to`),
+        so multi-hundred-MB renders are never held in memory.
 
         :param path: Destination file path.
         :param status: A completed status (from :meth:`wait` or :meth:`poll`).
+        :param checksum: Optional ``"sha256:<hex>"`` digest to verify.
+        :param parallel: Concurrent ranged requests for large files.
         :return: The resolved :class:`Path` of the saved file.
         """
         path = Path(path)
-        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
-        if status.data:
-            await asyncio.to_thread(path.write_bytes, status.data)
-        elif status.url:
-            data = await self._client.fetch_external(status.url)
-            await asyncio.to_thread(path.write_bytes, data)
-        elif self._download_url:
-            # VPS-backed models: the status carries neither inline bytes nor a
-            # url; the downloadable file lives at the queue-time download_url.
-            data = await self._client.fetch_external(self._download_url)
-            await asyncio.to_thread(path.write_bytes, data)
+        await self.download_to(path, status, checksum=checksum, parallel=parallel)
         return path
 
+    async def download_to(
+        self,
+        destination: str | Path | BinaryIO,
+        status: VideoCompletedStatus,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        checksum: str | None = None,
+        parallel: int = 1,
+    ) -> int:
+        """Stream a completed video into a file path or binary file-like object.
+
+        URL downloads go through :meth:`VeniceClient.download_to`: chunks are
+        written off the event loop as they arrive, dropped connections are
+        resumed with HTTP ``Range`` requests, and path destinations are
+        written to ``<name>.part`` first. Inline ``status.data`` is written
+        as-is.
+
+        :param destination: File path (parents are created) or writable binary file.
+        :param status: A completed status (from :meth:`wait` or :meth:`poll`).
+        :param chunk_size: Bytes per read/write.
+        :param checksum: Optional ``"algorithm:hexdigest"`` to verify.
+        :param parallel: Concurrent ranged requests for large files (paths only).
+        :return: Number of bytes written.
+        :raises ChecksumMismatchError: If the content does not match ``checksum``.
+        """
+        if status.data:
+            await write_bytes(destination, status.data)
+            return len(status.data)
+        # VPS-backed models: the status carries neither inline bytes nor a
+        # url; the downloadable file lives at the queue-time download_url.
+        url = status.url or self._download_url
+        if not url:
+            return 0
+        return await self._client.download_to(
+            url, destination, chunk_size=chunk_size, checksum=checksum, parallel=parallel
+        )
+
     async def cancel(self) -> VideoCompleteResponse:
         """Release server-side storage / cancel an in-progress job.
 
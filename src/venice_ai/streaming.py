@@ -46,6 +46,7 @@ Example:
 from __future__ import annotations
 
 import contextlib
+import io
 import logging
 import time
 from collections.abc import AsyncIterator
@@ -60,7 +61,7 @@ from typing import (
 if TYPE_CHECKING:
     from ._client import VeniceClient
     from .types.api.chat import ChatCompletionResponse
-    from .types.api.streaming import ChatCompletionChunk  # noqa: F401
+    from .types.api.streaming import ChatCompletionChunk, ChatCompletionChunkView
 
 import asyncio
 
@@ -405,6 +406,189 @@ class Stream[ChunkType]:
                 await self._iterator.aclose()  # pyright: ignore[reportAttributeAccessIssue]
 
 
+def _join_parts(parts: list[str]) -> str:
+    """Join ``parts`` and compact them in place.
+
+    The next snapshot then only joins what arrived since this one.
+    """
+    if len(parts) > 1:
+        parts[:] = ["".join(parts)]
+    return parts[0] if parts else ""
+
+
+class _ToolCallState:
+    """Running state for one streamed tool call (keyed by ``tool_call.index``)."""
+
+    __slots__ = ("id", "name", "arguments")
+
+    def __init__(self) -> None:
+        self.id = ""
+        self.name: list[str] = []
+        self.arguments: list[str] = []
+
+
+class _ChoiceState:
+    """Running state for one choice index, plus its last snapshot."""
+
+    __slots__ = ("content", "reasoning", "tool_calls", "finish_reason", "dirty", "snapshot")
+
+    def __init__(self) -> None:
+        self.content: io.StringIO | None = None
+        self.reasoning: io.StringIO | None = None
+        self.tool_calls: dict[int, _ToolCallState] = {}
+        self.finish_reason: str | None = None
+        self.dirty = True
+        self.snapshot: Any = None
+
+
+class StreamAccumulator:
+    """Assemble chat completion chunks into a ``ChatCompletionResponse``.
+
+    Tracks every choice index (so ``n > 1`` requests are fully supported) and
+    merges tool-call fragments by ``tool_call.index`` within each choice.
+    Text and reasoning deltas are appended to a per-choice
+    :class:`io.StringIO`; tool-call names and arguments are list-joined.
+
+    Works with both validated :class:`~venice_ai.types.api.streaming.ChatCompletionChunk`
+    models and ``fast_chunks=True`` views. The response is built with
+    ``model_construct`` — the chunks were already parsed, so the assembled
+    object is not validated a second time.
+
+    :meth:`current` may be called at any point mid-stream; only choices that
+    received new deltas since the previous snapshot are rebuilt.
+
+    Example::
+
+        acc = StreamAccumulator()
+        async for chunk in await client.chat.completions.create(
+            model=model, messages=messages, n=4, stream=True,
+        ):
+            acc.add(chunk)
+            partial = acc.current()  # cheap progress snapshot
+        response = acc.result()
+        texts = [choice.message.content for choice in response.choices]
+    """
+
+    __slots__ = ("_choices", "_id", "_model", "_created", "_usage")
+
+    def __init__(self) -> None:
+        self._choices: dict[int, _ChoiceState] = {}
+        self._id = ""
+        self._model = ""
+        self._created = 0
+        self._usage: Any = None
+
+    def add(self, chunk: ChatCompletionChunk | ChatCompletionChunkView) -> None:
+        """Fold one stream chunk into the accumulated state."""
+        if chunk.model:
+            self._model = chunk.model
+        if chunk.id:
+            self._id = chunk.id
+        if chunk.created:
+            self._created = chunk.created
+        for choice in chunk.choices:
+            state = self._choices.get(choice.index)
+            if state is None:
+                state = self._choices[choice.index] = _ChoiceState()
+            delta = choice.delta
+            if delta:
+                if delta.content:
+                    if state.content is None:
+                        state.content = io.StringIO()
+                    state.content.write(delta.content)
+                    state.dirty = True
+                if delta.reasoning_content:
+                    if state.reasoning is None:
+                        state.reasoning = io.StringIO()
+                    state.reasoning.write(delta.reasoning_content)
+                    state.dirty = True
+                if delta.tool_calls:
+                    for tc in delta.tool_calls:
+                        idx = tc.index or 0
+                        entry = state.tool_calls.get(idx)
+                        if entry is None:
+                            entry = state.tool_calls[idx] = _ToolCallState()
+                        if tc.id:
+                            entry.id = tc.id
+                        function = tc.function
+                        if function:
+                            if function.name:
+                                entry.name.append(function.name)
+                            if function.arguments:
+                                entry.arguments.append(function.arguments)
+                    state.dirty = True
+            if choice.finish_reason:
+                state.finish_reason = choice.finish_reason
+                state.dirty = True
+        if chunk.usage:
+            self._usage = chunk.usage
+
+    def current(self) -> ChatCompletionResponse:
+        """Return a snapshot of everything accumulated so far.
+
+        Choices that have not finished yet carry ``finish_reason=None``.
+        Unchanged choices reuse the object from the previous snapshot.
+        """
+        from .types.api.chat import ChatCompletionResponse
+
+        fields: dict[str, Any] = {
+            "id": self._id,
+            "object": "chat.completion",
+            "created": self._created,
+            "model": self._model,
+            "choices": [self._snapshot_choice(i, s) for i, s in sorted(self._choices.items())],
+        }
+        # Only include usage when the API sent one; otherwise leave it unset.
+        if self._usage is not None:
+            fields["usage"] = self._usage
+        return ChatCompletionResponse.model_construct(**fields)
+
+    def result(self) -> ChatCompletionResponse:
+        """Return the final response once every choice has finished.
+
+        :raises ValueError: If no choice was seen, or any choice lacks a
+            ``finish_reason`` (typically the stream was interrupted).
+        """
+        unfinished = [i for i, s in sorted(self._choices.items()) if s.finish_reason is None]
+        if not self._choices or unfinished:
+            detail = f" (choices {unfinished})" if len(self._choices) > 1 else ""
+            raise ValueError(
+                f"Stream completed without a finish_reason{detail} — likely "
+                "interrupted before the final chunk arrived."
+            )
+        return self.current()
+
+    @staticmethod
+    def _snapshot_choice(index: int, state: _ChoiceState) -> Any:
+        if not state.dirty:
+            return state.snapshot
+
+        from .types.api.chat import ChatChoice, ChatMessage, ToolCall, ToolCallFunction
+
+        tool_calls = [
+            ToolCall.model_construct(
+                id=entry.id,
+                type="function",
+                function=ToolCallFunction.model_construct(
+                    name=_join_parts(entry.name),
+                    arguments=_join_parts(entry.arguments),
+                ),
+            )
+            for _, entry in sorted(state.tool_calls.items())
+        ]
+        message = ChatMessage.model_construct(
+            role="assistant",
+            content=state.content.getvalue() if state.content else None,
+            reasoning_content=state.reasoning.getvalue() if state.reasoning else None,
+            tool_calls=tool_calls or None,
+        )
+        state.snapshot = ChatChoice.model_construct(
+            index=index, message=message, finish_reason=state.finish_reason
+        )
+        state.dirty = False
+        return state.snapshot
+
+
 class ChatStream(Stream["ChatCompletionChunk"]):
     """Enhanced stream for chat completions with convenience accessors.
 
@@ -416,6 +600,8 @@ class ChatStream(Stream["ChatCompletionChunk"]):
     * :meth:`collect_with_deltas` — yields text deltas live AND populates
       :attr:`final_response` once iteration completes; one pass, both signals
 
+    Both collectors use :class:`StreamAccumulator` and track every choice.
+
     Example — display deltas live and use the final aggregated response::
 
         async with await client.chat.completions.stream(
@@ -464,117 +650,17 @@ class ChatStream(Stream["ChatCompletionChunk"]):
         """Consume the entire stream and return a ``ChatCompletionResponse``.
 
         Accumulates text, reasoning content, and tool calls from all chunks
-        into a single non-streaming response object.
-
-        .. note::
-            Only the first choice (index 0) is tracked. For ``n > 1`` requests,
-            use the raw ``Stream`` iterator and accumulate per-choice yourself.
-            A one-time warning is emitted if non-zero choices are observed.
+        into a single non-streaming response object via
+        :class:`StreamAccumulator`. Every choice is tracked, so ``n > 1``
+        requests yield one assembled choice per index.
 
         :raises ValueError: If the stream completes without a ``finish_reason``
-            on choice 0 (typically indicates the stream was interrupted).
+            on every choice (typically indicates the stream was interrupted).
         """
-        import warnings
-
-        from .types.api.chat import ChatCompletionResponse
-
-        text_parts: list[str] = []
-        reasoning_parts: list[str] = []
-        tool_calls_by_index: dict[int, dict[str, str]] = {}
-        model = ""
-        stream_id = ""
-        created = 0
-        usage = None
-        finish_reason: str | None = None
-        warned_multi_choice = False
-
+        accumulator = StreamAccumulator()
         async for chunk in self:
-            model = chunk.model or model
-            if chunk.id:
-                stream_id = chunk.id
-            if chunk.created:
-                created = chunk.created
-            for choice in chunk.choices:
-                if choice.index != 0:
-                    if not warned_multi_choice:
-                        warnings.warn(
-                            "ChatStream.collect() only tracks choice 0; non-zero "
-                            "indices ignored. Use the raw Stream iterator for n>1.",
-                            stacklevel=2,
-                        )
-                        warned_multi_choice = True
-                    continue
-                if choice.delta:
-                    if choice.delta.content:
-                        text_parts.append(choice.delta.content)
-                    if choice.delta.reasoning_content:
-                        reasoning_parts.append(choice.delta.reasoning_content)
-                    if choice.delta.tool_calls:
-                        for tc in choice.delta.tool_calls:
-                            idx = tc.index or 0
-                            if idx not in tool_calls_by_index:
-                                tool_calls_by_index[idx] = {
-                                    "id": tc.id or "",
-                                    "type": tc.type or "function",
-                                    "name": "",
-                                    "arguments": "",
-                                }
-                            entry = tool_calls_by_index[idx]
-                            if tc.id:
-                                entry["id"] = tc.id
-                            if tc.function:
-                                if tc.function.name:
-                                    entry["name"] += tc.function.name
-                                if tc.function.arguments:
-                                    entry["arguments"] += tc.function.arguments
-                if choice.finish_reason:
-                    finish_reason = choice.finish_reason
-            if chunk.usage:
-                usage = chunk.usage
-
-        if finish_reason is None:
-            raise ValueError(
-                "Stream completed without a finish_reason — likely interrupted "
-                "before the final chunk arrived."
-            )
-
-        payload: dict[str, object] = {
-            "id": stream_id,
-            "object": "chat.completion",
-            "created": created,
-            "model": model,
-            "choices": [
-                {
-                    "index": 0,
-                    "message": {
-                        "role": "assistant",
-                        "content": "".join(text_parts) if text_parts else None,
-                        "reasoning_content": "".join(reasoning_parts) if reasoning_parts else None,
-                        "tool_calls": [
-                            {
-                                "id": entry["id"],
-                                "type": "function",
-                                "function": {
-                                    "name": entry["name"],
-                                    "arguments": entry["arguments"],
-                                },
-                            }
-                            for _, entry in sorted(tool_calls_by_index.items())
-                        ]
-                        if tool_calls_by_index
-                        else None,
-                    },
-                    "finish_reason": finish_reason,
-                }
-            ],
-        }
-        # Only include usage when the API sent one; otherwise leave it None.
-        # Stream chunks carry ChatUsage; convert to dict so pydantic re-validates
-        # as ChatCompletionResponse.usage (ChatUsage) rather than rejecting the
-        # cross-model instance under strict mode.
-        if usage is not None:
-            payload["usage"] = usage.model_dump()
-        response = ChatCompletionResponse.model_validate(payload)
+            accumulator.add(chunk)
+        response = accumulator.result()
         self._final_response = response
         return response
 
@@ -603,112 +689,20 @@ class ChatStream(Stream["ChatCompletionChunk"]):
                     print("tokens:", s.final_response.usage.total_tokens)
 
         .. note::
-            Only choice 0 is tracked (same constraint as :meth:`collect`).
-            A one-time warning is emitted if multi-choice (``n > 1``) chunks
-            are observed.
+            Only choice 0's text is yielded, but every choice is accumulated
+            into :attr:`final_response` (see :class:`StreamAccumulator`).
 
         :raises ValueError: If the stream completes without a
-            ``finish_reason`` on choice 0 (typically indicates the stream
+            ``finish_reason`` on every choice (typically indicates the stream
             was interrupted before the final chunk arrived).
         """
-        import warnings
-
-        from .types.api.chat import ChatCompletionResponse
-
-        text_parts: list[str] = []
-        reasoning_parts: list[str] = []
-        tool_calls_by_index: dict[int, dict[str, str]] = {}
-        model = ""
-        stream_id = ""
-        created = 0
-        usage = None
-        finish_reason: str | None = None
-        warned_multi_choice = False
-
+        accumulator = StreamAccumulator()
         async for chunk in self:
-            model = chunk.model or model
-            if chunk.id:
-                stream_id = chunk.id
-            if chunk.created:
-                created = chunk.created
+            accumulator.add(chunk)
             for choice in chunk.choices:
-                if choice.index != 0:
-                    if not warned_multi_choice:
-                        warnings.warn(
-                            "ChatStream.collect_with_deltas() only tracks choice 0; "
-                            "non-zero indices ignored. Use the raw Stream iterator for n>1.",
-                            stacklevel=2,
-                        )
-                        warned_multi_choice = True
-                    continue
-                if choice.delta:
-                    if choice.delta.content:
-                        text_parts.append(choice.delta.content)
-                        yield choice.delta.content
-                    if choice.delta.reasoning_content:
-                        reasoning_parts.append(choice.delta.reasoning_content)
-                    if choice.delta.tool_calls:
-                        for tc in choice.delta.tool_calls:
-                            idx = tc.index or 0
-                            if idx not in tool_calls_by_index:
-                                tool_calls_by_index[idx] = {
-                                    "id": tc.id or "",
-                                    "type": tc.type or "function",
-                                    "name": "",
-                                    "arguments": "",
-                                }
-                            entry = tool_calls_by_index[idx]
-                            if tc.id:
-                                entry["id"] = tc.id
-                            if tc.function:
-                                if tc.function.name:
-                                    entry["name"] += tc.function.name
-                                if tc.function.arguments:
-                                    entry["arguments"] += tc.function.arguments
-                if choice.finish_reason:
-                    finish_reason = choice.finish_reason
-            if chunk.usage:
-                usage = chunk.usage
-
-        if finish_reason is None:
-            raise ValueError(
-                "Stream completed without a finish_reason — likely interrupted "
-                "before the final chunk arrived."
-            )
-
-        payload: dict[str, object] = {
-            "id": stream_id,
-            "object": "chat.completion",
-            "created": created,
-            "model": model,
-            "choices": [
-                {
-                    "index": 0,
-                    "message": {
-                        "role": "assistant",
-                        "content": "".join(text_parts) if text_parts else None,
-                        "reasoning_content": "".join(reasoning_parts) if reasoning_parts else None,
-                        "tool_calls": [
-                            {
-                                "id": entry["id"],
-                                "type": "function",
-                                "function": {
-                                    "name": entry["name"],
-                                    "arguments": entry["arguments"],
-                                },
-                            }
-                            for _, entry in sorted(tool_calls_by_index.items())
-                        ]
-                        if tool_calls_by_index
-                        else None,
-                    },
-                    "finish_reason": finish_reason,
-                }
-            ],
-        }
-        if usage is not None:
-            payload["usage"] = usage.model_dump()
-        self._final_response = ChatCompletionResponse.model_validate(payload)
+                if choice.index == 0 and choice.delta and choice.delta.content:
+                    yield choice.delta.content
+        self._final_response = accumulator.result()
 
 
 class BytesResponse:
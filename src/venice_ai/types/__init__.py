@@ -83,8 +83,13 @@ from .api import (
     ChatCompletionChunk,
     ChatCompletionChunkChoice,
     ChatCompletionChunkChoiceDelta,
+    ChatCompletionChunkChoiceDeltaView,
+    ChatCompletionChunkChoiceView,
     ChatCompletionChunkToolCall,
     ChatCompletionChunkToolCallFunction,
+    ChatCompletionChunkToolCallFunctionView,
+    ChatCompletionChunkToolCallView,
+    ChatCompletionChunkView,
     ChatCompletionRequest,
     ChatCompletionResponse,
     ChatCompletionTokenLogprob,
@@ -433,6 +438,11 @@ __all__ = [
     "ChatCompletionChunkChoiceDelta",
     "ChatCompletionChunkChoice",
     "ChatCompletionChunk",
+    "ChatCompletionChunkToolCallFunctionView",
+    "ChatCompletionChunkToolCallView",
+    "ChatCompletionChunkChoiceDeltaView",
+    "ChatCompletionChunkChoiceView",
+    "ChatCompletionChunkView",
     # From video module - Response models
     "VideoQueueResponse",
     "VideoQuoteResponse",
@@ -253,8 +253,13 @@ from .streaming import (
     ChatCompletionChunk,
     ChatCompletionChunkChoice,
     ChatCompletionChunkChoiceDelta,
+    ChatCompletionChunkChoiceDeltaView,
+    ChatCompletionChunkChoiceView,
     ChatCompletionChunkToolCall,
     ChatCompletionChunkToolCallFunction,
+    ChatCompletionChunkToolCallFunctionView,
+    ChatCompletionChunkToolCallView,
+    ChatCompletionChunkView,
     ChatCompletionTokenLogprob,
     ChatCompletionTopLogprob,
     ChunkModelFactory,
@@ -433,6 +438,11 @@ __all__ = [
     "ChatCompletionChunkChoiceDelta",
     "ChatCompletionChunkChoice",
     "ChatCompletionChunk",
+    "ChatCompletionChunkToolCallFunctionView",
+    "ChatCompletionChunkToolCallView",
+    "ChatCompletionChunkChoiceDeltaView",
+    "ChatCompletionChunkChoiceView",
+    "ChatCompletionChunkView",
     # From requests module - Chat completion models
     "TextContent",
     "ImageUrl",
@@ -4,12 +4,16 @@ Embeddings models for Venice AI API.
 This module contains Pydantic models for text embedding requests and responses.
 """
 
-from typing import Literal
+import base64
+from typing import TYPE_CHECKING, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from ...core.models.common import VeniceBaseModel
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class EmbeddingObject(BaseModel):
     """Individual embedding object"""
@@ -52,6 +56,45 @@ class EmbeddingsResponse(VeniceBaseModel):
         default=None, description="Unix timestamp (seconds) when the response was created"
     )
 
+    def as_array(self) -> "numpy.ndarray":
+        """Return the embeddings as an ``(n, d)`` ``numpy.float32`` matrix.
+
+        Rows are ordered by ``index``. For ``encoding_format="base64"``
+        responses the payloads are decoded straight into one float32 buffer
+        with ``np.frombuffer`` (no intermediate float lists), so the matrix is
+        read-only. Float-list responses are converted with ``np.asarray``.
+
+        :raises ImportError: If NumPy is not installed. Use
+            :func:`venice_ai.helpers.decode_embedding` for a NumPy-free
+            ``array('f')`` per item.
+        :raises ValueError: If the embeddings have different lengths.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError(
+                "EmbeddingsResponse.as_array() requires NumPy (pip install numpy); "
+                "venice_ai.helpers.decode_embedding() works without it."
+            ) from e
+
+        items = sorted(self.data, key=lambda item: item.index)
+        if not items:
+            return np.empty((0, 0), dtype=np.float32)
+
+        encoded = [item.embedding for item in items if isinstance(item.embedding, str)]
+        if len(encoded) == len(items):
+            chunks = [base64.b64decode(embedding) for embedding in encoded]
+            width = len(chunks[0])
+            if width % 4 or any(len(chunk) != width for chunk in chunks):
+                raise ValueError(
+                    "Base64 embeddings must all decode to the same number of float32 values"
+                )
+            return np.frombuffer(b"".join(chunks), dtype="<f4").reshape(len(items), width // 4)
+
+        from ...helpers import decode_embedding
+
+        return np.stack([decode_embedding(item.embedding) for item in items])
+
 
 __all__ = [
     "EmbeddingObject",
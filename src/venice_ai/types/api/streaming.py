@@ -18,6 +18,8 @@ updates as responses are generated in real-time.
 * **ChatCompletionChunkChoiceDelta**: Incremental content deltas in streaming
 * **ChatCompletionChunkToolCall**: Tool call information in streaming chunks
 * **ChunkModelFactory**: Protocol for streaming model instantiation
+* **ChatCompletionChunkView**: Validation-free view over a decoded chunk dict,
+  used by ``client.chat.completions.stream(..., fast_chunks=True)``
 
 **Note:** Non-streaming response models (ChatCompletion, ChatCompletionChoice, etc.)
 are in ``src/venice_ai/types/api/chat.py``. Request models are
@@ -52,6 +54,12 @@ __all__ = [
     "ChatCompletionChunkChoiceDelta",
     "ChatCompletionChunkChoice",
     "ChatCompletionChunk",
+    # Validation-free chunk views
+    "ChatCompletionChunkToolCallFunctionView",
+    "ChatCompletionChunkToolCallView",
+    "ChatCompletionChunkChoiceDeltaView",
+    "ChatCompletionChunkChoiceView",
+    "ChatCompletionChunkView",
 ]
 
 # --- Protocol Definitions ---
@@ -348,6 +356,199 @@ class ChatCompletionChunk(BaseModel):
         return self.choices[0].delta.content or ""
 
 
+# --- Validation-Free Chunk Views ---
+#
+# High-volume token streaming spends most of its per-chunk CPU in
+# ``ChatCompletionChunk.model_validate``. The views below wrap the decoded
+# JSON dict instead and read fields on attribute access, exposing the same
+# attribute surface as the models for the fields stream consumers touch
+# (``choices[i].delta.content`` / ``reasoning_content`` / ``tool_calls``,
+# ``finish_reason``, ``usage``). No validation happens unless ``to_model()``
+# is called. Missing required fields read as empty values rather than raising.
+
+
+class ChatCompletionChunkToolCallFunctionView:
+    """Validation-free view of :class:`ChatCompletionChunkToolCallFunction`."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+
+    @property
+    def name(self) -> str | None:
+        return self._data.get("name")
+
+    @property
+    def arguments(self) -> str | None:
+        return self._data.get("arguments")
+
+
+class ChatCompletionChunkToolCallView:
+    """Validation-free view of :class:`ChatCompletionChunkToolCall`."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+
+    @property
+    def id(self) -> str | None:
+        return self._data.get("id")
+
+    @property
+    def type(self) -> str | None:
+        return self._data.get("type")
+
+    @property
+    def index(self) -> int | None:
+        return self._data.get("index")
+
+    @property
+    def function(self) -> ChatCompletionChunkToolCallFunctionView | None:
+        function = self._data.get("function")
+        return ChatCompletionChunkToolCallFunctionView(function) if function else None
+
+
+class ChatCompletionChunkChoiceDeltaView:
+    """Validation-free view of :class:`ChatCompletionChunkChoiceDelta`.
+
+    ``content`` is writable so in-place transforms (e.g. E2EE decryption)
+    work on views the same way they do on models.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+
+    @property
+    def role(self) -> str | None:
+        return self._data.get("role")
+
+    @property
+    def content(self) -> str | None:
+        return self._data.get("content")
+
+    @content.setter
+    def content(self, value: str | None) -> None:
+        self._data["content"] = value
+
+    @property
+    def reasoning_content(self) -> str | None:
+        return self._data.get("reasoning_content")
+
+    @property
+    def tool_calls(self) -> list[ChatCompletionChunkToolCallView] | None:
+        tool_calls = self._data.get("tool_calls")
+        if not tool_calls:
+            return None
+        return [ChatCompletionChunkToolCallView(tc) for tc in tool_calls]
+
+
+class ChatCompletionChunkChoiceView:
+    """Validation-free view of :class:`ChatCompletionChunkChoice`."""
+
+    __slots__ = ("_data", "_delta")
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+        self._delta: ChatCompletionChunkChoiceDeltaView | None = None
+
+    @property
+    def index(self) -> int:
+        return self._data.get("index") or 0
+
+    @property
+    def delta(self) -> ChatCompletionChunkChoiceDeltaView:
+        if self._delta is None:
+            delta = self._data.get("delta")
+            if delta is None:
+                delta = self._data["delta"] = {}
+            self._delta = ChatCompletionChunkChoiceDeltaView(delta)
+        return self._delta
+
+    @property
+    def finish_reason(self) -> str | None:
+        return self._data.get("finish_reason")
+
+    @property
+    def logprobs(self) -> ChatCompletionChoiceLogprobs | None:
+        logprobs = self._data.get("logprobs")
+        return ChatCompletionChoiceLogprobs.model_validate(logprobs) if logprobs else None
+
+
+class ChatCompletionChunkView:
+    """Validation-free, attribute-compatible view over a decoded stream chunk.
+
+    Yielded instead of :class:`ChatCompletionChunk` when a stream is opened
+    with ``fast_chunks=True``. Reads go straight to the underlying dict;
+    ``usage`` (present on the final chunk only) is validated into
+    :class:`~venice_ai.types.api.chat.ChatUsage` on access. Call
+    :meth:`to_model` to get a fully validated :class:`ChatCompletionChunk`.
+    """
+
+    __slots__ = ("_data", "_choices")
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+        self._choices: list[ChatCompletionChunkChoiceView] | None = None
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """The decoded JSON object backing this view."""
+        return self._data
+
+    @property
+    def id(self) -> str:
+        return self._data.get("id") or ""
+
+    @property
+    def object(self) -> str:
+        return self._data.get("object") or "chat.completion.chunk"
+
+    @property
+    def created(self) -> int:
+        return self._data.get("created") or 0
+
+    @property
+    def model(self) -> str:
+        return self._data.get("model") or ""
+
+    @property
+    def system_fingerprint(self) -> str | None:
+        return self._data.get("system_fingerprint")
+
+    @property
+    def choices(self) -> list[ChatCompletionChunkChoiceView]:
+        if self._choices is None:
+            self._choices = [
+                ChatCompletionChunkChoiceView(choice) for choice in self._data.get("choices") or ()
+            ]
+        return self._choices
+
+    @property
+    def usage(self) -> ChatUsage | None:
+        usage = self._data.get("usage")
+        return ChatUsage.model_validate(usage) if usage else None
+
+    @property
+    def text(self) -> str:
+        """Convenience accessor for ``choices[0].delta.content`` (see :attr:`ChatCompletionChunk.text`)."""
+        choices = self._data.get("choices")
+        if not choices:
+            return ""
+        delta = choices[0].get("delta")
+        return (delta.get("content") if delta else None) or ""
+
+    def to_model(self) -> ChatCompletionChunk:
+        """Validate the underlying dict into a :class:`ChatCompletionChunk`."""
+        return ChatCompletionChunk.model_validate(self._data)
+
+    def __repr__(self) -> str:
+        return f"ChatCompletionChunkView(id={self.id!r}, model={self.model!r})"
+
+
 # NOTE: This module contains only streaming-specific models.
 # Non-streaming response models are in src/venice_ai/types/api/chat.py
 # Request models are in src/venice_ai/types/api/requests/
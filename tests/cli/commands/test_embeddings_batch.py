@@ -0,0 +1,262 @@
+"""Tests for ``venice-py embeddings batch`` (cli/commands/embeddings_batch.py)."""
+
+import asyncio
+import base64
+import json
+import struct
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import click
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from venice_ai.cli.commands.embeddings_batch import (
+    Checkpoint,
+    _batch_async,
+    iter_records,
+    pack_batches,
+)
+
+
+def _vector(text: str) -> list[float]:
+    return [float(len(text)), float(ord(text[0])), 0.5]
+
+
+class _FakeEmbeddings:
+    """``client.embeddings`` stand-in returning base64 vectors derived from the text."""
+
+    def __init__(self, fail_after: int | None = None) -> None:
+        self.fail_after = fail_after
+        self.requests: list[list[str]] = []
+        self.active = 0
+        self.peak = 0
+
+    async def create(self, *, model, input, dimensions, encoding_format):
+        if self.fail_after is not None and len(self.requests) >= self.fail_after:
+            raise RuntimeError("upstream unavailable")
+        self.requests.append(list(input))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01 if len(self.requests) % 2 else 0.03)  # finish out of order
+        finally:
+            self.active -= 1
+        data = [
+            SimpleNamespace(
+                index=i, embedding=base64.b64encode(struct.pack("<3f", *_vector(t))).decode()
+            )
+            for i, t in enumerate(input)
+        ]
+        # Deliberately unordered, like a server is allowed to be
+        return SimpleNamespace(data=data[::-1], usage=SimpleNamespace(total_tokens=len(input)))
+
+
+async def _run(tmp_path: Path, corpus: Path, output: Path, embeddings: _FakeEmbeddings, **kwargs):
+    ctx = MagicMock()
+    ctx.obj = {"config": {}, "plain": True}
+    client = MagicMock()
+    client.embeddings = embeddings
+    client_cm = AsyncMock()
+    client_cm.__aenter__.return_value = client
+    with (
+        patch("venice_ai.cli.config.get_client_kwargs", return_value={}),
+        patch("venice_ai.VeniceClient", return_value=client_cm),
+        patch(
+            "venice_ai.cli._model_defaults.resolve_default_model",
+            AsyncMock(return_value="embed-model"),
+        ),
+    ):
+        options = {"batch_size": 2, "concurrency": 3}
+        options.update(kwargs)
+        await _batch_async(ctx, corpus, output, model=None, **options)
+
+
+def _corpus(tmp_path: Path, n: int = 7) -> Path:
+    path = tmp_path / "corpus.jsonl"
+    path.write_text(
+        "".join(json.dumps({"id": f"doc{i}", "text": f"t{i}" * (i + 1)}) + "\n" for i in range(n))
+    )
+    return path
+
+
+class TestInput:
+    def test_jsonl_and_csv_and_lines(self, tmp_path):
+        jsonl = tmp_path / "a.jsonl"
+        jsonl.write_text('{"id": "x", "body": "one"}\n\n{"body": "two"}\n')
+        csv_path = tmp_path / "a.csv"
+        csv_path.write_text('id,body\nx,"one, with comma"\n,two\n')
+        lines = tmp_path / "a.txt"
+        lines.write_text("one\n\ntwo\n")
+
+        assert list(iter_records(jsonl, text_field="body")) == [("x", "one"), ("1", "two")]
+        assert list(iter_records(csv_path, text_field="body")) == [
+            ("x", "one, with comma"),
+            ("1", "two"),
+        ]
+        assert list(iter_records(lines)) == [("0", "one"), ("1", "two")]
+
+    def test_missing_text_reports_line(self, tmp_path):
+        path = tmp_path / "a.jsonl"
+        path.write_text('{"text": "ok"}\n{"title": "no text"}\n')
+
+        with pytest.raises(ValueError, match="Line 2"):
+            list(iter_records(path))
+
+    def test_batches_bounded_by_inputs_and_tokens(self):
+        records = iter([(str(i), "x" * 40) for i in range(5)])  # ~10 tokens each
+
+        sizes = [len(b) for b in pack_batches(records, max_inputs=3, max_tokens=25)]
+
+        assert sizes == [2, 2, 1]
+
+
+class TestBatchRun:
+    @pytest.mark.asyncio
+    async def test_jsonl_output_in_input_order(self, tmp_path):
+        corpus = _corpus(tmp_path)
+        output = tmp_path / "out.jsonl"
+        embeddings = _FakeEmbeddings()
+
+        await _run(tmp_path, corpus, output, embeddings)
+
+        rows = [json.loads(line) for line in output.read_text().splitlines()]
+        assert [r["id"] for r in rows] == [f"doc{i}" for i in range(7)]
+        assert rows[3]["embedding"] == _vector("t3" * 4)
+        assert embeddings.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_npy_output_loads_with_numpy(self, tmp_path):
+        corpus = _corpus(tmp_path)
+        output = tmp_path / "out.npy"
+
+        await _run(tmp_path, corpus, output, _FakeEmbeddings())
+
+        matrix = np.load(output)
+        ids = [json.loads(line) for line in (tmp_path / "out.ids.jsonl").read_text().splitlines()]
+        assert matrix.shape == (7, 3)
+        assert matrix.dtype == np.float32
+        assert ids == [f"doc{i}" for i in range(7)]
+        np.testing.assert_allclose(matrix[6], _vector("t6" * 7))
+
+    @pytest.mark.asyncio
+    async def test_parquet_output_is_a_directory_of_parts(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        corpus = _corpus(tmp_path)
+        output = tmp_path / "out.parquet"
+
+        await _run(tmp_path, corpus, output, _FakeEmbeddings(), part_rows=3)
+
+        table = pq.read_table(output)
+        # Batches of 2 rows are buffered until a part holds at least 3
+        assert sorted(p.name for p in output.iterdir()) == [
+            "part-00000.parquet",
+            "part-00001.parquet",
+        ]
+        assert table.column("id").to_pylist() == [f"doc{i}" for i in range(7)]
+        assert table.column("embedding").to_pylist()[0] == _vector("t0")
+
+    @pytest.mark.asyncio
+    async def test_interrupted_run_resumes_from_checkpoint(self, tmp_path):
+        corpus = _corpus(tmp_path)
+        output = tmp_path / "out.npy"
+
+        with pytest.raises(SystemExit):
+            await _run(tmp_path, corpus, output, _FakeEmbeddings(fail_after=2), concurrency=1)
+        assert np.load(output).shape == (4, 3)  # valid array up to the checkpoint
+
+        second = _FakeEmbeddings()
+        await _run(tmp_path, corpus, output, second, concurrency=1)
+
+        assert [t for batch in second.requests for t in batch] == [
+            f"t{i}" * (i + 1) for i in range(4, 7)
+        ]
+        assert np.load(output).shape == (7, 3)
+        ids = (tmp_path / "out.ids.jsonl").read_text().splitlines()
+        assert [json.loads(i) for i in ids] == [f"doc{i}" for i in range(7)]
+
+    @pytest.mark.asyncio
+    async def test_complete_output_is_not_redone(self, tmp_path):
+        corpus = _corpus(tmp_path)
+        output = tmp_path / "out.jsonl"
+        await _run(tmp_path, corpus, output, _FakeEmbeddings())
+
+        again = _FakeEmbeddings()
+        await _run(tmp_path, corpus, output, again)
+        rerun = _FakeEmbeddings()
+        await _run(tmp_path, corpus, output, rerun, resume=False)
+
+        assert again.requests == []
+        assert len(rerun.requests) == 4
+        assert len(output.read_text().splitlines()) == 7
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_from_other_input_is_refused(self, tmp_path):
+        corpus = _corpus(tmp_path)
+        output = tmp_path / "out.jsonl"
+        Checkpoint.for_output(output, {"input": "elsewhere"}).save(3, {"size": 0})
+
+        with pytest.raises(click.ClickException, match="different run"):
+            await _run(tmp_path, corpus, output, _FakeEmbeddings())
+
+    @pytest.mark.asyncio
+    async def test_no_resume_discards_checkpoint_before_truncating(self, tmp_path):
+        corpus = _corpus(tmp_path)
+        output = tmp_path / "out.jsonl"
+        await _run(tmp_path, corpus, output, _FakeEmbeddings())
+
+        with pytest.raises(SystemExit):
+            await _run(tmp_path, corpus, output, _FakeEmbeddings(fail_after=0), resume=False)
+        assert output.read_bytes() == b""
+
+        again = _FakeEmbeddings()
+        await _run(tmp_path, corpus, output, again)
+        assert len(again.requests) == 4
+        assert len(output.read_text().splitlines()) == 7
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_past_end_of_output_is_refused(self, tmp_path):
+        corpus = _corpus(tmp_path)
+        output = tmp_path / "out.jsonl"
+        with pytest.raises(SystemExit):
+            await _run(tmp_path, corpus, output, _FakeEmbeddings(fail_after=2), concurrency=1)
+        output.write_bytes(b"")
+
+        with pytest.raises(click.ClickException, match="no longer matches"):
+            await _run(tmp_path, corpus, output, _FakeEmbeddings())
+
+
+class TestCommandRouting:
+    def test_batch_subcommand_and_text_default(self, tmp_path):
+        from venice_ai.cli.cli import cli
+
+        corpus = _corpus(tmp_path)
+
+        def consume(coro):
+            consume.name = coro.cr_code.co_name
+            coro.close()
+
+        runner = CliRunner()
+        with (
+            patch("venice_ai.cli.commands.embeddings_batch.asyncio.run", side_effect=consume),
+        ):
+            result = runner.invoke(
+                cli, ["embeddings", "batch", str(corpus), "-o", str(tmp_path / "o.npy")]
+            )
+        assert result.exit_code == 0, result.output
+        assert consume.name == "_batch_async"
+
+        with patch("venice_ai.cli.commands.embeddings.asyncio.run", side_effect=consume):
+            result = runner.invoke(cli, ["embeddings", "--model", "m", "hello"])
+        assert result.exit_code == 0, result.output
+        assert consume.name == "_embeddings_async"
+
+    def test_group_help_lists_batch(self):
+        from venice_ai.cli.cli import cli
+
+        result = CliRunner().invoke(cli, ["embeddings", "--help"])
+
+        assert result.exit_code == 0
+        assert "batch" in result.output
@@ -302,10 +302,12 @@ class TestActiveConfigPath:
         config_file.write_text("api:\n  key: kw-key\n  base_url: https://kw.example/api\n")
 
         kwargs = get_client_kwargs(config_path=config_file)
+        catalog = kwargs.pop("model_catalog")
         assert kwargs == {
             "api_key": "kw-key",
             "base_url": "https://kw.example/api",
         }
+        assert catalog.namespace == "https://kw.example/api"
 
 
 class TestDefaultConfig:
@@ -0,0 +1,241 @@
+"""Tests for the concurrent, resumable ``venice-py image batch`` work queue."""
+
+import asyncio
+import base64
+import binascii
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from venice_ai.cli.commands.image import _batch
+from venice_ai.cli.commands.image._batch import BatchJournal, load_jobs, write_b64_image
+from venice_ai.cli.commands.image.generate import _batch_generate_async
+
+IMAGE = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 64
+
+
+class _FakeImage:
+    """``client.image.create`` stand-in that records concurrency."""
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.fail_on = fail_on
+        self.calls: list[dict] = []
+        self.active = 0
+        self.peak = 0
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if kwargs["prompt"] == self.fail_on:
+                raise RuntimeError("content policy")
+            return SimpleNamespace(images=[base64.b64encode(IMAGE).decode()], timing=None)
+        finally:
+            self.active -= 1
+
+
+async def _run_batch(
+    tmp_path: Path, prompts_file: Path, image: _FakeImage, model: str = "test-model", **kwargs
+) -> Path:
+    save_dir = tmp_path / "out"
+    ctx = MagicMock()
+    ctx.obj = {"config": {"output": {"images_dir": str(save_dir)}}, "plain": True}
+    client = MagicMock()
+    client.image = image
+    client_cm = AsyncMock()
+    client_cm.__aenter__.return_value = client
+    with (
+        patch("venice_ai.cli.commands.image.generate.get_client_kwargs", return_value={}),
+        patch("venice_ai.cli.commands.image.generate.VeniceClient", return_value=client_cm),
+    ):
+        await _batch_generate_async(
+            ctx,
+            str(prompts_file),
+            model,
+            "1024x1024",
+            str(save_dir),
+            **kwargs,
+        )
+    return save_dir
+
+
+class TestLoadJobs:
+    def test_text_file_one_prompt_per_line(self, tmp_path):
+        path = tmp_path / "prompts.txt"
+        path.write_text("a cat\n\n  a dog  \n")
+
+        jobs = load_jobs(path)
+
+        assert [(j.index, j.prompt, j.params) for j in jobs] == [(1, "a cat", {}), (2, "a dog", {})]
+
+    def test_jsonl_rows_carry_parameters(self, tmp_path):
+        path = tmp_path / "prompts.jsonl"
+        path.write_text(
+            json.dumps({"prompt": "a cat", "seed": 7, "size": "640x480", "name": "cat"}) + "\n"
+        )
+
+        (job,) = load_jobs(path)
+
+        assert job.params == {"seed": 7, "width": 640, "height": 480}
+        assert job.filenames("webp", 1) == ["cat.webp"]
+
+    @pytest.mark.parametrize(
+        "row, message",
+        [
+            ("not json", "invalid JSON"),
+            ('["a cat"]', "JSON object"),
+            ('{"prompt": ""}', "non-empty"),
+            ('{"prompt": "x", "size": "big"}', "WxH"),
+            ('{"prompt": "x", "name": "../x"}', "plain file name"),
+            ('{"prompt": "x", "negative": "y"}', "unknown field"),
+        ],
+    )
+    def test_jsonl_rejects_bad_rows(self, tmp_path, row, message):
+        path = tmp_path / "prompts.jsonl"
+        path.write_text('{"prompt": "ok"}\n' + row + "\n")
+
+        with pytest.raises(ValueError, match=f"Line 2: .*{message}"):
+            load_jobs(path)
+
+    def test_keys_survive_reordering_and_distinguish_duplicates(self, tmp_path):
+        path = tmp_path / "prompts.txt"
+        path.write_text("a\nb\na\n")
+        first = load_jobs(path)
+        path.write_text("new\nb\na\na\n")
+        second = load_jobs(path)
+
+        assert len({j.key for j in first}) == 3
+        assert {j.key for j in first} < {j.key for j in second}
+
+
+class TestJournal:
+    def test_replay_skips_torn_lines_and_missing_files(self, tmp_path):
+        path = tmp_path / "prompts.txt"
+        path.write_text("a\nb\n")
+        a, b = load_jobs(path)
+        (tmp_path / "a.png").write_bytes(b"x")
+        journal_path = tmp_path / "journal.jsonl"
+        journal = BatchJournal(journal_path)
+        journal.record(a, files=["a.png"])
+        journal.record(b, files=["b.png"])
+        journal.close()
+        with open(journal_path, "a") as f:
+            f.write('{"key": "tor')
+
+        replayed = BatchJournal(journal_path)
+
+        assert replayed.is_done(a, tmp_path)
+        assert not replayed.is_done(b, tmp_path)  # b.png was never written
+        assert not BatchJournal(journal_path, resume=False).is_done(a, tmp_path)
+
+
+def test_write_b64_image_decodes_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(_batch, "B64_CHUNK", 64)
+    (tmp_path / "images").mkdir()
+    target = tmp_path / "images" / "out.png"
+
+    written = write_b64_image(target, base64.b64encode(IMAGE).decode())
+
+    assert written == len(IMAGE)
+    assert target.read_bytes() == IMAGE
+    assert list(target.parent.iterdir()) == [target]
+
+
+def test_write_b64_image_accepts_wrapped_base64(tmp_path, monkeypatch):
+    monkeypatch.setattr(_batch, "B64_CHUNK", 50)
+    target = tmp_path / "out.png"
+    image = IMAGE * 20
+
+    written = write_b64_image(target, base64.encodebytes(image).decode())
+
+    assert written == len(image)
+    assert target.read_bytes() == image
+
+
+def test_write_b64_image_rejects_truncated_data(tmp_path):
+    (tmp_path / "images").mkdir()
+    target = tmp_path / "images" / "out.png"
+
+    with pytest.raises(binascii.Error):
+        write_b64_image(target, base64.b64encode(IMAGE).decode()[:-1])
+    assert list(target.parent.iterdir()) == []
+
+
+class TestBatchRun:
+    @pytest.mark.asyncio
+    async def test_prompts_run_concurrently(self, tmp_path):
+        prompts = tmp_path / "prompts.txt"
+        prompts.write_text("\n".join(f"prompt {i}" for i in range(12)))
+        image = _FakeImage()
+
+        save_dir = await _run_batch(tmp_path, prompts, image, concurrency=4)
+
+        assert image.peak == 4
+        assert len(list(save_dir.glob("*.png"))) == 12
+        assert all(call["model"] == "test-model" for call in image.calls)
+
+    @pytest.mark.asyncio
+    async def test_jsonl_parameters_reach_the_request(self, tmp_path):
+        prompts = tmp_path / "prompts.jsonl"
+        prompts.write_text(
+            json.dumps({"prompt": "a", "seed": 3, "format": "webp", "name": "first"}) + "\n"
+        )
+        image = _FakeImage()
+
+        save_dir = await _run_batch(tmp_path, prompts, image, steps=20)
+
+        assert image.calls[0]["seed"] == 3
+        assert image.calls[0]["steps"] == 20
+        assert (save_dir / "first.webp").read_bytes() == IMAGE
+
+    @pytest.mark.asyncio
+    async def test_rerun_retries_only_failed_prompts(self, tmp_path):
+        prompts = tmp_path / "prompts.txt"
+        prompts.write_text("a\nb\nc\n")
+
+        await _run_batch(tmp_path, prompts, _FakeImage(fail_on="b"))
+        retry = _FakeImage()
+        save_dir = await _run_batch(tmp_path, prompts, retry)
+
+        assert [call["prompt"] for call in retry.calls] == ["b"]
+        assert len(list(save_dir.glob("*.png"))) == 3
+
+    @pytest.mark.asyncio
+    async def test_rerun_with_other_model_runs_everything_again(self, tmp_path):
+        prompts = tmp_path / "prompts.txt"
+        prompts.write_text("a\nb\n")
+
+        await _run_batch(tmp_path, prompts, _FakeImage())
+        other = _FakeImage()
+        save_dir = await _run_batch(tmp_path, prompts, other, model="other-model")
+
+        assert [call["model"] for call in other.calls] == ["other-model", "other-model"]
+        assert len(list(save_dir.glob("*.png"))) == 4
+
+    @pytest.mark.asyncio
+    async def test_no_resume_runs_everything_again(self, tmp_path):
+        prompts = tmp_path / "prompts.txt"
+        prompts.write_text("a\nb\n")
+
+        await _run_batch(tmp_path, prompts, _FakeImage())
+        again = _FakeImage()
+        await _run_batch(tmp_path, prompts, again, resume=False)
+
+        assert len(again.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_jsonl_exits(self, tmp_path):
+        prompts = tmp_path / "prompts.jsonl"
+        prompts.write_text('{"seed": 1}\n')
+
+        with (
+            patch("venice_ai.cli.commands.image.generate.print_error") as print_error,
+            pytest.raises(SystemExit),
+        ):
+            await _run_batch(tmp_path, prompts, _FakeImage())
+        assert "Line 1" in print_error.call_args[0][0]
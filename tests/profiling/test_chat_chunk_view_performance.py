@@ -0,0 +1,85 @@
+"""
+Chat Chunk Fast-Mode Micro-benchmark
+
+Compares ``ChatCompletionChunk.model_validate`` (the default stream path)
+against wrapping each decoded dict in ``ChatCompletionChunkView``
+(``stream(..., fast_chunks=True)``), reading ``choices[0].delta.content`` the
+way ``ChatStream.text_deltas`` does.
+
+Run with:
+    poetry run pytest tests/profiling/test_chat_chunk_view_performance.py -v -s
+"""
+
+import time
+
+import pytest
+
+from venice_ai._sse import json_loads
+from venice_ai.types.api.streaming import ChatCompletionChunk, ChatCompletionChunkView
+
+pytestmark = [pytest.mark.slow, pytest.mark.profiling]
+
+CHUNKS = 20_000
+ROUNDS = 5
+
+
+def _build_frames(count: int) -> list[bytes]:
+    return [
+        (
+            b'{"id":"chatcmpl-bench","object":"chat.completion.chunk","created":1700000000,'
+            b'"model":"bench-model","choices":[{"index":0,"delta":{"content":"tok%d "},'
+            b'"finish_reason":null}]}' % i
+        )
+        for i in range(count)
+    ]
+
+
+def _validated(frames: list[bytes]) -> int:
+    total = 0
+    for frame in frames:
+        chunk = ChatCompletionChunk.model_validate(json_loads(frame))
+        for choice in chunk.choices:
+            if choice.delta and choice.delta.content:
+                total += len(choice.delta.content)
+    return total
+
+
+def _fast(frames: list[bytes]) -> int:
+    total = 0
+    for frame in frames:
+        chunk = ChatCompletionChunkView(json_loads(frame))
+        for choice in chunk.choices:
+            if choice.delta and choice.delta.content:
+                total += len(choice.delta.content)
+    return total
+
+
+def _best_of(fn, arg) -> tuple[float, int]:
+    best = float("inf")
+    result = 0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        result = fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+class TestChunkViewThroughput:
+    """Chunks-per-second per core for validated vs. fast chunk mode."""
+
+    def test_view_vs_model_validate(self):
+        frames = _build_frames(CHUNKS)
+
+        validated_time, validated_chars = _best_of(_validated, frames)
+        fast_time, fast_chars = _best_of(_fast, frames)
+
+        assert validated_chars == fast_chars
+
+        print("\n" + "=" * 70)
+        print("CHAT CHUNK DECODE + READ THROUGHPUT (single core)")
+        print("=" * 70)
+        print(f"Chunks:             {CHUNKS}")
+        print(f"model_validate:     {CHUNKS / validated_time:>12,.0f} chunks/s")
+        print(f"ChunkView:          {CHUNKS / fast_time:>12,.0f} chunks/s")
+        print(f"Speedup:            {validated_time / fast_time:>12.2f}x")
+        print("=" * 70)
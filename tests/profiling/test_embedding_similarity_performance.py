@@ -0,0 +1,94 @@
+"""
+Embedding Similarity Micro-benchmark
+
+Compares reranking a corpus with the scalar :func:`venice_ai.helpers.cosine_similarity`
+loop (one call per document over float lists) against
+:func:`venice_ai.helpers.top_k`, which normalises the corpus once and scores it with a
+single matrix product, plus the memory footprint of float lists vs. the float32 matrix
+``EmbeddingsResponse.as_array()`` builds from ``encoding_format="base64"`` payloads.
+
+Run with:
+    poetry run pytest tests/profiling/test_embedding_similarity_performance.py -v -s
+"""
+
+import base64
+import random
+import struct
+import sys
+import time
+
+import pytest
+
+from venice_ai.helpers import cosine_similarity, top_k
+from venice_ai.types.api import EmbeddingsResponse
+
+np = pytest.importorskip("numpy")
+
+pytestmark = [pytest.mark.slow, pytest.mark.profiling]
+
+DOCUMENTS = 5_000
+DIMENSIONS = 1024
+K = 10
+
+
+def _vectors(n: int, d: int) -> list[list[float]]:
+    rng = random.Random(0)
+    return [[rng.uniform(-1.0, 1.0) for _ in range(d)] for _ in range(n)]
+
+
+def _list_bytes(vectors: list[list[float]]) -> int:
+    total = sys.getsizeof(vectors)
+    for vector in vectors:
+        total += sys.getsizeof(vector) + sum(sys.getsizeof(x) for x in vector)
+    return total
+
+
+class TestEmbeddingSimilarity:
+    """Reranking throughput and memory: float lists vs. float32 matrix."""
+
+    def test_top_k_vs_scalar_loop(self):
+        docs = _vectors(DOCUMENTS, DIMENSIONS)
+        query = docs[42]
+
+        start = time.perf_counter()
+        scores = [cosine_similarity(query, d) for d in docs]
+        loop_best = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)[:K]
+        loop_time = time.perf_counter() - start
+
+        response = EmbeddingsResponse.model_validate(
+            {
+                "object": "list",
+                "model": "bench",
+                "data": [
+                    {
+                        "object": "embedding",
+                        "index": i,
+                        "embedding": base64.b64encode(struct.pack(f"<{DIMENSIONS}f", *d)).decode(),
+                    }
+                    for i, d in enumerate(docs)
+                ],
+                "usage": {"prompt_tokens": 0, "total_tokens": 0},
+            }
+        )
+        start = time.perf_counter()
+        matrix = response.as_array()
+        decode_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vector_best = [i for i, _ in top_k(query, matrix, k=K)]
+        top_k_time = time.perf_counter() - start
+
+        assert vector_best[0] == loop_best[0] == 42
+        assert set(vector_best) == set(loop_best)
+
+        print("\n" + "=" * 70)
+        print("EMBEDDING RERANKING")
+        print("=" * 70)
+        print(f"Corpus:              {DOCUMENTS} x {DIMENSIONS}")
+        print(f"Float-list memory:   {_list_bytes(docs) / 2**20:>10.1f} MiB")
+        print(f"float32 matrix:      {matrix.nbytes / 2**20:>10.1f} MiB")
+        print(f"Scalar loop:         {loop_time * 1000:>10.1f} ms")
+        print(f"Base64 -> matrix:    {decode_time * 1000:>10.1f} ms")
+        print(f"top_k (matrix):      {top_k_time * 1000:>10.1f} ms")
+        print(f"Speedup:             {loop_time / top_k_time:>10.1f}x")
+        print("=" * 70)
@@ -0,0 +1,180 @@
+"""
+RedisBackend Round-trip Benchmark
+
+Counts the Redis commands and network round-trips the backend issues per
+request against ``fakeredis`` (an in-process Redis stand-in with Lua support),
+and compares them with the previous behaviour of PINGing the cached client
+before every operation.
+
+A "request" is the scheduler's hot path: ``reserve()`` before sending and
+``update_rate_limits()`` with the response headers afterwards.
+
+Run with:
+    poetry run pytest tests/profiling/test_redis_round_trips.py -v -s
+
+Requires ``fakeredis[lua]``; the module is skipped when it is not installed.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import Counter
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+from redis.asyncio.connection import AbstractConnection  # noqa: E402
+
+from venice_ai.core.backends.redis import RedisBackend  # noqa: E402
+
+pytestmark = [pytest.mark.slow, pytest.mark.profiling]
+
+REQUESTS = 500
+HEADERS = {
+    "x-ratelimit-limit-requests": "100000",
+    "x-ratelimit-remaining-requests": "99999",
+    "x-ratelimit-reset-requests": "60",
+    "x-ratelimit-limit-tokens": "10000000",
+    "x-ratelimit-remaining-tokens": "9999000",
+    "x-ratelimit-reset-tokens": "60",
+}
+
+
+class _WireCounter:
+    """Counts packed commands and socket writes (one write per round-trip)."""
+
+    def __init__(self) -> None:
+        self.commands: Counter[str] = Counter()
+        self.round_trips = 0
+
+    @contextlib.contextmanager
+    def installed(self) -> Iterator["_WireCounter"]:
+        original_pack = AbstractConnection.pack_command
+        original_send = AbstractConnection.send_packed_command
+        counter = self
+
+        def pack_command(conn, *args):
+            counter.commands[str(args[0]).upper()] += 1
+            return original_pack(conn, *args)
+
+        async def send_packed_command(conn, command, check_health=True):
+            counter.round_trips += 1
+            return await original_send(conn, command, check_health)
+
+        with (
+            patch.object(AbstractConnection, "pack_command", pack_command),
+            patch.object(AbstractConnection, "send_packed_command", send_packed_command),
+        ):
+            yield self
+
+
+def _backend(namespace: str) -> RedisBackend:
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    backend = RedisBackend(redis_client=client, namespace=namespace)
+    backend._connected = True
+    backend._event_loop_id = id(asyncio.get_running_loop())
+    return backend
+
+
+@contextlib.contextmanager
+def _ping_per_operation(backend: RedisBackend) -> Iterator[None]:
+    """Restore the old behaviour: PING the cached client before every operation."""
+    original = backend._ensure_connected
+
+    async def ensure_connected():
+        client = await original()
+        await client.ping()
+        return client
+
+    with patch.object(backend, "_ensure_connected", ensure_connected):
+        yield
+
+
+async def _run_requests(backend: RedisBackend, counter: _WireCounter) -> float:
+    await backend.update_rate_limits("bench-model", HEADERS)
+    await backend.reserve("bench-model", 10)  # loads the acquire script (NOSCRIPT -> EVAL)
+    with counter.installed():
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            await backend.reserve("bench-model", 100)
+            await backend.update_rate_limits("bench-model", HEADERS)
+        return time.perf_counter() - start
+
+
+def _report(label: str, counter: _WireCounter, elapsed: float, n: int) -> None:
+    per_request = counter.round_trips / n
+    commands = ", ".join(
+        f"{name}={count / n:g}" for name, count in sorted(counter.commands.items())
+    )
+    print(
+        f"{label:<22} {per_request:5.2f} round-trips/request  [{commands}]  {elapsed * 1e6 / n:8.1f}us"
+    )
+
+
+class TestRedisRoundTrips:
+    """Commands per request with and without the per-operation PING."""
+
+    async def test_request_path_round_trips(self):
+        current = _WireCounter()
+        current_elapsed = await _run_requests(_backend("rt_current"), current)
+
+        legacy_backend = _backend("rt_legacy")
+        legacy = _WireCounter()
+        with _ping_per_operation(legacy_backend):
+            legacy_elapsed = await _run_requests(legacy_backend, legacy)
+
+        print("\n" + "=" * 60)
+        print(f"REDIS ROUND-TRIPS PER REQUEST ({REQUESTS} requests, fakeredis)")
+        print("=" * 60)
+        _report("ping per operation", legacy, legacy_elapsed, REQUESTS)
+        _report("current", current, current_elapsed, REQUESTS)
+
+        assert current.commands["PING"] == 0
+        assert current.round_trips == 2 * REQUESTS
+        assert legacy.round_trips == 2 * current.round_trips
+
+    async def test_record_failure_is_one_round_trip(self):
+        backend = _backend("rt_failure")
+        await backend.clear_failures()  # open the connection outside the count
+        counter = _WireCounter()
+        with counter.installed():
+            for i in range(REQUESTS):
+                await backend.record_failure("BenchError", f"failure {i}")
+
+        print(
+            f"\nrecord_failure: {counter.round_trips / REQUESTS:g} round-trips, "
+            f"{sum(counter.commands.values()) / REQUESTS:g} commands per call"
+        )
+        assert counter.round_trips == REQUESTS
+        assert counter.commands == Counter(
+            {
+                "ZADD": REQUESTS,
+                "ZREMRANGEBYSCORE": REQUESTS,
+                "ZREMRANGEBYRANK": REQUESTS,
+                "EXPIRE": REQUESTS,
+            }
+        )
+        assert await backend.get_failure_count() == REQUESTS
+
+    async def test_circuit_check_is_one_round_trip(self):
+        backend = _backend("rt_circuit")
+        for i in range(1000):
+            await backend.record_failure("BenchError", f"failure {i}")
+
+        counter = _WireCounter()
+        with counter.installed():
+            start = time.perf_counter()
+            for _ in range(REQUESTS):
+                assert await backend.is_circuit_broken() is True
+            elapsed = time.perf_counter() - start
+
+        print(
+            f"\nis_circuit_broken (1000 failures logged): "
+            f"{counter.round_trips / REQUESTS:g} round-trips, {elapsed * 1e6 / REQUESTS:.1f}us"
+        )
+        assert counter.round_trips == REQUESTS
+        assert counter.commands == Counter({"EXISTS": REQUESTS, "ZCOUNT": REQUESTS})
@@ -0,0 +1,111 @@
+"""
+SSE Decoder Micro-benchmark
+
+Compares the incremental bytes-level decoder (``venice_ai._sse.SSEDecoder`` +
+the active JSON backend) against the line-oriented path ``_stream_request``
+used before it: decode each line to ``str``, ``strip()`` it twice, slice off
+``data: `` and ``json.loads`` the remainder.
+
+Both paths parse the same synthetic chat-completion stream, delivered in
+network-sized chunks that split lines at arbitrary offsets.
+
+Run with:
+    poetry run pytest tests/profiling/test_sse_decoder_performance.py -v -s
+"""
+
+import json
+import time
+
+import pytest
+
+from venice_ai._sse import JSON_BACKEND, SSEDecoder, json_loads
+
+pytestmark = [pytest.mark.slow, pytest.mark.profiling]
+
+FRAMES = 20_000
+CHUNK_SIZE = 1024
+ROUNDS = 5
+
+
+def _build_body(frames: int) -> bytes:
+    parts = []
+    for i in range(frames):
+        chunk = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "bench-model",
+            "choices": [{"index": 0, "delta": {"content": f"tok{i} "}, "finish_reason": None}],
+        }
+        parts.append(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+    parts.append(b"data: [DONE]\n\n")
+    return b"".join(parts)
+
+
+def _network_chunks(body: bytes, size: int) -> list[bytes]:
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+def _legacy_parse(lines: list[bytes]) -> int:
+    """Mirror of the pre-decoder line path (per-line str churn)."""
+    count = 0
+    for raw_line in lines:
+        line_str = raw_line.decode("utf-8").strip()
+        line_str = line_str.strip()
+        if not line_str or not line_str.startswith("data: "):
+            continue
+        if line_str == "data: [DONE]":
+            continue
+        json.loads(line_str[6:])
+        count += 1
+    return count
+
+
+def _decoder_parse(chunks: list[bytes]) -> int:
+    count = 0
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        for event in decoder.feed(chunk):
+            if event.data != b"[DONE]":
+                json_loads(event.data)
+                count += 1
+    for event in decoder.flush():
+        if event.data != b"[DONE]":
+            json_loads(event.data)
+            count += 1
+    return count
+
+
+def _best_of(fn, arg) -> tuple[float, int]:
+    best = float("inf")
+    result = 0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        result = fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+class TestSSEDecoderThroughput:
+    """Frames-per-second for the legacy line path vs. the incremental decoder."""
+
+    def test_decoder_vs_legacy_line_path(self):
+        body = _build_body(FRAMES)
+        # aiohttp's line iterator hands the legacy path one line per await.
+        lines = body.splitlines(keepends=True)
+        chunks = _network_chunks(body, CHUNK_SIZE)
+
+        legacy_time, legacy_count = _best_of(_legacy_parse, lines)
+        decoder_time, decoder_count = _best_of(_decoder_parse, chunks)
+
+        assert legacy_count == decoder_count == FRAMES
+
+        print("\n" + "=" * 70)
+        print("SSE DECODE THROUGHPUT")
+        print("=" * 70)
+        print(f"Frames:            {FRAMES}  ({len(body) / 1024:.0f} KiB body)")
+        print(f"JSON backend:      {JSON_BACKEND}")
+        print(f"Legacy line path:  {FRAMES / legacy_time:>12,.0f} frames/s")
+        print(f"SSEDecoder path:   {FRAMES / decoder_time:>12,.0f} frames/s")
+        print(f"Speedup:           {legacy_time / decoder_time:>12.2f}x")
+        print("=" * 70)
@@ -19,10 +19,15 @@ It focuses on:
 
 import asyncio
 import time
+from collections import deque
 
 import pytest
 
-from venice_ai.core.backends.memory import MemoryBackend
+from venice_ai.core.backends.memory import (
+    FAILURE_MAX_ENTRIES,
+    FAILURE_RETENTION,
+    MemoryBackend,
+)
 
 
 class TestMemoryBackendInitialization:
@@ -32,7 +37,7 @@ class TestMemoryBackendInitialization:
         """Test initialization with default namespace."""
         backend = MemoryBackend()
         assert backend.namespace == "venice_ai"
-        assert backend._failures == []
+        assert not backend._failures
         assert backend._circuit_broken_until is None
         assert backend._rate_limits == {}
 
@@ -77,7 +82,7 @@ class TestHealthCheck:
     async def test_health_check_with_failures(self):
         """Test health check with recorded failures."""
         backend = MemoryBackend(namespace="test_health_failures")
-        backend._failures = [(time.time(), "error", "test error")]
+        backend._failures = deque([(time.time(), "error", "test error")])
 
         result = await backend.health_check()
 
@@ -131,12 +136,15 @@ class TestGetAllStats:
         backend = MemoryBackend(namespace="test_stats_recent")
         current_time = time.time()
         # Add failures - some within 30s window, some outside
-        backend._failures = [
-            (current_time - 10, "error", "recent 1"),  # Within 30s
-            (current_time - 25, "error", "recent 2"),  # Within 30s
-            (current_time - 35, "error", "old 1"),  # Outside 30s
-            (current_time - 60, "error", "old 2"),  # Outside 30s
-        ]
+        # Oldest first, as record_failure appends
+        backend._failures = deque(
+            [
+                (current_time - 60, "error", "old 2"),  # Outside 30s
+                (current_time - 35, "error", "old 1"),  # Outside 30s
+                (current_time - 25, "error", "recent 2"),  # Within 30s
+                (current_time - 10, "error", "recent 1"),  # Within 30s
+            ]
+        )
 
         result = await backend.get_all_stats()
 
@@ -149,10 +157,12 @@ class TestGetAllStats:
         """Test get_all_stats when all failures are old."""
         backend = MemoryBackend(namespace="test_stats_old")
         current_time = time.time()
-        backend._failures = [
-            (current_time - 60, "error", "old 1"),
-            (current_time - 120, "error", "old 2"),
-        ]
+        backend._failures = deque(
+            [
+                (current_time - 120, "error", "old 2"),
+                (current_time - 60, "error", "old 1"),
+            ]
+        )
 
         result = await backend.get_all_stats()
 
@@ -214,7 +224,7 @@ class TestCleanup:
         backend = MemoryBackend(namespace="test_cleanup")
 
         # Populate all data structures
-        backend._failures = [(time.time(), "error", "test")]
+        backend._failures = deque([(time.time(), "error", "test")])
         backend._rate_limits = {"model1": {"rpm_remaining": 100}}
         backend._request_counts["model1"] = 5
         backend._token_counts["model1"] = 500
@@ -223,7 +233,7 @@ class TestCleanup:
         await backend.cleanup()
 
         # Verify all data cleared (covers lines 94-100)
-        assert backend._failures == []
+        assert not backend._failures
         assert backend._rate_limits == {}
         assert dict(backend._request_counts) == {}
         assert dict(backend._token_counts) == {}
@@ -237,7 +247,7 @@ class TestCleanup:
         # Should not raise on empty backend
         await backend.cleanup()
 
-        assert backend._failures == []
+        assert not backend._failures
         assert backend._rate_limits == {}
 
 
@@ -452,6 +462,74 @@ class TestRecordRequest:
         assert backend._token_counts["test_model"] == 0
 
 
+class TestStreamingReservations:
+    """Test reserve_streaming / release_streaming_reservation refund accounting."""
+
+    HEADERS = {
+        "x-ratelimit-limit-tokens": "1000",
+        "x-ratelimit-remaining-tokens": "1000",
+        "x-ratelimit-reset-tokens": "60",
+    }
+
+    @pytest.mark.asyncio
+    async def test_release_refunds_unused_tokens_once(self):
+        """Test the unused part of a reservation is refunded exactly once."""
+        backend = MemoryBackend(namespace="test_stream_refund")
+        await backend.update_rate_limits("test_model", self.HEADERS)
+
+        assert await backend.reserve_streaming("test_model", "r1", 400) == (True, 0.0)
+        assert backend._rate_limits["test_model"]["tpm_remaining"] == 600
+        assert backend._token_counts["test_model"] == 400
+
+        assert await backend.release_streaming_reservation("test_model", "r1", 400, 150) is True
+        assert backend._rate_limits["test_model"]["tpm_remaining"] == 850
+        assert backend._token_counts["test_model"] == 150
+
+        assert await backend.release_streaming_reservation("test_model", "r1", 400, 150) is False
+        assert backend._rate_limits["test_model"]["tpm_remaining"] == 850
+
+    @pytest.mark.asyncio
+    async def test_refund_capped_at_limit(self):
+        """Test a refund never lifts tpm_remaining above the limit."""
+        backend = MemoryBackend(namespace="test_stream_cap")
+        await backend.update_rate_limits("test_model", self.HEADERS)
+        await backend.reserve_streaming("test_model", "r1", 400)
+        await backend.update_rate_limits("test_model", self.HEADERS)  # server reset
+
+        assert await backend.release_streaming_reservation("test_model", "r1", 400, 0) is True
+        assert backend._rate_limits["test_model"]["tpm_remaining"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_expired_reservation_not_refunded(self):
+        """Test a reservation past its TTL is dropped without a refund."""
+        backend = MemoryBackend(namespace="test_stream_ttl")
+        await backend.update_rate_limits("test_model", self.HEADERS)
+        await backend.reserve_streaming("test_model", "r1", 400, ttl=0.01)
+        await asyncio.sleep(0.02)
+
+        assert await backend.release_streaming_reservation("test_model", "r1", 400, 0) is False
+        assert backend._rate_limits["test_model"]["tpm_remaining"] == 600
+
+    @pytest.mark.asyncio
+    async def test_reserve_streaming_blocked_by_capacity(self):
+        """Test nothing is reserved while the request budget is exhausted."""
+        backend = MemoryBackend(namespace="test_stream_blocked")
+        await backend.update_rate_limits(
+            "test_model",
+            {
+                "x-ratelimit-limit-requests": "100",
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-reset-requests": "60",
+            },
+        )
+
+        allowed, wait = await backend.reserve_streaming("test_model", "r1", 400)
+
+        assert allowed is False
+        assert wait > 0
+        assert backend._reservations == {}
+
+
 class TestRecordFailure:
     """Test record_failure method (lines 168-170)."""
 
@@ -492,6 +570,30 @@ class TestRecordFailure:
 
         assert len(backend._failures) == 3
 
+    @pytest.mark.asyncio
+    async def test_record_failure_prunes_expired(self):
+        """Test record_failure drops entries older than the retention period."""
+        backend = MemoryBackend(namespace="test_failure_prune")
+        current_time = time.time()
+        backend._failures.append((current_time - FAILURE_RETENTION - 1, "error", "expired"))
+        backend._failures.append((current_time - 10, "error", "kept"))
+
+        await backend.record_failure("error", "new")
+
+        assert [message for _, _, message in backend._failures] == ["kept", "new"]
+
+    @pytest.mark.asyncio
+    async def test_record_failure_ring_is_bounded(self):
+        """Test the failure ring keeps only the newest FAILURE_MAX_ENTRIES."""
+        backend = MemoryBackend(namespace="test_failure_ring")
+
+        for i in range(FAILURE_MAX_ENTRIES + 5):
+            await backend.record_failure("error", str(i))
+
+        assert len(backend._failures) == FAILURE_MAX_ENTRIES
+        assert backend._failures[0][2] == "5"
+        assert await backend.get_failure_count() == FAILURE_MAX_ENTRIES
+
 
 class TestGetFailureCount:
     """Test get_failure_count method (lines 182-184)."""
@@ -510,11 +612,13 @@ class TestGetFailureCount:
         """Test get_failure_count when all failures in window (lines 182-184)."""
         backend = MemoryBackend(namespace="test_count_all")
         current_time = time.time()
-        backend._failures = [
-            (current_time - 5, "error", "msg1"),
-            (current_time - 10, "error", "msg2"),
-            (current_time - 15, "error", "msg3"),
-        ]
+        backend._failures = deque(
+            [
+                (current_time - 15, "error", "msg3"),
+                (current_time - 10, "error", "msg2"),
+                (current_time - 5, "error", "msg1"),
+            ]
+        )
 
         count = await backend.get_failure_count(window_seconds=30)
 
@@ -526,12 +630,14 @@ class TestGetFailureCount:
         """Test get_failure_count with mixed ages."""
         backend = MemoryBackend(namespace="test_count_mixed")
         current_time = time.time()
-        backend._failures = [
-            (current_time - 10, "error", "recent"),  # In 30s window
-            (current_time - 25, "error", "recent"),  # In 30s window
-            (current_time - 40, "error", "old"),  # Outside 30s window
-            (current_time - 60, "error", "old"),  # Outside 30s window
-        ]
+        backend._failures = deque(
+            [
+                (current_time - 60, "error", "old"),  # Outside 30s window
+                (current_time - 40, "error", "old"),  # Outside 30s window
+                (current_time - 25, "error", "recent"),  # In 30s window
+                (current_time - 10, "error", "recent"),  # In 30s window
+            ]
+        )
 
         count = await backend.get_failure_count(window_seconds=30)
 
@@ -542,11 +648,13 @@ class TestGetFailureCount:
         """Test get_failure_count with custom window."""
         backend = MemoryBackend(namespace="test_count_custom")
         current_time = time.time()
-        backend._failures = [
-            (current_time - 5, "error", "msg1"),
-            (current_time - 15, "error", "msg2"),
-            (current_time - 25, "error", "msg3"),
-        ]
+        backend._failures = deque(
+            [
+                (current_time - 25, "error", "msg3"),
+                (current_time - 15, "error", "msg2"),
+                (current_time - 5, "error", "msg1"),
+            ]
+        )
 
         # 10 second window should only include first failure
         count = await backend.get_failure_count(window_seconds=10)
@@ -558,10 +666,12 @@ class TestGetFailureCount:
         """Test get_failure_count when all failures outside window."""
         backend = MemoryBackend(namespace="test_count_none")
         current_time = time.time()
-        backend._failures = [
-            (current_time - 60, "error", "old"),
-            (current_time - 120, "error", "older"),
-        ]
+        backend._failures = deque(
+            [
+                (current_time - 120, "error", "older"),
+                (current_time - 60, "error", "old"),
+            ]
+        )
 
         count = await backend.get_failure_count(window_seconds=30)
 
@@ -627,15 +737,17 @@ class TestClearFailures:
     async def test_clear_failures_basic(self):
         """Test clear_failures removes all failures (lines 204-206)."""
         backend = MemoryBackend(namespace="test_clear")
-        backend._failures = [
-            (time.time(), "error1", "msg1"),
-            (time.time(), "error2", "msg2"),
-        ]
+        backend._failures = deque(
+            [
+                (time.time(), "error1", "msg1"),
+                (time.time(), "error2", "msg2"),
+            ]
+        )
 
         await backend.clear_failures()
 
         # Verify cleared (covers lines 204-206)
-        assert backend._failures == []
+        assert not backend._failures
 
     @pytest.mark.asyncio
     async def test_clear_failures_empty(self):
@@ -645,7 +757,7 @@ class TestClearFailures:
         # Should not raise
         await backend.clear_failures()
 
-        assert backend._failures == []
+        assert not backend._failures
 
 
 class TestForceCircuitBreak:
@@ -5,7 +5,7 @@ This test module focuses on achieving >80% test coverage by testing
 error handling paths, connection pool management, and edge cases.
 """
 
-import json
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -84,39 +84,64 @@ class TestRedisBackendConnectionPoolManagement:
                 mock_redis_module.from_url.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_ensure_connected_ping_failure_reconnect(self):
-        """Test _ensure_connected handles ping failure and reconnects."""
+    async def test_ensure_connected_returns_cached_client_without_ping(self):
+        """Test _ensure_connected does not PING an already-connected client."""
         backend = RedisBackend(redis_url="redis://localhost:6379", namespace="test_namespace")
 
-        # Set up existing connection that will fail ping
         mock_existing_redis = AsyncMock()
-        mock_existing_redis.ping = AsyncMock(side_effect=ConnectionError("Connection lost"))
         backend._redis = mock_existing_redis
         backend._connected = True
-        backend._event_loop_id = 12345
+        backend._event_loop_id = id(asyncio.get_running_loop())
 
-        with patch("asyncio.get_running_loop") as mock_get_loop:
-            mock_loop = MagicMock()
-            mock_get_loop.return_value = mock_loop
+        assert await backend._ensure_connected() is mock_existing_redis
+        mock_existing_redis.ping.assert_not_called()
 
-            with (
-                patch("builtins.id", return_value=12345),  # Same loop ID
-                patch("venice_ai.core.backends.redis.Redis") as mock_redis_class,
-                patch("venice_ai.core.backends.redis.ConnectionPool") as mock_pool_class,
-            ):
-                # Setup new connection mocks
-                mock_pool = MagicMock()
-                mock_pool_class.from_url.return_value = mock_pool
+    @pytest.mark.asyncio
+    async def test_execute_reconnects_owned_client_on_connection_error(self):
+        """Test _execute rebuilds an owned client and retries once after ConnectionError."""
+        backend = RedisBackend(redis_url="redis://localhost:6379", namespace="test_namespace")
 
-                mock_new_redis = AsyncMock()
-                mock_new_redis.ping = AsyncMock(return_value=True)
-                mock_new_redis.script_load = AsyncMock(return_value="test_sha")
-                mock_redis_class.return_value = mock_new_redis
+        mock_existing_redis = AsyncMock()
+        mock_existing_redis.get = AsyncMock(side_effect=ConnectionError("Connection lost"))
+        backend._redis = mock_existing_redis
+        backend._connected = True
+        backend._event_loop_id = id(asyncio.get_running_loop())
 
-                # This should trigger reconnection logic (lines 163-166)
-                await backend._ensure_connected()
-                assert backend._redis == mock_new_redis
-                assert backend._connected is True
+        with (
+            patch("venice_ai.core.backends.redis.Redis") as mock_redis_class,
+            patch("venice_ai.core.backends.redis.ConnectionPool") as mock_pool_class,
+            patch.object(backend, "_register_loop_cleanup"),
+        ):
+            mock_pool_class.from_url.return_value = MagicMock()
+            mock_new_redis = AsyncMock()
+            mock_new_redis.ping = AsyncMock(return_value=True)
+            mock_new_redis.get = AsyncMock(return_value="value")
+            mock_redis_class.return_value = mock_new_redis
+
+            result = await backend._execute(lambda c: c.get("key"))
+
+        assert result == "value"
+        assert backend._redis is mock_new_redis
+        assert backend._connected is True
+        mock_new_redis.ping.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_retries_external_client_once(self):
+        """Test _execute retries a caller-supplied client in place, then propagates."""
+        mock_client = AsyncMock()
+        backend = RedisBackend(redis_client=mock_client, namespace="test_namespace")
+        backend._connected = True
+        backend._event_loop_id = id(asyncio.get_running_loop())
+
+        mock_client.get = AsyncMock(side_effect=[ConnectionError("Connection lost"), "value"])
+        assert await backend._execute(lambda c: c.get("key")) == "value"
+        assert backend._redis is mock_client
+
+        mock_client.get = AsyncMock(side_effect=ConnectionError("Connection lost"))
+        with pytest.raises(ConnectionError):
+            await backend._execute(lambda c: c.get("key"))
+        assert mock_client.get.await_count == 2
+        mock_client.ping.assert_not_called()
 
 
 class TestRedisBackendFailureManagement:
@@ -133,13 +158,33 @@ class TestRedisBackendFailureManagement:
         )
         backend._redis = mock_client
         backend._connected = True
+        mock_client.pipeline = MagicMock(return_value=MagicMock(execute=AsyncMock()))
         return backend, mock_client
 
+    @pytest.mark.asyncio
+    async def test_record_failure_pipelines_commands(self, redis_backend_with_mock):
+        """Test record_failure sends ZADD and both prunes in one pipeline round-trip."""
+        backend, mock_client = redis_backend_with_mock
+        pipe = mock_client.pipeline.return_value
+        key = "venice:test_namespace:failures:window"
+
+        with patch("venice_ai.core.backends.redis.time.time", return_value=5000.0):
+            await backend.record_failure("TestError", "Test message")
+
+        mock_client.pipeline.assert_called_once_with(transaction=False)
+        pipe.zadd.assert_called_once()
+        assert list(pipe.zadd.call_args.args[1].values()) == [5000.0]
+        pipe.zremrangebyscore.assert_called_once_with(key, "-inf", 5000.0 - 3600)
+        pipe.zremrangebyrank.assert_called_once_with(key, 0, -1001)
+        pipe.expire.assert_called_once_with(key, 3600)
+        pipe.execute.assert_awaited_once()
+        mock_client.zadd.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_record_failure_connection_error(self, redis_backend_with_mock):
         """Test record_failure handles ConnectionError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.lpush.side_effect = ConnectionError("Connection lost")
+        mock_client.pipeline.return_value.execute.side_effect = ConnectionError("Connection lost")
 
         # This should cover lines 561-562
         await backend.record_failure("TestError", "Test message")
@@ -149,7 +194,9 @@ class TestRedisBackendFailureManagement:
     async def test_record_failure_response_error(self, redis_backend_with_mock):
         """Test record_failure handles ResponseError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.lpush.side_effect = ResponseError("Redis response error")
+        mock_client.pipeline.return_value.execute.side_effect = ResponseError(
+            "Redis response error"
+        )
 
         # This should cover lines 563-564
         await backend.record_failure("TestError", "Test message")
@@ -159,7 +206,7 @@ class TestRedisBackendFailureManagement:
     async def test_record_failure_redis_error(self, redis_backend_with_mock):
         """Test record_failure handles RedisError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.lpush.side_effect = RedisError("Redis internal error")
+        mock_client.pipeline.return_value.execute.side_effect = RedisError("Redis internal error")
 
         # This should cover lines 565-566
         await backend.record_failure("TestError", "Test message")
@@ -169,7 +216,7 @@ class TestRedisBackendFailureManagement:
     async def test_get_failure_count_connection_error(self, redis_backend_with_mock):
         """Test get_failure_count handles ConnectionError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.lrange.side_effect = ConnectionError("Connection lost")
+        mock_client.zcount.side_effect = ConnectionError("Connection lost")
 
         # This should cover lines 590-592
         count = await backend.get_failure_count()
@@ -179,7 +226,7 @@ class TestRedisBackendFailureManagement:
     async def test_get_failure_count_response_error(self, redis_backend_with_mock):
         """Test get_failure_count handles ResponseError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.lrange.side_effect = ResponseError("Redis response error")
+        mock_client.zcount.side_effect = ResponseError("Redis response error")
 
         # This should cover lines 593-595
         count = await backend.get_failure_count()
@@ -189,7 +236,7 @@ class TestRedisBackendFailureManagement:
     async def test_get_failure_count_redis_error(self, redis_backend_with_mock):
         """Test get_failure_count handles RedisError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.lrange.side_effect = RedisError("Redis internal error")
+        mock_client.zcount.side_effect = RedisError("Redis internal error")
 
         # This should cover lines 596-598
         count = await backend.get_failure_count()
@@ -464,7 +511,7 @@ class TestRedisBackendRateLimitErrorHandling:
     async def test_update_rate_limits_connection_error(self, redis_backend_with_mock):
         """Test update_rate_limits handles ConnectionError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.setex.side_effect = ConnectionError("Connection lost")
+        mock_client.evalsha.side_effect = ConnectionError("Connection lost")
 
         # This should cover lines 621-625
         await backend.update_rate_limits("test_model", {"x-ratelimit-remaining-requests": "100"})
@@ -474,7 +521,7 @@ class TestRedisBackendRateLimitErrorHandling:
     async def test_update_rate_limits_response_error(self, redis_backend_with_mock):
         """Test update_rate_limits handles ResponseError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.setex.side_effect = ResponseError("Redis response error")
+        mock_client.evalsha.side_effect = ResponseError("Redis response error")
 
         # This should cover lines 625-627
         await backend.update_rate_limits("test_model", {"x-ratelimit-remaining-requests": "100"})
@@ -484,7 +531,7 @@ class TestRedisBackendRateLimitErrorHandling:
     async def test_update_rate_limits_redis_error(self, redis_backend_with_mock):
         """Test update_rate_limits handles RedisError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.setex.side_effect = RedisError("Redis internal error")
+        mock_client.evalsha.side_effect = RedisError("Redis internal error")
 
         # This should cover lines 627-628
         await backend.update_rate_limits("test_model", {"x-ratelimit-remaining-requests": "100"})
@@ -494,7 +541,7 @@ class TestRedisBackendRateLimitErrorHandling:
     async def test_get_rate_limits_connection_error(self, redis_backend_with_mock):
         """Test _get_rate_limits handles ConnectionError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.get.side_effect = ConnectionError("Connection lost")
+        mock_client.hgetall.side_effect = ConnectionError("Connection lost")
 
         # Test internal _get_rate_limits method
         result = await backend._get_rate_limits("test_model")
@@ -504,7 +551,7 @@ class TestRedisBackendRateLimitErrorHandling:
     async def test_get_rate_limits_response_error(self, redis_backend_with_mock):
         """Test _get_rate_limits handles ResponseError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.get.side_effect = ResponseError("Redis response error")
+        mock_client.hgetall.side_effect = ResponseError("Redis response error")
 
         # Test internal _get_rate_limits method
         result = await backend._get_rate_limits("test_model")
@@ -514,7 +561,7 @@ class TestRedisBackendRateLimitErrorHandling:
     async def test_get_rate_limits_redis_error(self, redis_backend_with_mock):
         """Test _get_rate_limits handles RedisError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.get.side_effect = RedisError("Redis internal error")
+        mock_client.hgetall.side_effect = RedisError("Redis internal error")
 
         # Test internal _get_rate_limits method
         result = await backend._get_rate_limits("test_model")
@@ -524,8 +571,7 @@ class TestRedisBackendRateLimitErrorHandling:
     async def test_record_request_connection_error(self, redis_backend_with_mock):
         """Test record_request handles ConnectionError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.get.return_value = json.dumps({"rpm_remaining": 100, "tpm_remaining": 10000})
-        mock_client.setex.side_effect = ConnectionError("Connection lost")
+        mock_client.evalsha.side_effect = ConnectionError("Connection lost")
 
         await backend.record_request("test_model", tokens_used=100)
         # Should not raise exception
@@ -534,8 +580,7 @@ class TestRedisBackendRateLimitErrorHandling:
     async def test_record_request_response_error(self, redis_backend_with_mock):
         """Test record_request handles ResponseError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.get.return_value = json.dumps({"rpm_remaining": 100, "tpm_remaining": 10000})
-        mock_client.setex.side_effect = ResponseError("Redis response error")
+        mock_client.evalsha.side_effect = ResponseError("Redis response error")
 
         await backend.record_request("test_model", tokens_used=100)
         # Should not raise exception
@@ -544,8 +589,7 @@ class TestRedisBackendRateLimitErrorHandling:
     async def test_record_request_redis_error(self, redis_backend_with_mock):
         """Test record_request handles RedisError."""
         backend, mock_client = redis_backend_with_mock
-        mock_client.get.return_value = json.dumps({"rpm_remaining": 100, "tpm_remaining": 10000})
-        mock_client.setex.side_effect = RedisError("Redis internal error")
+        mock_client.evalsha.side_effect = RedisError("Redis internal error")
 
         await backend.record_request("test_model", tokens_used=100)
         # Should not raise exception
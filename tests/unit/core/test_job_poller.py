@@ -0,0 +1,195 @@
+"""Unit tests for the shared job poller."""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from venice_ai._client import VeniceClient
+from venice_ai.core.job_poller import JobPoller, _Job
+from venice_ai.exceptions import RateLimitError
+
+
+def _fast_poller(**kwargs) -> JobPoller:
+    options = {"max_polls_per_second": 1000.0, "min_interval": 0.001, "max_interval": 0.01}
+    options.update(kwargs)
+    return JobPoller(**options)
+
+
+def _job_from(statuses):
+    """Poll function returning ``statuses`` in order, plus a call counter."""
+    it = iter(statuses)
+    calls = 0
+
+    async def poll():
+        nonlocal calls
+        calls += 1
+        value = next(it)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    return poll, lambda: calls
+
+
+class TestWait:
+    @pytest.mark.asyncio
+    async def test_resolves_many_jobs_from_one_driver(self):
+        poller = _fast_poller()
+        jobs = [_job_from(["run", "run", "done"]) for _ in range(20)]
+
+        results = await asyncio.gather(
+            *(
+                poller.wait(poll, is_terminal=lambda s: s == "done", interval=0.001)
+                for poll, _ in jobs
+            )
+        )
+
+        assert results == ["done"] * 20
+        assert poller.stats.jobs == 20
+        assert poller.stats.polls == 60
+        assert poller.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_max_polls_returns_last_status(self):
+        poller = _fast_poller()
+        poll, calls = _job_from(["run"] * 10)
+
+        status = await poller.wait(poll, is_terminal=lambda s: False, interval=0.001, max_polls=3)
+
+        assert status == "run"
+        assert calls() == 3
+
+    @pytest.mark.asyncio
+    async def test_on_status_sees_non_terminal_statuses(self):
+        poller = _fast_poller()
+        poll, _ = _job_from(["a", "b", "done"])
+        seen: list[str] = []
+
+        await poller.wait(
+            poll, is_terminal=lambda s: s == "done", on_status=seen.append, interval=0.001
+        )
+
+        assert seen == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_poll_error_reaches_waiter(self):
+        poller = _fast_poller()
+        poll, _ = _job_from(["run", ValueError("boom")])
+
+        with pytest.raises(ValueError, match="boom"):
+            await poller.wait(poll, is_terminal=lambda s: False, interval=0.001)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_delays_instead_of_failing(self):
+        poller = _fast_poller()
+        error = RateLimitError("slow down", response=Mock(status=429, headers={}))
+        error.retry_after_seconds = 0
+        poll, calls = _job_from([error, "run", "done"])
+
+        status = await poller.wait(poll, is_terminal=lambda s: s == "done", interval=0.001)
+
+        assert status == "done"
+        assert calls() == 3
+        assert poller.stats.rate_limited == 1
+
+    @pytest.mark.asyncio
+    async def test_polls_are_rate_capped(self):
+        poller = _fast_poller(max_polls_per_second=50.0)
+        jobs = [_job_from(["done"]) for _ in range(10)]
+
+        started = time.monotonic()
+        await asyncio.gather(*(poller.wait(poll, is_terminal=lambda s: True) for poll, _ in jobs))
+
+        # 10 polls spaced 20ms apart
+        assert time.monotonic() - started >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_disturb_others(self):
+        poller = _fast_poller()
+        slow, _ = _job_from(["run"] * 1000)
+        fast, _ = _job_from(["run", "done"])
+
+        slow_wait = asyncio.ensure_future(
+            poller.wait(slow, is_terminal=lambda s: False, interval=0.001, max_polls=1000)
+        )
+        await asyncio.sleep(0.01)
+        slow_wait.cancel()
+
+        assert await poller.wait(fast, is_terminal=lambda s: s == "done", interval=0.001) == "done"
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_outstanding_waits(self):
+        poller = _fast_poller()
+        poll, _ = _job_from(["run"] * 1000)
+        waiter = asyncio.ensure_future(
+            poller.wait(poll, is_terminal=lambda s: False, interval=0.05, max_polls=1000)
+        )
+        await asyncio.sleep(0.01)
+
+        await poller.close()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+
+class TestAdaptiveInterval:
+    def _job(self, remaining):
+        loop = asyncio.new_event_loop()
+        try:
+            return _Job(
+                poll=None,  # type: ignore[arg-type]
+                is_terminal=lambda s: False,
+                remaining=remaining,
+                on_status=None,
+                interval=5.0,
+                max_polls=10,
+                future=loop.create_future(),
+            )
+        finally:
+            loop.close()
+
+    def test_without_eta_uses_job_interval(self):
+        poller = JobPoller()
+        assert poller._next_delay(self._job(None), "s") == 5.0
+        assert poller._next_delay(self._job(lambda s: None), "s") == 5.0
+
+    def test_eta_fraction_clamped(self):
+        poller = JobPoller(min_interval=1.0, max_interval=30.0, eta_fraction=0.5)
+        assert poller._next_delay(self._job(lambda s: 600.0), "s") == 30.0
+        assert poller._next_delay(self._job(lambda s: 10.0), "s") == 5.0
+        assert poller._next_delay(self._job(lambda s: 0.5), "s") == 1.0
+
+    def test_overdue_backs_off(self):
+        poller = JobPoller(min_interval=1.0, max_interval=8.0)
+        job = self._job(lambda s: 0.0)
+        assert [poller._next_delay(job, "s") for _ in range(5)] == [1.0, 2.0, 4.0, 8.0, 8.0]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            JobPoller(max_polls_per_second=0)
+        with pytest.raises(ValueError):
+            JobPoller(min_interval=10.0, max_interval=1.0)
+
+
+class TestClientWiring:
+    def test_default_poller_created_lazily(self):
+        client = VeniceClient(api_key="test")
+        assert isinstance(client.job_poller, JobPoller)
+        assert client.job_poller is client.job_poller
+
+    @pytest.mark.asyncio
+    async def test_supplied_poller_left_open_on_close(self):
+        poller = _fast_poller()
+        poll, _ = _job_from(["run"] * 1000)
+        client = VeniceClient(api_key="test", job_poller=poller)
+        waiter = asyncio.ensure_future(
+            poller.wait(poll, is_terminal=lambda s: False, interval=0.05, max_polls=1000)
+        )
+        await asyncio.sleep(0.01)
+
+        await client.close()
+
+        assert not waiter.done()
+        await poller.close()
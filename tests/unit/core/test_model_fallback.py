@@ -0,0 +1,208 @@
+"""Unit tests for client-side model fallback chains."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from venice_ai._client import VeniceClient
+from venice_ai.core.config import VeniceAIConfig
+from venice_ai.core.model_fallback import ModelFallback
+from venice_ai.exceptions import RateLimitError, ServiceUnavailableError
+from venice_ai.rate_limiting import SimpleRateLimiter
+
+
+def _error(cls, status):
+    return cls("unavailable", response=Mock(status=status), body=None)
+
+
+class _Recorder:
+    """``send`` callable that fails for the given models."""
+
+    def __init__(self, failing=()):
+        self.failing = dict(failing)
+        self.models = []
+
+    async def __call__(self, model):
+        self.models.append(model)
+        if model in self.failing:
+            raise self.failing[model]
+        return f"response from {model}"
+
+
+class _Selector:
+    def __init__(self, models):
+        self.models = models
+        self.get_model_info = AsyncMock(side_effect=lambda m: self.models.get(m))
+
+    async def get_available_models(self, resource_type=None):
+        return [m for m, info in self.models.items() if info["type"] == resource_type]
+
+
+def _info(kind, **capabilities):
+    return {"type": kind, "model_spec": {"capabilities": capabilities}}
+
+
+class TestChain:
+    def test_follows_map_and_stops_at_cycles(self):
+        fallback = ModelFallback({"a": "b", "b": "c", "c": "a"})
+
+        assert fallback.chain("a") == ["b", "c"]
+        assert fallback.chain("c") == ["a", "b"]
+        assert fallback.chain("z") == []
+
+    def test_max_fallbacks_bounds_chain(self):
+        fallback = ModelFallback({"a": "b", "b": "c", "c": "d"}, max_fallbacks=2)
+
+        assert fallback.chain("a") == ["b", "c"]
+
+
+class TestSend:
+    @pytest.mark.asyncio
+    async def test_model_without_fallback_is_sent_as_is(self):
+        fallback = ModelFallback({"a": "b"})
+        send = _Recorder()
+
+        assert await fallback.send("z", send) == "response from z"
+        assert fallback.stats.requests == 0
+
+    @pytest.mark.asyncio
+    async def test_backing_off_model_is_rerouted_before_sending(self):
+        limiter = SimpleRateLimiter(min_backoff=30.0)
+        await limiter.record_failure("a")
+        fallback = ModelFallback({"a": "b"})
+        send = _Recorder()
+
+        assert await fallback.send("a", send, rate_limiter=limiter) == "response from b"
+        assert send.models == ["b"]
+        assert fallback.stats.preemptive == 1
+        assert fallback.stats.routes == {("a", "b"): 1}
+
+    @pytest.mark.asyncio
+    async def test_short_wait_is_left_to_the_limiter(self):
+        limiter = Mock()
+        limiter.acquire = AsyncMock(return_value=(False, 0.2))
+        fallback = ModelFallback({"a": "b"})
+        send = _Recorder()
+
+        await fallback.send("a", send, rate_limiter=limiter)
+
+        assert send.models == ["a"]
+        assert fallback.stats.rerouted == 0
+
+    @pytest.mark.asyncio
+    async def test_backend_capacity_vets_fallbacks(self):
+        limiter = Mock()
+        limiter.acquire = AsyncMock(side_effect=lambda m: (m != "a", 10.0))
+        backend = Mock()
+        backend.check_capacity = AsyncMock(
+            side_effect=lambda m: (False, 10.0) if m == "b" else (True, 0.0)
+        )
+        fallback = ModelFallback({"a": "b", "b": "c"})
+        send = _Recorder()
+
+        await fallback.send("a", send, rate_limiter=limiter, backend=backend)
+
+        assert send.models == ["c"]
+        assert [c.args[0] for c in backend.check_capacity.await_args_list] == ["b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_backend_not_asked_when_primary_can_proceed(self):
+        backend = Mock()
+        backend.check_capacity = AsyncMock(return_value=(False, 10.0))
+        fallback = ModelFallback({"a": "b"})
+        send = _Recorder()
+
+        await fallback.send("a", send, rate_limiter=SimpleRateLimiter(), backend=backend)
+
+        assert send.models == ["a"]
+        backend.check_capacity.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_errors_walk_the_chain(self):
+        fallback = ModelFallback({"a": "b", "b": "c"})
+        send = _Recorder(
+            {"a": _error(RateLimitError, 429), "b": _error(ServiceUnavailableError, 503)}
+        )
+
+        assert await fallback.send("a", send) == "response from c"
+        assert send.models == ["a", "b", "c"]
+        assert fallback.stats.on_error == 2
+        assert fallback.stats.routes == {("a", "c"): 1}
+
+    @pytest.mark.asyncio
+    async def test_last_error_raised_when_chain_is_exhausted(self):
+        fallback = ModelFallback({"a": "b"})
+        send = _Recorder({"a": _error(RateLimitError, 429), "b": _error(RateLimitError, 429)})
+
+        with pytest.raises(RateLimitError):
+            await fallback.send("a", send)
+        assert fallback.stats.exhausted == 1
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_rerouted(self):
+        fallback = ModelFallback({"a": "b"})
+        send = _Recorder({"a": ValueError("bad request")})
+
+        with pytest.raises(ValueError):
+            await fallback.send("a", send)
+        assert send.models == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_equivalents_extend_the_chain(self):
+        selector = _Selector(
+            {
+                "a": _info("text", supportsVision=True),
+                "plain": _info("text"),
+                "vision": _info("text", supportsVision=True, supportsReasoning=True),
+                "image": _info("image", supportsVision=True),
+            }
+        )
+        fallback = ModelFallback({}, equivalents=True, selector=selector)
+        send = _Recorder({"a": _error(RateLimitError, 429)})
+
+        assert await fallback.send("a", send) == "response from vision"
+        assert fallback.stats.routes == {("a", "vision"): 1}
+
+
+class TestClientWiring:
+    def test_fallbacks_default_to_scheduler_config(self):
+        config = VeniceAIConfig.create_minimal_config(api_key="test")
+        config.scheduler.model_fallbacks = {"a": "b"}
+
+        client = VeniceClient(api_key="test", config=config)
+
+        assert client.model_fallback_stats is not None
+        assert client._model_fallback.fallbacks == {"a": "b"}
+        assert VeniceClient(api_key="test").model_fallback_stats is None
+
+    @pytest.mark.asyncio
+    async def test_request_body_model_is_swapped(self):
+        client = VeniceClient(api_key="test", model_fallbacks={"a": "b"})
+        sent = []
+
+        async def fake_send(method, path, *, json_data=None, **kwargs):
+            sent.append(json_data)
+            if json_data["model"] == "a":
+                raise _error(ServiceUnavailableError, 503)
+            return "ok"
+
+        body = {"model": "a", "input": "hi"}
+        with patch.object(client, "_send_request", side_effect=fake_send):
+            assert (
+                await client._prepare_and_send_request("POST", "embeddings", json_data=body) == "ok"
+            )
+
+        assert sent == [body, {"model": "b", "input": "hi"}]
+        assert body["model"] == "a"
+        assert client.model_fallback_stats.routes == {("a", "b"): 1}
+
+    @pytest.mark.asyncio
+    async def test_list_body_is_sent_unchanged(self):
+        client = VeniceClient(api_key="test", model_fallbacks={"a": "b"})
+        body = [{"jsonrpc": "2.0", "id": 0, "method": "eth_blockNumber"}]
+
+        with patch.object(client, "_send_request", AsyncMock(return_value="ok")) as send:
+            assert await client._prepare_and_send_request("POST", "crypto/rpc", json_data=body)
+
+        assert send.call_args.kwargs["json_data"] is body
+        assert client.model_fallback_stats.requests == 0
@@ -0,0 +1,197 @@
+"""Unit tests for the retry budget shared by the retry middleware and rate limiter."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from aiohttp import ClientResponse
+
+from venice_ai._client import VeniceClient
+from venice_ai.core.retry_budget import (
+    RetryBudget,
+    RetryScope,
+    current_retry_scope,
+    retry_scope,
+)
+from venice_ai.exceptions import RateLimitError
+from venice_ai.middleware.retry import RetryOptions, create_retry_middleware
+from venice_ai.rate_limiting import SimpleRateLimiter
+
+
+def _response(status: int) -> Mock:
+    response = Mock(spec=ClientResponse)
+    response.status = status
+    response.headers = {}
+    return response
+
+
+def _request() -> Mock:
+    request = Mock()
+    request.method = "GET"
+    request.url = "http://example.com/api"
+    return request
+
+
+class TestRetryBudget:
+    def test_burst_then_denied(self):
+        budget = RetryBudget(burst=3, min_retries_per_second=0)
+        assert [budget.try_acquire("m") for _ in range(4)] == [True, True, True, False]
+        assert budget.stats.retries == 3
+        assert budget.stats.denied_budget == 1
+
+    def test_requests_deposit_ratio(self):
+        budget = RetryBudget(ratio=0.5, burst=2, min_retries_per_second=0)
+        budget.try_acquire("m")
+        budget.try_acquire("m")
+        assert budget.try_acquire("m") is False
+
+        budget.record_request("m")
+        assert budget.try_acquire("m") is False
+        budget.record_request("m")
+        assert budget.try_acquire("m") is True
+
+    def test_global_bucket_caps_all_models(self):
+        budget = RetryBudget(burst=2, min_retries_per_second=0)
+        assert budget.try_acquire("a") is True
+        assert budget.try_acquire("b") is True
+        assert budget.try_acquire("c") is False
+        assert budget.available("c") == 0
+
+    def test_time_refill(self):
+        budget = RetryBudget(burst=1, min_retries_per_second=10)
+        with patch("venice_ai.core.retry_budget.time.monotonic", return_value=100.0):
+            assert budget.try_acquire("m") is True
+            assert budget.try_acquire("m") is False
+        with patch("venice_ai.core.retry_budget.time.monotonic", return_value=100.2):
+            assert budget.try_acquire("m") is True
+
+    def test_oldest_model_bucket_evicted(self):
+        budget = RetryBudget(max_keys=3)
+        for key in ("a", "b", "c"):
+            budget.record_request(key)
+        assert set(budget._buckets) == {"*", "b", "c"}
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            RetryBudget(ratio=-1)
+        with pytest.raises(ValueError):
+            RetryBudget(burst=0)
+
+
+class TestRetryScope:
+    def test_deadline_refuses_retry_that_cannot_finish(self):
+        budget = RetryBudget()
+        scope = RetryScope(budget, "m", deadline=time.monotonic() + 1.0)
+
+        assert scope.allow_retry(0.2, attempt_time=0.5) is True
+        assert scope.allow_retry(0.6, attempt_time=0.5) is False
+        assert budget.stats.denied_deadline == 1
+        assert scope.retries == 1
+
+    def test_context_manager_sets_and_resets(self):
+        budget = RetryBudget()
+        assert current_retry_scope() is None
+        with retry_scope(budget, "m", timeout=5.0, rate_limited=True) as scope:
+            assert current_retry_scope() is scope
+            assert scope.rate_limited is True
+            assert scope.deadline is not None
+        assert current_retry_scope() is None
+        assert budget.stats.requests == 1
+
+
+class TestMiddlewareUsesScope:
+    @pytest.mark.asyncio
+    async def test_empty_budget_stops_status_retries(self):
+        middleware = create_retry_middleware(
+            RetryOptions(max_attempts=3, base_delay=0.0, retry_status_codes={503})
+        )
+        handler = AsyncMock(return_value=_response(503))
+        budget = RetryBudget(burst=1, min_retries_per_second=0)
+
+        with retry_scope(budget, "m"):
+            result = await middleware(_request(), handler)
+
+        assert result.status == 503
+        assert handler.call_count == 2  # initial attempt + the one budgeted retry
+
+    @pytest.mark.asyncio
+    async def test_empty_budget_stops_exception_retries(self):
+        middleware = create_retry_middleware(RetryOptions(max_attempts=3, base_delay=0.0))
+        handler = AsyncMock(side_effect=TimeoutError("slow"))
+
+        with (
+            retry_scope(RetryBudget(burst=1, min_retries_per_second=0), "m"),
+            pytest.raises(TimeoutError),
+        ):
+            await middleware(_request(), handler)
+
+        assert handler.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_429_left_to_rate_limiter(self):
+        middleware = create_retry_middleware(
+            RetryOptions(max_attempts=3, base_delay=0.0, retry_status_codes={429, 503})
+        )
+        handler = AsyncMock(return_value=_response(429))
+
+        with retry_scope(RetryBudget(), "m", rate_limited=True):
+            result = await middleware(_request(), handler)
+
+        assert result.status == 429
+        assert handler.call_count == 1
+
+
+class TestRateLimiterUsesScope:
+    @staticmethod
+    def _rate_limited_func(retry_after: str = "0.01"):
+        calls = 0
+
+        async def request_func():
+            nonlocal calls
+            calls += 1
+            response = MagicMock()
+            response.status = 429
+            response.headers = {"retry-after": retry_after}
+            response.json = AsyncMock(return_value={"error": "rate limited"})
+            return response
+
+        return request_func, lambda: calls
+
+    @pytest.mark.asyncio
+    async def test_429_retries_draw_from_budget(self):
+        limiter = SimpleRateLimiter(min_backoff=0.01, max_retries=5)
+        request_func, calls = self._rate_limited_func()
+        metadata = MagicMock()
+        metadata.model_id = "test-model"
+
+        with (
+            retry_scope(RetryBudget(burst=2, min_retries_per_second=0), "test-model"),
+            pytest.raises(RateLimitError),
+        ):
+            await limiter.submit_request(metadata, request_func)
+
+        assert calls() == 3
+
+    @pytest.mark.asyncio
+    async def test_429_retry_past_deadline_not_started(self):
+        limiter = SimpleRateLimiter(max_retries=3)
+        request_func, calls = self._rate_limited_func(retry_after="5")
+        metadata = MagicMock()
+        metadata.model_id = "test-model"
+
+        with (
+            retry_scope(RetryBudget(), "test-model", timeout=1.0),
+            pytest.raises(RateLimitError),
+        ):
+            await limiter.submit_request(metadata, request_func)
+
+        assert calls() == 1
+
+
+class TestClientWiring:
+    def test_default_budget(self):
+        client = VeniceClient(api_key="test")
+        assert isinstance(client.retry_budget, RetryBudget)
+
+    def test_budget_can_be_disabled(self):
+        assert VeniceClient(api_key="test", retry_budget=None).retry_budget is None
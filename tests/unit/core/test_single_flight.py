@@ -0,0 +1,181 @@
+"""Unit tests for single-flight request coalescing."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from venice_ai._client import VeniceClient
+from venice_ai.core.single_flight import SingleFlight
+
+
+class TestKeyFor:
+    def test_body_order_does_not_matter(self):
+        sf = SingleFlight()
+        a = sf.key_for("POST", "embeddings", json_data={"input": "x", "model": "m"})
+        b = sf.key_for("post", "/embeddings", json_data={"model": "m", "input": "x"})
+        assert a is not None and a == b
+
+    def test_different_params_differ(self):
+        sf = SingleFlight()
+        assert sf.key_for("GET", "models", params={"type": "chat"}) != sf.key_for(
+            "GET", "models", params={"type": "image"}
+        )
+
+    def test_unlisted_post_is_ineligible(self):
+        assert SingleFlight().key_for("POST", "chat/completions", json_data={"a": 1}) is None
+
+    def test_stream_body_is_ineligible(self):
+        sf = SingleFlight(post_paths={"chat/completions"})
+        assert sf.key_for("POST", "chat/completions", json_data={"stream": True}) is None
+
+    def test_unserialisable_body_is_ineligible(self):
+        assert SingleFlight().key_for("GET", "models", params={"x": object()}) is None
+
+
+class TestDo:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self):
+        sf = SingleFlight()
+        calls = 0
+        result = object()
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return result
+
+        key = sf.key_for("GET", "models")
+        out = await asyncio.gather(*(sf.do(key, fetch) for _ in range(5)))
+        assert calls == 1
+        assert all(r is result for r in out)
+        assert (sf.stats.requests, sf.stats.executed, sf.stats.coalesced) == (5, 1, 4)
+        assert sf.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_cached(self):
+        sf = SingleFlight()
+        fetch = AsyncMock(return_value=1)
+        key = sf.key_for("GET", "models")
+        await sf.do(key, fetch)
+        await sf.do(key, fetch)
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self):
+        sf = SingleFlight()
+
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("nope")
+
+        key = sf.key_for("GET", "models")
+        results = await asyncio.gather(
+            *(sf.do(key, boom) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert sf.stats.executed == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_waiter_keeps_flight_alive(self):
+        sf = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "ok"
+
+        key = sf.key_for("GET", "models")
+        first = asyncio.create_task(sf.do(key, fetch))
+        second = asyncio.create_task(sf.do(key, fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        assert await second == "ok"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    @pytest.mark.asyncio
+    async def test_cancelling_last_waiter_cancels_flight(self):
+        sf = SingleFlight()
+        started = asyncio.Event()
+
+        async def fetch():
+            started.set()
+            await asyncio.sleep(10)
+
+        key = sf.key_for("GET", "models")
+        waiter = asyncio.create_task(sf.do(key, fetch))
+        await started.wait()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0)
+        assert sf.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_caller_after_cancellation_starts_a_fresh_flight(self):
+        sf = SingleFlight()
+        started = asyncio.Event()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            if len(calls) == 1:
+                started.set()
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    await asyncio.sleep(0.01)  # slow cleanup keeps the task alive
+                    raise
+            return "fresh"
+
+        key = sf.key_for("GET", "models")
+        waiter = asyncio.create_task(sf.do(key, fetch))
+        await started.wait()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert await sf.do(key, fetch) == "fresh"
+        assert sf.stats.executed == 2
+
+
+class TestClientIntegration:
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        client = VeniceClient(api_key="test-key")
+        assert client.coalescing_stats is None
+
+    @pytest.mark.asyncio
+    async def test_identical_gets_share_one_round_trip(self):
+        client = VeniceClient(api_key="test-key", coalesce_requests=True)
+
+        async def send_and_parse(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return {"data": []}
+
+        with patch.object(
+            client, "_send_and_parse", AsyncMock(side_effect=send_and_parse)
+        ) as mock_send:
+            results = await asyncio.gather(
+                *(client.get("models", params={"type": "chat"}) for _ in range(4)),
+                client.get("models", params={"type": "image"}),
+            )
+
+        assert mock_send.await_count == 2
+        assert results[0] is results[1] is results[2] is results[3]
+        assert client.coalescing_stats.coalesced == 3
+
+    @pytest.mark.asyncio
+    async def test_non_idempotent_post_bypasses_single_flight(self):
+        client = VeniceClient(api_key="test-key", coalesce_requests=True)
+        with patch.object(client, "_send_and_parse", AsyncMock(return_value={})) as mock_send:
+            await asyncio.gather(
+                client.post("chat/completions", json_data={"model": "m"}),
+                client.post("chat/completions", json_data={"model": "m"}),
+            )
+        assert mock_send.await_count == 2
+        assert client.coalescing_stats.requests == 0
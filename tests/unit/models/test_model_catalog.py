@@ -0,0 +1,205 @@
+"""Tests for the shared model catalog cache (``venice_ai.models.catalog``)."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from venice_ai import VeniceClient
+from venice_ai.cache import FileCacheStore
+from venice_ai.models.catalog import ModelCatalog
+from venice_ai.models.selection import DynamicModelSelector
+from venice_ai.types.api.models import ModelResponse, ModelsListResponse
+
+_PARAMS = {"type": "all"}
+
+
+def _catalog_body(*ids: str) -> bytes:
+    listing = ModelsListResponse(
+        object="list",
+        type="all",
+        data=[
+            ModelResponse.model_validate(
+                {
+                    "id": model_id,
+                    "object": "model",
+                    "created": None,
+                    "owned_by": "venice.ai",
+                    "type": "embedding",
+                    "model_spec": {"name": model_id},
+                }
+            )
+            for model_id in ids
+        ],
+    )
+    return listing.model_dump_json().encode()
+
+
+class _ModelsServer:
+    """Serves ``/models`` with an ETag and honours ``If-None-Match``."""
+
+    def __init__(self, *ids: str) -> None:
+        self.body = _catalog_body(*ids)
+        self.etag = '"v1"'
+        self.requests: list[str | None] = []
+        self.fail = False
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests.append(request.headers.get("If-None-Match"))
+        if self.fail:
+            return web.json_response({"error": "gone"}, status=404)
+        if request.headers.get("If-None-Match") == self.etag:
+            return web.Response(status=304, headers={"ETag": self.etag})
+        return web.Response(
+            body=self.body, content_type="application/json", headers={"ETag": self.etag}
+        )
+
+
+@asynccontextmanager
+async def _serving(server: _ModelsServer):
+    app = web.Application()
+    app.router.add_get("/api/v1/models", server.handle)
+    test_server = TestServer(app)
+    await test_server.start_server()
+    try:
+        yield str(test_server.make_url("/api/v1"))
+    finally:
+        await test_server.close()
+
+
+@asynccontextmanager
+async def _client(server: _ModelsServer, catalog: ModelCatalog):
+    async with (
+        _serving(server) as base_url,
+        VeniceClient(api_key="test", base_url=base_url, model_catalog=catalog) as client,
+    ):
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_fresh_catalog_served_without_request():
+    models_server = _ModelsServer("fake-a", "fake-b")
+    catalog = ModelCatalog(ttl=60)
+    async with _client(models_server, catalog) as client:
+        first = await client.models.get("fake-a")
+        await client.models.get("fake-b")
+        await client.models.list(type="all", cached=True)
+
+    assert first.id == "fake-a"
+    assert models_server.requests == [None]
+    assert catalog.stats.hits == 2
+    assert catalog.stats.fetches == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_catalog_is_revalidated_with_etag():
+    models_server = _ModelsServer("fake-a", "fake-b")
+    catalog = ModelCatalog(ttl=1)
+    async with _client(models_server, catalog) as client:
+        await client.models.get("fake-a")
+        with patch("venice_ai.models.catalog.time.time", return_value=10**10):
+            await client.models.get("fake-a")
+
+    assert models_server.requests == [None, '"v1"']
+    assert catalog.stats.not_modified == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_catalog_served_while_refreshing():
+    models_server = _ModelsServer("fake-a", "fake-b")
+    catalog = ModelCatalog(ttl=1, stale_while_revalidate=10**11)
+    async with _client(models_server, catalog) as client:
+        await client.models.get("fake-a")
+        with patch("venice_ai.models.catalog.time.time", return_value=10**10):
+            assert (await client.models.get("fake-a")).id == "fake-a"
+            await catalog.aclose()
+
+    assert catalog.stats.stale_hits == 1
+    assert len(models_server.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_lookups_share_one_request():
+    models_server = _ModelsServer("fake-a", "fake-b")
+    catalog = ModelCatalog()
+    async with _client(models_server, catalog) as client:
+        await asyncio.gather(*(client.models.get("fake-a") for _ in range(10)))
+
+    assert models_server.requests == [None]
+
+
+@pytest.mark.asyncio
+async def test_file_store_shared_across_clients(tmp_path):
+    models_server = _ModelsServer("fake-a", "fake-b")
+
+    def make_catalog() -> ModelCatalog:
+        return ModelCatalog(FileCacheStore(tmp_path), ttl=300)
+
+    async with _client(models_server, make_catalog()) as client:
+        await client.models.get("fake-a")
+    # A second "process": new catalog, same directory
+    second = make_catalog()
+    async with _client(models_server, second) as client:
+        assert (await client.models.get("fake-b")).id == "fake-b"
+
+    assert models_server.requests == [None]
+    assert second.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_serves_cached_copy():
+    models_server = _ModelsServer("fake-a", "fake-b")
+    catalog = ModelCatalog(ttl=1)
+    async with _client(models_server, catalog) as client:
+        await client.models.get("fake-a")
+        models_server.fail = True
+        with patch("venice_ai.models.catalog.time.time", return_value=10**10):
+            assert (await client.models.get("fake-a")).id == "fake-a"
+
+    assert catalog.stats.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_selector_reads_the_same_catalog():
+    models_server = _ModelsServer("fake-a", "fake-b")
+    catalog = ModelCatalog(ttl=60)
+    async with _client(models_server, catalog) as client:
+        await client.models.get("fake-a")
+        models = await DynamicModelSelector(client).get_available_models()
+
+    assert sorted(models) == ["fake-a", "fake-b"]
+    assert models_server.requests == [None]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_full_fetch():
+    models_server = _ModelsServer("fake-a", "fake-b")
+    catalog = ModelCatalog(ttl=60)
+    async with _client(models_server, catalog) as client:
+        await client.models.get("fake-a")
+        await catalog.invalidate(_PARAMS)
+        await client.models.get("fake-a")
+
+    assert models_server.requests == [None, None]
+
+
+def test_from_env(monkeypatch, tmp_path):
+    monkeypatch.delenv("VENICE_MODEL_CACHE_DIR", raising=False)
+    assert ModelCatalog.from_env().ttl == 30.0
+
+    monkeypatch.setenv("VENICE_MODEL_CACHE_DIR", str(tmp_path))
+    catalog = ModelCatalog.from_env()
+    assert isinstance(catalog.store, FileCacheStore)
+    assert catalog.store.directory == tmp_path
+
+
+def test_client_catalog_is_namespaced_by_base_url(monkeypatch, tmp_path):
+    monkeypatch.setenv("VENICE_MODEL_CACHE_DIR", str(tmp_path))
+    staging = VeniceClient(api_key="test", base_url="https://staging.example/api/v1")
+    production = VeniceClient(api_key="test")
+
+    assert staging.model_catalog.namespace == staging.base_url
+    assert staging.model_catalog.key_for(_PARAMS) != production.model_catalog.key_for(_PARAMS)
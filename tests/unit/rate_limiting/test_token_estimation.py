@@ -0,0 +1,129 @@
+"""Tests for venice_ai.rate_limiting.token_estimation."""
+
+import pytest
+
+from venice_ai.rate_limiting.token_estimation import (
+    CharTokenEstimator,
+    TokenCalibration,
+    TokenEstimator,
+    TokenizerTokenEstimator,
+    completion_budget,
+    iter_prompt_text,
+)
+
+
+class _WordTokenizer:
+    def encode(self, text: str) -> list[int]:
+        return [0] * len(text.split())
+
+
+class TestIterPromptText:
+    def test_collects_all_input_text(self):
+        body = {
+            "messages": [
+                {"role": "system", "content": "sys"},
+                {
+                    "role": "user",
+                    "content": [{"type": "text", "text": "look"}, {"type": "image_url"}],
+                },
+                {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [{"function": {"name": "f", "arguments": '{"a":1}'}}],
+                },
+            ],
+            "instructions": "be brief",
+            "input": ["raw", {"role": "user", "content": "item"}],
+            "tools": [{"type": "function"}],
+        }
+        assert list(iter_prompt_text(body)) == [
+            "sys",
+            "look",
+            "f",
+            '{"a":1}',
+            "be brief",
+            "raw",
+            "item",
+            '[{"type":"function"}]',
+        ]
+
+    def test_yields_strings_by_reference(self):
+        big = "x" * 10_000
+        (text,) = iter_prompt_text({"messages": [{"role": "user", "content": big}]})
+        assert text is big
+
+
+class TestCompletionBudget:
+    @pytest.mark.parametrize(
+        ("body", "expected"),
+        [
+            ({}, 150),
+            ({"max_completion_tokens": 64}, 64),
+            ({"max_tokens": 32}, 32),
+            ({"max_output_tokens": 16}, 16),
+            ({"max_completion_tokens": "bad", "max_tokens": 8}, 8),
+            ({"max_completion_tokens": 10, "n": 3}, 30),
+            ({"max_completion_tokens": True}, 150),
+        ],
+    )
+    def test_budget(self, body, expected):
+        assert completion_budget(body) == expected
+
+
+class TestEstimators:
+    def test_char_estimator(self):
+        estimator = CharTokenEstimator(chars_per_token=2)
+        assert isinstance(estimator, TokenEstimator)
+        assert estimator.count_prompt_tokens({"prompt": "abcdef"}) == 3
+
+    def test_char_estimator_rejects_bad_ratio(self):
+        with pytest.raises(ValueError, match="positive"):
+            CharTokenEstimator(chars_per_token=0)
+
+    def test_tokenizer_estimator_adds_message_overhead(self):
+        estimator = TokenizerTokenEstimator(_WordTokenizer(), per_message_tokens=3)
+        body = {
+            "messages": [
+                {"role": "user", "content": "one two three"},
+                {"role": "user", "content": "four"},
+            ]
+        }
+        assert estimator.count_prompt_tokens(body) == 4 + 2 * 3
+
+    def test_tokenizer_estimator_requires_encode(self):
+        with pytest.raises(TypeError, match="encode"):
+            TokenizerTokenEstimator(object())
+
+    def test_from_tiktoken(self):
+        pytest.importorskip("tiktoken")
+        try:
+            estimator = TokenizerTokenEstimator.from_tiktoken("cl100k_base")
+        except Exception as exc:  # encoding files are downloaded on first use
+            pytest.skip(f"tiktoken encoding unavailable: {exc}")
+        assert estimator.count_prompt_tokens({"prompt": "hello world"}) == 2
+
+
+class TestTokenCalibration:
+    def test_defaults_to_one(self):
+        assert TokenCalibration().factor("m") == 1.0
+
+    def test_first_observation_sets_ratio_then_smooths(self):
+        calibration = TokenCalibration(smoothing=0.5)
+        calibration.observe("m", estimated=100, actual=200)
+        assert calibration.factor("m") == pytest.approx(2.0)
+        calibration.observe("m", estimated=100, actual=100)
+        assert calibration.factor("m") == pytest.approx(1.5)
+        assert calibration.snapshot() == {"m": pytest.approx(1.5)}
+
+    def test_clamps_and_ignores_empty(self):
+        calibration = TokenCalibration(max_factor=3.0)
+        calibration.observe("m", estimated=1, actual=1000)
+        assert calibration.factor("m") == 3.0
+        calibration.observe("n", estimated=0, actual=10)
+        assert calibration.factor("n") == 1.0
+
+    def test_bounded_model_count(self):
+        calibration = TokenCalibration(max_models=2)
+        for model in ("a", "b", "c"):
+            calibration.observe(model, 10, 20)
+        assert set(calibration.snapshot()) == {"b", "c"}
@@ -6,12 +6,20 @@ Exercises the two ``/crypto/rpc/*`` endpoints documented at
 forwarder (single + batch).
 """
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import aiohttp
 import pytest
+from aiohttp import web
 
+from venice_ai import VeniceClient
+from venice_ai.exceptions import (
+    APIResponseProcessingError,
+    InvalidRequestError,
+    ServiceUnavailableError,
+)
 from venice_ai.resources.crypto import Crypto
 from venice_ai.types.api.crypto import (
     BatchJsonRpcResponse,
@@ -41,6 +49,7 @@ def _make_fake_aiohttp_response(
 @pytest.fixture
 def crypto() -> Crypto:
     client = MagicMock()
+    client.request_batching = False
     return Crypto(client)  # type: ignore[arg-type]
 
 
@@ -319,3 +328,193 @@ async def test_batch_rpc_surfaces_response_headers(crypto: Crypto) -> None:
     assert results.rpc_cost_usd == pytest.approx(0.00001250)
     assert results.venice_request_id == "req_batch_1"
     assert results.idempotent_replayed is False
+
+
+@pytest.mark.asyncio
+async def test_batch_rpc_through_real_client(aiohttp_server: Any) -> None:
+    """The JSON array body survives the full ``VeniceClient`` request path."""
+    received: list[Any] = []
+
+    async def handle(request: web.Request) -> web.Response:
+        body = await request.json()
+        received.append(body)
+        return web.json_response(
+            [{"jsonrpc": "2.0", "id": item["id"], "result": "0x1"} for item in body]
+        )
+
+    app = web.Application()
+    app.router.add_post("/api/v1/crypto/rpc/{network}", handle)
+    server = await aiohttp_server(app)
+
+    async with VeniceClient(api_key="test", base_url=str(server.make_url("/api/v1"))) as client:
+        results = await client.crypto.batch_rpc(
+            network="ethereum-mainnet",
+            requests=[{"method": "eth_chainId", "params": [], "id": 1}],
+        )
+
+    assert [item.result for item in results] == ["0x1"]
+    assert received == [[{"method": "eth_chainId", "jsonrpc": "2.0", "params": [], "id": 1}]]
+
+
+# ---------------------------------------------------------------------------
+# RpcBatcher
+# ---------------------------------------------------------------------------
+
+
+def _echo_batches(crypto: Crypto) -> AsyncMock:
+    """Answer each batch in reverse order, echoing ``method`` as the result."""
+
+    async def request(**kwargs: Any) -> MagicMock:
+        body = [
+            {"jsonrpc": "2.0", "id": item["id"], "result": item["method"]}
+            for item in kwargs["json_data"]
+        ]
+        return _make_fake_aiohttp_response(body=body[::-1])
+
+    crypto._client._request = AsyncMock(side_effect=request)  # type: ignore[attr-defined]
+    return crypto._client._request  # type: ignore[attr-defined,no-any-return]
+
+
+@pytest.mark.asyncio
+async def test_batcher_merges_calls_per_network(crypto: Crypto) -> None:
+    request = _echo_batches(crypto)
+    async with crypto.batcher(max_wait_ms=5) as batcher:
+        results = await asyncio.gather(
+            *(batcher.rpc(network="eth", method=f"m{i}") for i in range(3)),
+            batcher.rpc(network="base", method="other", id="x"),
+        )
+
+    assert [r.result for r in results] == ["m0", "m1", "m2", "other"]
+    # Every caller used id=1; their ids come back unchanged
+    assert [r.id for r in results] == [1, 1, 1, "x"]
+    paths = sorted(c.kwargs["path"] for c in request.await_args_list)
+    assert paths == ["crypto/rpc/base", "crypto/rpc/eth"]
+    assert batcher.stats.batches == 2
+    assert batcher.stats.average_batch_size == 2
+
+
+@pytest.mark.asyncio
+async def test_batcher_splits_at_max_batch_size(crypto: Crypto) -> None:
+    request = _echo_batches(crypto)
+    batcher = crypto.batcher(max_batch_size=2, max_wait_ms=5)
+    await asyncio.gather(*(batcher.rpc(network="eth", method="m") for _ in range(5)))
+
+    sizes = sorted(len(c.kwargs["json_data"]) for c in request.await_args_list)
+    assert sizes == [1, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_batcher_failure_reaches_every_caller(crypto: Crypto) -> None:
+    crypto._client._request = AsyncMock(side_effect=ValueError("boom"))  # type: ignore[attr-defined]
+    batcher = crypto.batcher(max_wait_ms=5)
+    results = await asyncio.gather(
+        batcher.rpc(network="eth", method="a"),
+        batcher.rpc(network="eth", method="b"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert batcher.stats.failed_batches == 1
+
+
+def _rejection(cls: type[Exception], status: int) -> Exception:
+    return cls("rejected", request=None, response=MagicMock(status=status), body=None)
+
+
+@pytest.mark.asyncio
+async def test_batcher_resends_calls_alone_when_proxy_rejects_batch(crypto: Crypto) -> None:
+    crypto._client._request = AsyncMock(  # type: ignore[attr-defined]
+        side_effect=_rejection(InvalidRequestError, 400)
+    )
+
+    async def post(path: str, *, json_data: dict[str, Any], **kwargs: Any) -> JsonRpcResponse:
+        if json_data["method"] == "eth_bogus":
+            raise _rejection(InvalidRequestError, 400)
+        return JsonRpcResponse(jsonrpc="2.0", id=json_data["id"], result=json_data["method"])
+
+    crypto._client.post = AsyncMock(side_effect=post)  # type: ignore[attr-defined]
+    batcher = crypto.batcher(max_wait_ms=5)
+    good, bad, other = await asyncio.gather(
+        batcher.rpc(network="eth", method="eth_chainId", id="a"),
+        batcher.rpc(network="eth", method="eth_bogus"),
+        batcher.rpc(network="eth", method="eth_blockNumber", id="c"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(bad, InvalidRequestError)
+    assert isinstance(good, JsonRpcResponse) and (good.id, good.result) == ("a", "eth_chainId")
+    assert isinstance(other, JsonRpcResponse) and other.result == "eth_blockNumber"
+    assert batcher.stats.resent_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_batcher_server_error_is_not_resent(crypto: Crypto) -> None:
+    crypto._client._request = AsyncMock(  # type: ignore[attr-defined]
+        side_effect=_rejection(ServiceUnavailableError, 503)
+    )
+    crypto._client.post = AsyncMock()  # type: ignore[attr-defined]
+    batcher = crypto.batcher(max_wait_ms=5)
+    results = await asyncio.gather(
+        batcher.rpc(network="eth", method="a"),
+        batcher.rpc(network="eth", method="b"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, ServiceUnavailableError) for r in results)
+    crypto._client.post.assert_not_awaited()  # type: ignore[attr-defined]
+    assert batcher.stats.failed_batches == 1
+
+
+@pytest.mark.asyncio
+async def test_batcher_cancelled_send_cancels_every_caller(crypto: Crypto) -> None:
+    started = asyncio.Event()
+
+    async def hang(**kwargs: Any) -> None:
+        started.set()
+        await asyncio.Event().wait()
+
+    crypto._client._request = AsyncMock(side_effect=hang)  # type: ignore[attr-defined]
+    batcher = crypto.batcher(max_wait_ms=1)
+    callers = [asyncio.ensure_future(batcher.rpc(network="eth", method=m)) for m in "ab"]
+    await started.wait()
+    for task in list(batcher._in_flight):
+        task.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*callers, return_exceptions=True), 1)
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_batcher_missing_item_fails_only_that_call(crypto: Crypto) -> None:
+    crypto._client._request = AsyncMock(  # type: ignore[attr-defined]
+        return_value=_make_fake_aiohttp_response(body=[{"jsonrpc": "2.0", "id": 1, "result": "b"}])
+    )
+    batcher = crypto.batcher(max_wait_ms=5)
+    first, second = await asyncio.gather(
+        batcher.rpc(network="eth", method="a"),
+        batcher.rpc(network="eth", method="b"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(first, APIResponseProcessingError)
+    assert isinstance(second, JsonRpcResponse) and second.result == "b"
+
+
+@pytest.mark.asyncio
+async def test_rpc_batch_flag_uses_client_batcher() -> None:
+    from venice_ai._client import VeniceClient
+
+    client = VeniceClient(api_key="test", batch_requests=True)
+    request = _echo_batches(client.crypto)
+    client.post = AsyncMock()  # type: ignore[method-assign]
+
+    results = await asyncio.gather(
+        *(client.crypto.rpc(network="eth", method=f"m{i}") for i in range(4)),
+        client.crypto.rpc(network="eth", method="keyed", idempotency_key="k1", batch=True),
+    )
+    await client.close()
+
+    assert request.await_count == 1
+    assert [r.result for r in results[:4]] == ["m0", "m1", "m2", "m3"]
+    assert client.post.await_count == 1  # the keyed call went on its own
+    assert client.rpc_batcher.stats.calls == 4
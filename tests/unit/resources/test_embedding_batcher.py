@@ -0,0 +1,211 @@
+"""Unit tests for EmbeddingBatcher (micro-batching of embeddings.create calls)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from venice_ai.exceptions import APIResponseProcessingError, InvalidRequestError, RateLimitError
+from venice_ai.resources.embeddings import EmbeddingBatcher, Embeddings
+from venice_ai.types.api import EmbeddingsResponse
+
+
+def _response_for(inputs: list) -> EmbeddingsResponse:
+    return EmbeddingsResponse.model_validate(
+        {
+            "object": "list",
+            "model": "fake-embedding-model",
+            "data": [
+                {"object": "embedding", "index": i, "embedding": [float(len(text))]}
+                for i, text in enumerate(inputs)
+            ],
+            "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)},
+        }
+    )
+
+
+def _embeddings_resource():
+    client = MagicMock()
+
+    async def post(path, json_data, cast_to):
+        return _response_for(json_data["input"])
+
+    client.post = AsyncMock(side_effect=post)
+    return Embeddings(client), client
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_request():
+    resource, client = _embeddings_resource()
+    async with resource.batcher(max_wait_ms=5) as batcher:
+        vectors = await asyncio.gather(*(batcher.embed("x" * n, model="m") for n in (1, 2, 3)))
+    assert vectors == [[1.0], [2.0], [3.0]]
+    assert client.post.await_count == 1
+    assert client.post.await_args.kwargs["json_data"]["input"] == ["x", "xx", "xxx"]
+    assert batcher.stats.batches == 1
+    assert batcher.stats.average_batch_size == 3
+
+
+@pytest.mark.asyncio
+async def test_groups_by_model_and_dimensions():
+    resource, client = _embeddings_resource()
+    async with resource.batcher(max_wait_ms=5) as batcher:
+        await asyncio.gather(
+            batcher.embed("a", model="m1"),
+            batcher.embed("b", model="m1", dimensions=256),
+            batcher.embed("c", model="m2"),
+            batcher.embed("d", model="m1"),
+        )
+    bodies = {
+        (c.kwargs["json_data"]["model"], c.kwargs["json_data"].get("dimensions"))
+        for c in client.post.await_args_list
+    }
+    assert client.post.await_count == 3
+    assert bodies == {("m1", None), ("m1", 256), ("m2", None)}
+
+
+@pytest.mark.asyncio
+async def test_splits_at_size_and_model_limit():
+    resource, client = _embeddings_resource()
+    batcher = EmbeddingBatcher(
+        resource, max_batch_size=3, max_wait_ms=5, model_input_limits={"small": 2}
+    )
+    await asyncio.gather(*(batcher.embed(str(i), model="m") for i in range(7)))
+    await asyncio.gather(*(batcher.embed(str(i), model="small") for i in range(3)))
+    sizes = [len(c.kwargs["json_data"]["input"]) for c in client.post.await_args_list]
+    assert sorted(sizes) == [1, 1, 2, 3, 3]
+
+
+@pytest.mark.asyncio
+async def test_token_budget_splits_batches():
+    resource, client = _embeddings_resource()
+    batcher = EmbeddingBatcher(resource, max_batch_tokens=10, max_wait_ms=5)
+    # 24 chars ≈ 6 tokens each: two cannot share a 10-token batch.
+    await asyncio.gather(*(batcher.embed("y" * 24, model="m") for _ in range(3)))
+    assert client.post.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_failure_propagates_to_every_caller():
+    resource, client = _embeddings_resource()
+    client.post.side_effect = RateLimitError("slow down", request=None, response=None, body=None)
+    batcher = resource.batcher(max_wait_ms=5)
+    results = await asyncio.gather(
+        batcher.embed("a", model="m"), batcher.embed("b", model="m"), return_exceptions=True
+    )
+    assert all(isinstance(r, RateLimitError) for r in results)
+    assert batcher.stats.failed_batches == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_send_cancels_every_caller():
+    resource, client = _embeddings_resource()
+    started = asyncio.Event()
+
+    async def hang(path, json_data, cast_to):
+        started.set()
+        await asyncio.Event().wait()
+
+    client.post.side_effect = hang
+    batcher = resource.batcher(max_wait_ms=1)
+    callers = [asyncio.ensure_future(batcher.embed(text, model="m")) for text in "ab"]
+    await started.wait()
+    for task in list(batcher._in_flight):
+        task.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*callers, return_exceptions=True), 1)
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_short_response_fails_missing_slots():
+    resource, client = _embeddings_resource()
+    client.post.side_effect = None
+    client.post.return_value = _response_for(["only-one"])
+    batcher = resource.batcher(max_wait_ms=5)
+    first, second = await asyncio.gather(
+        batcher.embed("a", model="m"), batcher.embed("b", model="m"), return_exceptions=True
+    )
+    assert first == [8.0]
+    assert isinstance(second, APIResponseProcessingError)
+
+
+@pytest.mark.asyncio
+async def test_closed_batcher_rejects_new_inputs():
+    resource, _ = _embeddings_resource()
+    batcher = resource.batcher()
+    await batcher.aclose()
+    with pytest.raises(InvalidRequestError):
+        await batcher.embed("a", model="m")
+
+
+def test_invalid_bounds_rejected():
+    resource, _ = _embeddings_resource()
+    with pytest.raises(ValueError):
+        EmbeddingBatcher(resource, max_batch_size=0)
+
+
+def _batching_client(**kwargs):
+    from venice_ai._client import VeniceClient
+
+    client = VeniceClient(api_key="test", **kwargs)
+
+    async def post(path, json_data, cast_to):
+        return _response_for(json_data["input"])
+
+    client.post = AsyncMock(side_effect=post)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_client_batching_merges_concurrent_creates():
+    client = _batching_client(batch_requests=True)
+    single, pair = await asyncio.gather(
+        client.embeddings.create(model="m", input="aaaa"),
+        client.embeddings.create(model="m", input=["bb", "cccccccc"]),
+    )
+    await client.close()
+
+    assert client.post.await_count == 1
+    assert client.post.await_args.kwargs["json_data"]["input"] == ["aaaa", "bb", "cccccccc"]
+    assert [(d.index, d.embedding) for d in single.data] == [(0, [4.0])]
+    assert [(d.index, d.embedding) for d in pair.data] == [(0, [2.0]), (1, [8.0])]
+    # Usage is split by estimated tokens: 1 + (1 + 2) of 4
+    assert (single.usage.total_tokens, pair.usage.total_tokens) == (1, 2)
+    assert client.embedding_batcher.stats.batches == 1
+
+
+@pytest.mark.asyncio
+async def test_client_batching_sends_large_calls_directly():
+    client = _batching_client(batch_requests=True)
+    inputs = [str(i) for i in range(client.embedding_batcher.max_batch_size)]
+
+    response = await client.embeddings.create(model="m", input=inputs)
+    await client.close()
+
+    assert len(response.data) == len(inputs)
+    assert client.embedding_batcher.stats.requests == 0
+
+
+@pytest.mark.asyncio
+async def test_client_batching_follows_config():
+    from venice_ai.core.config import VeniceAIConfig
+
+    config = VeniceAIConfig.create_minimal_config(api_key="test")
+    config.scheduler.enable_request_batching = True
+    config.state.batch_size = 2
+    client = _batching_client(config=config)
+    await asyncio.gather(*(client.embeddings.create(model="m", input=str(i)) for i in range(5)))
+    await client.close()
+
+    assert sorted(len(c.kwargs["json_data"]["input"]) for c in client.post.await_args_list) == [
+        1,
+        2,
+        2,
+    ]
+    assert client.embedding_batcher.max_wait == config.state.batch_timeout
+
+    unbatched = _batching_client()
+    await asyncio.gather(*(unbatched.embeddings.create(model="m", input="x") for _ in range(3)))
+    await unbatched.close()
+    assert unbatched.post.await_count == 3
@@ -30,6 +30,7 @@ class MockVeniceClient:
     def __init__(self, api_key: str = "test-key"):
         self._api_key = api_key
         self.post = AsyncMock()
+        self.request_batching = False
 
 
 @pytest.fixture
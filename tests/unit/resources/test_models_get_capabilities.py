@@ -1,6 +1,5 @@
 """Unit tests for Models.get() and Models.get_capabilities()."""
 
-import time
 from unittest.mock import AsyncMock
 
 import pytest
@@ -136,32 +135,17 @@ class TestModelsGet:
             await resource.get("does-not-exist")
 
     @pytest.mark.asyncio
-    async def test_caches_listing_within_ttl(self):
+    async def test_reads_shared_catalog(self):
         resource, list_mock = _build_models(
             _model(id="fake-test-a", type="text", capabilities=_chat_caps()),
         )
         await resource.get("fake-test-a")
-        await resource.get("fake-test-a")
-        await resource.get("fake-test-a")
-        list_mock.assert_awaited_once()
-
-    @pytest.mark.asyncio
-    async def test_cache_expires_after_ttl(self, monkeypatch):
-        resource, list_mock = _build_models(
-            _model(id="fake-test-a", type="text", capabilities=_chat_caps()),
-        )
-        # First call seeds the cache.
-        await resource.get("fake-test-a")
-        assert list_mock.await_count == 1
-        # Advance "now" past the 30-second TTL.
-        original_monotonic = time.monotonic
-
-        def fake_monotonic():
-            return original_monotonic() + 31.0
-
-        monkeypatch.setattr("venice_ai.resources.models.time.monotonic", fake_monotonic)
-        await resource.get("fake-test-a")
-        assert list_mock.await_count == 2
+        await resource.get_capabilities("fake-test-a")
+        # Caching itself lives in ModelCatalog (tests/unit/models/test_model_catalog.py)
+        assert list_mock.await_args_list == [
+            ((), {"type": "all", "cached": True}),
+            ((), {"type": "all", "cached": True}),
+        ]
 
 
 # ---------------------------------------------------------------------------
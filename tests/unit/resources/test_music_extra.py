@@ -22,6 +22,7 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from venice_ai.core.job_poller import JobPoller
 from venice_ai.exceptions import MusicGenerationError
 from venice_ai.resources.music import Music, MusicJob
 from venice_ai.types.api.music import (
@@ -90,7 +91,8 @@ def mock_client():
     client.music = Mock()
     client.music.retrieve = AsyncMock()
     client.music.cancel = AsyncMock(return_value=MusicCompleteResponse(success=True))
-    client.fetch_external = AsyncMock(return_value=b"MUSIC_BYTES")
+    client.job_poller = JobPoller()
+    client.download_to = AsyncMock(return_value=len(b"MUSIC_BYTES"))
     return client
 
 
@@ -164,7 +166,7 @@ async def test_wait_raises_timeout_when_max_polls_exhausted(
     async def _no_sleep(_seconds: float) -> None:
         return None
 
-    monkeypatch.setattr("venice_ai.resources.music.asyncio.sleep", _no_sleep)
+    monkeypatch.setattr("venice_ai.core.job_poller.asyncio.sleep", _no_sleep)
 
     with pytest.raises(TimeoutError, match="did not complete within 3 polls"):
         await job.wait(max_polls=3)
@@ -186,7 +188,7 @@ async def test_wait_skips_on_progress_when_callback_is_none(
     async def _no_sleep(_seconds: float) -> None:
         return None
 
-    monkeypatch.setattr("venice_ai.resources.music.asyncio.sleep", _no_sleep)
+    monkeypatch.setattr("venice_ai.core.job_poller.asyncio.sleep", _no_sleep)
     # No on_progress callback — line 138 condition short-circuits → 140
     result = await job.wait()
     assert result is completed
@@ -463,7 +465,7 @@ async def test_wait_failed_status_short_circuits_before_sleep(
     async def _track_sleep(seconds: float) -> None:
         sleep_calls.append(seconds)
 
-    monkeypatch.setattr("venice_ai.resources.music.asyncio.sleep", _track_sleep)
+    monkeypatch.setattr("venice_ai.core.job_poller.asyncio.sleep", _track_sleep)
     failed = MusicFailedStatus(status="FAILED", error="bad", error_code="X")
     mock_client.music.retrieve.return_value = failed
 
@@ -1,9 +1,11 @@
 """Unit tests for the MusicJob lifecycle + Music.submit / cancel methods."""
 
+from pathlib import Path
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from venice_ai.core.job_poller import JobPoller
 from venice_ai.exceptions import MusicGenerationError
 from venice_ai.resources.music import Music, MusicJob
 from venice_ai.types.api.music import (
@@ -26,7 +28,13 @@ def mock_client():
     client.music = Mock()
     client.music.retrieve = AsyncMock()
     client.music.cancel = AsyncMock(return_value=MusicCompleteResponse(success=True))
-    client.fetch_external = AsyncMock(return_value=b"MUSIC_BYTES")
+    client.job_poller = JobPoller()
+
+    async def _download_to(url, destination, **_kwargs):
+        Path(destination).write_bytes(b"MUSIC_BYTES")
+        return len(b"MUSIC_BYTES")
+
+    client.download_to = AsyncMock(side_effect=_download_to)
     return client
 
 
@@ -95,7 +103,7 @@ async def test_wait_returns_completed_immediately(job: MusicJob, mock_client, mo
     async def _fake_sleep(seconds: float) -> None:
         sleep_calls.append(seconds)
 
-    monkeypatch.setattr("venice_ai.resources.music.asyncio.sleep", _fake_sleep)
+    monkeypatch.setattr("venice_ai.core.job_poller.asyncio.sleep", _fake_sleep)
     result = await job.wait(poll_interval=0.5)
     assert result is completed
     # First poll was already COMPLETED, so no sleep.
@@ -117,7 +125,7 @@ async def test_wait_invokes_progress_then_completes(
     async def _no_sleep(seconds: float) -> None:
         return None
 
-    monkeypatch.setattr("venice_ai.resources.music.asyncio.sleep", _no_sleep)
+    monkeypatch.setattr("venice_ai.core.job_poller.asyncio.sleep", _no_sleep)
     seen: list[MusicProcessingStatus] = []
     result = await job.wait(on_progress=seen.append)
     assert result is completed
@@ -157,7 +165,8 @@ async def test_download_fetches_url_when_no_inline_bytes(
     )
     target = tmp_path / "out.mp3"
     await job.download(target, completed)
-    mock_client.fetch_external.assert_awaited_once_with("https://example.com/a.mp3")
+    mock_client.download_to.assert_awaited_once()
+    assert mock_client.download_to.await_args.args[0] == "https://example.com/a.mp3"
     assert target.read_bytes() == b"MUSIC_BYTES"
 
 
@@ -1,10 +1,12 @@
 """Unit tests for VideoJob lifecycle management."""
 
 import logging
+from pathlib import Path
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from venice_ai.core.job_poller import JobPoller
 from venice_ai.exceptions import InvalidRequestError, VideoGenerationError
 from venice_ai.resources.video import Video, VideoJob
 from venice_ai.types.api.video import (
@@ -27,7 +29,13 @@ def mock_client():
     client.video = Mock()
     client.video.retrieve = AsyncMock()
     client.video.cancel = AsyncMock(return_value=VideoCompleteResponse(success=True))
-    client.fetch_external = AsyncMock(return_value=b"VIDEO_BYTES")
+    client.job_poller = JobPoller()
+
+    async def _download_to(url, destination, **_kwargs):
+        Path(destination).write_bytes(b"VIDEO_BYTES")
+        return len(b"VIDEO_BYTES")
+
+    client.download_to = AsyncMock(side_effect=_download_to)
     return client
 
 
@@ -96,7 +104,7 @@ async def test_wait_returns_completed(job, mock_client, monkeypatch):
     async def _fake_sleep(seconds: float) -> None:
         sleep_calls.append(seconds)
 
-    monkeypatch.setattr("venice_ai.resources.video.asyncio.sleep", _fake_sleep)
+    monkeypatch.setattr("venice_ai.core.job_poller.asyncio.sleep", _fake_sleep)
     result = await job.wait(poll_interval=0.5)
     assert result is completed
     # First poll already returned COMPLETED, so no sleeps should have occurred.
@@ -116,7 +124,7 @@ async def test_wait_invokes_progress_callback_then_completes(job, mock_client, m
     async def _no_sleep(seconds: float) -> None:
         return None
 
-    monkeypatch.setattr("venice_ai.resources.video.asyncio.sleep", _no_sleep)
+    monkeypatch.setattr("venice_ai.core.job_poller.asyncio.sleep", _no_sleep)
     seen: list[VideoProcessingStatus] = []
     result = await job.wait(on_progress=seen.append)
     assert result is completed
@@ -131,7 +139,7 @@ async def test_wait_raises_video_generation_error_on_failed(job, mock_client, mo
     async def _no_sleep(seconds: float) -> None:
         return None
 
-    monkeypatch.setattr("venice_ai.resources.video.asyncio.sleep", _no_sleep)
+    monkeypatch.setattr("venice_ai.core.job_poller.asyncio.sleep", _no_sleep)
     with pytest.raises(VideoGenerationError) as exc:
         await job.wait()
     assert exc.value.error_code == "E1"
@@ -149,7 +157,7 @@ async def test_wait_raises_timeout_after_max_polls(job, mock_client, monkeypatch
     async def _no_sleep(seconds: float) -> None:
         return None
 
-    monkeypatch.setattr("venice_ai.resources.video.asyncio.sleep", _no_sleep)
+    monkeypatch.setattr("venice_ai.core.job_poller.asyncio.sleep", _no_sleep)
     with pytest.raises(TimeoutError):
         await job.wait(max_polls=3)
 
@@ -170,7 +178,7 @@ async def test_download_inline_data_writes_via_to_thread(job, tmp_path, monkeypa
         to_thread_calls.append(fn.__name__)
         return fn(*args, **kwargs)
 
-    monkeypatch.setattr("venice_ai.resources.video.asyncio.to_thread", _record_to_thread)
+    monkeypatch.setattr("venice_ai._download.asyncio.to_thread", _record_to_thread)
     target = tmp_path / "out.mp4"
     result = await job.download(target, completed)
     assert result == target
@@ -197,16 +205,17 @@ async def test_download_falls_back_to_queue_download_url(mock_client, tmp_path,
     async def _passthrough_to_thread(fn, *args, **kwargs):
         return fn(*args, **kwargs)
 
-    monkeypatch.setattr("venice_ai.resources.video.asyncio.to_thread", _passthrough_to_thread)
+    monkeypatch.setattr("venice_ai._download.asyncio.to_thread", _passthrough_to_thread)
     target = tmp_path / "out.mp4"
     result = await job.download(target, completed)
     assert result == target
     assert target.read_bytes() == b"VIDEO_BYTES"
-    mock_client.fetch_external.assert_awaited_once_with("https://cdn.example.com/queued.mp4")
+    mock_client.download_to.assert_awaited_once()
+    assert mock_client.download_to.await_args.args[0] == "https://cdn.example.com/queued.mp4"
 
 
 @pytest.mark.asyncio
-async def test_download_url_uses_client_fetch_external(job, mock_client, tmp_path, monkeypatch):
+async def test_download_url_streams_through_client(job, mock_client, tmp_path, monkeypatch):
     completed = VideoCompletedStatus(
         status="COMPLETED", url="https://cdn.example.com/v.mp4", expires_at=None
     )
@@ -214,12 +223,13 @@ async def test_download_url_uses_client_fetch_external(job, mock_client, tmp_pat
     async def _passthrough_to_thread(fn, *args, **kwargs):
         return fn(*args, **kwargs)
 
-    monkeypatch.setattr("venice_ai.resources.video.asyncio.to_thread", _passthrough_to_thread)
+    monkeypatch.setattr("venice_ai._download.asyncio.to_thread", _passthrough_to_thread)
     target = tmp_path / "out.mp4"
     result = await job.download(target, completed)
     assert result == target
     assert target.read_bytes() == b"VIDEO_BYTES"
-    mock_client.fetch_external.assert_awaited_once_with("https://cdn.example.com/v.mp4")
+    mock_client.download_to.assert_awaited_once()
+    assert mock_client.download_to.await_args.args[0] == "https://cdn.example.com/v.mp4"
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,205 @@
+"""Unit tests for the validation-free ``ChatCompletionChunkView`` fast path."""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from venice_ai.resources.chat.completions import ChatCompletions
+from venice_ai.streaming import ChatStream
+from venice_ai.types.api.chat import ChatUsage
+from venice_ai.types.api.streaming import ChatCompletionChunk, ChatCompletionChunkView
+
+
+def _payload(
+    *,
+    content: str | None = None,
+    reasoning_content: str | None = None,
+    tool_calls: list[dict] | None = None,
+    finish_reason: str | None = None,
+    usage: dict | None = None,
+) -> dict:
+    payload = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 1700000000,
+        "model": "llama-3.3-70b",
+        "choices": [
+            {
+                "index": 0,
+                "delta": {
+                    "content": content,
+                    "reasoning_content": reasoning_content,
+                    "tool_calls": tool_calls,
+                },
+                "finish_reason": finish_reason,
+            }
+        ],
+    }
+    if usage is not None:
+        payload["usage"] = usage
+    return payload
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+def _stream(payloads):
+    return ChatStream(_aiter([ChatCompletionChunkView(p) for p in payloads]), client=Mock())
+
+
+USAGE = {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8}
+
+
+class TestChunkViewAttributes:
+    def test_reads_match_validated_model(self):
+        payload = _payload(content="hi", finish_reason="stop", usage=USAGE)
+        view = ChatCompletionChunkView(payload)
+        model = ChatCompletionChunk.model_validate(payload)
+
+        assert view.id == model.id
+        assert view.model == model.model
+        assert view.created == model.created
+        assert view.text == model.text == "hi"
+        assert view.choices[0].index == model.choices[0].index
+        assert view.choices[0].delta.content == model.choices[0].delta.content
+        assert view.choices[0].finish_reason == "stop"
+        assert isinstance(view.usage, ChatUsage)
+        assert view.usage.total_tokens == 8
+
+    def test_tool_call_fields(self):
+        view = ChatCompletionChunkView(
+            _payload(
+                tool_calls=[
+                    {
+                        "index": 1,
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "lookup", "arguments": '{"q":'},
+                    }
+                ]
+            )
+        )
+        (tc,) = view.choices[0].delta.tool_calls
+        assert (tc.index, tc.id, tc.type) == (1, "call_1", "function")
+        assert tc.function.name == "lookup"
+        assert tc.function.arguments == '{"q":'
+
+    def test_missing_fields_read_as_empty(self):
+        view = ChatCompletionChunkView({"choices": [{}]})
+        assert view.id == ""
+        assert view.text == ""
+        assert view.usage is None
+        assert view.choices[0].delta.content is None
+        assert view.choices[0].delta.tool_calls is None
+
+    def test_content_setter_writes_through(self):
+        payload = _payload(content="ciphertext")
+        view = ChatCompletionChunkView(payload)
+        view.choices[0].delta.content = "plaintext"
+        assert view.text == "plaintext"
+        assert payload["choices"][0]["delta"]["content"] == "plaintext"
+
+    def test_to_model_validates(self):
+        view = ChatCompletionChunkView(_payload(content="x"))
+        model = view.to_model()
+        assert isinstance(model, ChatCompletionChunk)
+        assert model.text == "x"
+
+
+@pytest.mark.asyncio
+async def test_collect_over_views():
+    stream = _stream(
+        [
+            _payload(content="Hello"),
+            _payload(content=" world", reasoning_content="thinking"),
+            _payload(
+                tool_calls=[
+                    {"index": 0, "id": "call_1", "type": "function", "function": {"name": "f"}}
+                ]
+            ),
+            _payload(tool_calls=[{"index": 0, "function": {"arguments": "{}"}}]),
+            _payload(finish_reason="tool_calls", usage=USAGE),
+        ]
+    )
+    response = await stream.collect()
+    message = response.choices[0].message
+    assert message.content == "Hello world"
+    assert message.reasoning_content == "thinking"
+    assert message.tool_calls[0].function.name == "f"
+    assert message.tool_calls[0].function.arguments == "{}"
+    assert response.usage.total_tokens == 8
+
+
+@pytest.mark.asyncio
+async def test_text_deltas_over_views():
+    stream = _stream([_payload(content="a"), _payload(), _payload(content="b")])
+    assert [t async for t in stream.text_deltas()] == ["a", "b"]
+
+
+class TestDecodeStreamEventWithFactory:
+    def test_factory_bypasses_model_validation(self):
+        from venice_ai._client import VeniceClient
+
+        client = VeniceClient(api_key="test-key")
+        items = list(
+            client._decode_stream_event(
+                b'{"id": "c", "choices": [{"index": 0, "delta": {"content": "x"}}]}',
+                ChatCompletionChunk,
+                chunk_factory=ChatCompletionChunkView,
+            )
+        )
+        assert len(items) == 1
+        assert isinstance(items[0], ChatCompletionChunkView)
+        assert items[0].text == "x"
+
+    def test_done_sentinel_still_skipped(self):
+        from venice_ai._client import VeniceClient
+
+        client = VeniceClient(api_key="test-key")
+        assert (
+            list(
+                client._decode_stream_event(
+                    b"[DONE]", ChatCompletionChunk, chunk_factory=ChatCompletionChunkView
+                )
+            )
+            == []
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fast_chunks", [True, False])
+async def test_stream_forwards_chunk_factory(fast_chunks):
+    captured: dict = {}
+
+    async def fake_stream_request(*args, **kwargs):
+        captured.update(kwargs)
+        yield ChatCompletionChunkView(_payload(content="x", finish_reason="stop"))
+
+    client = MagicMock()
+    client._stream_request = fake_stream_request
+    resource = ChatCompletions(client)
+
+    stream = await resource.stream(
+        model="llama-3.3-70b",
+        messages=[{"role": "user", "content": "hi"}],
+        fast_chunks=fast_chunks,
+    )
+    assert [t async for t in stream.text_deltas()] == ["x"]
+    expected = ChatCompletionChunkView if fast_chunks else None
+    assert captured["chunk_factory"] is expected
+
+
+@pytest.mark.asyncio
+async def test_fast_chunks_without_stream_is_rejected():
+    client = MagicMock()
+    resource = ChatCompletions(client)
+
+    with pytest.raises(ValueError, match="fast_chunks"):
+        await resource.create(
+            model="llama-3.3-70b",
+            messages=[{"role": "user", "content": "hi"}],
+            fast_chunks=True,
+        )
+    client.post.assert_not_called()
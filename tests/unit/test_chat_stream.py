@@ -193,17 +193,29 @@ async def test_collect_raises_when_no_finish_reason():
 
 
 @pytest.mark.asyncio
-async def test_collect_warns_on_n_greater_than_one():
-    # Same chunk carries choice index 0 AND a chunk with index 1.
+async def test_collect_tracks_every_choice_when_n_greater_than_one():
     chunks = [
         _chunk(content="hi", choice_index=0),
-        _chunk(content="ignored", choice_index=1),
+        _chunk(content="hey", choice_index=1),
+        _chunk(content=" there", choice_index=1),
         _chunk(content=None, finish_reason="stop", choice_index=0),
+        _chunk(content=None, finish_reason="length", choice_index=1),
     ]
-    with pytest.warns(UserWarning, match="only tracks choice 0"):
-        response = await _stream(chunks).collect()
-    # Choice-0 content preserved, choice-1 dropped.
+    response = await _stream(chunks).collect()
+    assert [c.index for c in response.choices] == [0, 1]
     assert response.choices[0].message.content == "hi"
+    assert response.choices[1].message.content == "hey there"
+    assert [c.finish_reason for c in response.choices] == ["stop", "length"]
+
+
+@pytest.mark.asyncio
+async def test_collect_raises_when_any_choice_unfinished():
+    chunks = [
+        _chunk(content="a", finish_reason="stop", choice_index=0),
+        _chunk(content="b", choice_index=1),
+    ]
+    with pytest.raises(ValueError, match=r"finish_reason \(choices \[1\]\)"):
+        await _stream(chunks).collect()
 
 
 # ---------------------------------------------------------------------------
@@ -399,3 +411,76 @@ class TestChunkTextProperty:
             ],
         )
         assert c.text == "first"
+
+
+# ---------------------------------------------------------------------------
+# StreamAccumulator
+# ---------------------------------------------------------------------------
+
+
+class TestStreamAccumulator:
+    def test_current_snapshots_mid_stream(self):
+        from venice_ai.streaming import StreamAccumulator
+
+        acc = StreamAccumulator()
+        acc.add(_chunk(content="Hel"))
+        first = acc.current()
+        assert first.choices[0].message.content == "Hel"
+        assert first.choices[0].finish_reason is None
+
+        acc.add(_chunk(content="lo", finish_reason="stop"))
+        assert acc.current().choices[0].message.content == "Hello"
+        assert acc.result().choices[0].finish_reason == "stop"
+
+    def test_unchanged_choices_reuse_previous_snapshot(self):
+        from venice_ai.streaming import StreamAccumulator
+
+        acc = StreamAccumulator()
+        acc.add(_chunk(content="a", choice_index=0))
+        acc.add(_chunk(content="b", choice_index=1))
+        before = acc.current()
+        acc.add(_chunk(content="c", choice_index=1))
+        after = acc.current()
+        assert after.choices[0] is before.choices[0]
+        assert after.choices[1].message.content == "bc"
+
+    def test_tool_calls_merge_per_choice(self):
+        from venice_ai.streaming import StreamAccumulator
+
+        acc = StreamAccumulator()
+        for idx in (0, 1):
+            acc.add(
+                _chunk(
+                    choice_index=idx,
+                    tool_calls=[
+                        {
+                            "index": 0,
+                            "id": f"call_{idx}",
+                            "type": "function",
+                            "function": {"name": "f", "arguments": '{"a":'},
+                        }
+                    ],
+                )
+            )
+        acc.add(_chunk(choice_index=1, tool_calls=[{"index": 0, "function": {"arguments": "1}"}}]))
+        snapshot = acc.current()
+        assert snapshot.choices[0].message.tool_calls[0].function.arguments == '{"a":'
+        assert snapshot.choices[1].message.tool_calls[0].id == "call_1"
+        assert snapshot.choices[1].message.tool_calls[0].function.arguments == '{"a":1}'
+
+    def test_result_carries_usage_without_revalidation(self):
+        from venice_ai.streaming import StreamAccumulator
+
+        usage = {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3}
+        acc = StreamAccumulator()
+        last = _chunk(content="x", finish_reason="stop", usage=usage)
+        acc.add(last)
+        response = acc.result()
+        assert response.usage is last.usage
+        assert response.model_dump()["usage"]["total_tokens"] == 3
+
+    def test_result_raises_on_empty_stream(self):
+        from venice_ai.streaming import StreamAccumulator
+
+        with pytest.raises(ValueError, match="finish_reason"):
+            StreamAccumulator().result()
@@ -524,11 +524,30 @@ class TestClientExpanded:
 
         client._get_session = AsyncMock()
 
+        body = {"model": "test-model", "messages": [{"role": "user", "content": "hi"}]}
         await client._prepare_and_send_request(
-            method="POST", path="/test", json_data={"model": "test-model"}, force_direct=False
+            method="POST", path="/test", json_data=body, force_direct=False
         )
 
         client.rate_limiter.classifier.classify.assert_awaited_once()
+        request_dict = client.rate_limiter.classifier.classify.await_args.args[0]
+        assert request_dict["model"] == "test-model"
+        # The body reaches the classifier by reference, not as a copy.
+        assert request_dict["body"] is body
+
+    def test_record_token_usage_feeds_classifier(self, client):
+        """Response usage is forwarded to the classifier's calibration."""
+        client.rate_limiter = MagicMock()
+        body = {"model": "test-model"}
+        usage = {"prompt_tokens": 12, "total_tokens": 20}
+
+        client._record_token_usage(body, {"usage": usage})
+        client.rate_limiter.classifier.record_usage.assert_called_once_with(body, usage)
+
+        client.rate_limiter.classifier.record_usage.side_effect = RuntimeError("boom")
+        client._record_token_usage(body, {"usage": usage})  # never raises
+        client._record_token_usage(body, {"data": []})
+        assert client.rate_limiter.classifier.record_usage.call_count == 2
 
     @pytest.mark.asyncio
     async def test_prepare_request_await_future(self, client):
@@ -435,6 +435,12 @@ class TestStreamingErrorHandling:
         mock_response._body = None
         mock_response.close = Mock()
 
+        async def _no_chunks():
+            if False:
+                yield b""
+
+        mock_response.content.iter_any = Mock(return_value=_no_chunks())
+
         with patch.object(
             client, "_prepare_and_send_request", new_callable=AsyncMock
         ) as mock_prepare:
@@ -0,0 +1,241 @@
+"""Tests for streaming asset downloads (``venice_ai._download``)."""
+
+import hashlib
+import io
+import re
+from pathlib import Path
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from venice_ai import _download
+from venice_ai._download import download
+from venice_ai.exceptions import ChecksumMismatchError
+
+BLOB = bytes(range(256)) * 400  # 102_400 bytes
+
+
+class _Server:
+    """Range-aware file server that can drop the connection mid-body."""
+
+    def __init__(self, *, honour_range: bool = True, drop_after: int | None = None) -> None:
+        self.honour_range = honour_range
+        self.drop_after = drop_after
+        self.ranges: list[str | None] = []
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        range_header = request.headers.get("Range")
+        self.ranges.append(range_header)
+        start, end, status = 0, len(BLOB) - 1, 200
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", range_header or "")
+        if match and self.honour_range:
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else end
+            status = 206
+        body = BLOB[start : end + 1]
+        response = web.StreamResponse(status=status)
+        response.content_length = len(body)
+        if status == 206:
+            response.headers["Content-Range"] = f"bytes {start}-{end}/{len(BLOB)}"
+        await response.prepare(request)
+        if self.drop_after is not None and len(self.ranges) == 1:
+            await response.write(body[: self.drop_after])
+            assert request.transport is not None
+            request.transport.close()
+            return response
+        await response.write(body)
+        return response
+
+
+@pytest.fixture(autouse=True)
+def _no_resume_backoff(monkeypatch):
+    monkeypatch.setattr(_download, "RESUME_BACKOFF", 0.0)
+
+
+async def _serve(server: _Server):
+    app = web.Application()
+    app.router.add_get("/asset", server.handle)
+    test_server = TestServer(app)
+    await test_server.start_server()
+    return test_server, str(test_server.make_url("/asset"))
+
+
+@pytest.mark.asyncio
+async def test_streams_to_path_without_leaving_part_file(tmp_path: Path):
+    test_server, url = await _serve(_Server())
+    try:
+        async with aiohttp.ClientSession() as session:
+            written = await download(session, url, tmp_path / "out" / "v.mp4", chunk_size=4096)
+    finally:
+        await test_server.close()
+
+    assert written == len(BLOB)
+    assert (tmp_path / "out" / "v.mp4").read_bytes() == BLOB
+    assert not (tmp_path / "out" / "v.mp4.part").exists()
+
+
+@pytest.mark.asyncio
+async def test_resumes_with_range_after_disconnect(tmp_path: Path):
+    server = _Server(drop_after=30_000)
+    test_server, url = await _serve(server)
+    try:
+        async with aiohttp.ClientSession() as session:
+            written = await download(session, url, tmp_path / "v.mp4", chunk_size=4096)
+    finally:
+        await test_server.close()
+
+    assert written == len(BLOB)
+    assert (tmp_path / "v.mp4").read_bytes() == BLOB
+    assert server.ranges[0] is None
+    assert server.ranges[1] is not None and server.ranges[1].startswith("bytes=")
+    assert server.ranges[1] != "bytes=0-"
+
+
+@pytest.mark.asyncio
+async def test_restarts_when_server_ignores_range(tmp_path: Path):
+    server = _Server(honour_range=False, drop_after=30_000)
+    test_server, url = await _serve(server)
+    try:
+        async with aiohttp.ClientSession() as session:
+            written = await download(session, url, tmp_path / "v.mp4", chunk_size=4096)
+    finally:
+        await test_server.close()
+
+    assert written == len(BLOB)
+    assert (tmp_path / "v.mp4").read_bytes() == BLOB
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_resumes(tmp_path: Path):
+    server = _Server(drop_after=1000)
+    test_server, url = await _serve(server)
+    try:
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(aiohttp.ClientPayloadError):
+                await download(session, url, tmp_path / "v.mp4", max_resumes=0)
+    finally:
+        await test_server.close()
+
+    assert not (tmp_path / "v.mp4").exists()
+    assert not (tmp_path / "v.mp4.part").exists()
+
+
+@pytest.mark.asyncio
+async def test_checksum_verified(tmp_path: Path):
+    digest = hashlib.sha256(BLOB).hexdigest()
+    test_server, url = await _serve(_Server())
+    try:
+        async with aiohttp.ClientSession() as session:
+            await download(session, url, tmp_path / "ok.mp4", checksum=f"sha256:{digest}")
+            with pytest.raises(ChecksumMismatchError) as excinfo:
+                await download(session, url, tmp_path / "bad.mp4", checksum="0" * 64)
+    finally:
+        await test_server.close()
+
+    assert excinfo.value.actual == digest
+    assert (tmp_path / "ok.mp4").exists()
+    assert not (tmp_path / "bad.mp4").exists()
+    assert not (tmp_path / "bad.mp4.part").exists()
+
+
+@pytest.mark.asyncio
+async def test_parallel_ranges(tmp_path: Path):
+    server = _Server()
+    test_server, url = await _serve(server)
+    digest = hashlib.md5(BLOB).hexdigest()
+    try:
+        async with aiohttp.ClientSession() as session:
+            written = await download(
+                session,
+                url,
+                tmp_path / "v.mp4",
+                parallel=3,
+                part_size=20_000,
+                checksum=f"md5:{digest}",
+            )
+    finally:
+        await test_server.close()
+
+    assert written == len(BLOB)
+    assert (tmp_path / "v.mp4").read_bytes() == BLOB
+    # probe + ceil(102_400 / 20_000) parts
+    assert len(server.ranges) == 1 + 6
+    assert "bytes=100000-102399" in server.ranges
+
+
+@pytest.mark.asyncio
+async def test_parallel_falls_back_without_range_support(tmp_path: Path):
+    server = _Server(honour_range=False)
+    test_server, url = await _serve(server)
+    try:
+        async with aiohttp.ClientSession() as session:
+            written = await download(session, url, tmp_path / "v.mp4", parallel=4, part_size=1000)
+    finally:
+        await test_server.close()
+
+    assert written == len(BLOB)
+    assert (tmp_path / "v.mp4").read_bytes() == BLOB
+    assert len(server.ranges) == 2  # probe + one sequential GET
+
+
+@pytest.mark.asyncio
+async def test_file_like_destination_resumes():
+    server = _Server(drop_after=50_000)
+    test_server, url = await _serve(server)
+    buffer = io.BytesIO(b"header")
+    buffer.seek(0, io.SEEK_END)
+    try:
+        async with aiohttp.ClientSession() as session:
+            written = await download(session, url, buffer, chunk_size=8192)
+    finally:
+        await test_server.close()
+
+    assert written == len(BLOB)
+    assert buffer.getvalue() == b"header" + BLOB
+
+
+@pytest.mark.asyncio
+async def test_http_error_raised(tmp_path: Path):
+    async def not_found(_request: web.Request) -> web.Response:
+        return web.Response(status=404)
+
+    app = web.Application()
+    app.router.add_get("/asset", not_found)
+    test_server = TestServer(app)
+    await test_server.start_server()
+    try:
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(aiohttp.ClientResponseError):
+                await download(session, str(test_server.make_url("/asset")), tmp_path / "v.mp4")
+    finally:
+        await test_server.close()
+
+    assert not (tmp_path / "v.mp4.part").exists()
+
+
+@pytest.mark.asyncio
+async def test_write_bytes_creates_parents(tmp_path: Path):
+    await _download.write_bytes(tmp_path / "a" / "b.bin", b"xyz")
+    assert (tmp_path / "a" / "b.bin").read_bytes() == b"xyz"
+
+
+def test_unsupported_checksum_algorithm():
+    with pytest.raises(ValueError, match="Unsupported checksum"):
+        _download._parse_checksum("crc99:abcd")
+
+
+@pytest.mark.asyncio
+async def test_client_download_to_uses_managed_session(tmp_path: Path):
+    from venice_ai import VeniceClient
+
+    test_server, url = await _serve(_Server())
+    try:
+        async with VeniceClient(api_key="test") as client:
+            written = await client.download_to(url, tmp_path / "v.mp4", chunk_size=8192)
+    finally:
+        await test_server.close()
+
+    assert written == len(BLOB)
+    assert (tmp_path / "v.mp4").read_bytes() == BLOB
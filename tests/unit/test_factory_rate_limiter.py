@@ -235,7 +235,9 @@ class TestAdaptiveIntelligentSuccessPath:
         mock_provider_cls.assert_called_once_with(
             client=mock_client, rate_limit_discovery=mock_discovery
         )
-        mock_request_classifier_cls.assert_called_once_with(rate_limit_discovery=mock_discovery)
+        mock_request_classifier_cls.assert_called_once_with(
+            rate_limit_discovery=mock_discovery, token_estimator=None
+        )
         mock_classifier_adapter_cls.assert_called_once_with(classifier=mock_request_classifier)
         # Scheduler invoked with full dependency set
         sched_kwargs = mock_sched_cls.call_args.kwargs
@@ -1,6 +1,9 @@
 """Unit tests for venice_ai.helpers module."""
 
+import base64
 import io
+import struct
+from array import array
 from typing import Literal, Optional  # noqa: UP035, UP045
 
 import pytest
@@ -10,12 +13,16 @@ from venice_ai.helpers import (
     Conversation,
     _python_type_to_json_schema,
     cosine_similarity,
+    cosine_similarity_matrix,
+    decode_embedding,
     detect_image_format,
     fit_image_bytes,
     normalize_duration_seconds,
     tool_from_function,
     tool_from_model,
+    top_k,
 )
+from venice_ai.types.api import EmbeddingsResponse
 
 # ============================================================================
 # _python_type_to_json_schema tests
@@ -408,6 +415,135 @@ class TestCosineSimilarity:
             cosine_similarity([1.0, 1.0], [0.0, 0.0])
 
 
+# ============================================================================
+# Vectorised similarity tests
+# ============================================================================
+
+
+def _b64(values: list[float]) -> str:
+    return base64.b64encode(struct.pack(f"<{len(values)}f", *values)).decode()
+
+
+DOCS = [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [-1.0, 0.0]]
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    """Run each test with NumPy and with the ``array('f')`` fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr("venice_ai.helpers._numpy", lambda: None)
+    return request.param
+
+
+class TestDecodeEmbedding:
+    def test_base64_round_trip(self, backend):
+        vector = decode_embedding(_b64([0.5, -1.0, 2.0]))
+        assert list(vector) == [0.5, -1.0, 2.0]
+        if backend == "array":
+            assert isinstance(vector, array)
+            assert vector.typecode == "f"
+        else:
+            assert vector.dtype.name == "float32"
+            assert not vector.flags.writeable
+
+    def test_float_list(self, backend):
+        assert list(decode_embedding([1.0, 2.0])) == [1.0, 2.0]
+
+    def test_truncated_base64_raises(self, backend):
+        with pytest.raises(ValueError, match="float32"):
+            decode_embedding(base64.b64encode(b"\x00" * 6).decode())
+
+
+class TestCosineSimilarityMatrix:
+    def test_matches_scalar_helper(self, backend):
+        queries = [[1.0, 2.0], [3.0, -1.0]]
+        matrix = cosine_similarity_matrix(queries, DOCS)
+        for i, q in enumerate(queries):
+            for j, d in enumerate(DOCS):
+                assert float(matrix[i][j]) == pytest.approx(cosine_similarity(q, d), abs=1e-6)
+
+    def test_accepts_base64_rows(self, backend):
+        matrix = cosine_similarity_matrix([_b64([1.0, 0.0])], [_b64(d) for d in DOCS])
+        assert [round(float(x), 5) for x in matrix[0]] == [1.0, 0.0, 0.70711, -1.0]
+
+    def test_dimension_mismatch_raises(self, backend):
+        with pytest.raises(ValueError, match="same length"):
+            cosine_similarity_matrix([[1.0, 0.0, 0.0]], DOCS)
+
+    def test_empty_raises(self, backend):
+        with pytest.raises(ValueError, match="non-empty"):
+            cosine_similarity_matrix([], DOCS)
+
+    def test_zero_vector_raises(self, backend):
+        with pytest.raises(ValueError, match="zero vector"):
+            cosine_similarity_matrix([[1.0, 0.0]], [[0.0, 0.0]])
+
+
+class TestTopK:
+    def test_ranked_by_score(self, backend):
+        results = top_k([1.0, 0.1], DOCS, k=2)
+        assert [i for i, _ in results] == [0, 2]
+        assert results[0][1] > results[1][1]
+        assert all(isinstance(i, int) and isinstance(s, float) for i, s in results)
+
+    def test_k_larger_than_corpus(self, backend):
+        assert [i for i, _ in top_k([1.0, 0.0], DOCS, k=10)] == [0, 2, 1, 3]
+
+    def test_empty_corpus(self, backend):
+        assert top_k([1.0, 0.0], [], k=3) == []
+
+    def test_invalid_k(self, backend):
+        with pytest.raises(ValueError, match="k must be positive"):
+            top_k([1.0, 0.0], DOCS, k=0)
+
+
+class TestEmbeddingsResponseAsArray:
+    def _response(self, embeddings, encoding_format=None):
+        return EmbeddingsResponse.model_validate(
+            {
+                "object": "list",
+                "model": "text-embedding-bge-m3",
+                "data": [
+                    {
+                        "object": "embedding",
+                        "index": i,
+                        "embedding": e,
+                        "encoding_format": encoding_format,
+                    }
+                    for i, e in enumerate(embeddings)
+                ],
+                "usage": {"prompt_tokens": 1, "total_tokens": 1},
+            }
+        )
+
+    def test_base64_matrix(self):
+        np = pytest.importorskip("numpy")
+        response = self._response([_b64([1.0, 2.0]), _b64([3.0, 4.0])], "base64")
+        matrix = response.as_array()
+        assert matrix.shape == (2, 2)
+        assert matrix.dtype == np.float32
+        assert matrix.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_float_matrix_ordered_by_index(self):
+        pytest.importorskip("numpy")
+        response = self._response([[1.0, 2.0], [3.0, 4.0]])
+        response.data.reverse()
+        assert response.as_array().tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_ragged_base64_raises(self):
+        pytest.importorskip("numpy")
+        response = self._response([_b64([1.0, 2.0]), _b64([3.0])], "base64")
+        with pytest.raises(ValueError, match="same number"):
+            response.as_array()
+
+    def test_feeds_top_k(self):
+        pytest.importorskip("numpy")
+        response = self._response([_b64(d) for d in DOCS], "base64")
+        assert top_k([0.0, 1.0], response.as_array(), k=1)[0][0] == 1
+
+
 # ============================================================================
 # detect_image_format tests
 # ============================================================================
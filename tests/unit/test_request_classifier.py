@@ -640,6 +640,15 @@ class TestEstimateTokens:
         # Should return 1 (minimum) + 150 (default max_tokens) = 151
         assert tokens == 151
 
+    def test_public_estimate_tokens_matches_classifier_estimate(self):
+        """Test that estimate_tokens exposes the same estimate."""
+        mock_tier_discovery = MagicMock(spec=RateLimitDiscovery)
+        classifier = RequestClassifier(rate_limit_discovery=mock_tier_discovery)
+
+        request_data = {"prompt": "Hello world", "max_tokens": 50}
+
+        assert classifier.estimate_tokens(request_data) == classifier._estimate_tokens(request_data)
+
 
 class TestGetResourceTypeForModel:
     """Test get_resource_type_for_model method."""
@@ -766,3 +775,40 @@ class TestEstimateTokensEdgeCases:
 
         result = classifier._estimate_tokens({"prompt": "test", "max_tokens": "invalid"})
         assert result == 151  # 1 (from "test") + 150 (default)
+
+
+class TestTokenEstimationPipeline:
+    """Body passthrough, pluggable estimators and usage calibration."""
+
+    @pytest.mark.asyncio
+    async def test_reads_body_key(self, classifier):
+        body = {
+            "model": "llama-3.3-70b",
+            "messages": [{"role": "user", "content": "x" * 4000}],
+            "max_completion_tokens": 500,
+        }
+        metadata = await classifier.classify(
+            {"model": "llama-3.3-70b", "endpoint": "chat/completions", "body": body}
+        )
+        assert metadata.estimated_tokens == 1000 + 500
+
+    def test_custom_estimator(self, rate_limit_discovery):
+        estimator = MagicMock()
+        estimator.count_prompt_tokens.return_value = 42
+        classifier = RequestClassifier(rate_limit_discovery, token_estimator=estimator)
+        assert classifier._estimate_tokens({"max_completion_tokens": 8}) == 50
+
+    def test_record_usage_calibrates_model(self, classifier):
+        body = {"model": "m", "messages": [{"role": "user", "content": "x" * 400}]}
+        assert classifier._estimate_tokens({"model": "m", "body": body}) == 100 + 150
+
+        classifier.record_usage(body, {"prompt_tokens": 200, "total_tokens": 210})
+        assert classifier.calibration.factor("m") == pytest.approx(2.0)
+        assert classifier._estimate_tokens({"model": "m", "body": body}) == 200 + 150
+        # Other models are unaffected.
+        assert classifier._estimate_tokens({"model": "other", "body": body}) == 100 + 150
+
+    def test_record_usage_ignores_missing_fields(self, classifier):
+        classifier.record_usage({"messages": []}, {"prompt_tokens": 5})
+        classifier.record_usage({"model": "m"}, {})
+        assert classifier.calibration.snapshot() == {}
@@ -0,0 +1,295 @@
+"""Unit tests for ``venice_ai.cache`` (ResponseCache, stores, client wiring)."""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from venice_ai._client import VeniceClient
+from venice_ai.cache import (
+    CacheRule,
+    FileCacheStore,
+    MemoryCacheStore,
+    RedisCacheStore,
+    ResponseCache,
+)
+from venice_ai.costs import CostTracker
+from venice_ai.types.api.embeddings import EmbeddingObject, EmbeddingsResponse, EmbeddingUsage
+from venice_ai.types.api.models import LLMModelPricing, PricingTier
+
+_MODEL = "fake-embedding-model"
+
+
+def _embeddings(value: float = 0.5) -> EmbeddingsResponse:
+    return EmbeddingsResponse(
+        object="list",
+        model=_MODEL,
+        data=[
+            EmbeddingObject(object="embedding", index=0, embedding=[value], encoding_format=None)
+        ],
+        usage=EmbeddingUsage(prompt_tokens=1000, total_tokens=1000),
+        id=None,
+        created=None,
+    )
+
+
+def _cache(**rules) -> ResponseCache:
+    return ResponseCache(MemoryCacheStore(), endpoints=rules or {"embeddings": 60})
+
+
+class TestMemoryCacheStore:
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_by_bytes(self):
+        store = MemoryCacheStore(max_bytes=10)
+        await store.set("a", b"xxxx", 60)
+        await store.set("b", b"yyyy", 60)
+        await store.get("a")  # a is now most recent
+        await store.set("c", b"zzzz", 60)
+        assert await store.get("b") is None
+        assert await store.get("a") == b"xxxx"
+        assert store.size_bytes == 8
+        assert store.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_oversized_value_is_not_stored(self):
+        store = MemoryCacheStore(max_bytes=4)
+        await store.set("a", b"12345", 60)
+        assert len(store) == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_dropped(self):
+        store = MemoryCacheStore()
+        with patch("venice_ai.cache.time.monotonic", return_value=100.0):
+            await store.set("a", b"v", 5)
+        with patch("venice_ai.cache.time.monotonic", return_value=106.0):
+            assert await store.get("a") is None
+        assert store.size_bytes == 0
+
+
+class TestRules:
+    def test_key_ignores_body_ordering(self):
+        cache = _cache()
+        a = cache.key_for("POST", "embeddings", json_data={"input": "x", "model": "m"})
+        b = cache.key_for("POST", "/embeddings", json_data={"model": "m", "input": "x"})
+        assert a == b
+
+    def test_unlisted_endpoint_is_not_cached(self):
+        assert _cache().rule_for("POST", "image/generate", {"prompt": "x"}) is None
+
+    def test_chat_shorthand_requires_determinism(self):
+        cache = ResponseCache(endpoints={"chat/completions": 60})
+        assert cache.rule_for("POST", "chat/completions", {"temperature": 0.7}) is None
+        assert cache.rule_for("POST", "chat/completions", {"temperature": 0}) is not None
+        assert cache.rule_for("POST", "chat/completions", {"seed": 7}) is not None
+        assert cache.rule_for("POST", "chat/completions", {"seed": 7, "stream": True}) is None
+
+    def test_invalid_ttl_rejected(self):
+        with pytest.raises(ValueError):
+            CacheRule(ttl=0)
+
+
+class TestGetOrFetch:
+    @pytest.mark.asyncio
+    async def test_second_call_is_served_from_cache(self):
+        cache = _cache()
+        fetch = AsyncMock(return_value=_embeddings())
+        kwargs = {"json_data": {"input": "x"}, "params": None, "cast_to": EmbeddingsResponse}
+
+        first = await cache.get_or_fetch("POST", "embeddings", fetch=fetch, **kwargs)
+        second = await cache.get_or_fetch("POST", "embeddings", fetch=fetch, **kwargs)
+
+        assert fetch.await_count == 1
+        assert isinstance(second, EmbeddingsResponse)
+        assert second.data[0].embedding == first.data[0].embedding
+        assert (cache.stats.misses, cache.stats.hits, cache.stats.stores) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_plain_dict_results_round_trip(self):
+        cache = ResponseCache(endpoints={"models": 60})
+        fetch = AsyncMock(return_value={"data": [1, 2]})
+        for _ in range(2):
+            result = await cache.get_or_fetch(
+                "GET", "models", json_data=None, params={"type": "chat"}, cast_to=None, fetch=fetch
+            )
+        assert result == {"data": [1, 2]}
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_revalidating(self):
+        cache = ResponseCache(
+            endpoints={"embeddings": CacheRule(ttl=10, stale_while_revalidate=100)}
+        )
+        fetch = AsyncMock(side_effect=[_embeddings(0.1), _embeddings(0.2)])
+        kwargs = {"json_data": {"input": "x"}, "params": None, "cast_to": EmbeddingsResponse}
+
+        with patch("venice_ai.cache.time.time", return_value=1000.0):
+            await cache.get_or_fetch("POST", "embeddings", fetch=fetch, **kwargs)
+        with patch("venice_ai.cache.time.time", return_value=1050.0):
+            stale = await cache.get_or_fetch("POST", "embeddings", fetch=fetch, **kwargs)
+            await cache.aclose()
+        assert stale.data[0].embedding == [0.1]
+        assert cache.stats.stale_hits == 1
+        assert cache.stats.revalidations == 1
+
+        with patch("venice_ai.cache.time.time", return_value=1055.0):
+            fresh = await cache.get_or_fetch("POST", "embeddings", fetch=fetch, **kwargs)
+        assert fresh.data[0].embedding == [0.2]
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_store_failure_falls_back_to_fetch(self):
+        store = MagicMock()
+        store.get = AsyncMock(side_effect=ConnectionError("down"))
+        store.set = AsyncMock(side_effect=ConnectionError("down"))
+        cache = ResponseCache(store, endpoints={"embeddings": 60})
+        fetch = AsyncMock(return_value=_embeddings())
+
+        result = await cache.get_or_fetch(
+            "POST", "embeddings", json_data={}, params=None, cast_to=EmbeddingsResponse, fetch=fetch
+        )
+        assert result is fetch.return_value
+        assert cache.stats.errors == 2
+
+    @pytest.mark.asyncio
+    async def test_malformed_entry_is_a_miss(self):
+        store = MagicMock()
+        store.get = AsyncMock(return_value=b"not-a-timestamp\n{}")
+        store.set = AsyncMock()
+        cache = ResponseCache(store, endpoints={"embeddings": 60})
+        fetch = AsyncMock(return_value=_embeddings())
+
+        result = await cache.get_or_fetch(
+            "POST", "embeddings", json_data={}, params=None, cast_to=EmbeddingsResponse, fetch=fetch
+        )
+        assert result is fetch.return_value
+        assert (cache.stats.errors, cache.stats.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_hits_recorded_as_savings(self):
+        tracker = CostTracker(
+            pricing_map={
+                _MODEL: LLMModelPricing(
+                    input=PricingTier(usd=1.0, diem=1.0),
+                    output=PricingTier(usd=1.0, diem=1.0),
+                    cache_input=None,
+                )
+            }
+        )
+        cache = _cache()
+        fetch = AsyncMock(return_value=_embeddings())
+        kwargs = {"json_data": {"input": "x"}, "params": None, "cast_to": EmbeddingsResponse}
+        for _ in range(3):
+            await cache.get_or_fetch(
+                "POST", "embeddings", fetch=fetch, cost_tracker=tracker, **kwargs
+            )
+
+        summary = await tracker.summary()
+        assert summary.cache_hits == 2
+        assert summary.saved_cost_usd > Decimal("0")
+        assert summary.total_cost_usd == Decimal("0.00")
+
+
+class TestRedisCacheStore:
+    @pytest.mark.asyncio
+    async def test_uses_backend_connection(self):
+        redis_client = MagicMock()
+        redis_client.get = AsyncMock(return_value="12.000\n{}")
+        redis_client.set = AsyncMock()
+        backend = MagicMock()
+        backend.connection = AsyncMock(return_value=redis_client)
+        store = RedisCacheStore(backend, prefix="p")
+
+        await store.set("k", b"payload", 1.5)
+        redis_client.set.assert_awaited_once_with("p:k", "payload", px=1500)
+        assert await store.get("k") == b"12.000\n{}"
+
+
+class TestFileCacheStore:
+    @pytest.mark.asyncio
+    async def test_round_trip_shared_between_instances(self, tmp_path):
+        await FileCacheStore(tmp_path / "c").set("k", b"payload\nmore", 60)
+        other = FileCacheStore(tmp_path / "c")
+        assert await other.get("k") == b"payload\nmore"
+        assert await other.get("missing") is None
+        assert not list((tmp_path / "c").glob(".tmp-*"))
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_removed(self, tmp_path):
+        store = FileCacheStore(tmp_path)
+        with patch("venice_ai.cache.time.time", return_value=100.0):
+            await store.set("k", b"v", 5)
+        with patch("venice_ai.cache.time.time", return_value=106.0):
+            assert await store.get("k") is None
+        assert not list(tmp_path.glob("*.cache"))
+
+    @pytest.mark.asyncio
+    async def test_delete_and_clear(self, tmp_path):
+        store = FileCacheStore(tmp_path)
+        await store.set("a", b"1", 60)
+        await store.set("b", b"2", 60)
+        await store.delete("a")
+        await store.delete("a")
+        assert await store.get("a") is None
+        await store.clear()
+        assert await store.get("b") is None
+
+    @pytest.mark.asyncio
+    async def test_directory_created_on_first_write(self, tmp_path):
+        store = FileCacheStore(tmp_path / "not" / "yet")
+        assert await store.get("k") is None
+        assert not (tmp_path / "not").exists()
+
+
+class TestClientIntegration:
+    @pytest.mark.asyncio
+    async def test_client_serves_repeat_from_cache(self):
+        cache = _cache()
+        client = VeniceClient(api_key="test-key", response_cache=cache)
+        with patch.object(
+            client, "_send_and_parse", AsyncMock(return_value=_embeddings())
+        ) as mock_send:
+            await client.post("embeddings", json_data={"input": "x"}, cast_to=EmbeddingsResponse)
+            await client.post("embeddings", json_data={"input": "x"}, cast_to=EmbeddingsResponse)
+        assert mock_send.await_count == 1
+        assert client.response_cache is cache
+
+    @pytest.mark.asyncio
+    async def test_clients_with_different_keys_do_not_share_entries(self, tmp_path):
+        store = FileCacheStore(tmp_path)
+        clients = [
+            VeniceClient(
+                api_key=key, response_cache=ResponseCache(store, endpoints={"embeddings": 60})
+            )
+            for key in ("key-a", "key-a", "key-b")
+        ]
+        sends = []
+        for client in clients:
+            with patch.object(
+                client, "_send_and_parse", AsyncMock(return_value=_embeddings())
+            ) as mock_send:
+                await client.post(
+                    "embeddings", json_data={"input": "x"}, cast_to=EmbeddingsResponse
+                )
+            sends.append(mock_send.await_count)
+
+        assert sends == [1, 0, 1]
+        assert clients[0].cache_scope == clients[1].cache_scope != clients[2].cache_scope
+        assert "key-a" not in clients[0].cache_scope
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_coalesce_with_single_flight(self):
+        client = VeniceClient(api_key="test-key", response_cache=_cache(), coalesce_requests=True)
+
+        async def slow(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return _embeddings()
+
+        with patch.object(client, "_send_and_parse", AsyncMock(side_effect=slow)) as mock_send:
+            await asyncio.gather(
+                *(
+                    client.post("embeddings", json_data={"input": "x"}, cast_to=EmbeddingsResponse)
+                    for _ in range(3)
+                )
+            )
+        assert mock_send.await_count == 1
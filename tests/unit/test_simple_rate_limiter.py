@@ -1628,3 +1628,137 @@ class TestGetAllStatesWithDeletion:
         # Should have 4 states (one was deleted during iteration)
         # The exact count depends on which models were iterated before deletion
         assert isinstance(result, dict)
+
+
+class TestProactivePacing:
+    """Tests for proactive token-bucket pacing."""
+
+    LIMIT_HEADERS = {
+        "x-ratelimit-limit-requests": "60",
+        "x-ratelimit-remaining-requests": "60",
+        "x-ratelimit-limit-tokens": "6000",
+        "x-ratelimit-remaining-tokens": "6000",
+    }
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        limiter = SimpleRateLimiter()
+        await limiter.update_from_headers("m", self.LIMIT_HEADERS)
+
+        assert limiter.classifier is None
+        assert await limiter.reserve("m", 10_000) == 0.0
+        state = await limiter.get_state("m")
+        assert state["request_allowance"] is None
+
+    @pytest.mark.asyncio
+    async def test_no_pacing_before_limits_known(self):
+        limiter = SimpleRateLimiter(proactive=True)
+        assert await limiter.reserve("m", 100) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_requests_spread_across_window(self):
+        """60 rpm with a 10% burst: 6 immediate requests, then one per second."""
+        limiter = SimpleRateLimiter(proactive=True, burst_fraction=0.1)
+        await limiter.update_from_headers("m", self.LIMIT_HEADERS)
+
+        with patch("venice_ai.rate_limiting.simple.time.time", return_value=1000.0):
+            limiter._model_states["m"].allowance_updated = 1000.0
+            waits = [await limiter.reserve("m") for _ in range(9)]
+
+        assert waits[:6] == [0.0] * 6
+        assert waits[6:] == pytest.approx([1.0, 2.0, 3.0])
+        stats = limiter.get_stats()
+        assert stats["paced_requests"] == 3
+        assert stats["pacing_delay_total"] == pytest.approx(6.0)
+
+    @pytest.mark.asyncio
+    async def test_token_budget_paces_large_requests(self):
+        limiter = SimpleRateLimiter(proactive=True, burst_fraction=0.1)
+        await limiter.update_from_headers("m", self.LIMIT_HEADERS)
+
+        with patch("venice_ai.rate_limiting.simple.time.time", return_value=1000.0):
+            limiter._model_states["m"].allowance_updated = 1000.0
+            assert await limiter.reserve("m", 600) == 0.0
+            # 300 tokens over budget at 100 tokens/s
+            assert await limiter.reserve("m", 300) == pytest.approx(3.0)
+
+    @pytest.mark.asyncio
+    async def test_refill_over_time(self):
+        limiter = SimpleRateLimiter(proactive=True, burst_fraction=0.1)
+        await limiter.update_from_headers("m", self.LIMIT_HEADERS)
+
+        with patch("venice_ai.rate_limiting.simple.time.time") as clock:
+            clock.return_value = 1000.0
+            limiter._model_states["m"].allowance_updated = 1000.0
+            for _ in range(6):
+                await limiter.reserve("m")
+            clock.return_value = 1002.0
+            assert await limiter.reserve("m") == 0.0
+            assert await limiter.reserve("m") == 0.0
+            assert await limiter.reserve("m") == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_headers_clamp_allowance(self):
+        limiter = SimpleRateLimiter(proactive=True)
+        await limiter.update_from_headers("m", self.LIMIT_HEADERS)
+        await limiter.update_from_headers(
+            "m",
+            {**self.LIMIT_HEADERS, "x-ratelimit-remaining-requests": "1"},
+        )
+
+        state = await limiter.get_state("m")
+        assert state["request_allowance"] == 1.0
+        assert state["token_allowance"] == pytest.approx(600.0)
+
+    @pytest.mark.asyncio
+    async def test_zero_limit_stops_pacing(self):
+        limiter = SimpleRateLimiter(proactive=True)
+        await limiter.update_from_headers("m", self.LIMIT_HEADERS)
+        await limiter.update_from_headers(
+            "m",
+            {
+                "x-ratelimit-limit-requests": "0",
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-limit-tokens": "0",
+                "x-ratelimit-remaining-tokens": "0",
+            },
+        )
+
+        assert await limiter.reserve("m", 100) == 0.0
+        state = await limiter.get_state("m")
+        assert (state["request_allowance"], state["token_allowance"]) == (None, None)
+
+    @pytest.mark.asyncio
+    async def test_submit_request_sleeps_for_pacing(self):
+        limiter = SimpleRateLimiter(proactive=True)
+        await limiter.update_from_headers("m", self.LIMIT_HEADERS)
+        limiter._model_states["m"].request_allowance = 0.0
+
+        response = MagicMock()
+        response.status = 200
+        response.headers = {}
+        metadata = MagicMock()
+        metadata.model_id = "m"
+        metadata.estimated_tokens = 0
+
+        with patch("venice_ai.rate_limiting.simple.asyncio.sleep", new=AsyncMock()) as sleep:
+            assert (
+                await limiter.submit_request(metadata, AsyncMock(return_value=response)) is response
+            )
+
+        sleep.assert_awaited_once()
+        assert sleep.await_args.args[0] == pytest.approx(1.0, abs=0.05)
+
+    def test_creates_classifier_with_estimator(self):
+        from venice_ai._request_classifier import RequestClassifier
+        from venice_ai.rate_limiting import CharTokenEstimator
+
+        estimator = CharTokenEstimator(chars_per_token=3.0)
+        limiter = SimpleRateLimiter(proactive=True, token_estimator=estimator)
+
+        assert isinstance(limiter.classifier, RequestClassifier)
+        assert limiter.classifier.token_estimator is estimator
+
+    def test_rejects_invalid_burst_fraction(self):
+        with pytest.raises(ValueError, match="burst_fraction"):
+            SimpleRateLimiter(burst_fraction=0)
@@ -0,0 +1,115 @@
+"""Unit tests for the incremental SSE decoder in ``venice_ai._sse``."""
+
+import pytest
+
+from venice_ai._sse import JSON_BACKEND, ServerSentEvent, SSEDecoder, json_loads
+
+
+def _decode_all(chunks: list[bytes]) -> list[ServerSentEvent]:
+    decoder = SSEDecoder()
+    events: list[ServerSentEvent] = []
+    for chunk in chunks:
+        events.extend(decoder.feed(chunk))
+    events.extend(decoder.flush())
+    return events
+
+
+class TestSSEDecoderFraming:
+    def test_single_frame(self):
+        events = _decode_all([b'data: {"a": 1}\n\n'])
+        assert len(events) == 1
+        assert events[0].data == b'{"a": 1}'
+        assert events[0].event == "message"
+        assert events[0].json() == {"a": 1}
+
+    def test_multiple_frames_in_one_chunk(self):
+        events = _decode_all([b"data: one\n\ndata: two\n\n"])
+        assert [e.data for e in events] == [b"one", b"two"]
+
+    def test_frame_split_across_chunks_byte_by_byte(self):
+        body = b'data: {"x": "hello"}\n\ndata: [DONE]\n\n'
+        events = _decode_all([body[i : i + 1] for i in range(len(body))])
+        assert [e.data for e in events] == [b'{"x": "hello"}', b"[DONE]"]
+
+    @pytest.mark.parametrize("eol", [b"\n", b"\r\n", b"\r"])
+    def test_line_terminators(self, eol):
+        body = b"data: a" + eol + b"data: b" + eol + eol + b"data: c" + eol + eol
+        assert [e.data for e in _decode_all([body])] == [b"a\nb", b"c"]
+
+    def test_crlf_split_between_chunks_is_one_terminator(self):
+        events = _decode_all([b"data: a\r", b"\n\r", b"\ndata: b\r\n\r\n"])
+        assert [e.data for e in events] == [b"a", b"b"]
+
+    def test_multiline_data_joined_with_newline(self):
+        events = _decode_all([b"data: line1\ndata: line2\ndata:line3\n\n"])
+        assert events[0].data == b"line1\nline2\nline3"
+
+    def test_only_one_leading_space_stripped(self):
+        events = _decode_all([b"data:  padded\n\n"])
+        assert events[0].data == b" padded"
+
+    def test_comments_are_ignored(self):
+        events = _decode_all([b": keepalive\n\n: another\ndata: x\n\n"])
+        assert [e.data for e in events] == [b"x"]
+
+    def test_blank_lines_without_data_do_not_dispatch(self):
+        assert _decode_all([b"\n\n\n"]) == []
+
+    def test_empty_data_field_does_not_dispatch(self):
+        assert _decode_all([b"data:\n\n"]) == []
+
+    def test_leading_bom_is_stripped(self):
+        events = _decode_all([b"\xef\xbb\xbfdata: x\n\n"])
+        assert events[0].data == b"x"
+
+
+class TestSSEDecoderFields:
+    def test_event_field_applies_to_one_frame(self):
+        events = _decode_all([b"event: delta\ndata: 1\n\ndata: 2\n\n"])
+        assert [e.event for e in events] == ["delta", "message"]
+
+    def test_id_persists_across_frames(self):
+        decoder = SSEDecoder()
+        events = decoder.feed(b"id: 7\ndata: a\n\ndata: b\n\n")
+        assert [e.id for e in events] == ["7", "7"]
+        assert decoder.last_event_id == "7"
+
+    def test_id_with_nul_is_ignored(self):
+        events = _decode_all([b"id: 1\ndata: a\n\nid: bad\x00id\ndata: b\n\n"])
+        assert [e.id for e in events] == ["1", "1"]
+
+    def test_retry_accepts_digits_only(self):
+        decoder = SSEDecoder()
+        decoder.feed(b"retry: 3000\n\nretry: soon\n\n")
+        assert decoder.retry == 3000
+
+    def test_field_without_colon_is_name_only(self):
+        events = _decode_all([b"data\ndata: x\n\n"])
+        assert events[0].data == b"\nx"
+
+    def test_unknown_fields_are_ignored(self):
+        events = _decode_all([b"foo: bar\ndata: x\n\n"])
+        assert [e.data for e in events] == [b"x"]
+
+
+class TestSSEDecoderFlush:
+    def test_flush_dispatches_unterminated_frame(self):
+        decoder = SSEDecoder()
+        assert decoder.feed(b'data: {"usage": 1}') == []
+        events = decoder.flush()
+        assert [e.data for e in events] == [b'{"usage": 1}']
+
+    def test_flush_dispatches_frame_missing_blank_line(self):
+        decoder = SSEDecoder()
+        assert decoder.feed(b"data: last\n") == []
+        assert [e.data for e in decoder.flush()] == [b"last"]
+
+    def test_flush_on_clean_stream_is_empty(self):
+        decoder = SSEDecoder()
+        decoder.feed(b"data: a\n\n")
+        assert decoder.flush() == []
+
+
+def test_json_loads_accepts_bytes():
+    assert JSON_BACKEND in {"orjson", "msgspec", "json"}
+    assert json_loads(b'{"k": [1, 2]}') == {"k": [1, 2]}
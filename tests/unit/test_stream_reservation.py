@@ -0,0 +1,158 @@
+"""Streaming token reservations against ``VeniceClient(account_backend=...)``."""
+
+from unittest.mock import AsyncMock, Mock
+
+import aiohttp
+import pytest
+from pydantic import BaseModel
+
+from venice_ai._client import VeniceClient
+from venice_ai.core.backends.memory import MemoryBackend
+from venice_ai.exceptions import APIConnectionError, APITimeoutError, ServiceUnavailableError
+
+MODEL = "test-model"
+BODY = {"model": MODEL, "messages": [{"role": "user", "content": "hi"}], "max_tokens": 100}
+
+
+class Usage(BaseModel):
+    total_tokens: int
+
+
+class Chunk(BaseModel):
+    id: str
+    usage: Usage | None = None
+
+
+async def _aiter_chunks(chunks: list[bytes]):
+    for chunk in chunks:
+        yield chunk
+
+
+def _response(lines: list[bytes]) -> AsyncMock:
+    response = AsyncMock(spec=aiohttp.ClientResponse)
+    response._body = None
+    response.status = 200
+    response.headers = {}
+    response.content = AsyncMock()
+    response.content.iter_any = Mock(return_value=_aiter_chunks(lines))
+    response.close = Mock()
+    return response
+
+
+async def _backend(*models: str) -> MemoryBackend:
+    backend = MemoryBackend()
+    for model in models or (MODEL,):
+        await backend.update_rate_limits(
+            model,
+            {
+                "x-ratelimit-limit-tokens": "10000",
+                "x-ratelimit-remaining-tokens": "10000",
+                "x-ratelimit-reset-tokens": "60",
+            },
+        )
+    return backend
+
+
+def _remaining(backend: MemoryBackend, model: str = MODEL) -> float:
+    return backend._rate_limits[model]["tpm_remaining"]
+
+
+@pytest.mark.asyncio
+async def test_stream_refunds_against_final_usage():
+    """The reservation is held while streaming and settled from ``usage``."""
+    backend = await _backend()
+    client = VeniceClient(api_key="test", account_backend=backend)
+    client._send_request = AsyncMock(
+        return_value=_response(
+            [
+                b'data: {"id": "1"}\n\n',
+                b'data: {"id": "2", "usage": {"total_tokens": 42}}\n\n',
+                b"data: [DONE]\n\n",
+            ]
+        )
+    )
+
+    stream = client._stream_request("POST", "/chat/completions", json_data=BODY, cast_to=Chunk)
+    first = await anext(stream)
+    assert first.id == "1"
+    assert _remaining(backend) < 10000 - 100
+    assert len(backend._reservations) == 1
+
+    assert [chunk.id async for chunk in stream] == ["2"]
+    assert _remaining(backend) == 10000 - 42
+    assert backend._reservations == {}
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_early_keeps_reservation_spent():
+    """Closing before ``usage`` arrives releases the reservation with no refund."""
+    backend = await _backend()
+    client = VeniceClient(api_key="test", account_backend=backend)
+    client._send_request = AsyncMock(
+        return_value=_response([b'data: {"id": "1"}\n\n', b'data: {"id": "2"}\n\n'])
+    )
+
+    stream = client._stream_request("POST", "/chat/completions", json_data=BODY, cast_to=Chunk)
+    await anext(stream)
+    spent = 10000 - _remaining(backend)
+    await stream.aclose()
+
+    assert backend._reservations == {}
+    assert _remaining(backend) == 10000 - spent
+
+
+@pytest.mark.asyncio
+async def test_failed_request_refunds_everything():
+    """A request that never gets a response gives the whole reservation back."""
+    backend = await _backend()
+    client = VeniceClient(api_key="test", account_backend=backend)
+    client._send_request = AsyncMock(side_effect=APIConnectionError("down"))
+
+    stream = client._stream_request("POST", "/chat/completions", json_data=BODY, cast_to=Chunk)
+    with pytest.raises(APIConnectionError):
+        await anext(stream)
+
+    assert backend._reservations == {}
+    assert _remaining(backend) == 10000
+
+
+@pytest.mark.asyncio
+async def test_reservation_wait_is_bounded_by_timeout():
+    """A backend that never has capacity fails the stream at its timeout."""
+    backend = Mock()
+    backend.reserve_streaming = AsyncMock(return_value=(False, 0.05))
+    client = VeniceClient(api_key="test", account_backend=backend)
+    client._send_request = AsyncMock()
+
+    stream = client._stream_request(
+        "POST", "/chat/completions", json_data=BODY, cast_to=Chunk, timeout=0.2
+    )
+    with pytest.raises(APITimeoutError):
+        await anext(stream)
+
+    assert 2 <= backend.reserve_streaming.await_count <= 5
+    client._send_request.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reservation_follows_model_fallback():
+    """A stream rerouted to a fallback is charged to the fallback, not the primary."""
+    backend = await _backend(MODEL, "fallback-model")
+    client = VeniceClient(
+        api_key="test", account_backend=backend, model_fallbacks={MODEL: "fallback-model"}
+    )
+    served = _response([b'data: {"id": "1", "usage": {"total_tokens": 42}}\n\n'])
+
+    async def send(method, path, *, json_data=None, **kwargs):
+        if json_data["model"] == MODEL:
+            raise ServiceUnavailableError("busy", response=Mock(status=503), body=None)
+        return served
+
+    client._send_request = AsyncMock(side_effect=send)
+
+    stream = client._stream_request("POST", "/chat/completions", json_data=BODY, cast_to=Chunk)
+    assert [chunk.id async for chunk in stream] == ["1"]
+
+    assert _remaining(backend, MODEL) == 10000
+    assert _remaining(backend, "fallback-model") == 10000 - 42
+    assert backend._reservations == {}
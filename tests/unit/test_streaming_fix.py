@@ -14,6 +14,11 @@ class MockModel(BaseModel):
     choices: list
 
 
+async def _aiter_chunks(chunks: list[bytes]):
+    for chunk in chunks:
+        yield chunk
+
+
 def _make_streaming_response(lines: list[bytes]) -> AsyncMock:
     """Build a mock aiohttp.ClientResponse that streams ``lines`` via .content."""
     mock_response = AsyncMock(spec=aiohttp.ClientResponse)
@@ -21,7 +26,7 @@ def _make_streaming_response(lines: list[bytes]) -> AsyncMock:
     mock_response.status = 200  # In-band error: HTTP itself succeeded
     mock_response.headers = {}
     mock_response.content = AsyncMock()
-    mock_response.content.__aiter__.return_value = lines
+    mock_response.content.iter_any = Mock(return_value=_aiter_chunks(lines))
     mock_response.content.read.return_value = b""
     mock_response.close = Mock()  # close() is synchronous in aiohttp
     return mock_response
@@ -41,7 +46,7 @@ async def test_stream_request_uses_iteration():
     mock_response.close = Mock()  # close() is synchronous in aiohttp
 
     # Setup async iterator for content
-    # Note: aiohttp response.content yields bytes lines
+    # Note: aiohttp response.content.iter_any() yields raw byte chunks
     lines = [
         b'data: {"id": "1", "choices": [{"delta": {"content": "Hello"}}]}\n',
         b"\n",
@@ -50,8 +55,7 @@ async def test_stream_request_uses_iteration():
         b"data: [DONE]\n",
     ]
 
-    # AsyncMock.__aiter__ expects an iterable (list), not an async generator
-    mock_response.content.__aiter__.return_value = lines
+    mock_response.content.iter_any = Mock(return_value=_aiter_chunks(lines))
 
     # Ensure read() is NOT called (or we can check it later)
     # But for the current implementation, read() IS called.
@@ -244,3 +244,117 @@ def test_sync_stream_proxy_context_manager_forwards_args():
     proxy.__exit__(type(err), err, None)
     assert captured[0][0] is ValueError
     assert captured[0][1] is err
+
+
+# ---------------------------------------------------------------------------
+# Concurrent execution: map() / submit() / per-thread retry overrides
+# ---------------------------------------------------------------------------
+
+
+def _tracking_fetch(mock_async_client, delay: float = 0.05):
+    """Attach an async ``fetch`` that records peak concurrency."""
+    import asyncio
+
+    state = {"active": 0, "peak": 0}
+
+    async def fetch(item):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        try:
+            await asyncio.sleep(delay)
+            if item == "bad":
+                raise ValueError(item)
+            return item * 2
+        finally:
+            state["active"] -= 1
+
+    mock_async_client.fetch = fetch
+    return state
+
+
+def test_map_runs_concurrently_and_preserves_order(sync_client, mock_async_client):
+    state = _tracking_fetch(mock_async_client)
+
+    results = sync_client.map(sync_client.fetch, range(10), max_concurrency=4)
+
+    assert results == [i * 2 for i in range(10)]
+    assert state["peak"] == 4
+
+
+def test_map_accepts_callables_returning_coroutines(sync_client, mock_async_client):
+    _tracking_fetch(mock_async_client, delay=0)
+
+    results = sync_client.map(lambda x: sync_client.async_client.fetch(x + 1), [1, 2])
+
+    assert results == [4, 6]
+
+
+def test_map_raises_first_error_or_collects(sync_client, mock_async_client):
+    _tracking_fetch(mock_async_client, delay=0)
+
+    with pytest.raises(ValueError, match="bad"):
+        sync_client.map(sync_client.fetch, [1, "bad", 3])
+
+    results = sync_client.map(sync_client.fetch, [1, "bad", 3], return_exceptions=True)
+    assert results[0] == 2 and results[2] == 6
+    assert isinstance(results[1], ValueError)
+
+
+def test_map_rejects_blocking_callables(sync_client, mock_async_client):
+    _tracking_fetch(mock_async_client, delay=0)
+
+    with pytest.raises(TypeError, match="awaitable"):
+        sync_client.map(lambda x: x, [1])
+    # A sync method called inside the loop would deadlock; it is refused instead
+    with pytest.raises(RuntimeError, match="async_client"):
+        sync_client.map(lambda x: sync_client.fetch(x), [1])
+
+
+def test_submit_returns_concurrent_future(sync_client, mock_async_client):
+    import concurrent.futures
+
+    state = _tracking_fetch(mock_async_client)
+
+    futures = [sync_client.submit(sync_client.fetch, i) for i in range(5)]
+
+    assert all(isinstance(f, concurrent.futures.Future) for f in futures)
+    assert [f.result(timeout=5) for f in futures] == [0, 2, 4, 6, 8]
+    assert state["peak"] == 5
+
+
+def test_retry_override_is_per_thread(sync_client):
+    import threading
+
+    from venice_ai.middleware.retry import RetryOptions
+
+    seen: list[object] = []
+    with sync_client.with_retries(RetryOptions(max_attempts=9)):
+        worker = threading.Thread(target=lambda: seen.append(sync_client._retry_override))
+        worker.start()
+        worker.join()
+        assert sync_client._retry_override.max_attempts == 9
+
+    assert seen == [None]
+
+
+def test_submit_applies_callers_retry_override(sync_client, mock_async_client):
+    from contextlib import asynccontextmanager
+
+    from venice_ai.middleware.retry import RetryOptions
+
+    applied: list[RetryOptions] = []
+
+    @asynccontextmanager
+    async def with_retries(options):
+        applied.append(options)
+        yield
+
+    mock_async_client.with_retries = with_retries
+    _tracking_fetch(mock_async_client, delay=0)
+    options = RetryOptions(max_attempts=4)
+
+    with sync_client.with_retries(options):
+        assert sync_client.submit(sync_client.fetch, 1).result(timeout=5) == 2
+    sync_client.submit(sync_client.fetch, 1).result(timeout=5)
+
+    assert applied == [options]
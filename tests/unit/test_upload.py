@@ -0,0 +1,110 @@
+"""Tests for streamed multipart uploads (``venice_ai._upload``)."""
+
+import base64
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from venice_ai import VeniceClient, _upload
+
+AUDIO = b"RIFF" + bytes(range(256)) * 1024  # spans several 64 KiB read chunks
+
+
+class _Receiver:
+    def __init__(self) -> None:
+        self.uploads: list[tuple[str | None, bytes]] = []
+
+    async def transcribe(self, request: web.Request) -> web.Response:
+        reader = await request.multipart()
+        async for part in reader:
+            if part.name == "file":
+                self.uploads.append((part.filename, await part.read()))  # type: ignore[union-attr]
+        return web.json_response({"text": "hello"})
+
+
+async def _client_for(receiver: _Receiver) -> tuple[TestServer, VeniceClient]:
+    app = web.Application()
+    app.router.add_post("/api/v1/audio/transcriptions", receiver.transcribe)
+    server = TestServer(app)
+    await server.start_server()
+    client = VeniceClient(api_key="test", base_url=str(server.make_url("/api/v1")))
+    return server, client
+
+
+@pytest.mark.asyncio
+async def test_transcribe_streams_path_upload(tmp_path: Path):
+    path = tmp_path / "meeting.wav"
+    path.write_bytes(AUDIO)
+    receiver = _Receiver()
+    server, client = await _client_for(receiver)
+    try:
+        async with client:
+            result = await client.audio.transcribe(file=path)
+    finally:
+        await server.close()
+
+    assert result.text == "hello"
+    assert receiver.uploads == [("meeting.wav", AUDIO)]
+
+
+@pytest.mark.asyncio
+async def test_transcribe_streams_caller_file_and_leaves_it_open(tmp_path: Path):
+    path = tmp_path / "meeting.wav"
+    path.write_bytes(b"HEADER" + AUDIO)
+    receiver = _Receiver()
+    server, client = await _client_for(receiver)
+    try:
+        async with client:
+            with open(path, "rb") as f:
+                f.seek(len(b"HEADER"))
+                await client.audio.transcribe(file=f)
+                assert not f.closed
+    finally:
+        await server.close()
+
+    assert receiver.uploads == [("meeting.wav", AUDIO)]
+
+
+@pytest.mark.asyncio
+async def test_prepare_audio_file_does_not_read_paths(tmp_path: Path):
+    from unittest.mock import Mock
+
+    from venice_ai.resources.audio import Audio
+
+    path = tmp_path / "clip.flac"
+    path.write_bytes(AUDIO)
+    content, filename, content_type = await Audio(Mock())._prepare_audio_file(path)
+    try:
+        assert not isinstance(content, bytes)
+        assert (filename, content_type) == ("clip.flac", "audio/flac")
+    finally:
+        content.close()  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_prepare_audio_file_missing_path(tmp_path: Path):
+    from unittest.mock import Mock
+
+    from venice_ai.resources.audio import Audio
+
+    with pytest.raises(ValueError, match="Audio file not found"):
+        await Audio(Mock())._prepare_audio_file(tmp_path / "missing.wav")
+
+
+@pytest.mark.asyncio
+async def test_b64encode_matches_stdlib():
+    small = b"abc"
+    large = bytes(range(256)) * 1024
+    assert await _upload.b64encode(small) == base64.b64encode(small).decode()
+    assert await _upload.b64encode(large) == base64.b64encode(large).decode()
+
+
+def test_is_streamable():
+    import io
+
+    assert _upload.is_streamable(io.BufferedReader(io.BytesIO(b"x")))
+    assert not _upload.is_streamable(io.BytesIO(b"x"))
+    assert not _upload.is_streamable(io.StringIO("x"))
+    assert not _upload.is_streamable(b"x")
@@ -0,0 +1,196 @@
+"""Unit tests for ``venice_ai.vector``."""
+
+import base64
+import json
+import struct
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from venice_ai.types.api import EmbeddingsResponse
+from venice_ai.vector import SearchHit, SemanticSearch, VectorIndex
+
+np = pytest.importorskip("numpy")
+
+
+def _random(n: int, d: int, seed: int = 0):
+    return np.random.default_rng(seed).standard_normal((n, d)).astype(np.float32)
+
+
+@pytest.fixture(params=["float32", "int8"])
+def quantize(request):
+    return request.param
+
+
+class TestVectorIndex:
+    def test_search_returns_nearest(self, quantize):
+        vectors = _random(200, 32)
+        index = VectorIndex(32, quantize=quantize, capacity=8)
+        index.add([f"doc-{i}" for i in range(200)], vectors)
+
+        hits = index.search(vectors[17], k=3)
+        assert hits[0].id == "doc-17"
+        assert hits[0].score == pytest.approx(1.0, abs=0.01)
+        assert [h.score for h in hits] == sorted((h.score for h in hits), reverse=True)
+        assert len(index) == 200
+
+    def test_matches_brute_force_ranking(self):
+        vectors = _random(500, 16, seed=1)
+        query = _random(1, 16, seed=2)[0]
+        index = VectorIndex(16)
+        index.add([str(i) for i in range(500)], vectors)
+
+        unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        expected = np.argsort(-(unit @ (query / np.linalg.norm(query))))[:10]
+        assert [int(h.id) for h in index.search(query, k=10)] == expected.tolist()
+
+    def test_int8_is_smaller(self):
+        vectors = _random(100, 64)
+        full = VectorIndex(64, capacity=100)
+        small = VectorIndex(64, quantize="int8", capacity=100)
+        full.add([str(i) for i in range(100)], vectors)
+        small.add([str(i) for i in range(100)], vectors)
+        assert small.nbytes < full.nbytes / 3
+
+    def test_delete_and_replace(self, quantize):
+        index = VectorIndex(2, quantize=quantize)
+        index.add(["a", "b", "c"], [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+
+        assert index.delete(["a", "missing"]) == 1
+        assert "a" not in index
+        assert index.tombstones == 1
+        assert [h.id for h in index.search([1.0, 0.0], k=5)] == ["c", "b"]
+
+        index.add(["b"], [[1.0, 0.0]])
+        assert index.search([1.0, 0.0], k=1) == [SearchHit("b", pytest.approx(1.0, abs=0.01))]
+
+        index.compact()
+        assert index.tombstones == 0
+        assert sorted(index.ids) == ["b", "c"]
+        assert index.search([1.0, 0.0], k=1)[0].id == "b"
+
+    def test_accepts_base64_vectors(self):
+        index = VectorIndex(2)
+        index.add(["x"], [base64.b64encode(struct.pack("<2f", 3.0, 4.0)).decode()])
+        assert index.search([3.0, 4.0], k=1)[0].score == pytest.approx(1.0)
+
+    def test_validation(self):
+        index = VectorIndex(3)
+        with pytest.raises(ValueError, match="length 3"):
+            index.add(["a"], [[1.0, 0.0]])
+        with pytest.raises(ValueError, match="1 ids for 2 vectors"):
+            index.add(["a"], [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+        with pytest.raises(ValueError, match="unique"):
+            index.add(["a", "a"], [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+        with pytest.raises(ValueError, match="zero vector"):
+            index.add(["a"], [[0.0, 0.0, 0.0]])
+        with pytest.raises(ValueError, match="k must be positive"):
+            index.search([1.0, 0.0, 0.0], k=0)
+        assert index.search([1.0, 0.0, 0.0]) == []
+
+    def test_search_spans_blocks(self, monkeypatch):
+        monkeypatch.setattr("venice_ai.vector.SEARCH_BLOCK_ROWS", 7)
+        vectors = _random(50, 8)
+        index = VectorIndex(8)
+        index.add([str(i) for i in range(50)], vectors)
+        assert index.search(vectors[44], k=1)[0].id == "44"
+
+
+class TestPersistence:
+    def test_round_trip_mmap(self, tmp_path, quantize):
+        vectors = _random(64, 8)
+        index = VectorIndex(8, quantize=quantize)
+        index.add([f"d{i}" for i in range(64)], vectors)
+        index.delete(["d3"])
+        index.save(tmp_path / "idx")
+
+        manifest = json.loads((tmp_path / "idx" / "index.json").read_text())
+        assert manifest["quantize"] == quantize
+        assert len(manifest["ids"]) == 63
+
+        loaded = VectorIndex.load(tmp_path / "idx")
+        assert isinstance(loaded._vectors, np.memmap)
+        assert not loaded._vectors.flags.writeable
+        assert len(loaded) == 63 and "d3" not in loaded
+        assert [h.id for h in loaded.search(vectors[9], k=3)] == [
+            h.id for h in index.search(vectors[9], k=3)
+        ]
+
+    def test_mutating_loaded_index_copies(self, tmp_path):
+        index = VectorIndex(2)
+        index.add(["a"], [[1.0, 0.0]])
+        index.save(tmp_path)
+
+        loaded = VectorIndex.load(tmp_path)
+        loaded.add(["b"], [[0.0, 1.0]])
+        assert loaded._vectors.flags.writeable
+        assert loaded.search([0.0, 1.0], k=1)[0].id == "b"
+        assert len(VectorIndex.load(tmp_path)) == 1
+
+    def test_rejects_unknown_version(self, tmp_path):
+        VectorIndex(2).save(tmp_path)
+        manifest = json.loads((tmp_path / "index.json").read_text())
+        manifest["version"] = 99
+        (tmp_path / "index.json").write_text(json.dumps(manifest))
+        with pytest.raises(ValueError, match="version"):
+            VectorIndex.load(tmp_path)
+
+
+def _embeddings_response(vectors) -> EmbeddingsResponse:
+    return EmbeddingsResponse.model_validate(
+        {
+            "object": "list",
+            "model": "emb",
+            "data": [
+                {
+                    "object": "embedding",
+                    "index": i,
+                    "embedding": base64.b64encode(np.asarray(v, dtype="<f4").tobytes()).decode(),
+                }
+                for i, v in enumerate(vectors)
+            ],
+            "usage": {"prompt_tokens": 1, "total_tokens": 1},
+        }
+    )
+
+
+class TestSemanticSearch:
+    @pytest.fixture
+    def client(self):
+        table = {"cats": [1.0, 0.0], "dogs": [0.0, 1.0], "kittens": [0.9, 0.1]}
+
+        async def create(*, model, input, dimensions, encoding_format):
+            assert encoding_format == "base64"
+            return _embeddings_response([table[t] for t in input])
+
+        async def gather(awaitables, *, max_concurrency, return_exceptions):
+            return [await a for a in awaitables]
+
+        client = MagicMock()
+        client.embeddings.create = AsyncMock(side_effect=create)
+        client.gather = AsyncMock(side_effect=gather)
+        return client
+
+    async def test_add_and_query(self, client):
+        search = SemanticSearch(client, model="emb", batch_size=2, max_concurrency=3)
+        ids = await search.add_texts(["cats", "dogs", "kittens"])
+
+        assert ids == ["0", "1", "2"]
+        assert search.index.dimensions == 2
+        assert client.embeddings.create.await_count == 2
+        assert client.gather.await_args.kwargs["max_concurrency"] == 3
+
+        hits = await search.query("cats", k=2)
+        assert [h.id for h in hits] == ["0", "2"]
+
+    async def test_auto_ids_skip_existing(self, client):
+        search = SemanticSearch(client, model="emb")
+        await search.add_texts(["cats"], ids=["1"])
+        assert await search.add_texts(["dogs", "kittens"]) == ["0", "2"]
+        assert search.delete(["1"]) == 1
+        assert len(search.index) == 2
+
+    async def test_query_on_empty_index(self, client):
+        search = SemanticSearch(client, model="emb")
+        assert await search.query("cats") == []
+        client.embeddings.create.assert_not_awaited()